@@ -166,19 +166,18 @@ async def _firecrawl_search(query: str, *, api_key: str) -> str:
         # and falls back to the static snippet.
         raise RuntimeError("firecrawl_disabled")
 
-    # Lazy import: keep ``httpx`` out of module-import path for tests that
-    # mock this entire function via ``patch``.
-    import httpx  # noqa: PLC0415
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.firecrawl.dev/v0/search",
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={"query": query, "limit": 3},
-            timeout=None,  # Outer asyncio.wait_for owns the timeout.
-        )
-        response.raise_for_status()
-        data = response.json()
+    # Lazy import: keep the HTTP client registry out of module-import path
+    # for tests that mock this entire function via ``patch``.
+    from nikita.llm.clients import get_http_client  # noqa: PLC0415
+
+    response = await get_http_client("firecrawl").post(
+        "https://api.firecrawl.dev/v0/search",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={"query": query, "limit": 3},
+        timeout=None,  # Outer asyncio.wait_for owns the timeout.
+    )
+    response.raise_for_status()
+    data = response.json()
 
     # Concatenate top result snippets, then truncate.
     results = data.get("data") or data.get("results") or []
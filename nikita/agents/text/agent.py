@@ -100,6 +100,7 @@ def _create_nikita_agent() -> Agent[NikitaDeps, str]:
     start_time = time.time()
     logger.info(f"[TIMING] _create_nikita_agent START")
 
+    from nikita.agents.text.prefetch import prefetched_results
     from nikita.agents.text.tools import format_memory_results
     logger.info(f"[TIMING] Tools imported: {time.time() - start_time:.2f}s")
 
@@ -209,7 +210,9 @@ def _create_nikita_agent() -> Agent[NikitaDeps, str]:
         if ctx.deps.memory is None:
             return "Memory system is not available right now."
         try:
-            results = await ctx.deps.memory.search_memory(query, limit=5)
+            results = await prefetched_results(ctx.deps, query)
+            if results is None:
+                results = await ctx.deps.memory.search_memory(query, limit=5, hybrid=True)
             return format_memory_results(results)
         except Exception as e:
             # Gracefully degrade when memory operations fail (e.g., OpenAI quota exceeded)
@@ -534,12 +537,26 @@ async def generate_response(
         Nikita's response string
     """
     from nikita.agents.text.history import load_message_history
+    from nikita.agents.text.prefetch import MemoryPrefetch
+    from nikita.config.settings import get_settings
 
     logger.info(
         f"[LLM-DEBUG] generate_response called: user_id={deps.user.id}, "
         f"message_len={len(user_message)}, conversation_id={deps.conversation_id}"
     )
 
+    # Start the likely recall_memory search now so it overlaps history
+    # loading and prompt building; the tool reuses it for similar queries
+    settings = get_settings()
+    deps.memory_prefetch = None
+    if deps.memory is not None and settings.memory_prefetch_enabled:
+        deps.memory_prefetch = MemoryPrefetch.start(
+            deps.user.id,
+            settings.openai_api_key or "",
+            user_message,
+            min_overlap=settings.memory_prefetch_min_overlap,
+        )
+
     # Spec 030: Load message history for conversation continuity
     # Critical: Returns None for new sessions (empty conversation_messages)
     # This ensures @agent.instructions decorators are called for fresh prompts
@@ -668,3 +685,7 @@ async def generate_response(
             },
         )
         return LLM_TIMEOUT_FALLBACK_MESSAGE
+
+    finally:
+        if deps.memory_prefetch is not None:
+            deps.memory_prefetch.cancel()
@@ -11,6 +11,7 @@ from uuid import UUID
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from nikita.agents.text.prefetch import MemoryPrefetch
     from nikita.config.settings import Settings
     from nikita.db.models.user import User
     from nikita.memory.supabase_memory import SupabaseMemory
@@ -37,6 +38,7 @@ class NikitaDeps:
         conversation_messages: Raw messages for message_history injection (None = new session)
         conversation_id: The current conversation's UUID for logging
         session: Database session for session propagation (None = create new, Spec 038)
+        memory_prefetch: recall_memory search started on the user message (None = off)
     """
 
     memory: "SupabaseMemory | None"
@@ -47,6 +49,7 @@ class NikitaDeps:
     conversation_id: UUID | None = None  # Spec 030: For logging
     session: "AsyncSession | None" = None  # Spec 038: Session propagation
     psyche_state: dict | None = None  # Spec 056: Psyche agent state for L3 injection
+    memory_prefetch: "MemoryPrefetch | None" = None  # Set per turn by generate_response
 
     @property
     def chapter(self) -> int:
@@ -11,8 +11,9 @@ Key Features:
 - Converts to PydanticAI ModelMessage types via ModelMessagesTypeAdapter
 - Implements token budgeting (1500-3000 tokens)
 - Ensures tool call/return pairing (PydanticAI requirement)
-- Uses fast token estimation for message loading loops
-- Uses accurate token estimation for final budget validation
+- Uses stored per-message token counts (fast estimation for messages
+  without one) for budget truncation
+- Uses accurate (tiktoken) estimation only for debug logging
 
 Critical Notes (from research):
 - When message_history is non-empty, PydanticAI does NOT regenerate the system prompt
@@ -40,6 +41,8 @@ logger = logging.getLogger(__name__)
 
 # Token budget for message history tier (1500-3000 tokens)
 DEFAULT_TOKEN_BUDGET = 3000
+# Most recent messages loaded before token truncation
+DEFAULT_HISTORY_LIMIT = 80
 MIN_TURNS_PRESERVED = 10
 
 
@@ -90,7 +93,25 @@ class HistoryLoader:
         Returns:
             List of ModelMessage objects.
         """
+        return self._convert_with_token_counts(raw_messages)[0]
+
+    def _convert_with_token_counts(
+        self,
+        raw_messages: list[dict[str, Any]],
+    ) -> tuple[list[ModelMessage], list[int | None]]:
+        """Convert raw messages, keeping each one's stored token count.
+
+        Messages appended to conversation_messages carry the token_count
+        computed when they were written; legacy messages do not (None).
+
+        Args:
+            raw_messages: List of message dicts from JSONB.
+
+        Returns:
+            (messages, token_counts) with one count per converted message.
+        """
         converted: list[ModelMessage] = []
+        token_counts: list[int | None] = []
 
         for msg in raw_messages:
             role = msg.get("role", "")
@@ -107,13 +128,15 @@ class HistoryLoader:
             elif role == "tool_call":
                 # Handle tool calls if present in raw format
                 # These would need special handling if stored separately
-                pass
+                continue
             else:
                 logger.warning(
                     f"Unknown message role '{role}' in conversation {self.conversation_id}"
                 )
+                continue
+            token_counts.append(msg.get("token_count"))
 
-        return converted
+        return converted, token_counts
 
     def _ensure_tool_call_pairing(
         self,
@@ -177,6 +200,32 @@ class HistoryLoader:
 
         return messages
 
+    def _message_tokens(self, msg: ModelMessage, accurate: bool = False) -> int:
+        """Estimate the token count of one message (user and text parts).
+
+        Args:
+            msg: A ModelMessage.
+            accurate: If True, use tiktoken for precise count.
+
+        Returns:
+            Estimated token count.
+        """
+        estimator = get_token_estimator()
+        total_tokens = 0
+
+        if isinstance(msg, ModelRequest):
+            for part in msg.parts:
+                if isinstance(part, UserPromptPart):
+                    content = part.content if isinstance(part.content, str) else ""
+                    total_tokens += estimator.estimate(content, accurate=accurate)
+        elif isinstance(msg, ModelResponse):
+            for part in msg.parts:
+                if isinstance(part, TextPart):
+                    content = part.content if isinstance(part.content, str) else ""
+                    total_tokens += estimator.estimate(content, accurate=accurate)
+
+        return total_tokens
+
     def _estimate_tokens(
         self, messages: list[ModelMessage], accurate: bool = False
     ) -> int:
@@ -193,41 +242,33 @@ class HistoryLoader:
         Returns:
             Estimated token count.
         """
-        estimator = get_token_estimator()
-        total_tokens = 0
-
-        for msg in messages:
-            if isinstance(msg, ModelRequest):
-                for part in msg.parts:
-                    if isinstance(part, UserPromptPart):
-                        content = part.content if isinstance(part.content, str) else ""
-                        total_tokens += estimator.estimate(content, accurate=accurate)
-            elif isinstance(msg, ModelResponse):
-                for part in msg.parts:
-                    if isinstance(part, TextPart):
-                        content = part.content if isinstance(part.content, str) else ""
-                        total_tokens += estimator.estimate(content, accurate=accurate)
-
-        return total_tokens
+        return sum(self._message_tokens(msg, accurate=accurate) for msg in messages)
 
     def _truncate_to_budget(
         self,
         messages: list[ModelMessage],
         token_budget: int,
         min_turns: int = MIN_TURNS_PRESERVED,
+        token_counts: list[int | None] | None = None,
     ) -> list[ModelMessage]:
         """Truncate messages to fit within token budget.
 
         Truncates from the oldest messages first, but preserves at least
         min_turns messages regardless of budget.
 
-        Spec 041 T2.8: Uses fast estimation during truncation loop,
-        accurate estimation for final budget validation.
+        Each message is counted once, using its stored token count when it
+        has one and the fast estimate otherwise, then a single
+        backward pass sums the counts from the newest message and stops at
+        the first message that would exceed the budget: everything after it
+        is the longest suffix that fits, so the cut point is found in O(n)
+        instead of re-estimating the remaining list per dropped message.
 
         Args:
             messages: List of ModelMessage objects.
             token_budget: Maximum token budget.
             min_turns: Minimum messages to preserve regardless of budget.
+            token_counts: Stored token counts aligned with messages (None
+                entries, or no list, are estimated).
 
         Returns:
             Truncated list of messages.
@@ -239,30 +280,34 @@ class HistoryLoader:
         if len(messages) <= min_turns:
             return messages
 
-        # Start with all messages and remove oldest until within budget
-        # Use fast estimation in the loop for performance
-        current_messages = messages.copy()
+        stored = token_counts or [None] * len(messages)
+        counts = [
+            tokens if tokens is not None else self._message_tokens(msg)
+            for msg, tokens in zip(messages, stored, strict=True)
+        ]
 
-        while len(current_messages) > min_turns:
-            tokens = self._estimate_tokens(current_messages, accurate=False)
-            if tokens <= token_budget:
+        start = len(messages)
+        tokens = 0
+        for index in range(len(messages) - 1, -1, -1):
+            if tokens + counts[index] > token_budget:
                 break
-            # Remove oldest message
-            current_messages = current_messages[1:]
-
-        # Use accurate estimation for final count logging
-        final_tokens = self._estimate_tokens(current_messages, accurate=True)
-        if len(current_messages) < len(messages):
-            logger.info(
-                f"Truncated history from {len(messages)} to {len(current_messages)} "
-                f"messages (~{final_tokens} tokens) for conversation {self.conversation_id}"
-            )
+            tokens += counts[index]
+            start = index
 
-        return current_messages
+        # The min_turns newest messages are kept even when over budget
+        start = min(start, len(messages) - min_turns)
+        if start == 0:
+            return messages
+
+        logger.info(
+            f"Truncated history from {len(messages)} to {len(messages) - start} "
+            f"messages (~{sum(counts[start:])} tokens) for conversation {self.conversation_id}"
+        )
+        return messages[start:]
 
     def load(
         self,
-        limit: int = 80,
+        limit: int = DEFAULT_HISTORY_LIMIT,
         token_budget: int = DEFAULT_TOKEN_BUDGET,
     ) -> list[ModelMessage] | None:
         """Load and format message history for agent.run().
@@ -294,22 +339,28 @@ class HistoryLoader:
         raw_subset = self.raw_messages[-limit:] if limit else self.raw_messages
 
         # Convert to ModelMessage types
-        messages = self._convert_to_model_messages(raw_subset)
+        messages, token_counts = self._convert_with_token_counts(raw_subset)
 
         if not messages:
             return None
 
         # Truncate to token budget
-        messages = self._truncate_to_budget(messages, token_budget)
+        messages = self._truncate_to_budget(
+            messages, token_budget, token_counts=token_counts
+        )
 
         # Ensure tool call pairing
         messages = self._ensure_tool_call_pairing(messages)
 
-        # Use accurate estimation for final count logging
         logger.info(
-            f"Loaded {len(messages)} messages (~{self._estimate_tokens(messages, accurate=True)} tokens) "
-            f"for conversation {self.conversation_id}"
+            f"Loaded {len(messages)} messages for conversation {self.conversation_id}"
         )
+        # tiktoken is only worth running when someone reads the count
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"History tokens (accurate): {self._estimate_tokens(messages, accurate=True)} "
+                f"for conversation {self.conversation_id}"
+            )
 
         return messages if messages else None
 
@@ -317,7 +368,7 @@ class HistoryLoader:
 async def load_message_history(
     conversation_messages: list[dict[str, Any]] | None,
     conversation_id: UUID | None = None,
-    limit: int = 80,
+    limit: int = DEFAULT_HISTORY_LIMIT,
     token_budget: int = DEFAULT_TOKEN_BUDGET,
 ) -> list[ModelMessage] | None:
     """Convenience function to load message history.
@@ -0,0 +1,145 @@
+"""Speculative memory prefetch for the recall_memory tool.
+
+recall_memory only searches after the model has decided to call it, so a
+tool-using turn pays for the embedding call and the vector search on top
+of the extra model round trip. generate_response() starts the same search
+on the incoming user message as soon as the turn begins, concurrently
+with history loading and prompt building, and keeps it on NikitaDeps.
+When the model's recall query is close enough to the user message the
+tool returns the prefetched results instead of searching again.
+
+The prefetch runs in its own database session: the SupabaseMemory session
+may be in use by the legacy prompt builder at the same time, and an
+AsyncSession must not be shared by concurrent tasks.
+"""
+
+import asyncio
+import logging
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from nikita.agents.text.deps import NikitaDeps
+
+logger = logging.getLogger(__name__)
+
+# Results per recall_memory call (same limit as the tool's own search)
+RECALL_LIMIT = 5
+
+# Words that say nothing about which memories a query is after
+_STOPWORDS = frozenset(
+    {
+        "about", "and", "are", "but", "can", "did", "does", "for", "from",
+        "had", "has", "have", "her", "him", "his", "how", "its", "just",
+        "know", "like", "me", "my", "nikita", "not", "our", "remember",
+        "she", "that", "the", "their", "them", "they", "this", "user",
+        "was", "we", "were", "what", "when", "where", "which", "who", "why",
+        "with", "you", "your",
+    }
+)
+_WORD = re.compile(r"\w+")
+
+
+def _terms(text: str) -> set[str]:
+    """Lowercased content words of a text (3+ characters, no stopwords)."""
+    return {
+        word
+        for word in _WORD.findall(text.lower())
+        if len(word) >= 3 and word not in _STOPWORDS
+    }
+
+
+async def _search(
+    user_id: "UUID",
+    openai_api_key: str,
+    query: str,
+    limit: int,
+) -> list[dict[str, Any]] | None:
+    """Hybrid memory search in a session of its own (None on failure)."""
+    from nikita.db.database import get_session_maker
+    from nikita.memory.supabase_memory import SupabaseMemory
+
+    try:
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            memory = SupabaseMemory(
+                session=session, user_id=user_id, openai_api_key=openai_api_key
+            )
+            return await memory.search(query, limit=limit, hybrid=True)
+    except Exception as e:
+        logger.warning(f"[MEMORY] prefetch failed: {type(e).__name__}: {e}")
+        return None
+
+
+class MemoryPrefetch:
+    """A recall_memory search started on the user message."""
+
+    def __init__(
+        self,
+        query: str,
+        task: "asyncio.Task[list[dict[str, Any]] | None]",
+        min_overlap: float,
+    ) -> None:
+        self.query = query
+        self._task = task
+        self._terms = _terms(query)
+        self._min_overlap = min_overlap
+
+    @classmethod
+    def start(
+        cls,
+        user_id: "UUID",
+        openai_api_key: str,
+        query: str,
+        min_overlap: float,
+        limit: int = RECALL_LIMIT,
+    ) -> "MemoryPrefetch":
+        """Start the search in the background and return its handle."""
+        task = asyncio.create_task(_search(user_id, openai_api_key, query, limit))
+        return cls(query, task, min_overlap)
+
+    def covers(self, query: str) -> bool:
+        """Whether the prefetched results can answer a recall query.
+
+        True when at least min_overlap of the query's content words occur in
+        the user message the prefetch searched for. Recall queries are
+        usually short restatements of the message ("their sister's
+        wedding"), so containment beats a symmetric similarity here.
+        """
+        if self._task.cancelled():
+            return False
+        terms = _terms(query)
+        if not terms:
+            return query.strip().lower() == self.query.strip().lower()
+        return len(terms & self._terms) / len(terms) >= self._min_overlap
+
+    async def results(self) -> list[dict[str, Any]] | None:
+        """The prefetched results, waiting for the search if still running.
+
+        None when the search failed or was cancelled; the caller then
+        searches itself.
+        """
+        try:
+            return await asyncio.shield(self._task)
+        except asyncio.CancelledError:
+            if self._task.cancelled():
+                return None
+            raise
+
+    def cancel(self) -> None:
+        """Stop the search if the turn finished without using it."""
+        if not self._task.done():
+            self._task.cancel()
+
+
+async def prefetched_results(deps: "NikitaDeps", query: str) -> list[dict[str, Any]] | None:
+    """Prefetched results for a recall query, or None to search normally."""
+    prefetch = deps.memory_prefetch
+    if prefetch is None or not prefetch.covers(query):
+        return None
+    results = await prefetch.results()
+    if results is not None:
+        logger.info("[MEMORY] recall_memory served from prefetch")
+    return results
@@ -2,6 +2,8 @@
 
 Spec 030: Text Agent Message History and Continuity
 Spec 041 T2.8: Two-tier token estimation (fast for truncation, accurate for validation)
+Counts already known (stored per message, or from an earlier truncation
+step) are reused instead of counting the same text again.
 
 Tasks: T5.1 (TokenBudgetManager), T5.2 (Truncation Priority)
 
@@ -54,12 +56,15 @@ class TierContent:
         today: Today's summary and key moments.
         threads: Open conversation threads.
         last_conversation: Summary of last conversation.
+        history_tokens: Stored token count of history (sum of the messages'
+            token_count), used instead of counting the text again.
     """
 
     history: str = ""
     today: str = ""
     threads: str = ""
     last_conversation: str = ""
+    history_tokens: int | None = None
 
 
 @dataclass
@@ -165,6 +170,7 @@ class TokenBudgetManager:
         text: str,
         token_budget: int,
         tier_name: str,
+        known_tokens: int | None = None,
     ) -> tuple[str, int, bool]:
         """Truncate text to fit within token budget.
 
@@ -175,6 +181,8 @@ class TokenBudgetManager:
             text: Text to truncate.
             token_budget: Maximum tokens allowed.
             tier_name: Name of tier (for logging).
+            known_tokens: Accurate token count of text if already known
+                (stored at write time, or returned by an earlier call).
 
         Returns:
             Tuple of (truncated_text, actual_tokens, was_truncated).
@@ -182,8 +190,13 @@ class TokenBudgetManager:
         if not text:
             return "", 0, False
 
-        # Use fast estimate for initial check
-        current_tokens = self._estimate_tokens(text, accurate=False)
+        if known_tokens is not None:
+            if known_tokens <= token_budget:
+                return text, known_tokens, False
+            current_tokens = known_tokens
+        else:
+            # Use fast estimate for initial check
+            current_tokens = self._estimate_tokens(text, accurate=False)
 
         if current_tokens <= token_budget:
             # Use accurate count for return value
@@ -223,12 +236,16 @@ class TokenBudgetManager:
 
         # Step 1: Apply per-tier budgets
         history_text, history_tokens, history_truncated = self._truncate_to_budget(
-            content.history, self.history_budget, "history"
+            content.history, self.history_budget, "history", content.history_tokens
         )
         if history_truncated:
             truncated = True
             truncation_info["history"] = {
-                "original_tokens": self._estimate_tokens(content.history),
+                "original_tokens": (
+                    content.history_tokens
+                    if content.history_tokens is not None
+                    else self._estimate_tokens(content.history)
+                ),
                 "truncated_to": history_tokens,
             }
 
@@ -280,7 +297,8 @@ class TokenBudgetManager:
                 reduction = min(excess, last_conv_tokens)
                 new_budget = max(0, last_conv_tokens - reduction)
                 last_conv_text, last_conv_tokens, _ = self._truncate_to_budget(
-                    last_conv_text, new_budget, "last_conversation (priority)"
+                    last_conv_text, new_budget, "last_conversation (priority)",
+                    known_tokens=last_conv_tokens,
                 )
                 excess -= reduction
                 truncation_info["last_conversation_priority"] = {
@@ -293,7 +311,8 @@ class TokenBudgetManager:
                 reduction = min(excess, threads_tokens)
                 new_budget = max(0, threads_tokens - reduction)
                 threads_text, threads_tokens, _ = self._truncate_to_budget(
-                    threads_text, new_budget, "threads (priority)"
+                    threads_text, new_budget, "threads (priority)",
+                    known_tokens=threads_tokens,
                 )
                 excess -= reduction
                 truncation_info["threads_priority"] = {
@@ -306,7 +325,8 @@ class TokenBudgetManager:
                 reduction = min(excess, today_tokens)
                 new_budget = max(0, today_tokens - reduction)
                 today_text, today_tokens, _ = self._truncate_to_budget(
-                    today_text, new_budget, "today (priority)"
+                    today_text, new_budget, "today (priority)",
+                    known_tokens=today_tokens,
                 )
                 excess -= reduction
                 truncation_info["today_priority"] = {
@@ -321,7 +341,8 @@ class TokenBudgetManager:
                 reduction = min(excess, max_reduction)
                 new_budget = max(MIN_HISTORY_TOKENS, history_tokens - reduction)
                 history_text, history_tokens, _ = self._truncate_to_budget(
-                    history_text, new_budget, "history (priority)"
+                    history_text, new_budget, "history (priority)",
+                    known_tokens=history_tokens,
                 )
                 truncation_info["history_priority"] = {
                     "reduced_by": reduction,
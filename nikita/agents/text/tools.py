@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any
 from pydantic_ai import RunContext
 
 from nikita.agents.text.deps import NikitaDeps
+from nikita.agents.text.prefetch import prefetched_results
 
 if TYPE_CHECKING:
     pass
@@ -69,8 +70,11 @@ async def recall_memory(ctx: RunContext[NikitaDeps], query: str) -> str:
     Returns:
         Formatted string of relevant memory results
     """
-    # Search memory with limit of 5 results
-    results = await ctx.deps.memory.search_memory(query, limit=5)
+    # Reuse the turn's prefetched search when it covers the query
+    results = await prefetched_results(ctx.deps, query)
+    if results is None:
+        # Search memory with limit of 5 results
+        results = await ctx.deps.memory.search_memory(query, limit=5, hybrid=True)
 
     # Format and return results
     return format_memory_results(results)
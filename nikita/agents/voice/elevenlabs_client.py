@@ -21,10 +21,9 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Literal
 
-import httpx
-
 from nikita.agents.voice.models import TranscriptData, TranscriptEntry
 from nikita.config.settings import get_settings
+from nikita.llm.clients import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -264,14 +263,14 @@ class ElevenLabsConversationsClient:
         if include_summary:
             params["summary_mode"] = "include"
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/conversations",
-                headers=self._headers(),
-                params=params,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client("elevenlabs").get(
+            f"{self.BASE_URL}/conversations",
+            headers=self._headers(),
+            params=params,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         conversations = [
             ConversationSummary(
@@ -311,13 +310,13 @@ class ElevenLabsConversationsClient:
         Raises:
             httpx.HTTPStatusError: On API errors
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/conversations/{conversation_id}",
-                headers=self._headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client("elevenlabs").get(
+            f"{self.BASE_URL}/conversations/{conversation_id}",
+            headers=self._headers(),
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         # Parse transcript
         transcript = [
@@ -384,13 +383,13 @@ class ElevenLabsConversationsClient:
         Raises:
             httpx.HTTPStatusError: On API errors
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/agents/{agent_id}",
-                headers=self._headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client("elevenlabs").get(
+            f"{self.BASE_URL}/agents/{agent_id}",
+            headers=self._headers(),
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         # Parse conversation config
         conv_config = None
@@ -81,6 +81,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Constant memory query for get_context (embedding warmed at startup)
+CONTEXT_MEMORY_QUERY = "relevant context about user and relationship"
+
 # TOKEN_VALIDITY_SECONDS imported from nikita.api.utils.webhook_auth (1800s = 30 min)
 
 # =============================================================================
@@ -418,7 +421,7 @@ class ServerToolHandler:
                     """Query a specific graph type and extract fact strings."""
                     try:
                         results = await memory.search_memory(
-                            query="relevant context about user and relationship",
+                            query=CONTEXT_MEMORY_QUERY,
                             graph_types=[graph_type],
                             limit=limit,
                         )
@@ -836,7 +839,7 @@ class ServerToolHandler:
             from nikita.memory import get_memory_client
 
             memory = await get_memory_client(user_id)
-            results = await memory.search_memory(query, limit=limit)
+            results = await memory.search_memory(query, limit=limit, hybrid=True)
             facts = [r.get("fact", "") for r in results[:3]] if results else []
         except Exception as e:
             logger.warning(f"[SERVER TOOL] Memory query failed: {e}")
@@ -40,6 +40,10 @@ logger = logging.getLogger(__name__)
 # REL-001: TTL for in-memory session cache (1 hour)
 SESSION_TTL_SECONDS = 3600
 
+# Constant memory queries for context enrichment (embeddings warmed at startup)
+RECENT_TOPICS_QUERY = "recent conversations"
+OPEN_THREADS_QUERY = "unresolved topics pending"
+
 
 class VoiceService:
     """High-level voice conversation service.
@@ -307,12 +311,12 @@ class VoiceService:
             memory = await get_memory_client(str(user_id))
 
             # Get recent topics
-            search_result = await memory.search("recent conversations", limit=5)
+            search_result = await memory.search(RECENT_TOPICS_QUERY, limit=5)
             if search_result:
                 context.recent_topics = [r.get("content", "")[:50] for r in search_result[:3]]
 
             # Get open threads
-            thread_result = await memory.search("unresolved topics pending", limit=3)
+            thread_result = await memory.search(OPEN_THREADS_QUERY, limit=3)
             if thread_result:
                 context.open_threads = [r.get("content", "")[:50] for r in thread_result[:2]]
 
@@ -693,7 +697,7 @@ class VoiceService:
             )
             ```
         """
-        import httpx
+        from nikita.llm.clients import get_http_client
 
         start_time = time.time()
         logger.info(
@@ -747,30 +751,29 @@ class VoiceService:
             payload["conversation_initiation_client_data"] = initiation_data
 
         # Make the API call
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.elevenlabs.io/v1/convai/twilio/outbound-call",
-                json=payload,
-                headers={
-                    "xi-api-key": self.settings.elevenlabs_api_key,
-                    "Content-Type": "application/json",
-                },
-                timeout=30.0,
-            )
+        response = await get_http_client("elevenlabs").post(
+            "https://api.elevenlabs.io/v1/convai/twilio/outbound-call",
+            json=payload,
+            headers={
+                "xi-api-key": self.settings.elevenlabs_api_key,
+                "Content-Type": "application/json",
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                error_text = response.text
-                logger.error(
-                    f"[VOICE] Outbound call failed: status={response.status_code}, "
-                    f"error={error_text}"
-                )
-                return {
-                    "success": False,
-                    "message": f"ElevenLabs API error: {response.status_code}",
-                    "error": error_text,
-                }
+        if response.status_code != 200:
+            error_text = response.text
+            logger.error(
+                f"[VOICE] Outbound call failed: status={response.status_code}, "
+                f"error={error_text}"
+            )
+            return {
+                "success": False,
+                "message": f"ElevenLabs API error: {response.status_code}",
+                "error": error_text,
+            }
 
-            result = response.json()
+        result = response.json()
 
         logger.info(
             f"[VOICE] Outbound call initiated in {time.time() - start_time:.2f}s | "
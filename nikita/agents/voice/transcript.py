@@ -15,6 +15,8 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
+from pydantic import BaseModel
+
 from nikita.agents.voice.elevenlabs_client import get_elevenlabs_client
 from nikita.agents.voice.models import TranscriptData, TranscriptEntry
 from nikita.config.models import Models
@@ -25,6 +27,54 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class ExtractedFact(BaseModel):
+    fact: str
+    category: str  # occupation, hobby, relationship, preference, biographical, emotional
+
+
+class FactExtractionResult(BaseModel):
+    facts: list[ExtractedFact]
+
+
+class TranscriptSummary(BaseModel):
+    summary: str  # 2-3 sentence summary of the voice call
+
+
+FACT_EXTRACTION_PROMPT = """You are a fact extraction assistant analyzing voice call transcripts.
+
+Extract personal facts about the USER (human) - NOT about the AI assistant Nikita.
+
+Categories:
+- occupation: job, work, career info
+- hobby: hobbies, interests, activities
+- relationship: family, friends, partners
+- preference: likes, dislikes, preferences
+- biographical: age, location, education, life events
+- emotional: feelings, emotional states, mental health
+
+Rules:
+- Only extract CONCRETE facts (not vague statements)
+- Focus on the USER's information, not Nikita's
+- Each fact should be a standalone statement
+- Skip greetings, small talk, and conversation fillers
+- If no clear facts, return empty list
+
+Example output for "I work at Google and love hiking on weekends":
+[{"fact": "Works at Google", "category": "occupation"},
+ {"fact": "Enjoys hiking on weekends", "category": "hobby"}]"""
+
+TRANSCRIPT_SUMMARY_PROMPT = """You are a voice call summarizer. Given a transcript between a user and Nikita (an AI girlfriend), write a 2-3 sentence summary.
+
+Your summary should capture:
+1. What was discussed (main topics)
+2. The emotional tone (warm, tense, playful, vulnerable, etc.)
+3. Any commitments or plans mentioned
+
+Keep the summary concise and factual. Write in past tense from Nikita's perspective.
+
+Example: "The user shared news about completing a big work project. The tone was positive and celebratory. They made plans to celebrate together this weekend." """
+
+
 class TranscriptManager:
     """Manager for voice call transcripts.
 
@@ -185,43 +235,18 @@ class TranscriptManager:
             Extracted facts with categories (occupation, hobby, relationship,
             preference, biographical, emotional)
         """
-        from pydantic import BaseModel
         from pydantic_ai import Agent
 
-        # Define extraction schema
-        class ExtractedFact(BaseModel):
-            fact: str
-            category: str  # occupation, hobby, relationship, preference, biographical, emotional
-
-        class FactExtractionResult(BaseModel):
-            facts: list[ExtractedFact]
-
-        # Create extraction agent
-        extract_agent = Agent(
-            Models.sonnet(),
-            output_type=FactExtractionResult,
-            system_prompt="""You are a fact extraction assistant analyzing voice call transcripts.
-
-Extract personal facts about the USER (human) - NOT about the AI assistant Nikita.
+        from nikita.llm.clients import get_agent
 
-Categories:
-- occupation: job, work, career info
-- hobby: hobbies, interests, activities
-- relationship: family, friends, partners
-- preference: likes, dislikes, preferences
-- biographical: age, location, education, life events
-- emotional: feelings, emotional states, mental health
-
-Rules:
-- Only extract CONCRETE facts (not vague statements)
-- Focus on the USER's information, not Nikita's
-- Each fact should be a standalone statement
-- Skip greetings, small talk, and conversation fillers
-- If no clear facts, return empty list
-
-Example output for "I work at Google and love hiking on weekends":
-[{"fact": "Works at Google", "category": "occupation"},
- {"fact": "Enjoys hiking on weekends", "category": "hobby"}]""",
+        model = Models.sonnet()
+        extract_agent = get_agent(
+            ("voice_fact_extraction", model),
+            lambda: Agent(
+                model,
+                output_type=FactExtractionResult,
+                system_prompt=FACT_EXTRACTION_PROMPT,
+            ),
         )
 
         try:
@@ -277,7 +302,15 @@ Example output for "I work at Google and love hiking on weekends":
         session_id: str,
         facts: list[dict[str, str]],
     ) -> dict[str, Any]:
-        """Store multiple facts to SupabaseMemory (pgVector).
+        """Store multiple facts to SupabaseMemory (pgVector) in one batch.
+
+        One memory client and one session serve the whole transcript:
+        SupabaseMemory.add_facts_bulk embeds every fact in a single request
+        and dedups them in a single query. Facts are written in
+        ``self.session`` when set (the caller commits), otherwise in a
+        short-lived session committed here.
+
+        AC-FR010-001: Facts stored with source='voice_call'.
 
         Args:
             user_id: User UUID
@@ -285,30 +318,65 @@ Example output for "I work at Google and love hiking on weekends":
             facts: List of fact dicts with 'fact' and 'category' keys
 
         Returns:
-            Result dict with count of stored facts
+            Result dict with counts of stored, deduplicated and failed facts
         """
-        stored = 0
+        batch = [
+            {
+                "fact": fact_data["fact"],
+                "graph_type": "user",
+                "metadata": {
+                    "category": fact_data.get("category"),
+                    "session_id": session_id,
+                },
+            }
+            for fact_data in facts
+            if fact_data.get("fact")
+        ]
+        result = {"stored": 0, "deduplicated": 0}
         errors = 0
 
-        for fact_data in facts:
+        if batch:
             try:
-                await self.store_fact(
-                    user_id=user_id,
-                    session_id=session_id,
-                    fact=fact_data.get("fact", ""),
-                    category=fact_data.get("category"),
+                if self.session is not None:
+                    result = await self._add_facts_bulk(self.session, user_id, batch)
+                else:
+                    from nikita.db.database import get_session_maker
+
+                    async with get_session_maker()() as session:
+                        result = await self._add_facts_bulk(session, user_id, batch)
+                        await session.commit()
+                logger.info(
+                    f"[TRANSCRIPT] Stored {result['stored']} facts "
+                    f"({result['deduplicated']} duplicates) for session {session_id}"
                 )
-                stored += 1
             except Exception as e:
                 logger.error(f"[TRANSCRIPT] Batch store error: {e}")
-                errors += 1
+                errors = len(batch)
 
         return {
-            "facts_stored": stored,
+            "facts_stored": result["stored"],
+            "deduplicated": result["deduplicated"],
             "errors": errors,
             "session_id": session_id,
         }
 
+    async def _add_facts_bulk(
+        self,
+        session: "AsyncSession",
+        user_id: UUID,
+        batch: list[dict[str, Any]],
+    ) -> dict[str, int]:
+        """Write a fact batch through one SupabaseMemory bound to session."""
+        from nikita.config.settings import get_settings
+        from nikita.memory import SupabaseMemory
+
+        memory = SupabaseMemory(
+            session=session,
+            user_id=user_id,
+            openai_api_key=get_settings().openai_api_key or "",
+        )
+        return await memory.add_facts_bulk(batch, source="voice_call", confidence=0.8)
+
     async def generate_summary(
         self,
         transcript: TranscriptData,
@@ -352,25 +420,18 @@ Example output for "I work at Google and love hiking on weekends":
         if not transcript_text.strip():
             return ""
 
-        from pydantic import BaseModel
         from pydantic_ai import Agent
 
-        class TranscriptSummary(BaseModel):
-            summary: str  # 2-3 sentence summary of the voice call
-
-        summarize_agent = Agent(
-            Models.haiku(),
-            output_type=TranscriptSummary,
-            system_prompt="""You are a voice call summarizer. Given a transcript between a user and Nikita (an AI girlfriend), write a 2-3 sentence summary.
-
-Your summary should capture:
-1. What was discussed (main topics)
-2. The emotional tone (warm, tense, playful, vulnerable, etc.)
-3. Any commitments or plans mentioned
-
-Keep the summary concise and factual. Write in past tense from Nikita's perspective.
+        from nikita.llm.clients import get_agent
 
-Example: "The user shared news about completing a big work project. The tone was positive and celebratory. They made plans to celebrate together this weekend." """,
+        model = Models.haiku()
+        summarize_agent = get_agent(
+            ("voice_transcript_summary", model),
+            lambda: Agent(
+                model,
+                output_type=TranscriptSummary,
+                system_prompt=TRANSCRIPT_SUMMARY_PROMPT,
+            ),
         )
 
         try:
@@ -120,22 +120,24 @@ async def validate_agent_exists(
     """
     import httpx
 
+    from nikita.llm.clients import get_http_client
+
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"https://api.elevenlabs.io/v1/convai/agents/{agent_id}",
-                headers={"xi-api-key": api_key},
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                agent_name = data.get("name", "Unknown")
-                logger.info(f"✓ ElevenLabs: Agent '{agent_name}' exists ({agent_id})")
-                return True, None
-            elif response.status_code == 404:
-                return False, f"Agent {agent_id} not found in ElevenLabs"
-            else:
-                return False, f"Failed to verify agent: HTTP {response.status_code}"
+        response = await get_http_client("elevenlabs").get(
+            f"https://api.elevenlabs.io/v1/convai/agents/{agent_id}",
+            headers={"xi-api-key": api_key},
+            timeout=10.0,
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            agent_name = data.get("name", "Unknown")
+            logger.info(f"✓ ElevenLabs: Agent '{agent_name}' exists ({agent_id})")
+            return True, None
+        elif response.status_code == 404:
+            return False, f"Agent {agent_id} not found in ElevenLabs"
+        else:
+            return False, f"Failed to verify agent: HTTP {response.status_code}"
 
     except httpx.TimeoutException:
         return False, "Timeout while verifying agent (ElevenLabs API slow)"
@@ -158,33 +160,33 @@ async def validate_agent_has_tools(
     Returns:
         Tuple of (all_present, missing_tools)
     """
-    import httpx
+    from nikita.llm.clients import get_http_client
 
     if expected_tools is None:
         expected_tools = ["get_context", "get_memory", "score_turn", "update_memory"]
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"https://api.elevenlabs.io/v1/convai/agents/{agent_id}",
-                headers={"xi-api-key": api_key},
-            )
+        response = await get_http_client("elevenlabs").get(
+            f"https://api.elevenlabs.io/v1/convai/agents/{agent_id}",
+            headers={"xi-api-key": api_key},
+            timeout=10.0,
+        )
 
-            if response.status_code != 200:
-                return False, expected_tools
+        if response.status_code != 200:
+            return False, expected_tools
 
-            data = response.json()
-            tools = data.get("conversation_config", {}).get("agent", {}).get("prompt", {}).get("tools", [])
-            tool_names = [t.get("name") for t in tools]
+        data = response.json()
+        tools = data.get("conversation_config", {}).get("agent", {}).get("prompt", {}).get("tools", [])
+        tool_names = [t.get("name") for t in tools]
 
-            missing = [t for t in expected_tools if t not in tool_names]
+        missing = [t for t in expected_tools if t not in tool_names]
 
-            if missing:
-                logger.warning(f"[ElevenLabs] Agent {agent_id} missing tools: {missing}")
-                return False, missing
-            else:
-                logger.info(f"✓ ElevenLabs: Agent has all {len(expected_tools)} expected tools")
-                return True, []
+        if missing:
+            logger.warning(f"[ElevenLabs] Agent {agent_id} missing tools: {missing}")
+            return False, missing
+        else:
+            logger.info(f"✓ ElevenLabs: Agent has all {len(expected_tools)} expected tools")
+            return True, []
 
     except Exception as e:
         logger.warning(f"[ElevenLabs] Failed to check tools: {e}")
@@ -156,6 +156,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     import asyncio
     app.state._llm_probe_task = asyncio.create_task(_probe_llm())
 
+    # 5. Embedding cache warm-up — constant memory queries used by every
+    # prompt build and voice context load (background, like the LLM probe)
+    async def _warm_embeddings() -> None:
+        try:
+            from nikita.agents.voice.server_tools import CONTEXT_MEMORY_QUERY
+            from nikita.agents.voice.service import OPEN_THREADS_QUERY, RECENT_TOPICS_QUERY
+            from nikita.memory.supabase_memory import warm_embedding_cache
+            from nikita.pipeline.stages.prompt_builder import MEMORY_QUERIES
+
+            warmed = await warm_embedding_cache([
+                *MEMORY_QUERIES.values(),
+                CONTEXT_MEMORY_QUERY,
+                RECENT_TOPICS_QUERY,
+                OPEN_THREADS_QUERY,
+            ])
+            if warmed:
+                print(f"✓ Embedding cache warmed ({warmed} queries)")
+        except Exception as e:
+            print(f"⚠ Embedding cache warm-up failed: {e}")
+
+    app.state._embedding_warmup_task = asyncio.create_task(_warm_embeddings())
+
     yield
 
     # Shutdown
@@ -164,11 +186,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Cancel LLM probe if still running to avoid post-shutdown warnings
     if hasattr(app.state, "_llm_probe_task") and not app.state._llm_probe_task.done():
         app.state._llm_probe_task.cancel()
+    if hasattr(app.state, "_embedding_warmup_task") and not app.state._embedding_warmup_task.done():
+        app.state._embedding_warmup_task.cancel()
 
     # Close Telegram bot client
     if hasattr(app.state, "telegram_bot"):
         await app.state.telegram_bot.close()
 
+    # Close pooled HTTP / OpenAI clients shared across requests
+    from nikita.llm.clients import close_clients
+
+    await close_clients()
+
+    # Flush unflushed pipeline latency histograms before the pool goes away
+    from nikita.observability.latency import latency_recorder
+
+    await latency_recorder.flush()
+
     # Dispose engine connections
     if hasattr(app.state, "db_engine"):
         await app.state.db_engine.dispose()
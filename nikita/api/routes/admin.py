@@ -64,8 +64,10 @@ from nikita.db.models.user import User, UserMetrics, UserVicePreference
 from nikita.db.repositories.conversation_repository import ConversationRepository
 from nikita.db.repositories.engagement_repository import EngagementStateRepository
 from nikita.db.repositories.metrics_repository import UserMetricsRepository
+from nikita.db.repositories.pipeline_latency_repository import PipelineLatencyRepository
 from nikita.db.repositories.user_repository import UserRepository
 from nikita.db.repositories.vice_repository import VicePreferenceRepository
+from nikita.observability.latency import LatencyHistogram, latency_recorder
 
 router = APIRouter()
 
@@ -1581,6 +1583,19 @@ async def get_audit_logs(
 
 
 
+def _merge_latency_rows(rows, pending) -> dict[tuple[str, str], LatencyHistogram]:
+    """Merge flushed histogram rows with this instance's unflushed ones."""
+    merged: dict[tuple[str, str], LatencyHistogram] = {}
+    for row in rows:
+        hist = merged.setdefault((row.stage, row.component), LatencyHistogram())
+        hist.merge(
+            LatencyHistogram.from_row(row.buckets, row.sample_count, row.sum_ms, row.max_ms)
+        )
+    for key, hist in pending.items():
+        merged.setdefault(key, LatencyHistogram()).merge(hist)
+    return merged
+
+
 @router.get("/pipeline/timings")
 async def get_pipeline_timings(
     admin_id: Annotated[UUID, Depends(get_current_admin_user_id)],
@@ -1589,12 +1604,24 @@ async def get_pipeline_timings(
 ):
     """Get per-stage pipeline timing statistics (Spec 105).
 
-    Reads stage_timings from job_executions metadata and calculates
-    p50/p95/p99 latency percentiles per stage.
+    Merges the flushed per-stage latency histograms (plus this instance's
+    unflushed samples) and reads p50/p95/p99 off the buckets. Falls back to
+    sampling job_executions metadata when no histograms exist yet.
     """
-
     since = datetime.now(UTC) - timedelta(days=days)
 
+    rows = await PipelineLatencyRepository(session).get_since(since, component="total")
+    pending = {k: h for k, h in latency_recorder.pending().items() if k[1] == "total"}
+    merged = _merge_latency_rows(rows, pending)
+    if merged:
+        stats = {stage: hist.summary() for (stage, _), hist in merged.items()}
+        return {
+            "days": days,
+            "source": "histograms",
+            "samples": sum(h.count for h in merged.values()),
+            "stage_stats": stats,
+        }
+
     stmt = (
         select(JobExecution)
         .where(
@@ -1636,11 +1663,70 @@ async def get_pipeline_timings(
 
     return {
         "days": days,
+        "source": "job_executions",
         "jobs_analyzed": len(jobs),
         "stage_stats": stats,
     }
 
 
+@router.get("/pipeline/profile")
+async def get_pipeline_profile(
+    admin_id: Annotated[UUID, Depends(get_current_admin_user_id)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    hours: int = 24,
+    live: bool = False,
+):
+    """Break each stage's latency down into DB / LLM / embedding / render time.
+
+    Per stage: the wall-time distribution ("total") and, per component,
+    count/avg/p50/p95/p99 of the time charged to it in each run, plus "other"
+    (wall time not attributed to any component, e.g. Python work or waiting
+    on the shared session lock). Components are summed per run, so they can
+    exceed wall time when a stage overlaps calls.
+
+    Args:
+        hours: Window over flushed histograms.
+        live: Only this instance's unflushed samples (last ~minute).
+    """
+    rows = []
+    if not live:
+        since = datetime.now(UTC) - timedelta(hours=hours)
+        rows = await PipelineLatencyRepository(session).get_since(since)
+    merged = _merge_latency_rows(rows, latency_recorder.pending())
+
+    stages: dict[str, dict] = {}
+    for (stage, component), hist in merged.items():
+        stages.setdefault(stage, {})[component] = hist.summary()
+
+    # Slowest stages first (by mean wall time)
+    ordered = dict(
+        sorted(
+            stages.items(),
+            key=lambda item: item[1].get("total", {}).get("avg_ms", 0.0),
+            reverse=True,
+        )
+    )
+    return {
+        "hours": None if live else hours,
+        "live": live,
+        "stages": ordered,
+    }
+
+
+@router.get("/memory/embedding-cache")
+async def get_embedding_cache_stats(
+    admin_id: Annotated[UUID, Depends(get_current_admin_user_id)],
+):
+    """Embedding cache hit rates for this instance since startup.
+
+    memory_hits are served by the in-process LRU, db_hits by the
+    embedding_cache table; misses went to the OpenAI API.
+    """
+    from nikita.memory.embedding_cache import embedding_cache
+
+    return embedding_cache.stats()
+
+
 @router.get("/analytics/engagement")
 async def get_engagement_analytics(
     admin_id: Annotated[UUID, Depends(get_current_admin_user_id)],
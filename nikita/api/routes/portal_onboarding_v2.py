@@ -870,7 +870,6 @@ async def _run_completion_side_effects(
             saturday_morning_val=saturday_morning_val,
             backstory_preview_val=backstory_preview_val,
         )
-        token_estimate = len(prompt_text) // 4  # rough 4-chars/token approximation
         # Per-platform isolation: each platform gets its own session so a DB error
         # on one platform (InFailedSQLTransactionError, constraint violation, etc.)
         # cannot poison the connection used by the other platform (GH #638 contract).
@@ -882,7 +881,7 @@ async def _run_completion_side_effects(
                         user_id=user_id,
                         platform=platform,
                         prompt_text=prompt_text,
-                        token_count=token_estimate,
+                        # token_count omitted: set_current counts it (tiktoken)
                         pipeline_version="onboarding-bootstrap-b2",
                         generation_time_ms=0.0,
                     )
@@ -893,7 +892,7 @@ async def _run_completion_side_effects(
                     platform,
                 )
         logger.info(
-            "ready_prompts_bootstrapped user_id=%s tokens=%d", user_id, token_estimate
+            "ready_prompts_bootstrapped user_id=%s chars=%d", user_id, len(prompt_text)
         )
     except Exception:  # noqa: BLE001
         logger.exception(
@@ -4,10 +4,13 @@ These endpoints are called by pg_cron + Supabase Edge Functions:
 - POST /tasks/decay - Apply daily decay to all active users
 - POST /tasks/deliver - Process pending message deliveries
 - POST /tasks/summary - Generate daily summaries
+- POST /tasks/drain-work-queue - Run due durable work_jobs
+- POST /tasks/memory-compaction - Compact users' memory facts (nightly)
 
 AC Coverage: Phase 3 background task infrastructure
 """
 
+import asyncio
 import logging
 from datetime import UTC, datetime, time, timedelta
 from decimal import Decimal
@@ -21,7 +24,7 @@ logger = logging.getLogger(__name__)
 from nikita.agents.voice.scheduling_overrides import build_scheduled_outbound_override
 from nikita.config.models import Models
 from nikita.config.settings import get_settings
-from nikita.db.database import get_session_maker
+from nikita.db.database import DB_MAX_OVERFLOW, DB_POOL_SIZE, get_session_maker
 # SummaryRepoDep, UserRepoDep removed (DC-002 — unused in this module)
 from nikita.db.models.job_execution import JobName
 from nikita.db.repositories.job_execution_repository import JobExecutionRepository
@@ -29,6 +32,29 @@ from nikita.db.repositories.job_execution_repository import JobExecutionReposito
 # Spec 100 FR-003: Max concurrent pipelines for process-conversations
 MAX_CONCURRENT_PIPELINES: int = 10
 
+# Connections one pipeline can hold at its peak: the worker's session for the
+# whole run, ViceService's own session (vice stage) and the loader's isolated
+# summaries read (prompt_builder), which can overlap in the same wave.
+PIPELINE_PEAK_CONNECTIONS: int = 3
+
+# Pipelines running at once. The calling job's session stays checked out
+# alongside the workers; at peak they use at most pool_size plus half of
+# max_overflow, leaving the other half for webhook traffic on the instance.
+PIPELINE_WORKER_CONCURRENCY: int = max(
+    1,
+    min(
+        MAX_CONCURRENT_PIPELINES,
+        (DB_POOL_SIZE + DB_MAX_OVERFLOW // 2 - 1) // PIPELINE_PEAK_CONNECTIONS,
+    ),
+)
+
+# Per-conversation wall-clock cap; a timed-out conversation is marked failed
+PIPELINE_TIMEOUT_SECONDS: float = 240.0
+
+# After the first MAX_CONCURRENT_PIPELINES, keep draining the deferred tail
+# only while the tick is younger than this (pg_cron fires every minute)
+PIPELINE_DRAIN_BUDGET_SECONDS: float = 45.0
+
 router = APIRouter()
 
 
@@ -93,6 +119,8 @@ async def _generate_summary_with_llm(
 
         from pydantic_ai import Agent
 
+        from nikita.llm.clients import get_agent
+
         settings = get_settings()
         if not settings.anthropic_api_key:
             return _fallback_summary(conversations_data)
@@ -100,7 +128,8 @@ async def _generate_summary_with_llm(
         prompt = _build_summary_prompt(
             conversations_data, new_threads, nikita_thoughts, user_chapter
         )
-        agent = Agent(model=Models.haiku())
+        model = Models.haiku()
+        agent = get_agent(("daily_summary", model), lambda: Agent(model=model))
 
         # Timeout to prevent pg_cron job delays
         result = await asyncio.wait_for(agent.run(prompt), timeout=10.0)
@@ -710,6 +739,120 @@ async def cleanup_expired_registrations(
             return result
 
 
+async def _process_conversation_pipeline(conv_id, session_maker):
+    """Run the unified pipeline for one conversation in its own session.
+
+    Per-conversation session isolates failures so conv #3 crashing doesn't
+    cascade to #4-#50. Returns the PipelineResult, or None when the
+    conversation is missing or the run raised (already marked failed).
+
+    Raises:
+        TimeoutError: Propagated from the caller's wait_for; the
+            conversation is marked failed before re-raising.
+    """
+    from nikita.db.repositories.conversation_repository import ConversationRepository
+    from nikita.db.repositories.user_repository import UserRepository
+    from nikita.pipeline.orchestrator import PipelineOrchestrator
+
+    try:
+        async with session_maker() as conv_session:
+            conv_repo = ConversationRepository(conv_session)
+            conv = await conv_repo.get(conv_id)
+            if not conv:
+                return None
+
+            # BUG-001b fix: Load user state for pipeline context
+            user_repo = UserRepository(conv_session)
+            user = await user_repo.get(conv.user_id)
+
+            orchestrator = PipelineOrchestrator(conv_session)
+            result = await orchestrator.process(
+                conversation_id=conv_id,
+                user_id=conv.user_id,
+                platform=conv.platform or "text",
+                conversation=conv,
+                user=user,
+            )
+
+            # Mark conversation status based on pipeline outcome
+            if result.success:
+                ctx = result.context
+                await conv_repo.mark_processed(
+                    conversation_id=conv_id,
+                    summary=ctx.extraction_summary or None,
+                    emotional_tone=ctx.emotional_tone or None,
+                )
+            else:
+                await conv_repo.mark_failed(conv_id)
+
+            await conv_session.commit()
+            return result
+    except (Exception, asyncio.CancelledError) as e:
+        if isinstance(e, asyncio.CancelledError):
+            logger.warning(f"[PIPELINE] Timed out for conversation {conv_id}")
+        else:
+            logger.warning(f"[PIPELINE] Failed for conversation {conv_id}: {e}")
+        # Mark failed in a fresh session to avoid polluted transaction
+        try:
+            async with session_maker() as err_session:
+                err_repo = ConversationRepository(err_session)
+                await err_repo.mark_failed(conv_id)
+                await err_session.commit()
+        except Exception:
+            logger.error(f"[PIPELINE] Could not mark {conv_id} as failed")
+        if isinstance(e, asyncio.CancelledError):
+            raise
+        return None
+
+
+async def _run_pipeline_pool(conv_ids, session_maker):
+    """Process conversations with a bounded pool of pipeline workers.
+
+    PIPELINE_WORKER_CONCURRENCY workers pull from the queue. The first
+    MAX_CONCURRENT_PIPELINES conversations are always started; later ones
+    only while the tick is inside PIPELINE_DRAIN_BUDGET_SECONDS. Each run
+    is capped at PIPELINE_TIMEOUT_SECONDS.
+
+    Returns:
+        (pipeline_results, timed_out_count, deferred_count) where deferred
+        counts conversations never started this tick.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + PIPELINE_DRAIN_BUDGET_SECONDS
+    pending = list(conv_ids)
+    results = []
+    started = 0
+    timed_out = 0
+
+    async def worker() -> None:
+        nonlocal started, timed_out
+        while pending:
+            if started >= MAX_CONCURRENT_PIPELINES and loop.time() >= deadline:
+                return
+            conv_id = pending.pop(0)
+            started += 1
+            try:
+                result = await asyncio.wait_for(
+                    _process_conversation_pipeline(conv_id, session_maker),
+                    timeout=PIPELINE_TIMEOUT_SECONDS,
+                )
+            except TimeoutError:
+                timed_out += 1
+                continue
+            if result is not None:
+                results.append(result)
+
+    workers = min(PIPELINE_WORKER_CONCURRENCY, len(pending))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    if pending:
+        logger.info(
+            "pipeline_batch_limited total=%d started=%d deferred=%d",
+            len(conv_ids), started, len(pending),
+        )
+    return results, timed_out, len(pending)
+
+
 @router.post("/process-conversations")
 async def process_stale_conversations(
     _: None = Depends(verify_task_secret),
@@ -719,7 +862,8 @@ async def process_stale_conversations(
     Called by pg_cron every minute.
 
     Finds text conversations with no messages for 15+ minutes
-    and triggers the post-processing pipeline for each.
+    and triggers the post-processing pipeline for each, running up to
+    PIPELINE_WORKER_CONCURRENCY pipelines at once (see _run_pipeline_pool).
 
     Pipeline stages:
     1. Ingestion - Mark as processing
@@ -753,86 +897,17 @@ async def process_stale_conversations(
             )
             await session.commit()
 
-            # Spec 100 FR-003: Limit batch to MAX_CONCURRENT_PIPELINES per cycle
-            batch = queued_ids[:MAX_CONCURRENT_PIPELINES]
-            deferred_count = len(queued_ids) - len(batch)
-            if deferred_count > 0:
-                logger.info(
-                    "pipeline_batch_limited total=%d batch=%d deferred=%d",
-                    len(queued_ids), len(batch), deferred_count,
-                )
+            # Spec 042: Process each detected conversation through the unified
+            # pipeline. Spec 100 FR-003: MAX_CONCURRENT_PIPELINES are always
+            # processed; the deferred tail is drained while the tick has budget left
+            pipeline_results, timed_out, deferred_count = await _run_pipeline_pool(
+                queued_ids, session_maker
+            )
 
-            # Process each detected conversation through pipeline
-            # Feature flag: Unified pipeline (Spec 042) vs legacy post-processing (Spec 029)
-            settings = get_settings()
-
-            if settings.unified_pipeline_enabled:
-                # Spec 042: Use unified pipeline
-                from nikita.pipeline.orchestrator import PipelineOrchestrator
-                from nikita.db.repositories.conversation_repository import ConversationRepository
-
-                pipeline_results = []
-                for conv_id in batch:
-                    # Per-conversation session: isolate failures so conv #3 crash
-                    # doesn't cascade to #4-#50
-                    try:
-                        async with session_maker() as conv_session:
-                            conv_repo = ConversationRepository(conv_session)
-                            conv = await conv_repo.get(conv_id)
-                            if conv:
-                                # BUG-001b fix: Load user state for pipeline context
-                                from nikita.db.repositories.user_repository import UserRepository
-                                user_repo = UserRepository(conv_session)
-                                user = await user_repo.get(conv.user_id)
-
-                                orchestrator = PipelineOrchestrator(conv_session)
-                                result = await orchestrator.process(
-                                    conversation_id=conv_id,
-                                    user_id=conv.user_id,
-                                    platform=conv.platform or "text",
-                                    conversation=conv,
-                                    user=user,
-                                )
-                                pipeline_results.append(result)
-
-                                # Mark conversation status based on pipeline outcome
-                                if result.success:
-                                    ctx = result.context
-                                    await conv_repo.mark_processed(
-                                        conversation_id=conv_id,
-                                        summary=ctx.extraction_summary or None,
-                                        emotional_tone=ctx.emotional_tone or None,
-                                    )
-                                else:
-                                    await conv_repo.mark_failed(conv_id)
-
-                                await conv_session.commit()
-                    except Exception as e:
-                        logger.warning(f"[PIPELINE] Failed for conversation {conv_id}: {e}")
-                        # Mark failed in a fresh session to avoid polluted transaction
-                        try:
-                            async with session_maker() as err_session:
-                                err_repo = ConversationRepository(err_session)
-                                await err_repo.mark_failed(conv_id)
-                                await err_session.commit()
-                        except Exception:
-                            logger.error(f"[PIPELINE] Could not mark {conv_id} as failed")
-
-                # Count successes, pipeline failures, and non-critical stage errors (MP-006)
-                processed_count = sum(1 for r in pipeline_results if r.success)
-                failed_ids = [str(r.context.conversation_id) for r in pipeline_results if not r.success]
-                stage_errors_count = sum(len(r.context.stage_errors) for r in pipeline_results)
-            else:
-                # Spec 043 T2.1: Legacy branch is dead code since pipeline is now enabled
-                # by default (Spec 043 T1.1). If someone explicitly disables the flag,
-                # log an error instead of silently skipping.
-                # Rollback: Set UNIFIED_PIPELINE_ENABLED=false in Cloud Run env vars
-                logger.error(
-                    "unified_pipeline_disabled_but_no_legacy_fallback "
-                    "conversations_skipped=%d", len(batch)
-                )
-                processed_count = 0
-                failed_ids = [str(cid) for cid in batch]
+            # Count successes, pipeline failures, and non-critical stage errors (MP-006)
+            processed_count = sum(1 for r in pipeline_results if r.success)
+            failed_ids = [str(r.context.conversation_id) for r in pipeline_results if not r.success]
+            stage_errors_count = sum(len(r.context.stage_errors) for r in pipeline_results)
 
             result = {
                 "status": "ok",
@@ -840,6 +915,7 @@ async def process_stale_conversations(
                 "processed": processed_count,
                 "failed": len(failed_ids),
                 "deferred": deferred_count,
+                "timed_out": timed_out,
                 "stage_errors": stage_errors_count,  # MP-006: non-critical stage failures
             }
 
@@ -860,6 +936,59 @@ async def process_stale_conversations(
             return result
 
 
+@router.post("/drain-work-queue")
+async def drain_work_queue(
+    _: None = Depends(verify_task_secret),
+):
+    """Claim and run due jobs from the durable work queue.
+
+    Called by pg_cron every minute. Instances also kick an in-process
+    drain right after enqueueing, so this mostly picks up retries and
+    jobs whose worker died (expired lease).
+
+    Returns:
+        Dict with status, drain counts, and queue depth by status.
+    """
+    settings = get_settings()
+    if not settings.work_queue_enabled:
+        return {"status": "skipped", "reason": "work_queue_enabled=false"}
+
+    from nikita.db.repositories.work_job_repository import WorkJobRepository
+    from nikita.tasks.work_queue import drain
+
+    session_maker = get_session_maker()
+    async with session_maker() as session:
+        job_repo = JobExecutionRepository(session)
+        execution = await job_repo.start_execution(JobName.DRAIN_WORK_QUEUE.value)
+        await session.commit()
+
+        try:
+            stats = await drain()
+            queue = await WorkJobRepository(session).count_by_status()
+
+            result = {"status": "ok", **stats, "queue": queue}
+            await job_repo.complete_execution(execution.id, result=result)
+            await session.commit()
+
+            if stats["claimed"]:
+                logger.info(
+                    "[WORK-QUEUE] Drained %d jobs: %d completed, %d retried, %d dead",
+                    stats["claimed"],
+                    stats["completed"],
+                    stats["retried"],
+                    stats["dead"],
+                )
+
+            return result
+
+        except Exception as e:
+            logger.error(f"[WORK-QUEUE] Drain error: {e}", exc_info=True)
+            result = {"status": "error", "error": str(e)}
+            await job_repo.fail_execution(execution.id, result=result)
+            await session.commit()
+            return result
+
+
 @router.post("/psyche-batch")
 async def run_psyche_batch_job(
     _: None = Depends(verify_task_secret),
@@ -916,6 +1045,64 @@ async def run_psyche_batch_job(
             return result
 
 
+@router.post("/memory-compaction")
+async def compact_memory_facts(
+    _: None = Depends(verify_task_secret),
+):
+    """Compact memory facts of users with new facts (nikita.memory.compaction).
+
+    Called by pg_cron nightly. Merges near-duplicate facts, retires old
+    low-confidence facts, deletes long-superseded rows and records a
+    memory_compaction_runs row per user.
+
+    Returns:
+        Dict with status and run totals.
+    """
+    settings = get_settings()
+    if not settings.memory_compaction_enabled:
+        return {"status": "skipped", "reason": "memory_compaction_enabled=false"}
+
+    session_maker = get_session_maker()
+    async with session_maker() as session:
+        job_repo = JobExecutionRepository(session)
+
+        # Idempotency guard: a retried cron tick must not run a second pass
+        if await job_repo.has_recent_execution(
+            JobName.MEMORY_COMPACTION.value, window_minutes=60
+        ):
+            return {"status": "skipped", "reason": "already_executed_recently"}
+
+        execution = await job_repo.start_execution(JobName.MEMORY_COMPACTION.value)
+        await session.commit()
+
+        try:
+            from nikita.memory.compaction import run_memory_compaction
+
+            totals = await run_memory_compaction()
+
+            result = {"status": "ok", **totals}
+            await job_repo.complete_execution(execution.id, result=result)
+            await session.commit()
+
+            logger.info(
+                "[MEMORY-COMPACTION] %d users: %d facts merged, %d retired, %d deleted, %d failed",
+                totals["users"],
+                totals["facts_merged"],
+                totals["low_confidence_retired"],
+                totals["superseded_deleted"],
+                totals["failed"],
+            )
+
+            return result
+
+        except Exception as e:
+            logger.error(f"[MEMORY-COMPACTION] Error: {e}", exc_info=True)
+            result = {"status": "error", "error": str(e)}
+            await job_repo.fail_execution(execution.id, result=result)
+            await session.commit()
+            return result
+
+
 @router.post("/refresh-voice-prompts")
 async def refresh_voice_prompts(
     _: None = Depends(verify_task_secret),
@@ -21,8 +21,8 @@ from nikita.agents.voice.availability import get_availability_service
 from nikita.agents.voice.models import ServerToolName, ServerToolRequest
 from nikita.agents.voice.server_tools import get_server_tool_handler
 from nikita.agents.voice.service import get_voice_service
-from nikita.config.settings import get_settings
 from nikita.api.middleware.rate_limit import voice_rate_limit
+from nikita.config.settings import get_settings
 from nikita.utils.masking import mask_phone
 
 logger = logging.getLogger(__name__)
@@ -215,7 +215,7 @@ async def check_availability(user_id: UUID) -> AvailabilityResponse:
 )
 async def get_signed_url(user_id: UUID, _rl=Depends(voice_rate_limit)) -> dict:
     """Generate ElevenLabs signed URL for frontend widget with full personalization."""
-    import httpx
+    from nikita.llm.clients import get_http_client
 
     logger.info(f"[VOICE API] Signed URL request for user {user_id}")
 
@@ -236,22 +236,21 @@ async def get_signed_url(user_id: UUID, _rl=Depends(voice_rate_limit)) -> dict:
                 raise HTTPException(status_code=400, detail=str(e))
 
         # Call ElevenLabs API for signed URL
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.elevenlabs.io/v1/convai/conversation/get-signed-url",
-                params={"agent_id": settings.elevenlabs_default_agent_id},
-                headers={"xi-api-key": settings.elevenlabs_api_key},
-                timeout=10.0,
-            )
+        response = await get_http_client("elevenlabs").get(
+            "https://api.elevenlabs.io/v1/convai/conversation/get-signed-url",
+            params={"agent_id": settings.elevenlabs_default_agent_id},
+            headers={"xi-api-key": settings.elevenlabs_api_key},
+            timeout=10.0,
+        )
 
-            if response.status_code != 200:
-                logger.error(f"[VOICE API] ElevenLabs API error: {response.text}")
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to get signed URL from ElevenLabs",
-                )
+        if response.status_code != 200:
+            logger.error(f"[VOICE API] ElevenLabs API error: {response.text}")
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to get signed URL from ElevenLabs",
+            )
 
-            data = response.json()
+        data = response.json()
 
         logger.info(
             f"[VOICE API] Signed URL generated for user {user_id}, "
@@ -762,11 +761,11 @@ async def _process_webhook_event(event_data: dict) -> dict:
                         # Uses details.zone == "critical" (temperature-based), consistent with
                         # text path at scoring/service.py:316. Not a raw relationship_score threshold.
                         try:
+                            from nikita.conflicts.models import ConflictDetails
                             from nikita.conflicts.persistence import (
                                 load_conflict_details,
                                 save_conflict_details,
                             )
-                            from nikita.conflicts.models import ConflictDetails
 
                             raw_details = await load_conflict_details(user_id, session)
                             details = ConflictDetails.from_jsonb(raw_details) if raw_details else ConflictDetails()
@@ -794,39 +793,66 @@ async def _process_webhook_event(event_data: dict) -> dict:
                 # NOTE: PostProcessor deprecated (Spec 042), only use unified pipeline
                 settings = get_settings()
                 pipeline_result = None
+                pipeline_job_queued = False
                 if settings.unified_pipeline_enabled:
                     try:
-                        from nikita.pipeline.orchestrator import PipelineOrchestrator
-
-                        orchestrator = PipelineOrchestrator(session)
-
-                        # Spec 051: Run pipeline async to avoid webhook timeout
+                        # Spec 051: Run pipeline off the webhook path
                         # Voice pipeline can take 30-60s (memory queries, LLM calls)
                         # ElevenLabs webhooks timeout at 30s
                         import asyncio
 
-                        async def run_pipeline():
-                            """Run pipeline in background without blocking webhook response."""
+                        from nikita.pipeline.orchestrator import PipelineOrchestrator
+
+                        if settings.work_queue_enabled:
+                            from nikita.db.models.work_job import WorkJobKind
+                            from nikita.tasks.work_queue import enqueue
+
+                            # Commits with the score/crisis updates below; the
+                            # savepoint keeps a queue error from poisoning them.
                             try:
-                                result = await orchestrator.process(
-                                    conversation_id=conversation_db_id,
-                                    user_id=user_id,
-                                    platform="voice",
-                                    conversation=conversation,
-                                    user=user,
-                                )
-                                logger.info(
-                                    f"[WEBHOOK] Pipeline completed async: "
-                                    f"success={result.success}, stages={len(result.stage_timings)}"
-                                )
+                                async with session.begin_nested():
+                                    await enqueue(
+                                        WorkJobKind.PIPELINE_RUN,
+                                        {
+                                            "conversation_id": str(conversation_db_id),
+                                            "user_id": str(user_id),
+                                            "platform": "voice",
+                                        },
+                                        session=session,
+                                        dedupe_key=f"pipeline_run:{conversation_db_id}",
+                                    )
+                                pipeline_job_queued = True
                             except Exception as e:
-                                logger.error(f"[WEBHOOK] Async pipeline error: {e}", exc_info=True)
+                                logger.warning(
+                                    f"[WEBHOOK] Pipeline enqueue failed, running in-process: {e}"
+                                )
 
-                        # Create task without awaiting (non-blocking)
-                        asyncio.create_task(run_pipeline())
+                        if not pipeline_job_queued:
+                            orchestrator = PipelineOrchestrator(session)
+
+                            async def run_pipeline():
+                                """Run pipeline in background without blocking webhook response."""
+                                try:
+                                    result = await orchestrator.process(
+                                        conversation_id=conversation_db_id,
+                                        user_id=user_id,
+                                        platform="voice",
+                                        conversation=conversation,
+                                        user=user,
+                                    )
+                                    logger.info(
+                                        f"[WEBHOOK] Pipeline completed async: "
+                                        f"success={result.success}, stages={len(result.stage_timings)}"
+                                    )
+                                except Exception as e:
+                                    logger.error(f"[WEBHOOK] Async pipeline error: {e}", exc_info=True)
+
+                            # Create task without awaiting (non-blocking)
+                            asyncio.create_task(run_pipeline())
 
                         logger.info(
-                            f"[WEBHOOK] Pipeline scheduled async for conversation {conversation_db_id}"
+                            f"[WEBHOOK] Pipeline scheduled for conversation {conversation_db_id} "
+                            f"(queued={pipeline_job_queued})"
                         )
 
                     except Exception as e:
@@ -834,6 +860,11 @@ async def _process_webhook_event(event_data: dict) -> dict:
 
                 await session.commit()
 
+                if pipeline_job_queued:
+                    from nikita.tasks.work_queue import kick_drain
+
+                    kick_drain()
+
                 # Build response (pipeline runs async, no result available yet)
                 return {
                     "status": "processed",
@@ -4,7 +4,7 @@ from functools import lru_cache
 from typing import Literal
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -78,6 +78,95 @@ class Settings(BaseSettings):
         le=1.0,
     )
 
+    # Memory vector search (partial HNSW index idx_memory_facts_embedding_hnsw).
+    # ef_search / iterative_scan are applied per connection (asyncpg
+    # server_settings); overfetch raises ef_search for a single search.
+    memory_hnsw_ef_search: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="pgvector hnsw.ef_search for memory searches: candidates kept per index scan (higher = better recall, slower).",
+    )
+    memory_hnsw_iterative_scan: Literal["off", "relaxed_order", "strict_order"] = Field(
+        default="relaxed_order",
+        description="pgvector >= 0.8 hnsw.iterative_scan: keep scanning the index until per-user filters leave enough rows. Ignored by older pgvector.",
+    )
+    memory_search_overfetch: int = Field(
+        default=4,
+        ge=1,
+        le=50,
+        description="Raise hnsw.ef_search to at least limit x this factor for one search, so rows dropped by the user/confidence filters after the index scan do not starve the results.",
+    )
+
+    # Hybrid memory retrieval for the recall tools (SupabaseMemory.search with
+    # hybrid=True): full-text search on memory_facts.fact_tsv fused with the
+    # vector search by reciprocal rank.
+    memory_hybrid_search_enabled: bool = Field(
+        default=True,
+        description="Fuse full-text and vector results for recall_memory / voice memory queries. Rollback: MEMORY_HYBRID_SEARCH_ENABLED=false",
+    )
+    memory_lexical_fast_path_min_hits: int = Field(
+        default=2,
+        ge=0,
+        description="Skip the embedding call and vector search when at least min(limit, this) facts match every query term. 0 disables the fast path.",
+    )
+
+    # Per-turn memory prefetch (nikita/agents/text/prefetch.py): the text
+    # agent starts the recall_memory search on the user message while the
+    # prompt is built, and the tool reuses it for similar queries.
+    memory_prefetch_enabled: bool = Field(
+        default=True,
+        description="Prefetch recall_memory results for each text turn. Rollback: MEMORY_PREFETCH_ENABLED=false",
+    )
+    memory_prefetch_min_overlap: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Share of a recall_memory query's content words that must occur in the user message for the prefetched results to be used.",
+    )
+
+    # Nightly memory compaction (POST /tasks/memory-compaction,
+    # nikita/memory/compaction.py)
+    memory_compaction_enabled: bool = Field(
+        default=True,
+        description="Merge near-duplicate memory facts, retire old low-confidence facts and delete long-superseded ones nightly. Rollback: MEMORY_COMPACTION_ENABLED=false",
+    )
+    memory_compaction_min_confidence: float = Field(
+        default=0.3,
+        ge=0.0,
+        le=1.0,
+        description="Active memory facts below this confidence are deactivated by compaction once 30 days old.",
+    )
+    memory_compaction_superseded_retention_days: int = Field(
+        default=30,
+        ge=1,
+        description="Days a superseded memory fact (superseded_by set) is kept before compaction deletes it. Facts deactivated without a replacement are never deleted.",
+    )
+
+    # Memory embedding storage (memory_facts.embedding_compact, halfvec(512)).
+    # The compact vector is the full text-embedding-3 vector shortened to 512
+    # dims (what the API's `dimensions` parameter returns) stored as float16:
+    # ~1 KB per vector instead of ~6 KB. Rollout: full → dual (new facts get
+    # both) → run scripts/backfill_compact_embeddings.py → compact.
+    memory_embedding_storage: Literal["full", "dual", "compact"] = Field(
+        default="full",
+        description="Which memory_facts embedding column facts are written to and searched: full (vector(1536)), dual (write both, search full) or compact (write both, search halfvec(512)). Rollback: MEMORY_EMBEDDING_STORAGE=full",
+    )
+    # Dedup threshold for compact vectors. Shortened embeddings spread
+    # similarities differently, so this is calibrated separately against the
+    # labeled pairs in tests/fixtures/memory_dedup_pairs.yaml with
+    # scripts/calibrate_dedup_threshold.py --record; change both together.
+    # Unset until that calibration is recorded: compact dedup (and the
+    # compaction clustering built on it) supersedes and deletes facts, so
+    # compact storage is refused without a calibrated threshold.
+    memory_compact_dedup_similarity_threshold: float | None = Field(
+        default=None,
+        description="Cosine similarity threshold for memory fact deduplication when memory_embedding_storage=compact. "
+                    "Calibrated with scripts/calibrate_dedup_threshold.py; required for compact storage.",
+        ge=0.0,
+        le=1.0,
+    )
+
     # ElevenLabs - Voice Agent (Spec 007)
     elevenlabs_api_key: str | None = Field(default=None, description="ElevenLabs API key")
     elevenlabs_default_agent_id: str | None = Field(
@@ -244,6 +333,10 @@ class Settings(BaseSettings):
         default=True,
         description="Enable pipeline event emission (EventEmitter). When OFF, NullEmitter used — zero overhead. Rollback: OBSERVABILITY_ENABLED=false",
     )
+    observability_low_overhead: bool = Field(
+        default=False,
+        description="Build stage event payloads from PipelineContext's write log instead of before/after snapshots. Opt-in: set OBSERVABILITY_LOW_OVERHEAD=true. Rollback: OBSERVABILITY_LOW_OVERHEAD=false",
+    )
 
     # Vice Pipeline (Spec 114, GE-006)
     vice_pipeline_enabled: bool = Field(
@@ -263,6 +356,26 @@ class Settings(BaseSettings):
         description="Canary rollout percentage (0-100). Uses hash(user_id) for deterministic sampling.",
     )
 
+    # Pipeline stage output cache (pipeline_stage_cache table)
+    pipeline_stage_cache_enabled: bool = Field(
+        default=True,
+        description="Replay stored extraction/summary outputs when a pipeline is retried over unchanged conversation content. Rollback: PIPELINE_STAGE_CACHE_ENABLED=false",
+    )
+    prompt_section_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse rendered system prompt sections (and their token counts) whose template inputs are unchanged. Rollback: PROMPT_SECTION_CACHE_ENABLED=false",
+    )
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        description="Serve repeated memory embeddings from an in-process LRU backed by the embedding_cache table instead of the OpenAI API. Rollback: EMBEDDING_CACHE_ENABLED=false",
+    )
+
+    # Durable work queue (work_jobs table, drained by /tasks/drain-work-queue)
+    work_queue_enabled: bool = Field(
+        default=True,
+        description="Persist background pipeline + onboarding work as work_jobs rows instead of in-process asyncio tasks. Rollback: WORK_QUEUE_ENABLED=false (fire-and-forget create_task).",
+    )
+
     # Response Timing v2 (Spec 210) — log-normal × chapter × momentum
     # Module-level constants in nikita/agents/text/timing.py and
     # nikita/agents/text/conversation_rhythm.py are canonical; this flag
@@ -298,6 +411,19 @@ class Settings(BaseSettings):
         ),
     )
 
+    @model_validator(mode="after")
+    def _require_calibrated_compact_threshold(self) -> "Settings":
+        if (
+            self.memory_embedding_storage == "compact"
+            and self.memory_compact_dedup_similarity_threshold is None
+        ):
+            raise ValueError(
+                "memory_embedding_storage=compact needs a calibrated "
+                "memory_compact_dedup_similarity_threshold "
+                "(scripts/calibrate_dedup_threshold.py --record)"
+            )
+        return self
+
     def is_unified_pipeline_enabled_for_user(self, user_id: str | UUID) -> bool:
         """Check if unified pipeline is enabled for a specific user.
 
@@ -14,14 +14,24 @@ from collections.abc import AsyncGenerator
 from functools import lru_cache
 
 from sqlalchemy import text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from supabase import AsyncClient, create_async_client
 
 from nikita.config.settings import get_settings
+from nikita.observability.profiler import install_db_hooks
 
 logger = logging.getLogger(__name__)
 
+# T11: Pool sizing. Exposed so background workers can size their concurrency
+# against the connections actually available.
+DB_POOL_SIZE = 5
+DB_MAX_OVERFLOW = 10
+
+# Per-stage DB time for the pipeline profiler (clock reads only, all engines)
+install_db_hooks(Engine)
+
 
 def _build_connect_args(settings) -> dict:
     """Build asyncpg connect_args dict (factored for testability — GH #359).
@@ -31,13 +41,16 @@ def _build_connect_args(settings) -> dict:
         Includes statement_cache disabling (Supavisor-required) plus
         server_settings.statement_timeout (replaces the greenlet-unsafe
         @event.listens_for sync cursor.execute("SET statement_timeout") block
-        that was removed for GH #359).
+        that was removed for GH #359) and the pgvector HNSW search settings.
     """
     return {
         "statement_cache_size": 0,
         "prepared_statement_cache_size": 0,
         "server_settings": {
             "statement_timeout": f"{settings.db_statement_timeout_ms}",
+            # Memory fact ANN search tuning (idx_memory_facts_embedding_hnsw)
+            "hnsw.ef_search": f"{settings.memory_hnsw_ef_search}",
+            "hnsw.iterative_scan": settings.memory_hnsw_iterative_scan,
         },
     }
 
@@ -61,8 +74,8 @@ def get_async_engine():
         settings.database_url,
         echo=settings.debug,
         # AC-T11.1: pool_size=5, max_overflow=15 (total max 20)
-        pool_size=5,
-        max_overflow=10,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
         # AC-T11.2: pool_timeout=30 seconds
         pool_timeout=30,
         # BKD-002: pool_recycle=300s (was 1800s); reduced to 5 min for scale-to-zero.
@@ -84,7 +97,6 @@ def get_async_engine():
         # asyncpg connection time (works under Supavisor session pooling).
         connect_args=_build_connect_args(settings),
     )
-
     return engine
 
 
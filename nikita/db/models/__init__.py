@@ -4,15 +4,19 @@ from nikita.db.models.audit_log import AuditLog
 from nikita.db.models.base import Base
 from nikita.db.models.error_log import ErrorLevel, ErrorLog
 from nikita.db.models.context import ConversationThread, NikitaThought
-from nikita.db.models.conversation import Conversation
+from nikita.db.models.conversation import Conversation, ConversationMessage
 from nikita.db.models.engagement import EngagementHistory, EngagementState
 from nikita.db.models.game import DailySummary, ScoreHistory
 from nikita.db.models.generated_prompt import GeneratedPrompt
+from nikita.db.models.embedding_cache import EmbeddingCacheEntry
+from nikita.db.models.memory_compaction import MemoryCompactionRun
 from nikita.db.models.memory_fact import MemoryFact
 from nikita.db.models.ready_prompt import ReadyPrompt
 from nikita.db.models.job_execution import JobExecution, JobName, JobStatus
 from nikita.db.models.narrative_arc import UserNarrativeArc
 from nikita.db.models.pending_registration import PendingRegistration
+from nikita.db.models.pipeline_latency import PipelineLatencyHistogram
+from nikita.db.models.pipeline_stage_cache import PipelineStageCache
 from nikita.db.models.telegram_signup_session import TelegramSignupSession
 from nikita.db.models.profile import (
     OnboardingState,
@@ -26,6 +30,7 @@ from nikita.db.models.scheduled_event import EventPlatform, EventStatus, EventTy
 from nikita.db.models.scheduled_touchpoint import ScheduledTouchpoint
 from nikita.db.models.social_circle import UserSocialCircle
 from nikita.db.models.user import User, UserMetrics, UserVicePreference
+from nikita.db.models.work_job import WorkJob, WorkJobKind, WorkJobStatus
 
 
 def __getattr__(name: str):
@@ -47,6 +52,7 @@ __all__ = [
     "UserSocialCircle",
     "UserVicePreference",
     "Conversation",
+    "ConversationMessage",
     "ScoreHistory",
     "DailySummary",
     "PendingRegistration",
@@ -58,10 +64,14 @@ __all__ = [
     "EngagementHistory",
     "GeneratedPrompt",
     "MemoryFact",
+    "MemoryCompactionRun",
+    "EmbeddingCacheEntry",
     "ReadyPrompt",
     "JobExecution",
     "JobName",
     "JobStatus",
+    "PipelineLatencyHistogram",
+    "PipelineStageCache",
     "UserProfile",
     "UserBackstory",
     "VenueCache",
@@ -73,4 +83,7 @@ __all__ = [
     "EventType",
     "ScheduledTouchpoint",
     "PsycheStateRecord",
+    "WorkJob",
+    "WorkJobKind",
+    "WorkJobStatus",
 ]
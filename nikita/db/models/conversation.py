@@ -1,6 +1,6 @@
 """Conversation-related database models."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -14,9 +14,12 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    func,
 )
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from nikita.db.models.base import Base, TimestampMixin, UUIDMixin
@@ -50,14 +53,32 @@ class Conversation(Base, UUIDMixin, TimestampMixin):
         nullable=False,
     )  # 'telegram' | 'voice'
 
-    # Messages as JSONB array
+    # Legacy message storage: JSONB array in conversations.messages
     # Format: [{role: str, content: str, timestamp: str, analysis?: dict}]
-    messages: Mapped[list[dict[str, Any]]] = mapped_column(
+    # Written whole when a conversation is created with its messages (voice
+    # transcripts); appended messages go to conversation_messages instead,
+    # and scripts/backfill_conversation_messages.py moves old arrays there.
+    # Read `messages`, which merges both.
+    messages_json: Mapped[list[dict[str, Any]]] = mapped_column(
+        "messages",
         JSONB,
         default=list,
         nullable=False,
     )
 
+    # Appended messages, one row each (append-only, ordered by seq)
+    message_rows: Mapped[list["ConversationMessage"]] = relationship(
+        "ConversationMessage",
+        order_by="ConversationMessage.seq",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    # Number of messages (legacy JSONB + rows), i.e. the last message's seq.
+    # Lets callers size a conversation without loading its messages.
+    message_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
     # Scoring
     score_delta: Mapped[Decimal | None] = mapped_column(Numeric(5, 2), nullable=True)
 
@@ -126,29 +147,101 @@ class Conversation(Base, UUIDMixin, TimestampMixin):
         back_populates="source_conversation",
     )
 
+    @hybrid_property
+    def messages(self) -> list[dict[str, Any]]:
+        """All messages in order: the legacy JSONB array, then appended rows.
+
+        Message dicts have the JSONB format either way. Rows are only
+        included when loaded (they are eager-loaded with the conversation;
+        a conversation that was never loaded from the database has none).
+        """
+        legacy = self.messages_json or []
+        if "message_rows" in sa_inspect(self).unloaded:
+            return list(legacy)
+        return [*legacy, *(row.to_dict() for row in self.message_rows)]
+
+    @messages.inplace.setter
+    def _messages_setter(self, value: list[dict[str, Any]]) -> None:
+        """Set the JSONB messages (conversation creation)."""
+        self.messages_json = value
+        self.message_count = len(value or [])
+
+    @messages.inplace.expression
+    @classmethod
+    def _messages_expression(cls):
+        return cls.messages_json
+
     def add_message(
         self,
         role: str,
         content: str,
         analysis: dict[str, Any] | None = None,
     ) -> None:
-        """Add a message to the conversation."""
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.now().isoformat(),
+        """Add a message to the conversation.
+
+        Appends a conversation_messages row: one INSERT on flush instead of
+        rewriting the whole JSONB array. The content's tokens are counted
+        here, once, and stored with it.
+        """
+        from nikita.context.utils.token_counter import count_tokens
+
+        self.message_count = (self.message_count or 0) + 1
+        self.message_rows.append(
+            ConversationMessage(
+                seq=self.message_count,
+                role=role,
+                content=content,
+                analysis=analysis or None,
+                token_count=count_tokens(content),
+                created_at=datetime.now(UTC),
+            )
+        )
+
+
+class ConversationMessage(Base):
+    """One message of a conversation (append-only).
+
+    seq is the message's 1-based position in Conversation.messages, so it
+    continues after the legacy JSONB messages of the conversation.
+    """
+
+    __tablename__ = "conversation_messages"
+
+    conversation_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    role: Mapped[str] = mapped_column(Text, nullable=False)  # 'user' | 'nikita'
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    analysis: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    # tiktoken count of content, computed when the message is written
+    # (NULL until scripts/backfill_message_token_counts.py for older rows)
+    token_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """The message in conversations.messages JSONB format.
+
+        Includes token_count when it is known, for budget logic that would
+        otherwise count the content again.
+        """
+        message: dict[str, Any] = {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.created_at.isoformat() if self.created_at else None,
         }
-        if analysis:
-            message["analysis"] = analysis
-        # Defensive: ensure messages is a list (may be None for new objects)
-        current_messages = self.messages if self.messages is not None else []
-        # Use assignment (triggers SQLAlchemy dirty flag) instead of mutation (ignored)
-        self.messages = [*current_messages, message]
-
-    @property
-    def message_count(self) -> int:
-        """Get total number of messages."""
-        return len(self.messages) if self.messages else 0
+        if self.analysis:
+            message["analysis"] = self.analysis
+        if self.token_count is not None:
+            message["token_count"] = self.token_count
+        return message
 
 
 
@@ -0,0 +1,33 @@
+"""Persistent embedding cache (see nikita.memory.embedding_cache)."""
+
+from datetime import datetime
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from nikita.db.models.base import Base
+
+
+class EmbeddingCacheEntry(Base):
+    """One embedding vector for a (model, normalized text) pair.
+
+    Attributes:
+        model: Embedding model name (e.g. "text-embedding-3-small").
+        text_hash: SHA-256 of the model and whitespace-normalized text.
+        embedding: The vector returned by the embedding API.
+    """
+
+    __tablename__ = "embedding_cache"
+
+    model: Mapped[str] = mapped_column(String(64), primary_key=True)
+    text_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    embedding: Mapped[list[float]] = mapped_column(Vector(1536), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<EmbeddingCacheEntry {self.model} {self.text_hash[:12]}>"
@@ -30,6 +30,8 @@ class JobName(str, Enum):
     HEARTBEAT = "heartbeat"  # Spec 215 PR 215-D: Hourly heartbeat tick (FR-005 safety net)
     GENERATE_DAILY_ARCS = "generate_daily_arcs"  # Spec 215 PR 215-D: Daily-arc generation cron
     HANDOFF_GREETING_BACKSTOP = "handoff_greeting_backstop"  # Spec 214 T4.4: FR-11e backstop cron
+    DRAIN_WORK_QUEUE = "drain_work_queue"  # Durable work_jobs queue drain cron
+    MEMORY_COMPACTION = "memory_compaction"  # Nightly memory fact compaction cron
 
 
 class JobStatus(str, Enum):
@@ -0,0 +1,49 @@
+"""Per-user memory compaction stats (see nikita.memory.compaction)."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from nikita.db.models.base import Base, UUIDMixin
+
+
+class MemoryCompactionRun(Base, UUIDMixin):
+    """Outcome of compacting one user's memory facts.
+
+    Attributes:
+        user_id: Whose facts were compacted.
+        active_before: Active facts before the run.
+        active_after: Active facts after the run.
+        clusters_merged: Near-duplicate clusters collapsed into one fact.
+        facts_merged: Facts superseded by their cluster's canonical fact.
+        low_confidence_retired: Old low-confidence facts deactivated.
+        superseded_deleted: Long-superseded rows hard-deleted.
+        duration_ms: Wall time of the run.
+    """
+
+    __tablename__ = "memory_compaction_runs"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    active_before: Mapped[int] = mapped_column(Integer, nullable=False)
+    active_after: Mapped[int] = mapped_column(Integer, nullable=False)
+    clusters_merged: Mapped[int] = mapped_column(Integer, nullable=False)
+    facts_merged: Mapped[int] = mapped_column(Integer, nullable=False)
+    low_confidence_retired: Mapped[int] = mapped_column(Integer, nullable=False)
+    superseded_deleted: Mapped[int] = mapped_column(Integer, nullable=False)
+    duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("idx_memory_compaction_runs_user_created", "user_id", "created_at"),
+    )
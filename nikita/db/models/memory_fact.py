@@ -3,9 +3,9 @@
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Boolean, CheckConstraint, Float, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy import Boolean, CheckConstraint, Computed, Float, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -38,10 +38,36 @@ class MemoryFact(Base, UUIDMixin, TimestampMixin):
 
     confidence: Mapped[float] = mapped_column(Float, nullable=False)
 
-    # pgVector 1536-dim embedding (OpenAI text-embedding-3-small)
+    # pgVector 1536-dim embedding (OpenAI text-embedding-3-small).
+    # Deferred like embedding_compact: entity queries do not ship ~6 KB of
+    # vector per row; searches compute distances in SQL and callers that
+    # need the vectors undefer them (MemoryFactRepository with_embeddings)
+    # or select the columns (get_active_vectors). Reading an unloaded
+    # vector raises instead of lazy-loading.
     embedding: Mapped[list[float]] = mapped_column(
         Vector(1536),
         nullable=False,
+        deferred=True,
+        deferred_raiseload=True,
+    )
+
+    # Compact copy: first 512 dims of `embedding`, renormalized, as float16
+    # (memory_embedding_storage; NULL until written in dual/compact mode or
+    # backfilled)
+    embedding_compact: Mapped[list[float] | None] = mapped_column(
+        HALFVEC(512),
+        nullable=True,
+        deferred=True,
+        deferred_raiseload=True,
+    )
+
+    # Full-text search vector of `fact` (generated by Postgres; hybrid
+    # search in MemoryFactRepository.lexical_search)
+    fact_tsv: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', fact)", persisted=True),
+        nullable=True,
+        deferred=True,
     )
 
     # Python attr "fact_metadata" maps to DB column "metadata"
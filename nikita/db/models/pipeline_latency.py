@@ -0,0 +1,51 @@
+"""Pipeline latency histogram aggregates (see nikita.observability.latency)."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from nikita.db.models.base import Base, UUIDMixin
+
+
+class PipelineLatencyHistogram(Base, UUIDMixin):
+    """One flushed histogram for a (stage, component) over a time window.
+
+    Attributes:
+        window_start: Start of the in-process aggregation window.
+        window_end: When the window was flushed.
+        stage: Pipeline stage name.
+        component: "total" (stage wall time) or a profiler component
+            (db, llm, embedding, render, other).
+        sample_count: Samples in the window.
+        sum_ms: Sum of samples (for averages).
+        max_ms: Largest sample.
+        buckets: Sparse log-bucket counts {bucket_index: count}.
+    """
+
+    __tablename__ = "pipeline_latency_histograms"
+
+    window_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    window_end: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    stage: Mapped[str] = mapped_column(String(50), nullable=False)
+    component: Mapped[str] = mapped_column(String(20), nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    sum_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    max_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    buckets: Mapped[dict[str, int]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("idx_pipeline_latency_histograms_window_end", "window_end"),
+    )
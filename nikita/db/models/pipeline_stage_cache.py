@@ -0,0 +1,56 @@
+"""Pipeline stage output cache model.
+
+Persists the ctx writes of pure, expensive stages (LLM extraction and
+summary) so a retried or admin-triggered pipeline run over the same
+conversation content replays them instead of calling the LLM again.
+"""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from nikita.db.models.base import Base, TimestampMixin, UUIDMixin
+
+
+class PipelineStageCache(Base, UUIDMixin, TimestampMixin):
+    """Last successful output of one cacheable stage for one conversation.
+
+    Attributes:
+        conversation_id: Conversation the output was computed for.
+        stage_name: Pipeline stage name (e.g. "extraction").
+        stage_version: Stage's cache_version when the output was stored.
+        input_hash: SHA-256 of the conversation messages plus the stage's
+            other declared ctx reads.
+        output: The stage's declared ctx writes, JSON-encoded.
+    """
+
+    __tablename__ = "pipeline_stage_cache"
+
+    conversation_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    stage_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    stage_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    input_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    output: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    __table_args__ = (
+        # One row per (conversation, stage); upserts replace stale outputs
+        UniqueConstraint(
+            "conversation_id",
+            "stage_name",
+            name="uq_pipeline_stage_cache_conversation_stage",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PipelineStageCache {self.stage_name} v{self.stage_version} "
+            f"conv={self.conversation_id}>"
+        )
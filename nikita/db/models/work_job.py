@@ -0,0 +1,114 @@
+"""Durable work queue model (replaces fire-and-forget asyncio.create_task).
+
+Background work that used to run as in-memory tasks on the request
+instance (voice post-call pipeline, onboarding social circle + pipeline
+bootstrap) is persisted as a row here. Workers claim rows with
+SELECT ... FOR UPDATE SKIP LOCKED and hold a time-bounded lease, so work
+survives Cloud Run scale-to-zero and can be drained by any instance.
+"""
+
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from nikita.db.models.base import Base, TimestampMixin, UUIDMixin
+
+
+class WorkJobKind(StrEnum):
+    """Job kinds with a registered handler in nikita.tasks.work_queue."""
+
+    PIPELINE_RUN = "pipeline_run"
+    ONBOARDING_SOCIAL_CIRCLE = "onboarding_social_circle"
+    ONBOARDING_BOOTSTRAP_PIPELINE = "onboarding_bootstrap_pipeline"
+
+
+class WorkJobStatus(StrEnum):
+    """Lifecycle of a queued job.
+
+    pending -> running -> completed
+                       -> pending (retry, run_after pushed out)
+                       -> dead (max_attempts exhausted)
+    A running job whose lease expired is claimable again.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    DEAD = "dead"
+
+
+class WorkJob(Base, UUIDMixin, TimestampMixin):
+    """A unit of durable background work.
+
+    Attributes:
+        kind: Handler key (WorkJobKind value).
+        payload: JSON-serializable handler arguments.
+        status: WorkJobStatus value.
+        attempts: Number of times the job has been claimed.
+        max_attempts: Attempts before the job is marked dead.
+        run_after: Earliest time the job may be claimed (retry backoff).
+        locked_by: Worker id holding the lease.
+        locked_until: Lease expiry; expired running jobs are re-claimable.
+        dedupe_key: Optional idempotency key (e.g. webhook retries).
+        last_error: Error from the most recent failed attempt.
+        completed_at: When the job completed.
+    """
+
+    __tablename__ = "work_jobs"
+
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default=WorkJobStatus.PENDING.value,
+    )
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
+
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
+
+    locked_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    dedupe_key: Mapped[str | None] = mapped_column(
+        String(200),
+        nullable=True,
+        unique=True,
+    )
+
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    __table_args__ = (
+        # Claim query: pending/running rows ordered by run_after
+        Index(
+            "idx_work_jobs_claimable",
+            "run_after",
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<WorkJob {self.kind} {self.status} attempts={self.attempts}>"
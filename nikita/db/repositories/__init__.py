@@ -10,6 +10,11 @@ from nikita.db.repositories.metrics_repository import UserMetricsRepository
 from nikita.db.repositories.pending_registration_repository import (
     PendingRegistrationRepository,
 )
+from nikita.db.repositories.embedding_cache_repository import EmbeddingCacheRepository
+from nikita.db.repositories.pipeline_latency_repository import PipelineLatencyRepository
+from nikita.db.repositories.pipeline_stage_cache_repository import (
+    PipelineStageCacheRepository,
+)
 from nikita.db.repositories.profile_repository import (
     BackstoryRepository,
     OnboardingStateRepository,
@@ -21,10 +26,12 @@ from nikita.db.repositories.summary_repository import DailySummaryRepository
 from nikita.db.repositories.thread_repository import ConversationThreadRepository
 from nikita.db.repositories.scheduled_event_repository import ScheduledEventRepository
 from nikita.db.repositories.thought_repository import NikitaThoughtRepository
+from nikita.db.repositories.memory_compaction_repository import MemoryCompactionRepository
 from nikita.db.repositories.memory_fact_repository import MemoryFactRepository
 from nikita.db.repositories.ready_prompt_repository import ReadyPromptRepository
 from nikita.db.repositories.user_repository import UserRepository
 from nikita.db.repositories.vice_repository import VicePreferenceRepository
+from nikita.db.repositories.work_job_repository import WorkJobRepository
 
 __all__ = [
     "BaseRepository",
@@ -38,11 +45,16 @@ __all__ = [
     "ConversationThreadRepository",
     "NikitaThoughtRepository",
     "JobExecutionRepository",
+    "EmbeddingCacheRepository",
+    "PipelineLatencyRepository",
+    "PipelineStageCacheRepository",
     "ProfileRepository",
     "BackstoryRepository",
     "OnboardingStateRepository",
     "VenueCacheRepository",
     "ScheduledEventRepository",
     "MemoryFactRepository",
+    "MemoryCompactionRepository",
     "ReadyPromptRepository",
+    "WorkJobRepository",
 ]
@@ -9,10 +9,25 @@ from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Integer,
+    Text,
+    exists,
+    func,
+    insert,
+    literal,
+    null,
+    select,
+    text,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, raiseload
+from sqlalchemy.orm.util import identity_key
 
-from nikita.db.models.conversation import Conversation
+from nikita.db.models.conversation import Conversation, ConversationMessage
 from nikita.db.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
@@ -108,14 +123,64 @@ class ConversationRepository(BaseRepository[Conversation]):
         await self.session.refresh(conversation)
         return conversation
 
+    @staticmethod
+    def _append_message_stmt(
+        conversation_id: UUID,
+        role: str,
+        content: str,
+        analysis: dict[str, Any] | None,
+        token_count: int | None = None,
+    ):
+        """INSERT of the next message row that also bumps last_message_at.
+
+        The UPDATE (in a CTE) increments message_count and the new row takes
+        the incremented value as its seq. The increment is re-evaluated on
+        the locked row, so concurrent appends to one conversation queue on
+        the row lock and each gets the next seq. No row is returned when
+        the conversation does not exist.
+        """
+        conversations = Conversation.__table__
+        rows = ConversationMessage.__table__
+        touched = (
+            update(conversations)
+            .where(conversations.c.id == conversation_id)
+            .values(
+                last_message_at=func.now(),
+                message_count=conversations.c.message_count + 1,
+            )
+            .returning(conversations.c.id, conversations.c.message_count)
+            .cte("touched")
+        )
+        return (
+            insert(rows)
+            .from_select(
+                ["conversation_id", "seq", "role", "content", "analysis", "token_count"],
+                select(
+                    touched.c.id,
+                    touched.c.message_count,
+                    literal(role, Text),
+                    literal(content, Text),
+                    literal(analysis, JSONB) if analysis else null(),
+                    literal(token_count, Integer),
+                ),
+            )
+            .returning(rows.c.seq, rows.c.created_at)
+        )
+
     async def append_message(
         self,
         conversation_id: UUID,
         role: str,
         content: str,
         analysis: dict[str, Any] | None = None,
-    ) -> Conversation:
-        """Append a message to the conversation's JSONB messages.
+    ) -> ConversationMessage:
+        """Append a message to the conversation in one round trip.
+
+        A single INSERT ... SELECT adds the conversation_messages row, with
+        the content's token count, and sets last_message_at (see
+        _append_message_stmt). Nothing is loaded:
+        a Conversation already in the session does not see the new message
+        until reloaded, so callers use the returned message instead.
 
         Args:
             conversation_id: The conversation's UUID.
@@ -124,64 +189,136 @@ class ConversationRepository(BaseRepository[Conversation]):
             analysis: Optional analysis dict.
 
         Returns:
-            Updated Conversation entity.
+            The stored message (detached); its seq is the conversation's
+            new message count.
 
         Raises:
             ValueError: If conversation not found.
         """
-        conversation = await self.get(conversation_id)
-        if conversation is None:
+        from nikita.context.utils.token_counter import count_tokens
+
+        # Counted once here; history budgeting reads the stored count
+        token_count = count_tokens(content)
+        stmt = self._append_message_stmt(conversation_id, role, content, analysis, token_count)
+
+        try:
+            row = (await self.session.execute(stmt)).one_or_none()
+        except Exception as e:
+            # Session is in bad state (prepared/committed, background task
+            # scenario): run the same statement in a new session
+            if "prepared" not in str(e) and "committed" not in str(e):
+                raise
+            logger.warning(f"Session in bad state, creating new session: {e}")
+            row = await self._append_message_in_new_session(
+                conversation_id, stmt, role, content, analysis
+            )
+
+        if row is None:
             raise ValueError(f"Conversation {conversation_id} not found")
 
-        conversation.add_message(role, content, analysis)
-        conversation.last_message_at = datetime.now(UTC)
+        return ConversationMessage(
+            conversation_id=conversation_id,
+            seq=row.seq,
+            role=role,
+            content=content,
+            analysis=analysis or None,
+            token_count=token_count,
+            created_at=row.created_at,
+        )
 
-        # Handle session in 'prepared' or committed state (background task scenario)
-        # by creating a new session for this operation
+    async def _append_message_in_new_session(
+        self,
+        conversation_id: UUID,
+        stmt,
+        role: str,
+        content: str,
+        analysis: dict[str, Any] | None,
+    ):
+        """append_message fallback: same statement, new session, committed."""
         from nikita.db.database import get_session_maker
 
-        try:
-            await self.session.flush()
-            await self.session.refresh(conversation)
-            return conversation
-        except Exception as e:
-            # Session is in bad state (prepared/committed), use a new session
-            if "prepared" in str(e) or "committed" in str(e):
-                logger.warning(f"Session in bad state, creating new session: {e}")
-                session_maker = get_session_maker()
-                async with session_maker() as new_session:
-                    # Re-fetch and update with new session
-                    from sqlalchemy import select
-
-                    stmt = select(Conversation).where(Conversation.id == conversation_id)
-                    result = await new_session.execute(stmt)
-                    fresh_conversation = result.scalar_one_or_none()
-                    if fresh_conversation is None:
-                        # Race condition: conversation not yet committed, create new one
-                        logger.warning(
-                            f"Conversation {conversation_id} not found in fallback, "
-                            "creating new conversation entry"
-                        )
-                        fresh_conversation = Conversation(
-                            id=conversation_id,
-                            user_id=conversation.user_id,
-                            platform=conversation.platform,
-                            started_at=conversation.started_at,
-                            last_message_at=datetime.now(UTC),
-                            status="active",
-                            messages=[],  # Explicitly initialize to avoid None
-                            # Copy game state fields from original conversation
-                            # Default chapter_at_time to 1 if None (defensive)
-                            chapter_at_time=conversation.chapter_at_time or 1,
-                            is_boss_fight=conversation.is_boss_fight or False,
-                            score_delta=conversation.score_delta,
-                        )
-                        new_session.add(fresh_conversation)
-                    fresh_conversation.add_message(role, content, analysis)
-                    fresh_conversation.last_message_at = datetime.now(UTC)
-                    await new_session.commit()
-                    return fresh_conversation
-            raise
+        session_maker = get_session_maker()
+        async with session_maker() as new_session:
+            row = (await new_session.execute(stmt)).one_or_none()
+            if row is None:
+                # Race condition: the conversation was created in the bad
+                # session and never committed. Recreate it from the copy
+                # still in that session's identity map.
+                conversation = self.session.identity_map.get(
+                    identity_key(Conversation, conversation_id)
+                )
+                if not isinstance(conversation, Conversation):
+                    return None
+                logger.warning(
+                    f"Conversation {conversation_id} not found in fallback, "
+                    "creating new conversation entry"
+                )
+                fresh_conversation = Conversation(
+                    id=conversation_id,
+                    user_id=conversation.user_id,
+                    platform=conversation.platform,
+                    started_at=conversation.started_at,
+                    status="active",
+                    messages=[],  # Explicitly initialize to avoid None
+                    # Copy game state fields from original conversation
+                    # Default chapter_at_time to 1 if None (defensive)
+                    chapter_at_time=conversation.chapter_at_time or 1,
+                    is_boss_fight=conversation.is_boss_fight or False,
+                    score_delta=conversation.score_delta,
+                )
+                new_session.add(fresh_conversation)
+                await new_session.flush()
+                row = (await new_session.execute(stmt)).one_or_none()
+            await new_session.commit()
+            return row
+
+    async def get_recent_messages(
+        self,
+        conversation_id: UUID,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """The last `limit` messages of a conversation, oldest first.
+
+        Same dicts as Conversation.messages[-limit:], without loading the
+        rest: the newest conversation_messages rows by seq, topped up from
+        the end of the legacy JSONB array only when the rows do not fill
+        the window and legacy messages precede them (seq > 1).
+
+        Args:
+            conversation_id: The conversation's UUID.
+            limit: Maximum number of messages.
+
+        Returns:
+            Message dicts in conversation order.
+        """
+        if limit <= 0:
+            return []
+        result = await self.session.execute(
+            select(ConversationMessage)
+            .where(ConversationMessage.conversation_id == conversation_id)
+            .order_by(ConversationMessage.seq.desc())
+            .limit(limit)
+        )
+        rows = list(result.scalars().all())
+        messages = [row.to_dict() for row in reversed(rows)]
+
+        missing = limit - len(rows)
+        if missing > 0 and (not rows or rows[-1].seq > 1):
+            legacy = await self.session.execute(
+                text(
+                    """
+                    SELECT e.value
+                    FROM conversations c,
+                         jsonb_array_elements(c.messages) WITH ORDINALITY AS e(value, ord)
+                    WHERE c.id = :conversation_id
+                      AND e.ord > jsonb_array_length(c.messages) - :missing
+                    ORDER BY e.ord
+                    """
+                ).columns(value=JSONB),
+                {"conversation_id": conversation_id, "missing": missing},
+            )
+            messages[:0] = legacy.scalars().all()
+        return messages
 
     async def get_recent(
         self,
@@ -253,7 +390,7 @@ class ConversationRepository(BaseRepository[Conversation]):
 
         Note: Full-text search on search_vector requires the tsvector
         column and index to be set up in the migration. This is a
-        placeholder that searches in JSONB messages.
+        placeholder that searches in JSONB messages and message rows.
 
         Args:
             user_id: The user's UUID.
@@ -267,15 +404,110 @@ class ConversationRepository(BaseRepository[Conversation]):
         from sqlalchemy import cast, String
         from sqlalchemy.dialects.postgresql import JSONB
 
+        in_rows = exists().where(
+            ConversationMessage.conversation_id == Conversation.id,
+            ConversationMessage.content.contains(query),
+        )
         stmt = (
             select(Conversation)
             .where(Conversation.user_id == user_id)
-            .where(cast(Conversation.messages, String).contains(query))
+            .where(cast(Conversation.messages, String).contains(query) | in_rows)
             .order_by(Conversation.started_at.desc())
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def backfill_message_rows(self, batch_size: int = 200) -> int:
+        """Move up to batch_size legacy JSONB message arrays to conversation_messages.
+
+        Each message becomes the row at its array position (seq 1..n; rows
+        appended since start after n) and the array is emptied, in one
+        statement. Rows are locked with SKIP LOCKED so concurrent runs split
+        the work.
+
+        Returns:
+            Number of conversations moved (0 when done).
+        """
+        result = await self.session.execute(
+            text(
+                """
+                WITH batch AS (
+                    SELECT id, messages, started_at
+                    FROM conversations
+                    WHERE messages <> '[]'::jsonb
+                    LIMIT :batch_size
+                    FOR UPDATE SKIP LOCKED
+                ),
+                moved AS (
+                    INSERT INTO conversation_messages
+                        (conversation_id, seq, role, content, analysis, created_at)
+                    SELECT
+                        b.id,
+                        m.seq,
+                        coalesce(m.value->>'role', 'user'),
+                        coalesce(m.value->>'content', ''),
+                        m.value->'analysis',
+                        CASE
+                            WHEN m.value->>'timestamp' ~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}'
+                            THEN (m.value->>'timestamp')::timestamptz
+                            ELSE b.started_at
+                        END
+                    FROM batch b
+                    CROSS JOIN LATERAL jsonb_array_elements(b.messages)
+                        WITH ORDINALITY AS m(value, seq)
+                    ON CONFLICT (conversation_id, seq) DO NOTHING
+                )
+                UPDATE conversations c
+                SET messages = '[]'::jsonb
+                FROM batch
+                WHERE c.id = batch.id
+                """
+            ),
+            {"batch_size": batch_size},
+        )
+        return result.rowcount
+
+    async def get_messages_missing_token_count(
+        self, limit: int = 1000
+    ) -> list[tuple[UUID, int, str]]:
+        """Message rows without a stored token count (backfill).
+
+        Returns:
+            Up to limit (conversation_id, seq, content) tuples.
+        """
+        result = await self.session.execute(
+            select(
+                ConversationMessage.conversation_id,
+                ConversationMessage.seq,
+                ConversationMessage.content,
+            )
+            .where(ConversationMessage.token_count.is_(None))
+            .limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def set_message_token_counts(
+        self, counts: list[tuple[UUID, int, int]]
+    ) -> int:
+        """Store token counts on message rows in one executemany UPDATE.
+
+        Args:
+            counts: (conversation_id, seq, token_count) tuples.
+
+        Returns:
+            Number of rows given.
+        """
+        if not counts:
+            return 0
+        await self.session.execute(
+            update(ConversationMessage),
+            [
+                {"conversation_id": conversation_id, "seq": seq, "token_count": tokens}
+                for conversation_id, seq, tokens in counts
+            ],
+        )
+        return len(counts)
+
     async def close_conversation(
         self,
         conversation_id: UUID,
@@ -526,11 +758,16 @@ class ConversationRepository(BaseRepository[Conversation]):
     async def get_active_conversation(
         self,
         user_id: UUID,
+        load_messages: bool = True,
     ) -> Conversation | None:
         """Get the current active conversation for a user.
 
         Args:
             user_id: The user's UUID.
+            load_messages: Load the messages with it. When False neither the
+                JSONB array nor the rows are loaded and accessing
+                `messages` raises; use message_count and
+                get_recent_messages() instead.
 
         Returns:
             Active conversation if exists, None otherwise.
@@ -542,6 +779,11 @@ class ConversationRepository(BaseRepository[Conversation]):
             .order_by(Conversation.started_at.desc())
             .limit(1)
         )
+        if not load_messages:
+            stmt = stmt.options(
+                defer(Conversation.messages_json, raiseload=True),
+                raiseload(Conversation.message_rows),
+            )
 
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
@@ -580,33 +822,40 @@ class ConversationRepository(BaseRepository[Conversation]):
         self,
         user_id: UUID,
         exclude_conversation_id: UUID | None = None,
-    ) -> dict[str, str | None]:
+        voice_limit: int = 0,
+    ) -> dict[str, Any]:
         """Get conversation summaries for prompt generation (Spec 045 WP-3).
 
         Returns last conversation summary, today's summaries, and this week's
         summaries as formatted strings, suitable for template injection.
+        All parts are fetched in one UNION ALL round trip.
 
         Token budget: ~1000 tokens total (200 last + 300 today + 500 week).
 
         Args:
             user_id: The user's UUID.
             exclude_conversation_id: Current conversation ID to exclude.
+            voice_limit: If > 0, also return the most recent voice summaries
+                (as get_recent_voice_summaries) under "voice_summaries".
 
         Returns:
-            Dict with keys: last_summary, today_summaries, week_summaries.
+            Dict with keys: last_summary, today_summaries, week_summaries
+            (and voice_summaries when voice_limit > 0).
         """
         now = datetime.now(UTC)
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         week_start = now - timedelta(days=7)
+        columns = (Conversation.conversation_summary, Conversation.started_at)
+
+        def part(name: str, stmt):
+            return stmt.add_columns(literal(name).label("part"))
 
         # Last conversation summary (most recent processed, not current)
-        last_summary = await self.get_last_conversation_summary(
-            user_id, exclude_conversation_id
-        )
+        parts = [part("last", self._last_summary_stmt(user_id, exclude_conversation_id, *columns))]
 
         # Today's conversation summaries
         today_stmt = (
-            select(Conversation.conversation_summary, Conversation.started_at)
+            select(*columns)
             .where(Conversation.user_id == user_id)
             .where(Conversation.conversation_summary.isnot(None))
             .where(Conversation.started_at >= today_start)
@@ -615,23 +864,11 @@ class ConversationRepository(BaseRepository[Conversation]):
         )
         if exclude_conversation_id:
             today_stmt = today_stmt.where(Conversation.id != exclude_conversation_id)
-        today_result = await self.session.execute(today_stmt)
-        today_rows = today_result.all()
-
-        today_text = None
-        if today_rows:
-            parts = []
-            for summary, started_at in today_rows:
-                time_str = started_at.strftime("%H:%M") if started_at else ""
-                parts.append(f"- [{time_str}] {summary}")
-            today_text = "\n".join(parts)
-            # Truncate to ~300 tokens (~1200 chars)
-            if len(today_text) > 1200:
-                today_text = today_text[:1197] + "..."
+        parts.append(part("today", today_stmt))
 
         # Week's conversation summaries (excluding today)
         week_stmt = (
-            select(Conversation.conversation_summary, Conversation.started_at)
+            select(*columns)
             .where(Conversation.user_id == user_id)
             .where(Conversation.conversation_summary.isnot(None))
             .where(Conversation.started_at >= week_start)
@@ -641,25 +878,77 @@ class ConversationRepository(BaseRepository[Conversation]):
         )
         if exclude_conversation_id:
             week_stmt = week_stmt.where(Conversation.id != exclude_conversation_id)
-        week_result = await self.session.execute(week_stmt)
-        week_rows = week_result.all()
+        parts.append(part("week", week_stmt))
+
+        if voice_limit > 0:
+            parts.append(part("voice", self._voice_summaries_stmt(user_id, voice_limit, *columns)))
+
+        result = await self.session.execute(union_all(*parts))
+        rows_by_part: dict[str, list[tuple[str, datetime | None]]] = {}
+        for summary, started_at, name in result.all():
+            rows_by_part.setdefault(name, []).append((summary, started_at))
+        for rows in rows_by_part.values():
+            rows.sort(key=lambda r: r[1] or datetime.min.replace(tzinfo=UTC), reverse=True)
+
+        last_rows = rows_by_part.get("last", [])
+        last_summary = last_rows[0][0] if last_rows else None
+
+        today_text = None
+        today_rows = rows_by_part.get("today", [])
+        if today_rows:
+            lines = []
+            for summary, started_at in today_rows:
+                time_str = started_at.strftime("%H:%M") if started_at else ""
+                lines.append(f"- [{time_str}] {summary}")
+            today_text = "\n".join(lines)
+            # Truncate to ~300 tokens (~1200 chars)
+            if len(today_text) > 1200:
+                today_text = today_text[:1197] + "..."
 
         week_text = None
+        week_rows = rows_by_part.get("week", [])
         if week_rows:
-            parts = []
+            lines = []
             for summary, started_at in week_rows:
                 day_str = started_at.strftime("%a %H:%M") if started_at else ""
-                parts.append(f"- [{day_str}] {summary}")
-            week_text = "\n".join(parts)
+                lines.append(f"- [{day_str}] {summary}")
+            week_text = "\n".join(lines)
             # Truncate to ~500 tokens (~2000 chars)
             if len(week_text) > 2000:
                 week_text = week_text[:1997] + "..."
 
-        return {
+        summaries: dict[str, Any] = {
             "last_summary": last_summary,
             "today_summaries": today_text,
             "week_summaries": week_text,
         }
+        if voice_limit > 0:
+            summaries["voice_summaries"] = [summary for summary, _ in rows_by_part.get("voice", [])]
+        return summaries
+
+    @staticmethod
+    def _last_summary_stmt(
+        user_id: UUID,
+        current_conversation_id: UUID | None,
+        *columns: Any,
+    ):
+        """Most recent summary older than 24h, excluding the current session."""
+        # Only return summaries from conversations older than 24 hours
+        cutoff_time = datetime.now(UTC) - timedelta(hours=24)
+
+        stmt = (
+            select(*(columns or (Conversation.conversation_summary,)))
+            .where(Conversation.user_id == user_id)
+            .where(Conversation.conversation_summary.isnot(None))
+            .where(Conversation.started_at < cutoff_time)  # AC-T4.1.4: >24h old
+            .order_by(Conversation.started_at.desc())
+            .limit(1)
+        )
+
+        # AC-T4.1.2: Exclude current session if provided
+        if current_conversation_id is not None:
+            stmt = stmt.where(Conversation.id != current_conversation_id)
+        return stmt
 
     async def get_last_conversation_summary(
         self,
@@ -684,22 +973,7 @@ class ConversationRepository(BaseRepository[Conversation]):
             - AC-T4.1.3: Returns None if no prior conversations
             - AC-T4.1.4: Only returns summaries >24h old
         """
-        # Only return summaries from conversations older than 24 hours
-        cutoff_time = datetime.now(UTC) - timedelta(hours=24)
-
-        stmt = (
-            select(Conversation.conversation_summary)
-            .where(Conversation.user_id == user_id)
-            .where(Conversation.conversation_summary.isnot(None))
-            .where(Conversation.started_at < cutoff_time)  # AC-T4.1.4: >24h old
-            .order_by(Conversation.started_at.desc())
-            .limit(1)
-        )
-
-        # AC-T4.1.2: Exclude current session if provided
-        if current_conversation_id is not None:
-            stmt = stmt.where(Conversation.id != current_conversation_id)
-
+        stmt = self._last_summary_stmt(user_id, current_conversation_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -813,8 +1087,15 @@ class ConversationRepository(BaseRepository[Conversation]):
         Returns:
             List of summary strings from voice conversations.
         """
-        stmt = (
-            select(Conversation.conversation_summary)
+        stmt = self._voice_summaries_stmt(user_id, limit)
+        result = await self.session.execute(stmt)
+        return [row[0] for row in result.all()]
+
+    @staticmethod
+    def _voice_summaries_stmt(user_id: UUID, limit: int, *columns: Any):
+        """Most recent non-empty voice conversation summaries."""
+        return (
+            select(*(columns or (Conversation.conversation_summary,)))
             .where(
                 Conversation.user_id == user_id,
                 Conversation.platform == "voice",
@@ -824,8 +1105,6 @@ class ConversationRepository(BaseRepository[Conversation]):
             .order_by(Conversation.started_at.desc())
             .limit(limit)
         )
-        result = await self.session.execute(stmt)
-        return [row[0] for row in result.all()]
 
     async def get_recent_with_summaries(
         self, user_id: UUID, limit: int = 3
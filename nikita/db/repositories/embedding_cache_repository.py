@@ -0,0 +1,44 @@
+"""Repository for the persistent embedding cache tier."""
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from nikita.db.models.embedding_cache import EmbeddingCacheEntry
+from nikita.db.repositories.base import BaseRepository
+
+
+class EmbeddingCacheRepository(BaseRepository[EmbeddingCacheEntry]):
+    """Repository for EmbeddingCacheEntry entity."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize EmbeddingCacheRepository."""
+        super().__init__(session, EmbeddingCacheEntry)
+
+    async def get_many(self, model: str, text_hashes: list[str]) -> dict[str, list[float]]:
+        """Load cached vectors for the given hashes in one query.
+
+        Returns:
+            text_hash -> embedding, for the hashes found.
+        """
+        if not text_hashes:
+            return {}
+        result = await self.session.execute(
+            select(EmbeddingCacheEntry.text_hash, EmbeddingCacheEntry.embedding).where(
+                EmbeddingCacheEntry.model == model,
+                EmbeddingCacheEntry.text_hash.in_(text_hashes),
+            )
+        )
+        return {text_hash: list(embedding) for text_hash, embedding in result.all()}
+
+    async def insert_many(self, model: str, embeddings: dict[str, list[float]]) -> None:
+        """Store vectors by hash (single statement); existing rows are kept."""
+        if not embeddings:
+            return
+        stmt = insert(EmbeddingCacheEntry).values(
+            [
+                {"model": model, "text_hash": text_hash, "embedding": embedding}
+                for text_hash, embedding in embeddings.items()
+            ]
+        )
+        await self.session.execute(stmt.on_conflict_do_nothing())
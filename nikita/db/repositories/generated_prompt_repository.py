@@ -64,6 +64,48 @@ class GeneratedPromptRepository(BaseRepository[GeneratedPrompt]):
 
         return prompt_log
 
+    async def create_logs(
+        self,
+        user_id: UUID,
+        entries: list[dict[str, Any]],
+        meta_prompt_template: str,
+        conversation_id: UUID | None = None,
+        context_snapshot: dict[str, Any] | None = None,
+    ) -> list[GeneratedPrompt]:
+        """Create several prompt log entries with a single commit.
+
+        Args:
+            user_id: The user's UUID.
+            entries: Dicts with prompt_content, token_count,
+                generation_time_ms and platform.
+            meta_prompt_template: Template used for generation.
+            conversation_id: Optional conversation UUID.
+            context_snapshot: Optional context data as JSONB, shared by all entries.
+
+        Returns:
+            Created GeneratedPrompt entities, in input order.
+        """
+        now = datetime.now(UTC)
+        prompt_logs = [
+            GeneratedPrompt(
+                user_id=user_id,
+                conversation_id=conversation_id,
+                prompt_content=entry["prompt_content"],
+                token_count=entry["token_count"],
+                generation_time_ms=entry["generation_time_ms"],
+                meta_prompt_template=meta_prompt_template,
+                context_snapshot=context_snapshot,
+                platform=entry["platform"],
+                created_at=now,
+            )
+            for entry in entries
+        ]
+
+        self.session.add_all(prompt_logs)
+        await self.session.commit()
+
+        return prompt_logs
+
     async def get_by_user_id(
         self, user_id: UUID, limit: int = 50
     ) -> list[GeneratedPrompt]:
@@ -0,0 +1,52 @@
+"""Repository for memory compaction runs (nikita.memory.compaction)."""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, insert, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from nikita.db.models.memory_compaction import MemoryCompactionRun
+from nikita.db.models.memory_fact import MemoryFact
+from nikita.db.repositories.base import BaseRepository
+
+
+class MemoryCompactionRepository(BaseRepository[MemoryCompactionRun]):
+    """Repository for MemoryCompactionRun entity."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize MemoryCompactionRepository."""
+        super().__init__(session, MemoryCompactionRun)
+
+    async def find_candidate_users(self, min_active_facts: int, limit: int) -> list[UUID]:
+        """Users worth compacting, most active facts first.
+
+        A user qualifies with at least min_active_facts active facts, one of
+        them created after the user's last compaction run (or never
+        compacted): users whose facts have not changed are skipped.
+        """
+        last_run = (
+            select(func.max(MemoryCompactionRun.created_at))
+            .where(MemoryCompactionRun.user_id == MemoryFact.user_id)
+            .correlate(MemoryFact)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(MemoryFact.user_id)
+            .where(MemoryFact.is_active)
+            .group_by(MemoryFact.user_id)
+            .having(
+                func.count() >= min_active_facts,
+                func.max(MemoryFact.created_at) > func.coalesce(
+                    last_run, literal_column("'-infinity'::timestamptz")
+                ),
+            )
+            .order_by(func.count().desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def record(self, stats: dict[str, Any]) -> None:
+        """Insert one run row (keys are MemoryCompactionRun attributes)."""
+        await self.session.execute(insert(MemoryCompactionRun).values(**stats))
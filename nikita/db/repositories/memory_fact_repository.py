@@ -1,20 +1,67 @@
 """MemoryFact repository for semantic memory operations (Spec 042)."""
 
+import re
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, update
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy import (
+    Integer,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    true,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from nikita.db.models.memory_fact import MemoryFact
 from nikita.db.repositories.base import BaseRepository
 
+# Text search configuration of the generated memory_facts.fact_tsv column
+# (supabase/migrations/20261017180000_memory_facts_fact_tsv.sql)
+FTS_CONFIG = "english"
+
+
+def _embedding_column(compact: bool):
+    """The embedding column searched (see memory_embedding_storage)."""
+    return MemoryFact.embedding_compact if compact else MemoryFact.embedding
+
+
+def _with_embeddings(stmt, with_embeddings: bool):
+    """Load the (deferred) embedding columns with the entities if asked."""
+    if with_embeddings:
+        return stmt.options(
+            undefer(MemoryFact.embedding), undefer(MemoryFact.embedding_compact)
+        )
+    return stmt
+
 
 class MemoryFactRepository(BaseRepository[MemoryFact]):
     """Repository for MemoryFact entity.
 
     Provides semantic search via pgVector cosine distance,
     fact management, and deactivation with supersession tracking.
+
+    Vector searches filter on the bare ``is_active`` column so they match
+    the predicate of the partial HNSW index idx_memory_facts_embedding_hnsw.
+    With pgvector's relaxed iterative scan the index may return rows
+    slightly out of distance order, so results are re-sorted here.
+
+    Searches take ``compact=True`` to run against embedding_compact
+    (halfvec, idx_memory_facts_embedding_compact_hnsw) instead of the full
+    embedding; the query vector must then be compact as well.
+
+    The embedding columns are deferred on MemoryFact, so entity queries
+    leave them in the database; pass ``with_embeddings=True`` to load them.
     """
 
     def __init__(self, session: AsyncSession) -> None:
@@ -30,6 +77,7 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
         confidence: float,
         metadata: dict[str, Any] | None = None,
         conversation_id: UUID | None = None,
+        embedding_compact: list[float] | None = None,
     ) -> MemoryFact:
         """Insert a new memory fact.
 
@@ -42,6 +90,7 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
             confidence: 0.0 to 1.0 confidence score.
             metadata: Optional JSONB metadata.
             conversation_id: Optional conversation UUID.
+            embedding_compact: Optional 512-dim compact embedding.
 
         Returns:
             The created MemoryFact.
@@ -53,6 +102,7 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
             source=source,
             confidence=confidence,
             embedding=embedding,
+            embedding_compact=embedding_compact,
             fact_metadata=metadata or {},
             is_active=True,
             conversation_id=conversation_id,
@@ -62,6 +112,75 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
         await self.session.refresh(memory_fact)
         return memory_fact
 
+    async def add_facts(self, rows: list[dict[str, Any]]) -> None:
+        """Insert several memory facts in one multi-row INSERT.
+
+        Args:
+            rows: One dict per fact with MemoryFact attribute names as keys
+                (id, user_id, graph_type, fact, source, confidence,
+                embedding, fact_metadata, is_active, conversation_id and
+                optionally embedding_compact).
+                Every dict must have the same keys.
+        """
+        if not rows:
+            return
+        await self.session.execute(insert(MemoryFact).values(rows))
+
+    async def find_nearest_batch(
+        self,
+        user_id: UUID,
+        embeddings: list[list[float]],
+        compact: bool = False,
+    ) -> list[tuple[UUID, float] | None]:
+        """Nearest active fact for each embedding, in a single query.
+
+        The embeddings are sent as a VALUES list joined LATERAL to a
+        per-row ``ORDER BY embedding <=> ... LIMIT 1`` over the user's
+        active facts, i.e. semantic_search(limit=1) for every embedding in
+        one round trip.
+
+        Args:
+            user_id: Owner user UUID.
+            embeddings: Query vectors.
+            compact: Compare against embedding_compact.
+
+        Returns:
+            (fact_id, distance) of the nearest active fact per embedding, in
+            input order; None where the user has no active facts.
+        """
+        if not embeddings:
+            return []
+
+        vector_type = (HALFVEC if compact else Vector)(len(embeddings[0]))
+        queries = values(
+            column("idx", Integer),
+            column("embedding", vector_type),
+            name="queries",
+        ).data(list(enumerate(embeddings)))
+        # VALUES parameters are typed text; cast for the vector operator
+        distance = _embedding_column(compact).cosine_distance(
+            cast(queries.c.embedding, vector_type)
+        )
+        nearest = (
+            select(MemoryFact.id.label("fact_id"), distance.label("distance"))
+            .where(
+                MemoryFact.user_id == user_id,
+                MemoryFact.is_active,
+            )
+            .order_by(distance)
+            .limit(1)
+            .lateral("nearest")
+        )
+        stmt = select(queries.c.idx, nearest.c.fact_id, nearest.c.distance).select_from(
+            queries.join(nearest, true())
+        )
+
+        result = await self.session.execute(stmt)
+        matches: list[tuple[UUID, float] | None] = [None] * len(embeddings)
+        for idx, fact_id, dist in result.all():
+            matches[idx] = (fact_id, dist)
+        return matches
+
     async def semantic_search(
         self,
         user_id: UUID,
@@ -69,6 +188,9 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
         graph_type: str | None = None,
         limit: int = 10,
         min_confidence: float = 0.0,
+        ef_search: int | None = None,
+        compact: bool = False,
+        with_embeddings: bool = False,
     ) -> list[tuple[MemoryFact, float]]:
         """Search for semantically similar facts using pgVector cosine distance.
 
@@ -78,17 +200,21 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
             graph_type: Optional filter by graph type.
             limit: Max results.
             min_confidence: Minimum confidence threshold.
+            ef_search: Optional hnsw.ef_search for the rest of the
+                transaction (see set_ef_search).
+            compact: Search embedding_compact with a compact query vector.
+            with_embeddings: Also load the facts' embedding columns.
 
         Returns:
             List of (MemoryFact, distance) tuples ordered by distance ASC.
         """
-        distance = MemoryFact.embedding.cosine_distance(query_embedding)
+        distance = _embedding_column(compact).cosine_distance(query_embedding)
 
         stmt = (
             select(MemoryFact, distance.label("distance"))
             .where(
                 MemoryFact.user_id == user_id,
-                MemoryFact.is_active.is_(True),
+                MemoryFact.is_active,
                 MemoryFact.confidence >= min_confidence,
             )
             .order_by(distance)
@@ -98,8 +224,10 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
         if graph_type is not None:
             stmt = stmt.where(MemoryFact.graph_type == graph_type)
 
-        result = await self.session.execute(stmt)
-        return list(result.all())
+        if ef_search is not None:
+            await self.set_ef_search(ef_search)
+        result = await self.session.execute(_with_embeddings(stmt, with_embeddings))
+        return sorted(result.all(), key=lambda row: row[1])
 
     async def semantic_search_batch(
         self,
@@ -108,6 +236,9 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
         graph_types: list[str],
         limit: int = 10,
         min_confidence: float = 0.0,
+        ef_search: int | None = None,
+        compact: bool = False,
+        with_embeddings: bool = False,
     ) -> list[tuple["MemoryFact", float]]:
         """Search across multiple graph types in a single DB query.
 
@@ -120,17 +251,21 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
             graph_types: List of graph types to search within.
             limit: Max results.
             min_confidence: Minimum confidence threshold.
+            ef_search: Optional hnsw.ef_search for the rest of the
+                transaction (see set_ef_search).
+            compact: Search embedding_compact with a compact query vector.
+            with_embeddings: Also load the facts' embedding columns.
 
         Returns:
             List of (MemoryFact, distance) tuples ordered by distance ASC.
         """
-        distance = MemoryFact.embedding.cosine_distance(query_embedding)
+        distance = _embedding_column(compact).cosine_distance(query_embedding)
 
         stmt = (
             select(MemoryFact, distance.label("distance"))
             .where(
                 MemoryFact.user_id == user_id,
-                MemoryFact.is_active.is_(True),
+                MemoryFact.is_active,
                 MemoryFact.confidence >= min_confidence,
                 MemoryFact.graph_type.in_(graph_types),
             )
@@ -138,14 +273,117 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
             .limit(limit)
         )
 
+        if ef_search is not None:
+            await self.set_ef_search(ef_search)
+        result = await self.session.execute(_with_embeddings(stmt, with_embeddings))
+        return sorted(result.all(), key=lambda row: row[1])
+
+    async def lexical_search(
+        self,
+        user_id: UUID,
+        query: str,
+        graph_types: list[str],
+        limit: int = 10,
+        min_confidence: float = 0.0,
+    ) -> list[tuple[MemoryFact, float, bool]]:
+        """Full-text search over fact_tsv (GIN index idx_memory_facts_fact_tsv).
+
+        A fact matches when it contains any of the query's terms (after
+        stemming and stop-word removal); ranking uses ts_rank_cd normalized
+        to 0..1, so facts containing more of the terms, closer together,
+        come first.
+
+        Args:
+            user_id: Owner user UUID.
+            query: Free-text query.
+            graph_types: Graph types to search within.
+            limit: Max results.
+            min_confidence: Minimum confidence threshold.
+
+        Returns:
+            (MemoryFact, rank, matches_all_terms) tuples ordered by rank
+            DESC. Empty when the query has no searchable terms.
+        """
+        config = literal_column(f"'{FTS_CONFIG}'::regconfig")
+        all_terms = func.plainto_tsquery(config, query)
+        # plainto_tsquery ANDs the terms; OR them for recall. Only the query's
+        # words are passed, so nothing in it is read as websearch syntax
+        # (quotes, a leading "-") and "or" between them is the OR operator.
+        words = [w for w in re.findall(r"\w+", query) if w.lower() != "or"]
+        any_term = func.websearch_to_tsquery(config, " or ".join(words))
+        rank = func.ts_rank_cd(MemoryFact.fact_tsv, any_term, 32)
+
+        stmt = (
+            select(
+                MemoryFact,
+                rank.label("rank"),
+                MemoryFact.fact_tsv.op("@@")(all_terms).label("matches_all"),
+            )
+            .where(
+                MemoryFact.user_id == user_id,
+                MemoryFact.is_active,
+                MemoryFact.confidence >= min_confidence,
+                MemoryFact.graph_type.in_(graph_types),
+                MemoryFact.fact_tsv.op("@@")(any_term),
+            )
+            .order_by(rank.desc())
+            .limit(limit)
+        )
+
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def backfill_compact_embeddings(self, batch_size: int = 500) -> int:
+        """Fill embedding_compact for up to batch_size facts that lack it.
+
+        The compact vector is computed in the database from the stored full
+        embedding (first dims, L2-normalized, cast to halfvec; pgvector >=
+        0.7), so no embedding API calls are needed. Rows locked by a
+        concurrent backfill are skipped.
+
+        Returns:
+            Number of facts updated; 0 once the backfill is complete.
+        """
+        dims = MemoryFact.embedding_compact.type.dim
+        pending = (
+            select(MemoryFact.id)
+            .where(MemoryFact.embedding_compact.is_(None))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(MemoryFact)
+            .where(MemoryFact.id.in_(pending.scalar_subquery()))
+            .values(
+                embedding_compact=cast(
+                    func.l2_normalize(func.subvector(MemoryFact.embedding, 1, dims)),
+                    HALFVEC(dims),
+                ),
+                # A re-encoding is not an edit: keep updated_at as it was
+                updated_at=MemoryFact.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
         result = await self.session.execute(stmt)
-        return list(result.all())
+        return result.rowcount
+
+    async def set_ef_search(self, ef_search: int) -> None:
+        """Set hnsw.ef_search until the end of the current transaction.
+
+        The connection default comes from settings (asyncpg server_settings);
+        callers raise it when a search's limit plus post-scan filtering needs
+        more candidates than the default keeps.
+        """
+        await self.session.execute(
+            select(func.set_config("hnsw.ef_search", str(ef_search), True))
+        )
 
     async def get_recent(
         self,
         user_id: UUID,
         graph_type: str | None = None,
         limit: int = 20,
+        with_embeddings: bool = False,
     ) -> list[MemoryFact]:
         """Get recent facts ordered by created_at DESC.
 
@@ -153,6 +391,7 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
             user_id: Owner user UUID.
             graph_type: Optional filter.
             limit: Max results.
+            with_embeddings: Also load the embedding columns.
 
         Returns:
             List of MemoryFact records.
@@ -170,7 +409,7 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
         if graph_type is not None:
             stmt = stmt.where(MemoryFact.graph_type == graph_type)
 
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_with_embeddings(stmt, with_embeddings))
         return list(result.scalars().all())
 
     async def deactivate(
@@ -197,11 +436,131 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
         await self.session.flush()
         return True
 
+    async def deactivate_many(self, superseded: dict[UUID, UUID]) -> None:
+        """Deactivate several facts in one UPDATE.
+
+        Args:
+            superseded: Maps each fact to deactivate to the ID of the fact
+                replacing it.
+        """
+        if not superseded:
+            return
+
+        stmt = (
+            update(MemoryFact)
+            .where(MemoryFact.id.in_(list(superseded)))
+            .values(
+                is_active=False,
+                superseded_by=case(superseded, value=MemoryFact.id),
+            )
+        )
+        await self.session.execute(stmt)
+
+    # ── Compaction (nikita.memory.compaction) ────────────────────────────
+
+    async def get_active_vectors(
+        self,
+        user_id: UUID,
+        limit: int,
+        compact: bool = False,
+    ) -> list[tuple[UUID, list[float], float]]:
+        """(id, embedding, confidence) of a user's active facts, newest first.
+
+        Only the columns compaction needs are loaded. With compact=True the
+        compact embedding is returned and facts without one are skipped.
+        """
+        embedding = _embedding_column(compact)
+        stmt = (
+            select(MemoryFact.id, embedding, MemoryFact.confidence)
+            .where(
+                MemoryFact.user_id == user_id,
+                MemoryFact.is_active,
+                embedding.is_not(None),
+            )
+            .order_by(MemoryFact.created_at.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def count_active(self, user_id: UUID) -> int:
+        """Number of active facts of a user."""
+        result = await self.session.execute(
+            select(func.count())
+            .select_from(MemoryFact)
+            .where(MemoryFact.user_id == user_id, MemoryFact.is_active)
+        )
+        return result.scalar_one()
+
+    async def set_confidences(self, confidences: dict[UUID, float]) -> None:
+        """Set the confidence of several facts in one UPDATE."""
+        if not confidences:
+            return
+        stmt = (
+            update(MemoryFact)
+            .where(MemoryFact.id.in_(list(confidences)))
+            .values(confidence=case(confidences, value=MemoryFact.id))
+        )
+        await self.session.execute(stmt)
+
+    async def deactivate_low_confidence(
+        self,
+        user_id: UUID,
+        below: float,
+        created_before: datetime,
+    ) -> int:
+        """Deactivate a user's facts under a confidence, older than a cutoff.
+
+        Returns:
+            Number of facts deactivated.
+        """
+        stmt = (
+            update(MemoryFact)
+            .where(
+                MemoryFact.user_id == user_id,
+                MemoryFact.is_active,
+                MemoryFact.confidence < below,
+                MemoryFact.created_at < created_before,
+            )
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
+
+    async def delete_superseded(self, user_id: UUID, inactive_before: datetime) -> int:
+        """Hard-delete a user's facts superseded before a cutoff.
+
+        Only facts with superseded_by set are deleted: their content lives
+        on in the fact that replaced them. Facts deactivated without a
+        replacement (low-confidence retirement, manual deactivation) are
+        kept. Deactivation bumps updated_at, so it dates the supersession.
+        Facts pointing at a deleted one through superseded_by get NULL (FK
+        ON DELETE SET NULL).
+
+        Returns:
+            Number of facts deleted.
+        """
+        stmt = (
+            delete(MemoryFact)
+            .where(
+                MemoryFact.user_id == user_id,
+                # Matches the idx_memory_facts_inactive_updated predicate
+                ~MemoryFact.is_active,
+                MemoryFact.superseded_by.is_not(None),
+                MemoryFact.updated_at < inactive_before,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
+
     async def get_by_user(
         self,
         user_id: UUID,
         graph_type: str | None = None,
         active_only: bool = True,
+        with_embeddings: bool = False,
     ) -> list[MemoryFact]:
         """Get all facts for a user.
 
@@ -209,6 +568,7 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
             user_id: Owner user UUID.
             graph_type: Optional filter.
             active_only: If True, only return active facts.
+            with_embeddings: Also load the embedding columns.
 
         Returns:
             List of MemoryFact records.
@@ -226,5 +586,36 @@ class MemoryFactRepository(BaseRepository[MemoryFact]):
             .order_by(MemoryFact.created_at.desc())
         )
 
+        result = await self.session.execute(_with_embeddings(stmt, with_embeddings))
+        return list(result.scalars().all())
+
+    async def get_fact_texts(
+        self,
+        user_id: UUID,
+        graph_type: str,
+        limit: int = 50,
+    ) -> list[str]:
+        """Texts of a user's newest active facts of one graph type.
+
+        Selects only the fact column, for callers that render facts as text.
+
+        Args:
+            user_id: Owner user UUID.
+            graph_type: Graph type to list.
+            limit: Max results.
+
+        Returns:
+            Fact texts ordered by created_at DESC.
+        """
+        stmt = (
+            select(MemoryFact.fact)
+            .where(
+                MemoryFact.user_id == user_id,
+                MemoryFact.is_active.is_(True),
+                MemoryFact.graph_type == graph_type,
+            )
+            .order_by(MemoryFact.created_at.desc())
+            .limit(limit)
+        )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
@@ -0,0 +1,42 @@
+"""Repository for flushed pipeline latency histograms."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from nikita.db.models.pipeline_latency import PipelineLatencyHistogram
+from nikita.db.repositories.base import BaseRepository
+
+
+class PipelineLatencyRepository(BaseRepository[PipelineLatencyHistogram]):
+    """Repository for PipelineLatencyHistogram entity."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize PipelineLatencyRepository."""
+        super().__init__(session, PipelineLatencyHistogram)
+
+    async def insert_windows(self, rows: list[dict[str, Any]]) -> None:
+        """Bulk insert flushed histogram rows (single statement)."""
+        if rows:
+            await self.session.execute(insert(PipelineLatencyHistogram), rows)
+
+    async def get_since(
+        self,
+        since: datetime,
+        component: str | None = None,
+    ) -> list[PipelineLatencyHistogram]:
+        """Histogram rows whose window ended at or after `since`.
+
+        Args:
+            since: Lower bound on window_end.
+            component: Optional component filter (e.g. "total").
+        """
+        stmt = select(PipelineLatencyHistogram).where(
+            PipelineLatencyHistogram.window_end >= since
+        )
+        if component is not None:
+            stmt = stmt.where(PipelineLatencyHistogram.component == component)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
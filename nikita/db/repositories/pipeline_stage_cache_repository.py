@@ -0,0 +1,64 @@
+"""PipelineStageCache repository for replaying stage outputs on retry."""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from nikita.db.models.pipeline_stage_cache import PipelineStageCache
+from nikita.db.repositories.base import BaseRepository
+
+
+class PipelineStageCacheRepository(BaseRepository[PipelineStageCache]):
+    """Repository for PipelineStageCache entity."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize PipelineStageCacheRepository."""
+        super().__init__(session, PipelineStageCache)
+
+    async def get_for_conversation(
+        self,
+        conversation_id: UUID,
+        stage_names: list[str],
+    ) -> dict[str, PipelineStageCache]:
+        """Load cached outputs for the given stages in one query.
+
+        Returns:
+            stage_name -> row. Callers check stage_version and input_hash.
+        """
+        result = await self.session.execute(
+            select(PipelineStageCache).where(
+                PipelineStageCache.conversation_id == conversation_id,
+                PipelineStageCache.stage_name.in_(stage_names),
+            )
+        )
+        return {row.stage_name: row for row in result.scalars().all()}
+
+    async def upsert(
+        self,
+        conversation_id: UUID,
+        stage_name: str,
+        stage_version: int,
+        input_hash: str,
+        output: dict[str, Any],
+    ) -> None:
+        """Insert or replace the cached output for (conversation, stage)."""
+        stmt = insert(PipelineStageCache).values(
+            conversation_id=conversation_id,
+            stage_name=stage_name,
+            stage_version=stage_version,
+            input_hash=input_hash,
+            output=output,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_pipeline_stage_cache_conversation_stage",
+            set_={
+                "stage_version": stmt.excluded.stage_version,
+                "input_hash": stmt.excluded.input_hash,
+                "output": stmt.excluded.output,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
@@ -6,6 +6,7 @@ from uuid import UUID
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from nikita.context.utils.token_counter import count_tokens
 from nikita.db.models.ready_prompt import ReadyPrompt
 from nikita.db.repositories.base import BaseRepository
 
@@ -50,9 +51,9 @@ class ReadyPromptRepository(BaseRepository[ReadyPrompt]):
         user_id: UUID,
         platform: str,
         prompt_text: str,
-        token_count: int,
         pipeline_version: str,
         generation_time_ms: float,
+        token_count: int | None = None,
         context_snapshot: dict[str, Any] | None = None,
         conversation_id: UUID | None = None,
     ) -> ReadyPrompt:
@@ -66,9 +67,10 @@ class ReadyPromptRepository(BaseRepository[ReadyPrompt]):
             user_id: Owner user UUID.
             platform: 'text' or 'voice'.
             prompt_text: The generated prompt text.
-            token_count: Token count of the prompt.
             pipeline_version: Pipeline version string.
             generation_time_ms: Time to generate in ms.
+            token_count: Token count of the prompt; counted here (tiktoken)
+                when the caller has none, so readers never recount it.
             context_snapshot: Optional context JSONB.
             conversation_id: Optional conversation UUID.
 
@@ -92,7 +94,7 @@ class ReadyPromptRepository(BaseRepository[ReadyPrompt]):
             user_id=user_id,
             platform=platform,
             prompt_text=prompt_text,
-            token_count=token_count,
+            token_count=token_count if token_count is not None else count_tokens(prompt_text),
             context_snapshot=context_snapshot,
             pipeline_version=pipeline_version,
             generation_time_ms=generation_time_ms,
@@ -104,6 +106,70 @@ class ReadyPromptRepository(BaseRepository[ReadyPrompt]):
         await self.session.refresh(new_prompt)
         return new_prompt
 
+    async def set_current_many(
+        self,
+        user_id: UUID,
+        prompts: list[dict[str, Any]],
+        pipeline_version: str,
+        context_snapshot: dict[str, Any] | None = None,
+        conversation_id: UUID | None = None,
+    ) -> list[ReadyPrompt]:
+        """set_current for several platforms in two statements.
+
+        One UPDATE deactivates every listed platform, then one flush inserts
+        all new rows (a single multi-row INSERT). The deactivation must run
+        as its own statement first: idx_ready_prompts_current is a unique
+        partial index on (user_id, platform) WHERE is_current, and a
+        data-modifying CTE would not make the UPDATE visible to the INSERT.
+
+        Args:
+            user_id: Owner user UUID.
+            prompts: Dicts with platform, prompt_text, generation_time_ms and
+                optionally token_count (counted here when missing); at most
+                one per platform.
+            pipeline_version: Pipeline version string.
+            context_snapshot: Optional context JSONB, shared by all rows.
+            conversation_id: Optional conversation UUID.
+
+        Returns:
+            The newly created ReadyPrompts, in input order.
+        """
+        if not prompts:
+            return []
+
+        deactivate_stmt = (
+            update(ReadyPrompt)
+            .where(
+                ReadyPrompt.user_id == user_id,
+                ReadyPrompt.platform.in_([p["platform"] for p in prompts]),
+                ReadyPrompt.is_current.is_(True),
+            )
+            .values(is_current=False)
+        )
+        await self.session.execute(deactivate_stmt)
+
+        new_prompts = [
+            ReadyPrompt(
+                user_id=user_id,
+                platform=p["platform"],
+                prompt_text=p["prompt_text"],
+                token_count=(
+                    p["token_count"]
+                    if p.get("token_count") is not None
+                    else count_tokens(p["prompt_text"])
+                ),
+                context_snapshot=context_snapshot,
+                pipeline_version=pipeline_version,
+                generation_time_ms=p["generation_time_ms"],
+                is_current=True,
+                conversation_id=conversation_id,
+            )
+            for p in prompts
+        ]
+        self.session.add_all(new_prompts)
+        await self.session.flush()
+        return new_prompts
+
     async def get_history(
         self,
         user_id: UUID,
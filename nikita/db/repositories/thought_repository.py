@@ -12,8 +12,9 @@ from datetime import UTC, datetime, timedelta
 from difflib import SequenceMatcher
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from nikita.db.models.context import NikitaThought, THOUGHT_TYPES
 from nikita.db.repositories.base import BaseRepository
@@ -103,6 +104,66 @@ class NikitaThoughtRepository(BaseRepository[NikitaThought]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_active_thoughts_by_type(
+        self,
+        user_id: UUID,
+        limits: dict[str | None, int],
+    ) -> dict[str | None, list[NikitaThought]]:
+        """Several get_active_thoughts() lookups in one round trip.
+
+        Ranks active thoughts overall and per type with window functions and
+        keeps only rows some lookup needs.
+
+        Args:
+            user_id: The user's UUID.
+            limits: thought_type -> limit; the None key means any type.
+
+        Returns:
+            Same keys as limits, each a list of active thoughts, newest first
+            (identical to get_active_thoughts(thought_type=key, limit=value)).
+        """
+        if not limits:
+            return {}
+        now = datetime.now(UTC)
+        newest_first = NikitaThought.created_at.desc()
+
+        ranked = (
+            select(
+                NikitaThought,
+                func.row_number().over(order_by=newest_first).label("overall_rank"),
+                func.row_number()
+                .over(partition_by=NikitaThought.thought_type, order_by=newest_first)
+                .label("type_rank"),
+            )
+            .where(NikitaThought.user_id == user_id)
+            .where(NikitaThought.used_at.is_(None))
+            .where((NikitaThought.expires_at.is_(None)) | (NikitaThought.expires_at > now))
+            .subquery()
+        )
+        thought = aliased(NikitaThought, ranked)
+        wanted = [
+            ranked.c.overall_rank <= limit
+            if thought_type is None
+            else and_(ranked.c.thought_type == thought_type, ranked.c.type_rank <= limit)
+            for thought_type, limit in limits.items()
+        ]
+        stmt = (
+            select(thought, ranked.c.overall_rank, ranked.c.type_rank)
+            .where(or_(*wanted))
+            .order_by(ranked.c.overall_rank)
+        )
+        result = await self.session.execute(stmt)
+
+        grouped: dict[str | None, list[NikitaThought]] = {key: [] for key in limits}
+        for row, overall_rank, type_rank in result.all():
+            for thought_type, limit in limits.items():
+                if thought_type is None:
+                    if overall_rank <= limit:
+                        grouped[None].append(row)
+                elif row.thought_type == thought_type and type_rank <= limit:
+                    grouped[thought_type].append(row)
+        return grouped
+
     async def get_thoughts_for_prompt(
         self,
         user_id: UUID,
@@ -0,0 +1,195 @@
+"""WorkJob repository for the durable work queue.
+
+Claiming uses UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED),
+so concurrent drains on different instances never claim the same row and
+never block on each other.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from nikita.db.models.work_job import WorkJob, WorkJobStatus
+from nikita.db.repositories.base import BaseRepository
+
+
+class WorkJobRepository(BaseRepository[WorkJob]):
+    """Repository for WorkJob entity.
+
+    Each method issues a single statement; callers own the transaction.
+    Claims should be committed immediately so the lease is visible to
+    other workers before the (long) handler runs.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize WorkJobRepository."""
+        super().__init__(session, WorkJob)
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        *,
+        dedupe_key: str | None = None,
+        delay_seconds: float = 0.0,
+        max_attempts: int = 5,
+    ) -> UUID | None:
+        """Insert a pending job.
+
+        Args:
+            kind: Handler key (WorkJobKind value).
+            payload: JSON-serializable handler arguments.
+            dedupe_key: Optional idempotency key; a second enqueue with the
+                same key is a no-op.
+            delay_seconds: Defer the first attempt.
+            max_attempts: Attempts before the job is marked dead.
+
+        Returns:
+            The new job id, or None if dedupe_key already exists.
+        """
+        stmt = (
+            insert(WorkJob)
+            .values(
+                kind=kind,
+                payload=payload,
+                status=WorkJobStatus.PENDING.value,
+                max_attempts=max_attempts,
+                run_after=datetime.now(UTC) + timedelta(seconds=delay_seconds),
+                dedupe_key=dedupe_key,
+            )
+            .on_conflict_do_nothing(index_elements=[WorkJob.dedupe_key])
+            .returning(WorkJob.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def claim_batch(
+        self,
+        worker_id: str,
+        limit: int,
+        lease_seconds: float,
+    ) -> list[WorkJob]:
+        """Claim up to `limit` runnable jobs and lease them to `worker_id`.
+
+        Runnable = pending with run_after due, or running with an expired
+        lease (abandoned by a dead worker), and attempts left.
+
+        Returns:
+            Claimed jobs with status=running and attempts incremented.
+        """
+        now = datetime.now(UTC)
+        claimable = (
+            select(WorkJob.id)
+            .where(
+                WorkJob.run_after <= now,
+                WorkJob.attempts < WorkJob.max_attempts,
+                or_(
+                    WorkJob.status == WorkJobStatus.PENDING.value,
+                    and_(
+                        WorkJob.status == WorkJobStatus.RUNNING.value,
+                        WorkJob.locked_until < now,
+                    ),
+                ),
+            )
+            .order_by(WorkJob.run_after)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(WorkJob)
+            .where(WorkJob.id.in_(claimable))
+            .values(
+                status=WorkJobStatus.RUNNING.value,
+                attempts=WorkJob.attempts + 1,
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=lease_seconds),
+            )
+            .returning(WorkJob)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def complete(self, job_id: UUID) -> None:
+        """Mark a job completed and release its lease."""
+        await self.session.execute(
+            update(WorkJob)
+            .where(WorkJob.id == job_id)
+            .values(
+                status=WorkJobStatus.COMPLETED.value,
+                completed_at=datetime.now(UTC),
+                locked_by=None,
+                locked_until=None,
+                last_error=None,
+            )
+        )
+
+    async def fail(
+        self,
+        job_id: UUID,
+        error: str,
+        retry_delay_seconds: float,
+    ) -> str:
+        """Record a failed attempt: reschedule, or mark dead if exhausted.
+
+        Args:
+            job_id: The job that failed.
+            error: Error description (truncated to 2000 chars).
+            retry_delay_seconds: Backoff before the next attempt.
+
+        Returns:
+            The resulting status value (pending or dead).
+        """
+        job = await self.get(job_id)
+        if job is None:
+            return WorkJobStatus.DEAD.value
+        exhausted = job.attempts >= job.max_attempts
+        status = WorkJobStatus.DEAD if exhausted else WorkJobStatus.PENDING
+        await self.session.execute(
+            update(WorkJob)
+            .where(WorkJob.id == job_id)
+            .values(
+                status=status.value,
+                run_after=datetime.now(UTC) + timedelta(seconds=retry_delay_seconds),
+                locked_by=None,
+                locked_until=None,
+                last_error=error[:2000],
+            )
+        )
+        return status.value
+
+    async def reap_exhausted(self) -> int:
+        """Mark dead any running job whose lease expired on its last attempt.
+
+        Such jobs are no longer claimable (attempts == max_attempts), so
+        without this they'd sit in running forever.
+
+        Returns:
+            Number of jobs marked dead.
+        """
+        result = await self.session.execute(
+            update(WorkJob)
+            .where(
+                WorkJob.status == WorkJobStatus.RUNNING.value,
+                WorkJob.locked_until < datetime.now(UTC),
+                WorkJob.attempts >= WorkJob.max_attempts,
+            )
+            .values(
+                status=WorkJobStatus.DEAD.value,
+                locked_by=None,
+                locked_until=None,
+                last_error="lease expired on final attempt",
+            )
+        )
+        return result.rowcount or 0
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Count jobs per status (for drain results and admin visibility)."""
+        result = await self.session.execute(
+            select(WorkJob.status, func.count()).group_by(WorkJob.status)
+        )
+        return dict(result.all())
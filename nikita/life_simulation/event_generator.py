@@ -32,6 +32,7 @@ from nikita.life_simulation.models import (
 )
 from nikita.life_simulation.entity_manager import EntityManager, get_entity_manager
 from nikita.life_simulation.mood_calculator import MoodState
+from nikita.observability.profiler import profile_span
 
 logger = logging.getLogger(__name__)
 
@@ -303,13 +304,20 @@ Example:
         # Use Pydantic AI agent
         from pydantic_ai import Agent
 
-        agent = Agent(
-            Models.sonnet(),
-            system_prompt="You are a creative writer generating realistic daily life events. Always respond with valid JSON matching the requested schema.",
-            retries=2,
+        from nikita.llm.clients import get_agent
+
+        model = Models.sonnet()
+        agent = get_agent(
+            ("life_events", model),
+            lambda: Agent(
+                model,
+                system_prompt="You are a creative writer generating realistic daily life events. Always respond with valid JSON matching the requested schema.",
+                retries=2,
+            ),
         )
 
-        result = await agent.run(prompt, output_type=GeneratedEventList)
+        with profile_span("llm"):
+            result = await agent.run(prompt, output_type=GeneratedEventList)
         return result.output
 
     def _convert_to_life_events(
@@ -0,0 +1,149 @@
+"""Process-wide pooled clients for external APIs.
+
+Call sites used to build a client per call or per instance:
+SupabaseMemory created an ``openai.AsyncOpenAI`` per instance, TelegramBot an
+``httpx.AsyncClient`` per bot, and every ElevenLabsConversationsClient method
+opened its own ``async with httpx.AsyncClient()``. Each new client pays DNS,
+TCP and TLS setup again and keeps nothing alive for the next request.
+
+This registry keeps one connection-pooled ``httpx.AsyncClient`` per provider
+(HTTP/2 via the ``httpx[http2]`` extra, keep-alive, bounded pool) with a
+per-provider cap on in-flight requests, plus one OpenAI client per API key
+built on the pooled transport. Agents with static configuration are cached
+with get_agent().
+
+Anthropic traffic goes through pydantic-ai, which already resolves
+``anthropic:`` model strings to a cached per-provider HTTP client; caching the
+Agents themselves is what avoids rebuilding providers per call.
+
+Clients are closed once, at shutdown, by close_clients(). Callers must not
+close or ``async with`` the clients they get here.
+
+Usage:
+    client = get_http_client("elevenlabs")
+    response = await client.get(url, headers=headers, timeout=30.0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import openai
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Pool and concurrency settings for one provider's client."""
+
+    max_connections: int
+    max_keepalive_connections: int
+    max_concurrency: int  # In-flight requests; HTTP/2 multiplexes past the pool
+    timeout: float  # Default per-request timeout (seconds)
+    keepalive_expiry: float = 60.0
+
+
+PROVIDER_LIMITS: dict[str, ProviderLimits] = {
+    "openai": ProviderLimits(max_connections=20, max_keepalive_connections=10, max_concurrency=32, timeout=30.0),
+    "elevenlabs": ProviderLimits(max_connections=10, max_keepalive_connections=5, max_concurrency=16, timeout=30.0),
+    "telegram": ProviderLimits(max_connections=20, max_keepalive_connections=10, max_concurrency=30, timeout=30.0),
+    "default": ProviderLimits(max_connections=20, max_keepalive_connections=10, max_concurrency=32, timeout=10.0),
+}
+
+
+class _ConcurrencyLimitedTransport(httpx.AsyncBaseTransport):
+    """Caps in-flight requests through a transport with a semaphore.
+
+    The slot is held until response headers arrive; streamed bodies are read
+    outside it.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_concurrency: int) -> None:
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self._semaphore:
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+_http_clients: dict[str, httpx.AsyncClient] = {}
+_openai_clients: dict[str, openai.AsyncOpenAI] = {}
+_agents: dict[Hashable, Any] = {}
+
+
+def get_http_client(provider: str = "default") -> httpx.AsyncClient:
+    """The shared pooled HTTP client for a provider.
+
+    Providers without an entry in PROVIDER_LIMITS get the "default" limits
+    but their own pool.
+    """
+    client = _http_clients.get(provider)
+    if client is None or client.is_closed:
+        limits = PROVIDER_LIMITS.get(provider, PROVIDER_LIMITS["default"])
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+            ),
+        )
+        client = httpx.AsyncClient(
+            transport=_ConcurrencyLimitedTransport(transport, limits.max_concurrency),
+            timeout=limits.timeout,
+        )
+        _http_clients[provider] = client
+    return client
+
+
+def get_openai_client(api_key: str) -> openai.AsyncOpenAI:
+    """The shared OpenAI client for an API key, on the pooled "openai" transport."""
+    client = _openai_clients.get(api_key)
+    if client is None:
+        client = openai.AsyncOpenAI(api_key=api_key, http_client=get_http_client("openai"))
+        _openai_clients[api_key] = client
+    return client
+
+
+def get_agent(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """A cached agent with static configuration, built by factory on first use.
+
+    Include everything the configuration depends on (e.g. the model string)
+    in key, so a settings change builds a new agent.
+    """
+    agent = _agents.get(key)
+    if agent is None:
+        agent = factory()
+        _agents[key] = agent
+    return agent
+
+
+async def close_clients() -> None:
+    """Close every pooled client (application shutdown)."""
+    clients = list(_http_clients.values())
+    clear_clients()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("[CLIENTS] Failed to close HTTP client: %s", e)
+
+
+def clear_clients() -> None:
+    """Forget cached clients and agents without closing them (tests)."""
+    _http_clients.clear()
+    _openai_clients.clear()
+    _agents.clear()
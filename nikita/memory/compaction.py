@@ -0,0 +1,199 @@
+"""Memory fact compaction (POST /tasks/memory-compaction, nightly).
+
+add_fact() only compares a new fact with its single nearest neighbour, so
+over months users accumulate near-duplicates, superseded rows and stale
+low-confidence facts, and vector searches rank more and more dead weight.
+For each user with new facts since their last run this job:
+
+1. Clusters the active facts by embedding similarity (the dedup threshold
+   of the active embedding storage) with batched NumPy matrix products, and
+   supersedes every fact of a cluster by its newest one, which keeps the
+   cluster's highest confidence. This is what add_fact() would have done
+   had each fact been compared against all earlier ones.
+2. Deactivates facts below memory_compaction_min_confidence that are older
+   than LOW_CONFIDENCE_MIN_AGE_DAYS.
+3. Hard-deletes facts superseded (superseded_by set) more than
+   memory_compaction_superseded_retention_days ago. Facts deactivated
+   without a replacement, like the low-confidence ones, are kept.
+4. Records a memory_compaction_runs row.
+
+Each user is compacted in its own transaction, so a failure leaves other
+users' results in place.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from nikita.config.settings import get_settings
+from nikita.db.repositories.memory_compaction_repository import MemoryCompactionRepository
+from nikita.db.repositories.memory_fact_repository import MemoryFactRepository
+from nikita.memory.supabase_memory import _dedup_threshold
+
+logger = logging.getLogger(__name__)
+
+# Users with fewer active facts are left alone
+MIN_ACTIVE_FACTS = 50
+# Users compacted per run (most active facts first)
+MAX_USERS_PER_RUN = 200
+# Newest active facts clustered per user (bounds the similarity matrix)
+MAX_FACTS_PER_USER = 5000
+# Low-confidence facts younger than this are kept
+LOW_CONFIDENCE_MIN_AGE_DAYS = 30
+# Rows of the similarity matrix computed at once (block x n float32)
+_SIMILARITY_BLOCK = 1024
+
+
+def cluster_facts(embeddings: list[list[float]] | np.ndarray, threshold: float) -> list[list[int]]:
+    """Near-duplicate clusters of embeddings ordered newest first.
+
+    Greedy leader clustering: walking the rows in order, each row not yet
+    assigned leads a cluster of itself and every unassigned row with cosine
+    similarity >= threshold to it. Similarities are computed a block of rows
+    at a time against the whole matrix.
+
+    Returns:
+        Clusters with two or more members, as row indices with the leader
+        (newest fact) first.
+    """
+    count = len(embeddings)
+    if count < 2:
+        return []
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    unit = matrix / np.where(norms == 0, 1.0, norms)
+
+    assigned = np.zeros(count, dtype=bool)
+    clusters: list[list[int]] = []
+    for start in range(0, count, _SIMILARITY_BLOCK):
+        similarity = unit[start:start + _SIMILARITY_BLOCK] @ unit.T
+        for offset, row in enumerate(similarity):
+            leader = start + offset
+            if assigned[leader]:
+                continue
+            assigned[leader] = True
+            members = np.flatnonzero((row >= threshold) & ~assigned)
+            if len(members):
+                assigned[members] = True
+                clusters.append([leader, *members.tolist()])
+    return clusters
+
+
+async def compact_user(
+    session: AsyncSession,
+    user_id: UUID,
+    threshold: float,
+    compact: bool = False,
+    min_confidence: float = 0.3,
+    retention_days: int = 30,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """Compact one user's memory facts and record the run (caller commits).
+
+    Args:
+        session: Database session.
+        user_id: Whose facts to compact.
+        threshold: Cosine similarity at which facts are duplicates.
+        compact: Cluster on embedding_compact instead of the full embedding.
+        min_confidence: Old facts below this confidence are deactivated.
+        retention_days: Superseded facts older than this are deleted.
+        now: Current time (tests).
+
+    Returns:
+        The recorded stats (MemoryCompactionRun fields without user_id).
+    """
+    now = now or datetime.now(UTC)
+    started = time.perf_counter()
+    repo = MemoryFactRepository(session)
+
+    active_before = await repo.count_active(user_id)
+    rows = await repo.get_active_vectors(user_id, limit=MAX_FACTS_PER_USER, compact=compact)
+    clusters = cluster_facts([embedding for _, embedding, _ in rows], threshold)
+
+    superseded: dict[UUID, UUID] = {}
+    confidences: dict[UUID, float] = {}
+    for cluster in clusters:
+        leader_id, _, leader_confidence = rows[cluster[0]]
+        for member in cluster[1:]:
+            superseded[rows[member][0]] = leader_id
+        best = max(rows[member][2] for member in cluster)
+        if best > leader_confidence:
+            confidences[leader_id] = best
+    await repo.deactivate_many(superseded)
+    await repo.set_confidences(confidences)
+
+    retired = await repo.deactivate_low_confidence(
+        user_id,
+        below=min_confidence,
+        created_before=now - timedelta(days=LOW_CONFIDENCE_MIN_AGE_DAYS),
+    )
+    deleted = await repo.delete_superseded(
+        user_id, inactive_before=now - timedelta(days=retention_days)
+    )
+
+    stats = {
+        "active_before": active_before,
+        "active_after": active_before - len(superseded) - retired,
+        "clusters_merged": len(clusters),
+        "facts_merged": len(superseded),
+        "low_confidence_retired": retired,
+        "superseded_deleted": deleted,
+        "duration_ms": int((time.perf_counter() - started) * 1000),
+    }
+    await MemoryCompactionRepository(session).record({"user_id": user_id, **stats})
+    return stats
+
+
+async def run_memory_compaction() -> dict[str, Any]:
+    """Compact every candidate user, one transaction per user.
+
+    Returns:
+        Totals over the run: users compacted, failed, and the summed
+        facts_merged / low_confidence_retired / superseded_deleted.
+    """
+    from nikita.db.database import get_session_maker
+
+    settings = get_settings()
+    threshold = _dedup_threshold()
+    compact = settings.memory_embedding_storage == "compact"
+    session_maker = get_session_maker()
+
+    async with session_maker() as session:
+        user_ids = await MemoryCompactionRepository(session).find_candidate_users(
+            min_active_facts=MIN_ACTIVE_FACTS, limit=MAX_USERS_PER_RUN
+        )
+
+    totals = {
+        "users": 0,
+        "failed": 0,
+        "facts_merged": 0,
+        "low_confidence_retired": 0,
+        "superseded_deleted": 0,
+    }
+    for user_id in user_ids:
+        try:
+            async with session_maker() as session:
+                stats = await compact_user(
+                    session,
+                    user_id,
+                    threshold=threshold,
+                    compact=compact,
+                    min_confidence=settings.memory_compaction_min_confidence,
+                    retention_days=settings.memory_compaction_superseded_retention_days,
+                )
+                await session.commit()
+        except Exception as e:
+            totals["failed"] += 1
+            logger.warning("[MEMORY-COMPACTION] user_id=%s failed: %s", user_id, e)
+            continue
+        totals["users"] += 1
+        for key in ("facts_merged", "low_confidence_retired", "superseded_deleted"):
+            totals[key] += stats[key]
+    return totals
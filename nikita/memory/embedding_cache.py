@@ -0,0 +1,200 @@
+"""Two-tier cache for OpenAI embeddings.
+
+SupabaseMemory embeds every search query, and many of them are constant
+strings (PromptBuilderStage's MEMORY_QUERIES, the voice server tool's
+context query). Embeddings are looked up, in order, in:
+
+1. An in-process LRU keyed on (model, hash of the normalized text).
+2. The embedding_cache table (EmbeddingCacheRepository), so a cold
+   instance gets constant queries from one indexed lookup.
+
+Only the remaining texts go to the embedding API, in one batch, and are
+written back to the tiers they belong to.
+
+The persistent tier only holds the constant queries registered by
+warm_up() at startup. Fact ingestion and per-message searches embed user
+text that is rarely repeated: it stays in the LRU only, so it costs no
+extra round trips and no copy of it is written outside memory_facts. The
+table is pruned by age and size (see its migrations). It is read and
+written in its own short sessions (never the caller's, which may be a
+pipeline session in use by concurrent lookups) and is best effort: if it
+fails, the API result is still returned.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Vectors kept in process (1536 floats each, ~12 KB as Python lists)
+EMBEDDING_CACHE_SIZE = 2048
+
+Embedder = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace and strip the ends."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def text_hash(model: str, text: str) -> str:
+    """Cache key for an embedding: SHA-256 of model and normalized text."""
+    return hashlib.sha256(f"{model}\n{normalize_text(text)}".encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """In-process LRU of embeddings, backed by the embedding_cache table.
+
+    Usage:
+        vectors = await embedding_cache.get_many(model, texts, embed_api_call)
+    """
+
+    def __init__(self, maxsize: int = EMBEDDING_CACHE_SIZE, persistent: bool = True) -> None:
+        self.maxsize = maxsize
+        self.persistent = persistent
+        self._entries: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        # (model, key) of the constant queries the persistent tier serves
+        self._persistent_keys: set[tuple[str, str]] = set()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def _get(self, model: str, key: str) -> list[float] | None:
+        vector = self._entries.get((model, key))
+        if vector is not None:
+            self._entries.move_to_end((model, key))
+        return vector
+
+    def _put(self, model: str, key: str, vector: list[float]) -> None:
+        self._entries[(model, key)] = vector
+        self._entries.move_to_end((model, key))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_many(
+        self,
+        model: str,
+        texts: list[str],
+        embed: Embedder,
+    ) -> list[list[float]]:
+        """Embeddings for texts, in order; only cache misses reach `embed`.
+
+        Args:
+            model: Embedding model name (part of the key).
+            texts: Texts to embed. Duplicates are embedded once.
+            embed: Embedding API call for a list of texts.
+
+        Raises:
+            Whatever `embed` raises for the missing texts.
+        """
+        keys = [text_hash(model, text) for text in texts]
+        found: dict[str, list[float]] = {}
+        for key in keys:
+            vector = self._get(model, key)
+            if vector is not None:
+                found[key] = vector
+                self.memory_hits += 1
+
+        missing = list(dict.fromkeys(k for k in keys if k not in found))
+        pinned = [k for k in missing if (model, k) in self._persistent_keys]
+        if pinned and self.persistent:
+            stored = await self._load(model, pinned)
+            for key, vector in stored.items():
+                self._put(model, key, vector)
+                found[key] = vector
+            self.db_hits += len(stored)
+            missing = [k for k in missing if k not in found]
+
+        if missing:
+            first_text = {}
+            for key, text in zip(keys, texts, strict=True):
+                first_text.setdefault(key, text)
+            vectors = await embed([first_text[key] for key in missing])
+            if len(vectors) != len(missing):
+                raise ValueError(
+                    f"embedding API returned {len(vectors)} vectors for {len(missing)} texts"
+                )
+            self.misses += len(missing)
+            new = dict(zip(missing, vectors, strict=True))
+            for key, vector in new.items():
+                self._put(model, key, vector)
+            found.update(new)
+            to_store = {k: v for k, v in new.items() if (model, k) in self._persistent_keys}
+            if to_store and self.persistent:
+                await self._store(model, to_store)
+
+        return [found[key] for key in keys]
+
+    async def warm_up(self, model: str, texts: Iterable[str], embed: Embedder) -> int:
+        """Preload embeddings for known constant queries.
+
+        The texts are also registered for the persistent tier, so later
+        lookups of them survive LRU eviction and instance restarts.
+
+        Returns:
+            Number of texts now cached (0 if the embedding call failed).
+        """
+        texts = list(dict.fromkeys(texts))
+        self._persistent_keys.update((model, text_hash(model, text)) for text in texts)
+        try:
+            await self.get_many(model, texts, embed)
+        except Exception as e:
+            logger.warning("[EMBEDDING-CACHE] Warm-up failed: %s", e)
+            return 0
+        return len(texts)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counts and rates since startup (this instance)."""
+        lookups = self.memory_hits + self.db_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.db_hits) / lookups, 4) if lookups else None,
+            "memory_hit_rate": round(self.memory_hits / lookups, 4) if lookups else None,
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._persistent_keys.clear()
+        self.memory_hits = self.db_hits = self.misses = 0
+
+    async def _load(self, model: str, keys: list[str]) -> dict[str, list[float]]:
+        try:
+            from nikita.db.database import get_session_maker
+            from nikita.db.repositories.embedding_cache_repository import (
+                EmbeddingCacheRepository,
+            )
+
+            async with get_session_maker()() as session:
+                stored = await EmbeddingCacheRepository(session).get_many(model, keys)
+            return {k: v for k, v in stored.items() if k in keys}
+        except Exception as e:
+            logger.warning("[EMBEDDING-CACHE] Persistent lookup failed: %s", e)
+            return {}
+
+    async def _store(self, model: str, vectors: dict[str, list[float]]) -> None:
+        try:
+            from nikita.db.database import get_session_maker
+            from nikita.db.repositories.embedding_cache_repository import (
+                EmbeddingCacheRepository,
+            )
+
+            async with get_session_maker()() as session:
+                await EmbeddingCacheRepository(session).insert_many(model, vectors)
+                await session.commit()
+        except Exception as e:
+            logger.warning("[EMBEDDING-CACHE] Persistent store failed: %s", e)
+
+
+embedding_cache = EmbeddingCache()
@@ -10,13 +10,17 @@ import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
+import numpy as np
 import openai
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from nikita.config.settings import get_settings
 from nikita.db.repositories.memory_fact_repository import MemoryFactRepository
+from nikita.llm.clients import get_openai_client
+from nikita.memory.embedding_cache import embedding_cache
+from nikita.observability.profiler import profile_span
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +35,13 @@ ALL_GRAPH_TYPES = ["user", "relationship", "nikita"]
 
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMS = 1536
+# memory_facts.embedding_compact halfvec(512) (memory_embedding_storage)
+COMPACT_EMBEDDING_DIMS = 512
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 1  # seconds
+# Reciprocal-rank fusion constant for hybrid search (the usual 60: damps
+# the advantage of the very top ranks of either list)
+RRF_K = 60
 
 # Spec 216 EM-3b: tuning constant moved to nikita.config.settings as
 # `memory_dedup_similarity_threshold` per `.claude/rules/tuning-constants.md`
@@ -46,16 +55,14 @@ RETRY_BACKOFF_BASE = 1  # seconds
 # a backward-compat alias for the small set of legacy callers + tests that
 # imported `DEDUP_SIMILARITY_THRESHOLD` directly before EM-3b.
 #
-# Production code path: `find_similar(threshold=DEDUP_SIMILARITY_THRESHOLD)`
-# uses this constant as the default value, but callers may pass through
-# `get_settings().memory_dedup_similarity_threshold` directly to honor
-# overrides. Test code that needs to vary the threshold should pass it
-# explicitly to `find_similar(...)` rather than mutating the module
-# constant.
+# Production code path: add_fact() and add_facts_bulk() read the threshold
+# for the active embedding storage via `_dedup_threshold()`;
+# `find_similar(threshold=DEDUP_SIMILARITY_THRESHOLD)` still uses this
+# constant as the default value. Test code that needs to vary the threshold
+# should pass it explicitly to `find_similar(...)` rather than mutating the
+# module constant.
 #
-# Future cleanup: migrate the 2 internal call sites in this module to read
-# `get_settings().memory_dedup_similarity_threshold` directly, then drop
-# this alias.
+# Future cleanup: drop this alias once no caller relies on the default.
 #
 # History (driving issue → value):
 #   - Spec 042              → 0.95
@@ -70,6 +77,117 @@ class EmbeddingError(Exception):
     pass
 
 
+async def _embed_with_retry(client: openai.AsyncOpenAI, texts: list[str]) -> list[list[float]]:
+    """Embed texts in one API call, retrying with exponential backoff."""
+    last_error: Exception | None = None
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            with profile_span("embedding"):
+                response = await client.embeddings.create(
+                    input=texts[0] if len(texts) == 1 else texts,
+                    model=EMBEDDING_MODEL,
+                )
+            return [d.embedding for d in response.data]
+        except Exception as e:
+            last_error = e
+            if attempt < MAX_RETRIES - 1:
+                wait = RETRY_BACKOFF_BASE * (2**attempt)
+                logger.warning(
+                    "[EMBEDDING] Attempt %d failed: %s. Retrying in %ds...",
+                    attempt + 1,
+                    str(e)[:100],
+                    wait,
+                )
+                await asyncio.sleep(wait)
+
+    raise EmbeddingError(
+        f"Embedding generation failed after {MAX_RETRIES} attempts: {last_error}"
+    )
+
+
+def _ef_search_for(limit: int) -> int | None:
+    """hnsw.ef_search for a search returning up to limit rows.
+
+    None when the connection default (memory_hnsw_ef_search) already keeps
+    limit x memory_search_overfetch candidates; the over-fetch leaves room
+    for rows the user/confidence filters drop after the index scan.
+    """
+    settings = get_settings()
+    wanted = min(limit * settings.memory_search_overfetch, 1000)
+    return wanted if wanted > settings.memory_hnsw_ef_search else None
+
+
+def compact_embedding(embedding: list[float]) -> list[float]:
+    """The COMPACT_EMBEDDING_DIMS form of a text-embedding-3 vector.
+
+    Requesting text-embedding-3 with ``dimensions=N`` returns the first N
+    components of the full embedding renormalized to unit length, so the
+    compact vector is derived here rather than with a second API call (and
+    the embedding cache keeps storing full vectors only).
+    """
+    head = np.asarray(embedding[:COMPACT_EMBEDDING_DIMS], dtype=np.float32)
+    norm = float(np.linalg.norm(head))
+    return (head / norm if norm else head).tolist()
+
+
+def _dedup_threshold() -> float:
+    """Dedup similarity threshold calibrated for the searched embedding."""
+    settings = get_settings()
+    if settings.memory_embedding_storage == "compact":
+        return settings.memory_compact_dedup_similarity_threshold
+    return settings.memory_dedup_similarity_threshold
+
+
+def _rrf_fuse(*rankings: list[Any]) -> list[tuple[Any, float]]:
+    """Merge ranked lists of facts by reciprocal-rank fusion.
+
+    Each fact scores sum(1 / (RRF_K + rank)) over the lists it appears in
+    (rank starting at 1); facts are identified by id.
+
+    Returns:
+        (fact, score) pairs ordered by score DESC.
+    """
+    scores: dict[Any, float] = {}
+    facts: dict[Any, Any] = {}
+    for ranking in rankings:
+        for rank, fact in enumerate(ranking, start=1):
+            facts.setdefault(fact.id, fact)
+            scores[fact.id] = scores.get(fact.id, 0.0) + 1.0 / (RRF_K + rank)
+    ordered = sorted(scores, key=scores.get, reverse=True)
+    return [(facts[fact_id], scores[fact_id]) for fact_id in ordered]
+
+
+def _result_dict(fact: Any, distance: float | None) -> dict[str, Any]:
+    """A search result as returned by SupabaseMemory.search()."""
+    return {
+        "fact": fact.fact,
+        "graph_type": fact.graph_type,
+        "created_at": fact.created_at,
+        "distance": distance,
+        "confidence": fact.confidence,
+    }
+
+
+def _dedup_within_batch(embeddings: list[list[float]], threshold: float) -> list[int]:
+    """Indices of the facts to keep when a batch contains near-duplicates.
+
+    Of each group of facts with cosine similarity >= threshold the last one
+    is kept, as it would have superseded the earlier ones had they been
+    added one at a time.
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    unit = matrix / np.where(norms == 0, 1.0, norms)
+    similarity = unit @ unit.T
+
+    kept: list[int] = []
+    for i in reversed(range(len(embeddings))):
+        if not kept or similarity[i, kept].max() < threshold:
+            kept.append(i)
+    return kept[::-1]
+
+
 class SupabaseMemory:
     """pgVector-based memory system using Supabase PostgreSQL.
 
@@ -97,7 +215,7 @@ class SupabaseMemory:
         self._openai_api_key = openai_api_key
         self._session = session
         self._repo = MemoryFactRepository(session)
-        self._client = openai.AsyncOpenAI(api_key=openai_api_key)
+        self._client = get_openai_client(openai_api_key)
         self._closed = False
 
     async def __aenter__(self) -> "SupabaseMemory":
@@ -124,31 +242,15 @@ class SupabaseMemory:
         AC-1.3.1: Uses text-embedding-3-small (1536 dims).
         AC-1.3.3: Retries 3x with exponential backoff (1s, 2s, 4s).
         AC-1.3.4: Raises EmbeddingError on persistent failure.
-        """
-        last_error: Exception | None = None
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = await self._client.embeddings.create(
-                    input=text,
-                    model=EMBEDDING_MODEL,
-                )
-                return response.data[0].embedding
-            except Exception as e:
-                last_error = e
-                if attempt < MAX_RETRIES - 1:
-                    wait = RETRY_BACKOFF_BASE * (2**attempt)
-                    logger.warning(
-                        "[EMBEDDING] Attempt %d failed: %s. Retrying in %ds...",
-                        attempt + 1,
-                        str(e)[:100],
-                        wait,
-                    )
-                    await asyncio.sleep(wait)
-
-        raise EmbeddingError(
-            f"Embedding generation failed after {MAX_RETRIES} attempts: {last_error}"
-        )
+        Served from the embedding cache when the text was embedded before.
+        """
+        if get_settings().embedding_cache_enabled:
+            vectors = await embedding_cache.get_many(
+                EMBEDDING_MODEL, [text], self._embed_uncached
+            )
+            return vectors[0]
+        return (await self._embed_uncached([text]))[0]
 
     async def generate_embeddings_batch(
         self, texts: list[str]
@@ -156,25 +258,38 @@ class SupabaseMemory:
         """Generate embeddings for multiple texts in a single API call.
 
         AC-1.3.2: Batch embedding support (up to 100 texts per call).
+
+        Only texts missing from the embedding cache are sent to the API.
         """
-        last_error: Exception | None = None
+        if get_settings().embedding_cache_enabled:
+            return await embedding_cache.get_many(
+                EMBEDDING_MODEL, texts, self._embed_uncached
+            )
+        return await self._embed_uncached(texts)
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = await self._client.embeddings.create(
-                    input=texts,
-                    model=EMBEDDING_MODEL,
-                )
-                return [d.embedding for d in response.data]
-            except Exception as e:
-                last_error = e
-                if attempt < MAX_RETRIES - 1:
-                    wait = RETRY_BACKOFF_BASE * (2**attempt)
-                    await asyncio.sleep(wait)
-
-        raise EmbeddingError(
-            f"Batch embedding failed after {MAX_RETRIES} attempts: {last_error}"
-        )
+    async def _embed_uncached(self, texts: list[str]) -> list[list[float]]:
+        """One embeddings API call for texts, with retry (AC-1.3.3, AC-1.3.4)."""
+        return await _embed_with_retry(self._client, texts)
+
+    # ── Embedding Storage ────────────────────────────────────────────────
+
+    @staticmethod
+    def _compact_fields(embedding: list[float]) -> dict[str, Any]:
+        """embedding_compact for a new fact, unless storage is "full"."""
+        if get_settings().memory_embedding_storage == "full":
+            return {}
+        return {"embedding_compact": compact_embedding(embedding)}
+
+    @staticmethod
+    def _search_vector(embedding: list[float]) -> dict[str, Any]:
+        """Repository search arguments for a full query embedding.
+
+        In "compact" storage the search runs on embedding_compact with the
+        compact form of the query.
+        """
+        if get_settings().memory_embedding_storage == "compact":
+            return {"query_embedding": compact_embedding(embedding), "compact": True}
+        return {"query_embedding": embedding}
 
     # ── Core Operations (T1.1) ───────────────────────────────────────────
 
@@ -199,7 +314,7 @@ class SupabaseMemory:
 
         # T1.2: Check for duplicates before inserting — pass pre-computed embedding
         existing = await self.find_similar(
-            fact, threshold=DEDUP_SIMILARITY_THRESHOLD, embedding=embedding
+            fact, threshold=_dedup_threshold(), embedding=embedding
         )
 
         new_fact = await self._repo.add_fact(
@@ -211,6 +326,7 @@ class SupabaseMemory:
             confidence=confidence,
             metadata=metadata,
             conversation_id=conversation_id,
+            **self._compact_fields(embedding),
         )
 
         # AC-1.2.3: Deactivate old fact if duplicate found
@@ -222,12 +338,95 @@ class SupabaseMemory:
 
         return new_fact
 
+    async def add_facts_bulk(
+        self,
+        facts: list[dict[str, Any]],
+        source: str,
+        confidence: float,
+        conversation_id: UUID | None = None,
+    ) -> dict[str, int]:
+        """Add many facts with batched embedding and dedup.
+
+        Same outcome as add_fact() per fact, in one embedding call and three
+        queries:
+        1. generate_embeddings_batch() for all facts.
+        2. Near-duplicates within the batch collapse to the last one
+           (NumPy cosine similarity, no round trip).
+        3. One LATERAL nearest-neighbour query against existing facts.
+        4. One multi-row INSERT, then one UPDATE deactivating the
+           superseded facts.
+
+        Args:
+            facts: Dicts with "fact" and "graph_type", optionally "metadata"
+                and "confidence" (overrides the shared confidence).
+            source: Where the facts came from (e.g. 'pipeline_extraction').
+            confidence: 0.0 to 1.0 confidence score.
+            conversation_id: Optional conversation UUID.
+
+        Returns:
+            Counts: stored (inserted), superseded (existing facts
+            deactivated) and deduplicated (dropped as duplicates within
+            the batch).
+        """
+        facts = [f for f in facts if f.get("fact")]
+        if not facts:
+            return {"stored": 0, "superseded": 0, "deduplicated": 0}
+
+        threshold = _dedup_threshold()
+        embeddings = await self.generate_embeddings_batch([f["fact"] for f in facts])
+        storage = get_settings().memory_embedding_storage
+        compact = (
+            [compact_embedding(e) for e in embeddings] if storage != "full" else None
+        )
+        # Compare in the space the threshold was calibrated for
+        searched = compact if storage == "compact" else embeddings
+
+        kept = _dedup_within_batch(searched, threshold)
+        nearest = await self._repo.find_nearest_batch(
+            user_id=self.user_id,
+            embeddings=[searched[i] for i in kept],
+            **({"compact": True} if storage == "compact" else {}),
+        )
+
+        rows = []
+        superseded: dict[UUID, UUID] = {}
+        max_distance = 1.0 - threshold
+        for i, match in zip(kept, nearest, strict=True):
+            fact_id = uuid4()
+            rows.append({
+                "id": fact_id,
+                "user_id": self.user_id,
+                "graph_type": facts[i]["graph_type"],
+                "fact": facts[i]["fact"],
+                "source": source,
+                "confidence": facts[i].get("confidence", confidence),
+                "embedding": embeddings[i],
+                "fact_metadata": facts[i].get("metadata") or {},
+                "is_active": True,
+                "conversation_id": conversation_id,
+                **({"embedding_compact": compact[i]} if compact else {}),
+            })
+            # AC-1.2.3: supersede the existing near-duplicate
+            if match is not None and match[1] <= max_distance:
+                superseded[match[0]] = fact_id
+
+        await self._repo.add_facts(rows)
+        await self._repo.deactivate_many(superseded)
+
+        return {
+            "stored": len(rows),
+            "superseded": len(superseded),
+            "deduplicated": len(facts) - len(rows),
+        }
+
     async def search(
         self,
         query: str,
         graph_types: list[str] | None = None,
         limit: int = 10,
         min_confidence: float = 0.0,
+        query_embedding: list[float] | None = None,
+        hybrid: bool = False,
     ) -> list[dict[str, Any]]:
         """Semantic search across knowledge graphs.
 
@@ -235,32 +434,62 @@ class SupabaseMemory:
 
         Spec 102 FR-002: Uses a single batch DB call via semantic_search_batch()
         instead of N sequential calls (one per graph type).
+
+        Pass query_embedding when already computed (e.g. one
+        generate_embeddings_batch() call for several queries) to skip the
+        embedding API call.
+
+        hybrid=True (memory_hybrid_search_enabled) first runs a full-text
+        search on the query. If at least min(limit,
+        memory_lexical_fast_path_min_hits) facts contain every query term,
+        those results are returned without embedding the query; otherwise
+        the lexical and vector results are merged by reciprocal-rank fusion.
+        Hybrid results carry a "score" (fusion score, or text rank on the
+        fast path); "distance" is None for facts only the text search found.
         """
         if graph_types is None:
             graph_types = ALL_GRAPH_TYPES
 
-        query_embedding = await self._generate_embedding(query)
+        settings = get_settings()
+        lexical: list[tuple[Any, float, bool]] = []
+        if hybrid and settings.memory_hybrid_search_enabled:
+            lexical = await self._repo.lexical_search(
+                user_id=self.user_id,
+                query=query,
+                graph_types=graph_types,
+                limit=limit,
+                min_confidence=min_confidence,
+            )
+            min_hits = min(limit, settings.memory_lexical_fast_path_min_hits)
+            full_matches = sum(1 for _, _, matches_all in lexical if matches_all)
+            if query_embedding is None and min_hits and full_matches >= min_hits:
+                return [
+                    {**_result_dict(fact, None), "score": rank}
+                    for fact, rank, _ in lexical[:limit]
+                ]
+
+        if query_embedding is None:
+            query_embedding = await self._generate_embedding(query)
 
         rows = await self._repo.semantic_search_batch(
             user_id=self.user_id,
-            query_embedding=query_embedding,
+            **self._search_vector(query_embedding),
             graph_types=graph_types,
             limit=limit,
             min_confidence=min_confidence,
+            ef_search=_ef_search_for(limit),
         )
 
-        results = []
-        for fact, distance in rows:
-            results.append({
-                "fact": fact.fact,
-                "graph_type": fact.graph_type,
-                "created_at": fact.created_at,
-                "distance": distance,
-                "confidence": fact.confidence,
-            })
+        if lexical:
+            distances = {fact.id: distance for fact, distance in rows}
+            fused = _rrf_fuse([fact for fact, _ in rows], [fact for fact, _, _ in lexical])
+            return [
+                {**_result_dict(fact, distances.get(fact.id)), "score": score}
+                for fact, score in fused[:limit]
+            ]
 
         # Results already ordered by distance from pgVector ORDER BY
-        return results[:limit]
+        return [_result_dict(fact, distance) for fact, distance in rows[:limit]]
 
     async def get_recent(
         self,
@@ -332,7 +561,7 @@ class SupabaseMemory:
 
         results = await self._repo.semantic_search(
             user_id=self.user_id,
-            query_embedding=embedding,
+            **self._search_vector(embedding),
             limit=1,
         )
 
@@ -370,12 +599,9 @@ class SupabaseMemory:
 
     async def get_user_facts(self, limit: int = 50) -> list[str]:
         """Get user facts as strings (NikitaMemory compat)."""
-        facts = await self._repo.get_by_user(
-            user_id=self.user_id,
-            graph_type="user",
-            active_only=True,
+        return await self._repo.get_fact_texts(
+            user_id=self.user_id, graph_type="user", limit=limit
         )
-        return [f.fact for f in facts[:limit]]
 
     async def add_relationship_episode(
         self,
@@ -393,12 +619,9 @@ class SupabaseMemory:
 
     async def get_relationship_episodes(self, limit: int = 50) -> list[str]:
         """Get relationship episodes as strings (NikitaMemory compat)."""
-        facts = await self._repo.get_by_user(
-            user_id=self.user_id,
-            graph_type="relationship",
-            active_only=True,
+        return await self._repo.get_fact_texts(
+            user_id=self.user_id, graph_type="relationship", limit=limit
         )
-        return [f.fact for f in facts[:limit]]
 
     async def add_nikita_event(
         self,
@@ -416,24 +639,23 @@ class SupabaseMemory:
 
     async def get_nikita_events(self, limit: int = 50) -> list[str]:
         """Get Nikita events as strings (NikitaMemory compat)."""
-        facts = await self._repo.get_by_user(
-            user_id=self.user_id,
-            graph_type="nikita",
-            active_only=True,
+        return await self._repo.get_fact_texts(
+            user_id=self.user_id, graph_type="nikita", limit=limit
         )
-        return [f.fact for f in facts[:limit]]
 
     async def search_memory(
         self,
         query: str,
         graph_types: list[str] | None = None,
         limit: int = 10,
+        hybrid: bool = False,
     ) -> list[dict[str, Any]]:
         """Search memory (NikitaMemory compat wrapper)."""
         return await self.search(
             query=query,
             graph_types=graph_types,
             limit=limit,
+            hybrid=hybrid,
         )
 
 
@@ -455,3 +677,20 @@ async def get_supabase_memory_client(user_id: UUID) -> SupabaseMemory:
         user_id=user_id,
         openai_api_key=settings.openai_api_key or "",
     )
+
+
+async def warm_embedding_cache(queries: list[str]) -> int:
+    """Preload the embedding cache with constant search queries.
+
+    Called once at startup; needs no session or user.
+
+    Returns:
+        Number of queries cached (0 if disabled or the API call failed).
+    """
+    settings = get_settings()
+    if not settings.embedding_cache_enabled or not settings.openai_api_key:
+        return 0
+    client = get_openai_client(settings.openai_api_key)
+    return await embedding_cache.warm_up(
+        EMBEDDING_MODEL, queries, lambda texts: _embed_with_retry(client, texts)
+    )
@@ -7,9 +7,8 @@ All errors are caught and logged — push failures never block game flow.
 import logging
 from uuid import UUID
 
-import httpx
-
 from nikita.config.settings import get_settings
+from nikita.llm.clients import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -47,41 +46,41 @@ async def send_push(
     function_url = f"{settings.supabase_url}/functions/v1/push-notify"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                function_url,
-                json={
-                    "user_id": str(user_id),
-                    "title": title,
-                    "body": body,
-                    "url": url,
-                    "tag": tag,
-                },
-                headers={
-                    "Authorization": f"Bearer {settings.supabase_service_key or ''}",
-                    "Content-Type": "application/json",
-                },
-            )
+        response = await get_http_client("supabase").post(
+            function_url,
+            json={
+                "user_id": str(user_id),
+                "title": title,
+                "body": body,
+                "url": url,
+                "tag": tag,
+            },
+            headers={
+                "Authorization": f"Bearer {settings.supabase_service_key or ''}",
+                "Content-Type": "application/json",
+            },
+            timeout=10.0,
+        )
 
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("sent", 0) == 0 and result.get("message", "").startswith("Push delivery stub"):
-                    logger.info("[Push] STUB: push-notify edge function not yet implemented, user=%s", user_id)
-                else:
-                    logger.info(
-                        "[Push] Sent to user %s: %d sent, %d failed",
-                        user_id,
-                        result.get("sent", 0),
-                        result.get("failed", 0),
-                    )
-                return result
+        if response.status_code == 200:
+            result = response.json()
+            if result.get("sent", 0) == 0 and result.get("message", "").startswith("Push delivery stub"):
+                logger.info("[Push] STUB: push-notify edge function not yet implemented, user=%s", user_id)
             else:
-                logger.warning(
-                    "[Push] Edge function returned %d: %s",
-                    response.status_code,
-                    response.text[:200],
+                logger.info(
+                    "[Push] Sent to user %s: %d sent, %d failed",
+                    user_id,
+                    result.get("sent", 0),
+                    result.get("failed", 0),
                 )
-                return {"sent": 0, "failed": 0, "error": f"HTTP {response.status_code}"}
+            return result
+        else:
+            logger.warning(
+                "[Push] Edge function returned %d: %s",
+                response.status_code,
+                response.text[:200],
+            )
+            return {"sent": 0, "failed": 0, "error": f"HTTP {response.status_code}"}
 
     except Exception as exc:
         logger.error("[Push] Failed to send push to user %s: %s", user_id, exc)
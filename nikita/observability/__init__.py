@@ -12,13 +12,14 @@ Usage:
 """
 
 from nikita.observability.emitter import EventEmitter, NullEmitter
-from nikita.observability.snapshots import compute_delta, snapshot_ctx
+from nikita.observability.snapshots import compute_delta, delta_from_writes, snapshot_ctx
 from nikita.observability.types import STAGE_EVENT_TYPES
 
 __all__ = [
     "EventEmitter",
     "NullEmitter",
     "compute_delta",
+    "delta_from_writes",
     "snapshot_ctx",
     "STAGE_EVENT_TYPES",
 ]
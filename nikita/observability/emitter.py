@@ -20,6 +20,8 @@ logger = logging.getLogger(__name__)
 # Max event data payload size (16KB)
 MAX_EVENT_DATA_SIZE = 16_384
 
+_encoder = json.JSONEncoder(default=str)
+
 
 class EventEmitterProtocol(Protocol):
     """Protocol for event emitters (real + null)."""
@@ -65,22 +67,13 @@ class EventEmitter:
         data: dict[str, Any] | None = None,
         duration_ms: int | None = None,
     ) -> None:
-        """Append an event to the buffer. No I/O — just memory."""
-        payload = data or {}
+        """Append an event to the buffer. No I/O — just memory.
 
-        # Truncate oversized payloads
-        try:
-            serialized = json.dumps(payload, default=str)
-            if len(serialized) > MAX_EVENT_DATA_SIZE:
-                payload = _truncate_payload(payload)
-                payload["_truncated"] = True
-                logger.warning(
-                    "event_payload_truncated event_type=%s size=%d",
-                    event_type,
-                    len(serialized),
-                )
-        except (TypeError, ValueError):
-            payload = {"_serialization_error": True}
+        The payload is stored as given; it is sized and, if oversized,
+        truncated once at flush (see _bounded_payload) instead of being
+        serialized here on every emit.
+        """
+        payload = data or {}
 
         self._buffer.append(
             {
@@ -102,7 +95,7 @@ class EventEmitter:
         try:
             from nikita.db.models.pipeline_event import PipelineEvent
 
-            events = [PipelineEvent(**event_data) for event_data in self._buffer]
+            events = [PipelineEvent(**self._prepare(event_data)) for event_data in self._buffer]
             session.add_all(events)
             # Don't commit — let the caller's transaction handle it.
             # The orchestrator already commits after pipeline completes.
@@ -138,6 +131,14 @@ class EventEmitter:
         finally:
             self._buffer.clear()
 
+    @staticmethod
+    def _prepare(event_data: dict[str, Any]) -> dict[str, Any]:
+        """Event row with its data payload size-bounded."""
+        return {
+            **event_data,
+            "data": _bounded_payload(event_data["data"], event_data["event_type"]),
+        }
+
     @property
     def event_count(self) -> int:
         """Number of events in the buffer."""
@@ -145,8 +146,8 @@ class EventEmitter:
 
     @property
     def events(self) -> list[dict[str, Any]]:
-        """Read-only access to buffer (for testing)."""
-        return list(self._buffer)
+        """Read-only access to buffer, payloads as flush would write them (for testing)."""
+        return [self._prepare(event_data) for event_data in self._buffer]
 
 
 class NullEmitter:
@@ -174,6 +175,38 @@ class NullEmitter:
         return []
 
 
+def _encoded_size(data: dict[str, Any], limit: int) -> int:
+    """JSON-encoded size of data, stopping early once it exceeds limit.
+
+    Encodes incrementally, so an oversized payload costs ~limit bytes of
+    encoding rather than a full json.dumps.
+    """
+    size = 0
+    for chunk in _encoder.iterencode(data):
+        size += len(chunk)
+        if size > limit:
+            break
+    return size
+
+
+def _bounded_payload(data: dict[str, Any], event_type: str) -> dict[str, Any]:
+    """Payload truncated to MAX_EVENT_DATA_SIZE, or a serialization-error marker."""
+    try:
+        size = _encoded_size(data, MAX_EVENT_DATA_SIZE)
+    except (TypeError, ValueError):
+        return {"_serialization_error": True}
+    if size <= MAX_EVENT_DATA_SIZE:
+        return data
+    payload = _truncate_payload(data)
+    payload["_truncated"] = True
+    logger.warning(
+        "event_payload_truncated event_type=%s size>%d",
+        event_type,
+        MAX_EVENT_DATA_SIZE,
+    )
+    return payload
+
+
 def _truncate_payload(data: dict[str, Any], max_items: int = 10) -> dict[str, Any]:
     """Truncate lists in payload to max_items to reduce size."""
     result: dict[str, Any] = {}
@@ -0,0 +1,177 @@
+"""Streaming per-stage latency histograms.
+
+Fixed log buckets (4 per doubling, ~19% relative error, 1ms .. ~17min) are
+kept in process per (stage, component) and periodically flushed as one row
+per key to pipeline_latency_histograms. Percentiles over any window are
+computed by merging rows (adding bucket counts), so the admin endpoints
+never load or sort raw samples.
+
+component is "total" for stage wall time, or a profiler component
+(db / llm / embedding / render / other, see nikita.observability.profiler).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Buckets per doubling; bucket i covers [2^((i-1)/4), 2^(i/4)) ms, bucket 0 is < 1ms
+BUCKETS_PER_DOUBLING = 4
+MAX_BUCKET = 80  # 2^20 ms ~ 17.5 min; slower samples land in the last bucket
+
+# Flush in-process histograms at most this often (from the pipeline path)
+FLUSH_INTERVAL_SECONDS = 60.0
+
+
+def bucket_index(ms: float) -> int:
+    """Bucket for a sample in milliseconds."""
+    if ms < 1.0:
+        return 0
+    return min(int(math.log2(ms) * BUCKETS_PER_DOUBLING) + 1, MAX_BUCKET)
+
+
+def bucket_upper_ms(index: int) -> float:
+    """Upper bound of a bucket (the value reported for percentiles)."""
+    return 2 ** (index / BUCKETS_PER_DOUBLING)
+
+
+@dataclass
+class LatencyHistogram:
+    """Sparse fixed-bucket histogram with count, sum and max."""
+
+    buckets: dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    sum_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, ms: float) -> None:
+        idx = bucket_index(ms)
+        self.buckets[idx] = self.buckets.get(idx, 0) + 1
+        self.count += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for idx, n in other.buckets.items():
+            self.buckets[idx] = self.buckets.get(idx, 0) + n
+        self.count += other.count
+        self.sum_ms += other.sum_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-quantile (0 < q <= 1), capped at the observed max."""
+        if self.count == 0:
+            return 0.0
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+            if seen >= rank:
+                return min(bucket_upper_ms(idx), self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> dict[str, Any]:
+        """Stats dict in the shape of /admin/pipeline/timings."""
+        return {
+            "count": self.count,
+            "p50_ms": round(self.percentile(0.50), 1),
+            "p95_ms": round(self.percentile(0.95), 1),
+            "p99_ms": round(self.percentile(0.99), 1),
+            "avg_ms": round(self.sum_ms / self.count, 1) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 1),
+        }
+
+    @classmethod
+    def from_row(cls, buckets: dict[str, int], count: int, sum_ms: float, max_ms: float) -> LatencyHistogram:
+        return cls(
+            buckets={int(k): v for k, v in buckets.items()},
+            count=count,
+            sum_ms=sum_ms,
+            max_ms=max_ms,
+        )
+
+
+class LatencyRecorder:
+    """Process-wide histograms keyed by (stage, component)."""
+
+    def __init__(self) -> None:
+        self._histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self._window_start = datetime.now(UTC)
+        self._last_flush = time.monotonic()
+
+    def record(self, stage: str, component: str, ms: float) -> None:
+        key = (stage, component)
+        hist = self._histograms.get(key)
+        if hist is None:
+            hist = self._histograms[key] = LatencyHistogram()
+        hist.record(ms)
+
+    def pending(self) -> dict[tuple[str, str], LatencyHistogram]:
+        """Unflushed histograms (read-only view for live profiling)."""
+        return dict(self._histograms)
+
+    def _take(self) -> tuple[datetime, dict[tuple[str, str], LatencyHistogram]]:
+        taken, window_start = self._histograms, self._window_start
+        self._histograms = {}
+        self._window_start = datetime.now(UTC)
+        self._last_flush = time.monotonic()
+        return window_start, taken
+
+    async def flush(self, session_maker: async_sessionmaker[AsyncSession] | None = None) -> int:
+        """Write one aggregate row per key and reset. Best-effort.
+
+        Returns:
+            Number of rows written (0 on failure; the samples are dropped
+            rather than retried, so a DB outage can't grow memory).
+        """
+        window_start, taken = self._take()
+        if not taken:
+            return 0
+
+        from nikita.db.repositories.pipeline_latency_repository import (
+            PipelineLatencyRepository,
+        )
+
+        rows = [
+            {
+                "window_start": window_start,
+                "window_end": datetime.now(UTC),
+                "stage": stage,
+                "component": component,
+                "sample_count": hist.count,
+                "sum_ms": hist.sum_ms,
+                "max_ms": hist.max_ms,
+                "buckets": {str(k): v for k, v in hist.buckets.items()},
+            }
+            for (stage, component), hist in taken.items()
+        ]
+        try:
+            if session_maker is None:
+                from nikita.db.database import get_session_maker
+
+                session_maker = get_session_maker()
+            async with session_maker() as session:
+                await PipelineLatencyRepository(session).insert_windows(rows)
+                await session.commit()
+            return len(rows)
+        except Exception as e:
+            logger.warning("latency_flush_failed rows=%d: %s", len(rows), e)
+            return 0
+
+    async def maybe_flush(self) -> int:
+        """Flush if FLUSH_INTERVAL_SECONDS have passed since the last flush."""
+        if time.monotonic() - self._last_flush < FLUSH_INTERVAL_SECONDS:
+            return 0
+        return await self.flush()
+
+
+latency_recorder = LatencyRecorder()
@@ -0,0 +1,118 @@
+"""Per-stage time breakdown: DB vs LLM vs embedding vs template render.
+
+The orchestrator opens a StageProfile around each stage via profile_stage().
+Time is attributed through a ContextVar, so concurrent stages (asyncio.gather
+copies the context per task) and tasks spawned inside a stage each charge
+the right profile.
+
+- DB: before/after_cursor_execute listeners on the engine (install_db_hooks),
+  so every round trip counts, including flushes and lazy loads.
+- LLM / embedding / render: profile_span() around the call sites.
+
+Component times are summed, so they can exceed the stage's wall time when
+a stage overlaps calls (e.g. gathered enrichment queries).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+Component = Literal["db", "llm", "embedding", "render"]
+
+COMPONENTS: tuple[Component, ...] = ("db", "llm", "embedding", "render")
+
+
+@dataclass
+class StageProfile:
+    """Accumulated component time for one stage execution."""
+
+    stage: str
+    ms: dict[str, float] = field(default_factory=lambda: dict.fromkeys(COMPONENTS, 0.0))
+    calls: dict[str, int] = field(default_factory=lambda: dict.fromkeys(COMPONENTS, 0))
+
+    def add(self, component: Component, elapsed_ms: float) -> None:
+        self.ms[component] += elapsed_ms
+        self.calls[component] += 1
+
+    def breakdown(self, total_ms: float) -> dict[str, Any]:
+        """Per-component ms/calls plus the unattributed remainder."""
+        accounted = sum(self.ms.values())
+        return {
+            **{f"{c}_ms": round(self.ms[c], 1) for c in COMPONENTS},
+            **{f"{c}_calls": self.calls[c] for c in COMPONENTS},
+            "other_ms": round(max(total_ms - accounted, 0.0), 1),
+        }
+
+
+_current_profile: ContextVar[StageProfile | None] = ContextVar(
+    "pipeline_stage_profile", default=None
+)
+
+
+@contextmanager
+def profile_stage(stage: str) -> Iterator[StageProfile]:
+    """Make a fresh StageProfile current for the enclosed stage run."""
+    profile = StageProfile(stage)
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+@contextmanager
+def profile_span(component: Component) -> Iterator[None]:
+    """Charge the enclosed wall time to `component` of the current stage.
+
+    No-op outside a pipeline stage. Works around awaits:
+        with profile_span("llm"):
+            result = await agent.run(prompt)
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(component, (time.perf_counter() - start) * 1000)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info.setdefault("_profile_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    starts = conn.info.get("_profile_query_start")
+    if profile is not None and starts:
+        profile.add("db", (time.perf_counter() - starts.pop()) * 1000)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute doesn't fire for a failed statement
+    conn = exception_context.connection
+    starts = conn.info.get("_profile_query_start") if conn is not None else None
+    if starts:
+        starts.pop()
+
+
+def install_db_hooks(sync_engine: Any) -> None:
+    """Attach DB timing listeners to an Engine (or the Engine class for all).
+
+    The listeners only read the clock; they never touch the cursor, so they
+    are safe under asyncpg's greenlet bridge.
+    """
+    from sqlalchemy import event
+
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
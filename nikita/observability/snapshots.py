@@ -3,6 +3,11 @@
 Each pipeline stage writes to known fields on PipelineContext. This module
 snapshots those fields before a stage runs, then computes the delta after
 to generate the event payload. Zero coupling to stage internals.
+
+In low-overhead mode (OBSERVABILITY_LOW_OVERHEAD=true) the orchestrator skips
+the before-snapshot; PipelineContext logs which fields the stage assigned
+(nikita.pipeline.models.track_writes) and delta_from_writes builds the
+payload from that write log.
 """
 
 from __future__ import annotations
@@ -100,6 +105,27 @@ def compute_delta(
     }
 
 
+def delta_from_writes(
+    written: set[str],
+    ctx: PipelineContext,
+    stage_name: str,
+) -> dict[str, Any]:
+    """Compute event payload from the stage's write log, without a snapshot.
+
+    Stage-specific builders read the current ctx values (they never use the
+    before-snapshot), so their payloads are identical to compute_delta's.
+    The generic fallback serializes only the fields the stage assigned.
+    """
+    builder = _DELTA_BUILDERS.get(stage_name)
+    if builder:
+        return builder({}, ctx)
+
+    return {
+        field_name: _serialize_value(getattr(ctx, field_name, None))
+        for field_name in sorted(written)
+    }
+
+
 # --- Stage-specific delta builders ---
 
 
@@ -12,7 +12,6 @@ Implements:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import random
 from dataclasses import dataclass
@@ -20,12 +19,14 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from nikita.db.models.work_job import WorkJobKind
 from nikita.onboarding.models import (
     ConversationStyle,
     PersonalityType,
     UserOnboardingProfile,
 )
 from nikita.onboarding.tuning import BACKSTORY_HOOK_PROBABILITY
+from nikita.tasks.work_queue import enqueue_or_run
 
 if TYPE_CHECKING:
     from nikita.onboarding.contracts import BackstoryOption
@@ -433,8 +434,9 @@ class HandoffManager:
                 profile_summary=profile_summary,
             )
 
-        # Spec 035: Generate social circle — fire-and-forget background task
-        # to avoid Cloud Run timeout (ONBOARD-TIMEOUT fix)
+        # Spec 035: Generate social circle — queued as a durable work job
+        # to avoid Cloud Run timeout (ONBOARD-TIMEOUT fix); the closure is
+        # the in-process fallback when the queue is off or unavailable
         location = _extract_location_from_timezone(profile.timezone)
         meeting_context = _extract_meeting_context(profile.hangout_spots)
 
@@ -453,7 +455,17 @@ class HandoffManager:
                     exc_info=True,
                 )
 
-        asyncio.create_task(_generate_social_circle_bg())
+        await enqueue_or_run(
+            WorkJobKind.ONBOARDING_SOCIAL_CIRCLE,
+            {
+                "user_id": str(user_id),
+                "location": location,
+                "hobbies": profile.hobbies,
+                "job_field": profile.occupation,
+                "meeting_context": meeting_context,
+            },
+            _generate_social_circle_bg,
+        )
 
         try:
             # Generate first Nikita message.
@@ -480,13 +492,13 @@ class HandoffManager:
                 first_message=first_message,
             )
 
-            # Spec 043 T2.2: Pipeline bootstrap — fire-and-forget background task.
+            # Spec 043 T2.2: Pipeline bootstrap — queued as a durable work job.
             # Only dispatch if seed succeeded — a None conversation_id would
             # fall back to get_recent, reintroducing the original race condition.
             if seed_conversation_id:
                 async def _bootstrap_pipeline_bg() -> None:
                     try:
-                        await self._bootstrap_pipeline(
+                        await self.bootstrap_pipeline(
                             user_id, conversation_id=seed_conversation_id
                         )
                     except Exception as bootstrap_err:
@@ -495,7 +507,15 @@ class HandoffManager:
                             f"{bootstrap_err}"
                         )
 
-                asyncio.create_task(_bootstrap_pipeline_bg())
+                await enqueue_or_run(
+                    WorkJobKind.ONBOARDING_BOOTSTRAP_PIPELINE,
+                    {
+                        "user_id": str(user_id),
+                        "conversation_id": str(seed_conversation_id),
+                    },
+                    _bootstrap_pipeline_bg,
+                    dedupe_key=f"bootstrap_pipeline:{seed_conversation_id}",
+                )
             else:
                 logger.warning(
                     "Skipping pipeline bootstrap for user %s — seed failed",
@@ -603,7 +623,7 @@ class HandoffManager:
 
         GH onboarding-pipeline-bootstrap: Fixes Bug 1 (pipeline found no
         conversations) and Bug 3 (first message not in conversation context).
-        The seeded conversation is then passed to _bootstrap_pipeline.
+        The seeded conversation is then passed to bootstrap_pipeline.
 
         Args:
             user_id: User's UUID.
@@ -647,16 +667,18 @@ class HandoffManager:
             )
             return None
 
-    async def _bootstrap_pipeline(
+    async def bootstrap_pipeline(
         self,
         user_id: UUID,
         conversation_id: UUID | None = None,
+        raise_on_failure: bool = False,
     ) -> None:
         """Trigger initial pipeline run for newly onboarded user.
 
         Spec 043 T2.2: Generates initial text + voice prompts so the first
         text message after onboarding uses personalized content.
         Non-blocking - failure is logged but does not fail the handoff.
+        A failed run is rolled back rather than committed.
 
         GH onboarding-pipeline-bootstrap: When conversation_id is provided
         (from the conversation seed), fetch that specific conversation instead
@@ -667,6 +689,9 @@ class HandoffManager:
             user_id: User's UUID.
             conversation_id: Specific seeded conversation ID (preferred).
                 Falls back to get_recent if None (backward compat).
+            raise_on_failure: Raise when the pipeline run fails (the work
+                queue handler, so the job is retried) instead of only
+                logging it.
         """
         from nikita.config.settings import get_settings
 
@@ -710,6 +735,21 @@ class HandoffManager:
                     conversation=conversation,
                     user=user,
                 )
+                if not result.success and not result.skipped:
+                    await session.rollback()
+                    logger.warning(
+                        "Pipeline bootstrap failed user=%s conv=%s at %s: %s",
+                        user_id,
+                        conversation.id,
+                        result.error_stage,
+                        result.error_message,
+                    )
+                    if raise_on_failure:
+                        raise RuntimeError(
+                            f"pipeline bootstrap failed at {result.error_stage}: "
+                            f"{result.error_message}"
+                        )
+                    return
                 await session.commit()
                 logger.info(
                     f"Pipeline bootstrap complete user={user_id} "
@@ -938,7 +978,7 @@ class HandoffManager:
         onboarded_at = datetime.now(UTC)
         profile_summary = self._generate_profile_summary(profile)
 
-        # Spec 035: Generate social circle — fire-and-forget background task
+        # Spec 035: Generate social circle — queued as a durable work job
         location = _extract_location_from_timezone(profile.timezone)
         meeting_context = _extract_meeting_context(profile.hangout_spots)
 
@@ -957,7 +997,17 @@ class HandoffManager:
                     exc_info=True,
                 )
 
-        asyncio.create_task(_generate_social_circle_voice_bg())
+        await enqueue_or_run(
+            WorkJobKind.ONBOARDING_SOCIAL_CIRCLE,
+            {
+                "user_id": str(user_id),
+                "location": location,
+                "hobbies": profile.hobbies,
+                "job_field": profile.occupation,
+                "meeting_context": meeting_context,
+            },
+            _generate_social_circle_voice_bg,
+        )
 
         try:
             # Initiate Nikita voice callback with personalized first message (Spec 033)
@@ -982,7 +1032,7 @@ class HandoffManager:
                 if voice_seed_conversation_id:
                     async def _bootstrap_pipeline_voice_bg() -> None:
                         try:
-                            await self._bootstrap_pipeline(
+                            await self.bootstrap_pipeline(
                                 user_id,
                                 conversation_id=voice_seed_conversation_id,
                             )
@@ -993,7 +1043,15 @@ class HandoffManager:
                                 bootstrap_err,
                             )
 
-                    asyncio.create_task(_bootstrap_pipeline_voice_bg())
+                    await enqueue_or_run(
+                        WorkJobKind.ONBOARDING_BOOTSTRAP_PIPELINE,
+                        {
+                            "user_id": str(user_id),
+                            "conversation_id": str(voice_seed_conversation_id),
+                        },
+                        _bootstrap_pipeline_voice_bg,
+                        dedupe_key=f"bootstrap_pipeline:{voice_seed_conversation_id}",
+                    )
                 else:
                     logger.warning(
                         "Skipping pipeline bootstrap (voice) for user %s — seed failed",
@@ -1037,7 +1095,7 @@ class HandoffManager:
                     if fallback_seed_id:
                         async def _bootstrap_pipeline_fallback_bg() -> None:
                             try:
-                                await self._bootstrap_pipeline(
+                                await self.bootstrap_pipeline(
                                     user_id,
                                     conversation_id=fallback_seed_id,
                                 )
@@ -1049,7 +1107,15 @@ class HandoffManager:
                                     bootstrap_err,
                                 )
 
-                        asyncio.create_task(_bootstrap_pipeline_fallback_bg())
+                        await enqueue_or_run(
+                            WorkJobKind.ONBOARDING_BOOTSTRAP_PIPELINE,
+                            {
+                                "user_id": str(user_id),
+                                "conversation_id": str(fallback_seed_id),
+                            },
+                            _bootstrap_pipeline_fallback_bg,
+                            dedupe_key=f"bootstrap_pipeline:{fallback_seed_id}",
+                        )
                     else:
                         logger.warning(
                             "Skipping pipeline bootstrap (voice fallback) "
@@ -1,7 +1,7 @@
 """Unified pipeline module for Spec 042.
 
 Replaces 3 prompt paths + 2 post-processing pipelines with a single
-PipelineOrchestrator running 9 sequential stages.
+PipelineOrchestrator running 11 stages in dependency waves.
 """
 
 from __future__ import annotations
@@ -0,0 +1,181 @@
+"""Per-run data loader shared by pipeline stages.
+
+Stages used to re-query the same rows independently: PromptBuilderStage
+re-fetched the user the caller had already loaded, instantiated
+ConversationRepository twice and built its own SupabaseMemory, and
+SummaryStage ran a separate query for arcs that PromptBuilderStage then
+repeated with different filters.
+
+PipelineDataLoader is created once per PipelineContext (ctx.get_loader) and
+memoizes each lookup by key for the rest of the run, so every stage sees the
+same objects and each query runs at most once. Lookups that can share a
+round trip are fetched together:
+
+- thoughts(): recent active thoughts, openers and arcs in one windowed query
+  (NikitaThoughtRepository.get_active_thoughts_by_type).
+- summaries(): last / today / week / voice conversation summaries in one
+  UNION ALL (ConversationRepository.get_conversation_summaries_for_prompt).
+
+Stages that write rows a later lookup covers call invalidate() so the next
+read refetches.
+
+Lookups may be awaited concurrently (PromptBuilderStage fans them out).
+Those over rows earlier stages write (thoughts, threads, memory) are
+serialized on ``session_lock`` because they share the pipeline's
+AsyncSession, whose uncommitted writes they must see. summaries() covers
+only other conversations, so given a ``session_maker`` it runs on its own
+pooled session alongside them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from nikita.memory.supabase_memory import SupabaseMemory
+    from nikita.pipeline.models import PipelineContext
+
+# Limits used by the prompt template and SummaryStage
+RECENT_THOUGHTS_LIMIT = 10
+OPENERS_LIMIT = 3
+ARCS_LIMIT = 5
+OPEN_THREADS_LIMIT = 10
+VOICE_SUMMARIES_LIMIT = 3
+
+
+class PipelineDataLoader:
+    """Memoized, identity-mapped reads for one pipeline run.
+
+    Concurrent callers of the same lookup share one in-flight query. A
+    failed lookup is not memoized, so a later caller retries it. Other
+    session work done alongside lookups must hold ``session_lock``.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        ctx: PipelineContext,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        self._session = session
+        self._ctx = ctx
+        self._session_maker = session_maker
+        self._values: dict[str, Any] = {}
+        self._pending: dict[str, asyncio.Future[Any]] = {}
+        self._memory: SupabaseMemory | None = None
+        self.session_lock = asyncio.Lock()
+
+    async def _load(
+        self,
+        key: str,
+        fetch: Callable[[AsyncSession], Awaitable[Any]],
+        isolated: bool = False,
+    ) -> Any:
+        if key in self._values:
+            return self._values[key]
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            if isolated and self._session_maker is not None:
+                async with self._session_maker() as session:
+                    value = await fetch(session)
+            else:
+                async with self.session_lock:
+                    value = await fetch(self._session)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved: there may be no waiters
+            raise
+        else:
+            self._values[key] = value
+            future.set_result(value)
+            return value
+        finally:
+            self._pending.pop(key, None)
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop memoized lookups so their next read hits the database."""
+        for key in keys:
+            self._values.pop(key, None)
+
+    async def user(self) -> Any:
+        """The run's User, reusing ctx.user when the caller already loaded it."""
+        if self._ctx.user is not None:
+            return self._ctx.user
+
+        async def fetch(session: AsyncSession) -> Any:
+            from nikita.db.repositories.user_repository import UserRepository
+
+            return await UserRepository(session).get(self._ctx.user_id)
+
+        user = await self._load("user", fetch)
+        if user is not None:
+            self._ctx.user = user
+        return user
+
+    def memory(self) -> SupabaseMemory:
+        """One SupabaseMemory (and its OpenAI client) for the whole run."""
+        if self._memory is None:
+            from nikita.config.settings import get_settings
+            from nikita.memory.supabase_memory import SupabaseMemory
+
+            self._memory = SupabaseMemory(
+                session=self._session,
+                user_id=self._ctx.user_id,
+                openai_api_key=get_settings().openai_api_key or "",
+            )
+        return self._memory
+
+    async def summaries(self) -> dict[str, Any]:
+        """Prompt summaries: last_summary, today_summaries, week_summaries, voice_summaries."""
+
+        async def fetch(session: AsyncSession) -> dict[str, Any]:
+            from nikita.db.repositories.conversation_repository import ConversationRepository
+
+            return await ConversationRepository(session).get_conversation_summaries_for_prompt(
+                user_id=self._ctx.user_id,
+                exclude_conversation_id=self._ctx.conversation_id,
+                voice_limit=VOICE_SUMMARIES_LIMIT,
+            )
+
+        return await self._load("summaries", fetch, isolated=True)
+
+    async def thoughts(self) -> dict[str | None, list[Any]]:
+        """Active thoughts keyed None (any type), "wants_to_share" and "arc"."""
+
+        async def fetch(session: AsyncSession) -> dict[str | None, list[Any]]:
+            from nikita.db.repositories.thought_repository import NikitaThoughtRepository
+
+            return await NikitaThoughtRepository(session).get_active_thoughts_by_type(
+                user_id=self._ctx.user_id,
+                limits={
+                    None: RECENT_THOUGHTS_LIMIT,
+                    "wants_to_share": OPENERS_LIMIT,
+                    "arc": ARCS_LIMIT,
+                },
+            )
+
+        return await self._load("thoughts", fetch)
+
+    async def open_threads(self) -> list[Any]:
+        """The user's open conversation threads, newest first."""
+
+        async def fetch(session: AsyncSession) -> list[Any]:
+            from nikita.db.repositories.thread_repository import ConversationThreadRepository
+
+            return await ConversationThreadRepository(session).get_open_threads(
+                user_id=self._ctx.user_id, limit=OPEN_THREADS_LIMIT,
+            )
+
+        return await self._load("threads", fetch)
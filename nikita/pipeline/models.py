@@ -5,12 +5,40 @@ Defines the shared context and result types passed between pipeline stages.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+if TYPE_CHECKING:
+    from nikita.pipeline.loader import PipelineDataLoader
+
+# Spec 110: fields assigned on a PipelineContext by the current stage. Set by
+# the orchestrator in low-overhead observability mode; a ContextVar so stages
+# running concurrently in one wave each log only their own writes.
+_stage_writes: ContextVar[set[str] | None] = ContextVar(
+    "pipeline_stage_writes", default=None
+)
+
+
+@contextmanager
+def track_writes() -> Iterator[set[str]]:
+    """Collect the names of PipelineContext fields assigned in this block.
+
+    Only attribute assignment is logged (``ctx.facts_stored = 3``); in-place
+    mutation such as ``ctx.score_events.append(...)`` is not.
+    """
+    written: set[str] = set()
+    token = _stage_writes.set(written)
+    try:
+        yield written
+    finally:
+        _stage_writes.reset(token)
+
 
 @dataclass
 class PipelineContext:
@@ -107,6 +135,26 @@ class PipelineContext:
     stage_errors: dict[str, str] = field(default_factory=dict)
     # Spec 105 T4.1: Per-stage timing + success tracking
     stage_results: dict[str, dict] = field(default_factory=dict)
+    # Per-run memoized reads shared by stages (see get_loader)
+    loader: PipelineDataLoader | None = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        written = _stage_writes.get()
+        if written is not None:
+            written.add(name)
+        object.__setattr__(self, name, value)
+
+    def get_loader(self, session: Any, session_maker: Any = None) -> PipelineDataLoader:
+        """The run's PipelineDataLoader, created on first use with `session`.
+
+        `session_maker` lets lookups that don't need the run's uncommitted
+        writes use their own pooled sessions (see PipelineDataLoader).
+        """
+        if self.loader is None:
+            from nikita.pipeline.loader import PipelineDataLoader
+
+            self.loader = PipelineDataLoader(session, self, session_maker)
+        return self.loader
 
     def record_stage_error(self, stage_name: str, error: str) -> None:
         """Record an error from a non-critical stage."""
@@ -117,7 +165,7 @@ class PipelineContext:
         self.stage_timings[stage_name] = duration_ms
 
     def record_stage_result(
-        self, stage_name: str, duration_ms: float, success: bool
+        self, stage_name: str, duration_ms: float, success: bool, cached: bool = False
     ) -> None:
         """Record timing and success outcome for a stage (Spec 105 T4.1).
 
@@ -128,12 +176,15 @@ class PipelineContext:
             stage_name: Name of the pipeline stage.
             duration_ms: Wall-clock execution time in milliseconds.
             success: Whether the stage completed without error.
+            cached: Whether the output was replayed from the stage cache.
         """
         self.stage_timings[stage_name] = duration_ms
         self.stage_results[stage_name] = {
             "duration_ms": round(duration_ms, 2),
             "success": success,
         }
+        if cached:
+            self.stage_results[stage_name]["cached"] = True
 
     def has_stage_errors(self) -> bool:
         """Check if any stage errors were recorded."""
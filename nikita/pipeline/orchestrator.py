@@ -1,7 +1,8 @@
 """Pipeline orchestrator for the unified pipeline (Spec 042 T2.2).
 
-Runs 11 stages sequentially, handles critical vs non-critical failures,
-logs per-stage timings, and records job execution in the database.
+Runs 11 stages, handles critical vs non-critical failures, logs per-stage
+timings, and records job execution in the database. Stages that declare
+independent PipelineContext reads/writes run concurrently in waves.
 
 Spec 110: Emits typed observability events by snapshotting PipelineContext
 before/after each stage. Zero stage code changes.
@@ -11,6 +12,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -18,20 +20,25 @@ from uuid import UUID
 import logging
 
 if TYPE_CHECKING:
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from nikita.config.settings import get_settings
 from nikita.db.repositories.psyche_state_repository import PsycheStateRepository
 from nikita.pipeline.stages.base import StageResult
-from nikita.pipeline.models import PipelineContext, PipelineResult
+from nikita.pipeline.models import PipelineContext, PipelineResult, track_writes
+from nikita.pipeline.stage_cache import StageCache, cache_version_of
+from nikita.observability.latency import latency_recorder
+from nikita.observability.profiler import COMPONENTS, StageProfile, profile_stage
 
 logger = logging.getLogger(__name__)
 
 
 class PipelineOrchestrator:
-    """Sequential stage runner for the unified pipeline.
+    """Stage runner for the unified pipeline.
 
-    Runs 11 stages in order. Critical stage failure stops the pipeline;
+    Runs 11 stages in dependency waves derived from each stage's declared
+    ctx reads/writes (see _build_waves); stages in a wave run concurrently
+    via asyncio.gather. Critical stage failure stops the pipeline;
     non-critical stage failure logs and continues.
 
     Spec 110: After each stage, emits a typed observability event derived
@@ -62,6 +69,7 @@ class PipelineOrchestrator:
         self,
         session: AsyncSession,
         stages: list[tuple[str, Any, bool]] | None = None,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
     ) -> None:
         """Initialize orchestrator.
 
@@ -69,10 +77,16 @@ class PipelineOrchestrator:
             session: Database session for pipeline execution.
             stages: Optional override for stage list (for testing).
                     Each tuple is (name, stage_instance, is_critical).
+            session_maker: Pool for the data loader's read-only lookups that
+                    don't need this run's uncommitted writes. Defaults to
+                    get_session_maker().
         """
         self._session = session
         self._stages = stages
+        self._session_maker = session_maker
         self._logger = logger
+        # Serializes savepoints on the shared session across concurrent stages
+        self._session_lock = asyncio.Lock()
 
     def _get_stages(self) -> list[tuple[str, Any, bool]]:
         """Get stage instances, using injected stages or lazy-loading defaults."""
@@ -113,6 +127,260 @@ class PipelineOrchestrator:
                 async def flush(self, *a, **kw): pass
             return _NoOp()
 
+    @staticmethod
+    def _build_waves(
+        stages: list[tuple[str, Any, bool]],
+    ) -> list[list[tuple[str, Any, bool]]]:
+        """Group stages into waves of mutually independent stages.
+
+        Stage B depends on an earlier stage A when A writes a PipelineContext
+        field that B reads or writes, or B writes a field A reads. Critical
+        stages and stages without reads/writes declarations are barriers:
+        they depend on every earlier stage and every later stage depends on
+        them. Each stage lands in the wave after its latest dependency, so
+        declared order is preserved for anything that isn't independent.
+        """
+        levels: list[int] = []
+        for j, (_, stage_j, critical_j) in enumerate(stages):
+            reads_j = getattr(stage_j, "reads", None)
+            writes_j = getattr(stage_j, "writes", None)
+            barrier_j = critical_j or reads_j is None or writes_j is None
+            level = 0
+            for i in range(j):
+                _, stage_i, critical_i = stages[i]
+                reads_i = getattr(stage_i, "reads", None)
+                writes_i = getattr(stage_i, "writes", None)
+                depends = (
+                    barrier_j
+                    or critical_i
+                    or reads_i is None
+                    or writes_i is None
+                    or bool(writes_i & (reads_j | writes_j))
+                    or bool(writes_j & reads_i)
+                )
+                if depends:
+                    level = max(level, levels[i] + 1)
+            levels.append(level)
+
+        waves: list[list[tuple[str, Any, bool]]] = [
+            [] for _ in range(max(levels, default=-1) + 1)
+        ]
+        for entry, level in zip(stages, levels, strict=True):
+            waves[level].append(entry)
+        return waves
+
+    async def _load_stage_cache(
+        self,
+        ctx: PipelineContext,
+        stages: list[tuple[str, Any, bool]],
+    ) -> StageCache | None:
+        """Load stored outputs for cacheable stages in one query.
+
+        Returns None (run everything) when the cache is disabled, there is
+        no conversation to key on, no stage opts in, or the lookup fails.
+        """
+        if ctx.conversation is None or not get_settings().pipeline_stage_cache_enabled:
+            return None
+        names = [name for name, stage, _ in stages if cache_version_of(stage) is not None]
+        if not names:
+            return None
+        try:
+            from nikita.db.database import get_session_maker
+
+            cache = StageCache(
+                ctx.conversation_id,
+                getattr(ctx.conversation, "messages", None) or [],
+                get_session_maker(),
+            )
+            await cache.load(names)
+            return cache
+        except Exception as e:
+            self._logger.warning("stage_cache_load_failed: %s", e)
+            return None
+
+    def _read_session_maker(self) -> async_sessionmaker[AsyncSession] | None:
+        """Pool for the loader's isolated reads; None keeps them on the session."""
+        if self._session_maker is None:
+            try:
+                from nikita.db.database import get_session_maker
+
+                self._session_maker = get_session_maker()
+            except Exception as e:
+                self._logger.warning("read_session_maker_unavailable: %s", e)
+                return None
+        return self._session_maker
+
+    async def _execute_with_retry(
+        self,
+        ctx: PipelineContext,
+        name: str,
+        stage: Any,
+        critical: bool,
+        uses_session: bool,
+        max_attempts: int,
+    ) -> tuple[bool, str | None]:
+        """Execute a stage, retrying failures up to max_attempts.
+
+        Returns:
+            (succeeded, last_error).
+        """
+        last_error: str | None = None
+        succeeded = False
+
+        for attempt in range(max_attempts):
+            try:
+                if uses_session:
+                    # SAVEPOINT isolation: each stage gets a nested transaction.
+                    # If a stage fails, its DB changes are rolled back without
+                    # poisoning the session for subsequent stages.
+                    async with self._session_lock, self._session.begin_nested():
+                        result: StageResult = await stage.execute(ctx)
+                else:
+                    result = await stage.execute(ctx)
+
+                if result.success:
+                    succeeded = True
+                    break
+
+                last_error = result.error or "Unknown error"
+                if attempt < max_attempts - 1:
+                    self._logger.info(
+                        "stage_retry stage=%s attempt=%d/%d error=%s",
+                        name, attempt + 1, max_attempts, last_error,
+                    )
+                    await asyncio.sleep(0.5)
+                continue
+
+            except Exception as e:
+                last_error = f"Unexpected error in {name}: {type(e).__name__}: {e}"
+                if attempt < max_attempts - 1:
+                    self._logger.info(
+                        "stage_retry stage=%s attempt=%d/%d error=%s",
+                        name, attempt + 1, max_attempts, e,
+                    )
+                    await asyncio.sleep(0.5)
+                    continue
+
+                self._logger.error(
+                    "stage_unexpected_error stage=%s critical=%s: %s",
+                    name, critical, e,
+                )
+                break
+
+        return succeeded, last_error
+
+    async def _run_stage(
+        self,
+        ctx: PipelineContext,
+        name: str,
+        stage: Any,
+        critical: bool,
+        emitter: Any,
+        obs: tuple[Any | None, Any, dict[str, str]] | None,
+        cache: StageCache | None = None,
+    ) -> tuple[bool, str | None]:
+        """Run one stage with savepoint isolation, retry, timing and events.
+
+        Stages that use the shared pipeline session hold the session lock for
+        the whole savepoint: AsyncSession forbids concurrent operations and
+        nested transactions are a stack, so only stages with
+        ``uses_session = False`` actually overlap with session work. Those
+        don't open a savepoint since they have no session writes to isolate.
+        All stage writes stay in the caller's transaction, so they commit or
+        roll back with it.
+
+        Cacheable stages whose inputs match a stored output are replayed from
+        ``cache`` without executing; on a miss, a successful output is stored.
+
+        Returns:
+            (succeeded, last_error). Non-critical failures are recorded on ctx;
+            the caller decides what a critical failure means.
+        """
+        stage_start = time.perf_counter()
+        uses_session = getattr(stage, "uses_session", True)
+
+        # Spec 110: Snapshot ctx fields before stage runs. In low-overhead
+        # mode obs[0] is None: ctx logs the fields the stage assigns instead,
+        # and that write log is what obs[1] receives.
+        low_overhead = obs is not None and obs[0] is None
+        before_snapshot: Any = {}
+        if obs is not None and not low_overhead:
+            try:
+                before_snapshot = obs[0](ctx, name)
+            except Exception:
+                before_snapshot = {}
+
+        max_attempts = 1 if critical else 2  # Non-critical get 1 retry
+        last_error: str | None = None
+        succeeded = False
+
+        cache_version = cache_version_of(stage) if cache is not None else None
+        input_hash: str | None = None
+        cached: dict[str, Any] | None = None
+        if cache_version is not None:
+            input_hash = cache.input_hash(stage, ctx)
+            cached = cache.get(name, cache_version, input_hash)
+        profile: StageProfile | None = None
+        with track_writes() if low_overhead else nullcontext(set()) as written:
+            if cached is not None:
+                stage.restore_cached(ctx, cached)
+                succeeded = True
+            else:
+                with profile_stage(name) as profile:
+                    succeeded, last_error = await self._execute_with_retry(
+                        ctx, name, stage, critical, uses_session, max_attempts,
+                    )
+        if low_overhead:
+            before_snapshot = written
+
+        if succeeded and cached is None and cache_version is not None:
+            await cache.store(name, cache_version, input_hash, stage, ctx)
+
+        duration_ms = (time.perf_counter() - stage_start) * 1000
+        # Spec 105 T4.1: record timing + success outcome for persistence
+        ctx.record_stage_result(name, duration_ms, succeeded, cached=cached is not None)
+        if profile is not None:
+            breakdown = profile.breakdown(duration_ms)
+            ctx.stage_results[name]["breakdown"] = breakdown
+            latency_recorder.record(name, "total", duration_ms)
+            for component in (*COMPONENTS, "other"):
+                latency_recorder.record(name, component, breakdown[f"{component}_ms"])
+
+        # Spec 110: Emit stage completion event from ctx delta
+        if obs is not None:
+            try:
+                event_type = obs[2].get(name)
+                if event_type:
+                    delta = obs[1](before_snapshot, ctx, name)
+                    emitter.emit(
+                        event_type,
+                        stage=name,
+                        data=delta,
+                        duration_ms=int(duration_ms),
+                    )
+            except Exception as emit_err:
+                self._logger.debug(
+                    "observability_emit_failed stage=%s: %s", name, emit_err,
+                )
+
+        if cached is not None:
+            self._logger.info(
+                "stage_cache_hit stage=%s duration_ms=%.1f", name, duration_ms,
+            )
+        elif succeeded:
+            self._logger.info(
+                "stage_completed stage=%s duration_ms=%.1f",
+                name, duration_ms,
+            )
+        elif not critical:
+            self._logger.warning(
+                "stage_failed stage=%s critical=%s duration_ms=%.1f: %s",
+                name, critical, duration_ms, last_error,
+            )
+            ctx.record_stage_error(name, last_error or "Unknown error")
+
+        return succeeded, last_error
+
     async def process(
         self,
         conversation_id: UUID,
@@ -207,12 +475,19 @@ class PipelineOrchestrator:
             except Exception as e:
                 self._logger.warning("pipeline_psyche_error user_id=%s: %s", user_id, e, exc_info=True)
 
+        # One memoized data loader per run, seeded with the caller's user
+        ctx.get_loader(self._session, self._read_session_maker())
+
         # Spec 110: Create emitter for observability events
         emitter = self._create_emitter(user_id, conversation_id)
 
         # Spec 110: Import observability helpers once (not per-stage)
         try:
-            from nikita.observability.snapshots import compute_delta, snapshot_ctx
+            from nikita.observability.snapshots import (
+                compute_delta,
+                delta_from_writes,
+                snapshot_ctx,
+            )
             from nikita.observability.types import PIPELINE_COMPLETE, STAGE_EVENT_TYPES
 
             _obs_available = True
@@ -221,99 +496,35 @@ class PipelineOrchestrator:
 
         stages = self._get_stages()
         pipeline_start = time.perf_counter()
-
-        for name, stage, critical in stages:
-            stage_start = time.perf_counter()
-
-            # Spec 110: Snapshot ctx fields before stage runs
-            if _obs_available:
-                try:
-                    before_snapshot = snapshot_ctx(ctx, name)
-                except Exception:
-                    before_snapshot = {}
+        obs = None
+        if _obs_available:
+            if get_settings().observability_low_overhead:
+                obs = (None, delta_from_writes, STAGE_EVENT_TYPES)
             else:
-                before_snapshot = {}
-
-            max_attempts = 1 if critical else 2  # Non-critical get 1 retry
-            last_error: str | None = None
-            succeeded = False
-
-            for attempt in range(max_attempts):
-                try:
-                    # SAVEPOINT isolation: each stage gets a nested transaction.
-                    # If a stage fails, its DB changes are rolled back without
-                    # poisoning the session for subsequent stages.
-                    async with self._session.begin_nested():
-                        result: StageResult = await stage.execute(ctx)
-
-                    if result.success:
-                        succeeded = True
-                        break
-
-                    last_error = result.error or "Unknown error"
-                    if attempt < max_attempts - 1:
-                        self._logger.info(
-                            "stage_retry stage=%s attempt=%d/%d error=%s",
-                            name, attempt + 1, max_attempts, last_error,
-                        )
-                        await asyncio.sleep(0.5)
-                    continue
+                obs = (snapshot_ctx, compute_delta, STAGE_EVENT_TYPES)
+        cache = await self._load_stage_cache(ctx, stages)
 
-                except Exception as e:
-                    last_error = f"Unexpected error in {name}: {type(e).__name__}: {e}"
-                    if attempt < max_attempts - 1:
-                        self._logger.info(
-                            "stage_retry stage=%s attempt=%d/%d error=%s",
-                            name, attempt + 1, max_attempts, e,
-                        )
-                        await asyncio.sleep(0.5)
-                        continue
-
-                    self._logger.error(
-                        "stage_unexpected_error stage=%s critical=%s: %s",
-                        name, critical, e,
-                    )
-                    break
-
-            duration_ms = (time.perf_counter() - stage_start) * 1000
-            # Spec 105 T4.1: record timing + success outcome for persistence
-            ctx.record_stage_result(name, duration_ms, succeeded)
-
-            # Spec 110: Emit stage completion event from ctx delta
-            if _obs_available:
-                try:
-                    event_type = STAGE_EVENT_TYPES.get(name)
-                    if event_type:
-                        delta = compute_delta(before_snapshot, ctx, name)
-                        emitter.emit(
-                            event_type,
-                            stage=name,
-                            data=delta,
-                            duration_ms=int(duration_ms),
-                        )
-                except Exception as emit_err:
-                    self._logger.debug(
-                        "observability_emit_failed stage=%s: %s", name, emit_err,
-                    )
-
-            if succeeded:
+        for wave in self._build_waves(stages):
+            if len(wave) == 1:
+                outcomes = [await self._run_stage(ctx, *wave[0], emitter, obs, cache)]
+            else:
                 self._logger.info(
-                    "stage_completed stage=%s duration_ms=%.1f",
-                    name, duration_ms,
+                    "stage_wave_started stages=%s", ",".join(n for n, _, _ in wave),
                 )
-            elif critical:
-                # Spec 110: Flush events even on critical failure
-                try:
-                    await emitter.flush(self._session)
-                except Exception:
-                    pass
-                return PipelineResult.failed(ctx, name, last_error or "Unknown error")
-            else:
-                self._logger.warning(
-                    "stage_failed stage=%s critical=%s duration_ms=%.1f: %s",
-                    name, critical, duration_ms, last_error,
+                outcomes = await asyncio.gather(
+                    *(self._run_stage(ctx, *entry, emitter, obs, cache) for entry in wave)
                 )
-                ctx.record_stage_error(name, last_error or "Unknown error")
+
+            for (name, _stage, critical), (succeeded, last_error) in zip(
+                wave, outcomes, strict=True
+            ):
+                if not succeeded and critical:
+                    # Spec 110: Flush events even on critical failure
+                    try:
+                        await emitter.flush(self._session)
+                    except Exception:
+                        pass
+                    return PipelineResult.failed(ctx, name, last_error or "Unknown error")
 
         total_ms = (time.perf_counter() - pipeline_start) * 1000
         self._logger.info(
@@ -349,4 +560,7 @@ class PipelineOrchestrator:
         except Exception as flush_err:
             self._logger.warning("observability_flush_failed: %s", flush_err)
 
+        # Periodic flush of in-process latency histograms (own session)
+        await latency_recorder.maybe_flush()
+
         return PipelineResult.succeeded(ctx)
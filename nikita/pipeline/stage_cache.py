@@ -0,0 +1,130 @@
+"""Persisted stage output cache for pipeline retries.
+
+A stage opts in with ``cache_version``. After it succeeds, its declared
+ctx writes are stored keyed on (conversation_id, stage_name) together with
+the stage version and a hash of its inputs (the conversation messages plus
+its other declared ctx reads). A later run over the same content replays
+the stored writes instead of executing the stage.
+
+Only stages whose output depends on nothing but the hashed inputs should
+opt in: a replay skips the stage entirely, so any side effect outside ctx
+would be lost, and an input read from elsewhere (the database, say) would
+not invalidate the stored output. Cache rows are read and written in
+their own short sessions, independent of the pipeline transaction, so a
+later stage failure (which rolls the pipeline session back) cannot discard
+a successful extraction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import structlog
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from nikita.pipeline.models import PipelineContext
+
+logger = structlog.get_logger(__name__)
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def cache_version_of(stage: Any) -> int | None:
+    """Return the stage's cache_version, or None if it doesn't opt in."""
+    version = getattr(stage, "cache_version", None)
+    if isinstance(version, int) and getattr(stage, "writes", None) is not None:
+        return version
+    return None
+
+
+class StageCache:
+    """Per-run view of the cached outputs for one conversation.
+
+    Usage:
+        cache = StageCache(conversation_id, messages, session_maker)
+        await cache.load(["extraction"])
+        key = cache.input_hash(stage, ctx)
+        output = cache.get("extraction", 1, key)
+        ...
+        await cache.store("extraction", 1, key, stage, ctx)
+    """
+
+    def __init__(
+        self,
+        conversation_id: UUID,
+        messages: list[Any],
+        session_maker: async_sessionmaker[AsyncSession],
+    ) -> None:
+        self._conversation_id = conversation_id
+        self._messages_hash = _digest(messages)
+        self._session_maker = session_maker
+        self._rows: dict[str, tuple[int, str, dict[str, Any]]] = {}
+
+    def input_hash(self, stage: Any, ctx: PipelineContext) -> str:
+        """Hash of everything the stage reads: messages + other ctx reads."""
+        reads = sorted((getattr(stage, "reads", None) or frozenset()) - {"conversation"})
+        return _digest([self._messages_hash, {f: getattr(ctx, f, None) for f in reads}])
+
+    async def load(self, stage_names: list[str]) -> None:
+        """Fetch cached rows for the given stages in a single query."""
+        from nikita.db.repositories.pipeline_stage_cache_repository import (
+            PipelineStageCacheRepository,
+        )
+
+        async with self._session_maker() as session:
+            rows = await PipelineStageCacheRepository(session).get_for_conversation(
+                self._conversation_id, stage_names
+            )
+        self._rows = {
+            name: (row.stage_version, row.input_hash, row.output)
+            for name, row in rows.items()
+        }
+
+    def get(self, name: str, version: int, input_hash: str) -> dict[str, Any] | None:
+        """Return the cached ctx writes if version and inputs still match."""
+        row = self._rows.get(name)
+        if row is None:
+            return None
+        cached_version, cached_hash, output = row
+        if cached_version != version or cached_hash != input_hash:
+            return None
+        return output
+
+    async def store(
+        self,
+        name: str,
+        version: int,
+        input_hash: str,
+        stage: Any,
+        ctx: PipelineContext,
+    ) -> None:
+        """Persist the stage's declared ctx writes. Best-effort.
+
+        ``input_hash`` must be computed before the stage ran, since a stage
+        may write a field it also reads.
+        """
+        from nikita.db.repositories.pipeline_stage_cache_repository import (
+            PipelineStageCacheRepository,
+        )
+
+        output = {field: getattr(ctx, field, None) for field in sorted(stage.writes)}
+        try:
+            async with self._session_maker() as session:
+                await PipelineStageCacheRepository(session).upsert(
+                    self._conversation_id,
+                    name,
+                    version,
+                    input_hash,
+                    json.loads(json.dumps(output, default=str)),
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning("stage_cache_store_failed stage=%s error=%s", name, e)
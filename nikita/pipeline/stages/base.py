@@ -50,11 +50,27 @@ class BaseStage(ABC):
 
     Subclasses set name, is_critical, timeout_seconds and implement _run().
     execute() wraps _run() with timeout and error handling.
+
+    Stages may declare the PipelineContext fields they read and write so the
+    orchestrator can run independent stages concurrently. A stage that leaves
+    ``reads``/``writes`` as None is treated as a barrier (runs alone, in
+    declared order). ``uses_session`` is False for stages that never touch the
+    shared pipeline session; those run outside the orchestrator's session lock.
+
+    Stages with no side effects outside ctx and no inputs beyond their
+    ``reads`` and the conversation messages may set ``cache_version``: the
+    orchestrator then persists their ``writes`` on success and replays them
+    via restore_cached() when the same conversation content is re-run (see
+    nikita.pipeline.stage_cache). Bump the version when the output changes.
     """
 
     name: str = "unnamed"
     is_critical: bool = False
     timeout_seconds: float = 30.0
+    reads: frozenset[str] | None = None
+    writes: frozenset[str] | None = None
+    uses_session: bool = True
+    cache_version: int | None = None
 
     def __init__(self, session: Any = None, **kwargs):
         self._session = session
@@ -94,13 +110,22 @@ class BaseStage(ABC):
             return StageResult.fail(error=error, duration_ms=duration_ms)
 
     async def _safe_rollback(self) -> None:
-        """Best-effort session rollback after stage failure."""
-        if self._session is not None:
+        """Best-effort session rollback after stage failure.
+
+        Skipped for stages that don't use the pipeline session: they run
+        concurrently with session-holding stages and must not roll them back.
+        """
+        if self._session is not None and self.uses_session:
             try:
                 await self._session.rollback()
             except Exception as rb_err:
                 self._logger.warning("rollback_failed: %s", rb_err)
 
+    def restore_cached(self, ctx: PipelineContext, output: dict[str, Any]) -> None:
+        """Apply cached ctx writes instead of running the stage."""
+        for field, value in output.items():
+            setattr(ctx, field, value)
+
     @abstractmethod
     async def _run(self, ctx: PipelineContext) -> dict | None:
         """Implement stage logic. Return data dict or None."""
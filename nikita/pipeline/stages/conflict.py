@@ -34,6 +34,11 @@ class ConflictStage(BaseStage):
     name = "conflict"
     is_critical = False
     timeout_seconds = 15.0
+    reads = frozenset({"conflict_details", "chapter", "relationship_score"})
+    writes = frozenset({
+        "active_conflict", "conflict_type", "conflict_temperature",
+        "conflict_details", "game_over_triggered",
+    })
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
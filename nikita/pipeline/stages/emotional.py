@@ -30,6 +30,8 @@ class EmotionalStage(BaseStage):
     name = "emotional"
     is_critical = False
     timeout_seconds = 30.0
+    reads = frozenset({"life_events", "emotional_tone", "chapter", "relationship_score"})
+    writes = frozenset({"emotional_state", "conflict_details"})
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
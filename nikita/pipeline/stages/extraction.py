@@ -13,6 +13,7 @@ from pydantic import BaseModel
 from pydantic_ai import Agent
 
 from nikita.config.models import Models
+from nikita.observability.profiler import profile_span
 from nikita.pipeline.stages.base import BaseStage, StageError
 from nikita.pipeline.models import PipelineContext
 
@@ -43,6 +44,12 @@ class ExtractionStage(BaseStage):
     name = "extraction"
     is_critical = True
     timeout_seconds = 120.0
+    reads = frozenset({"conversation"})
+    writes = frozenset({
+        "extracted_facts", "extracted_threads", "extracted_thoughts",
+        "extraction_summary", "emotional_tone",
+    })
+    cache_version = 1
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
@@ -92,9 +99,10 @@ class ExtractionStage(BaseStage):
 
         try:
             agent = self._get_agent()
-            result = await agent.run(
-                f"Extract information from this conversation:\n\n{conversation_text}"
-            )
+            with profile_span("llm"):
+                result = await agent.run(
+                    f"Extract information from this conversation:\n\n{conversation_text}"
+                )
             # pydantic-ai 1.x uses .output, older versions use .data
             extraction_data = getattr(result, "output", None) or getattr(result, "data", None)
             if extraction_data is None:
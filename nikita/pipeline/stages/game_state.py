@@ -35,6 +35,9 @@ class GameStateStage(BaseStage):
     name = "game_state"
     is_critical = False
     timeout_seconds = 30.0
+    reads = frozenset({"conversation", "chapter", "relationship_score"})
+    writes = frozenset({"score_delta", "score_events", "chapter_changed", "decay_applied"})
+    uses_session = False
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
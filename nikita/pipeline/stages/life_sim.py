@@ -45,6 +45,8 @@ class LifeSimStage(BaseStage):
     name = "life_sim"
     is_critical = False
     timeout_seconds = 60.0
+    reads = frozenset()
+    writes = frozenset({"life_events"})
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
@@ -32,28 +32,21 @@ class MemoryUpdateStage(BaseStage):
     name = "memory_update"
     is_critical = True
     timeout_seconds = 60.0
+    reads = frozenset({"extracted_facts"})
+    writes = frozenset({"facts_stored"})
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
 
     async def _run(self, ctx: PipelineContext) -> dict | None:
         """Write extracted facts to memory_facts."""
-        from nikita.config.settings import get_settings
-        from nikita.memory.supabase_memory import SupabaseMemory
-
         if not ctx.extracted_facts:
             self._logger.info("memory_update_skipped reason=no_facts")
             return {"stored": 0, "deduplicated": 0}
 
-        settings = get_settings()
-        memory = SupabaseMemory(
-            session=self._session,
-            user_id=ctx.user_id,
-            openai_api_key=settings.openai_api_key or "",
-        )
-
-        stored = 0
+        memory = ctx.get_loader(self._session).memory()
 
+        facts = []
         for fact_item in ctx.extracted_facts:
             # BUG-003 fix: Handle both str (from ExtractionResult) and dict formats
             if isinstance(fact_item, str):
@@ -66,29 +59,27 @@ class MemoryUpdateStage(BaseStage):
                 continue
             if not fact_text:
                 continue
-
-            try:
-                # add_fact() generates a single embedding and passes it to
-                # find_similar() internally (Spec 102 FR-001). Calling
-                # find_similar() here first would generate a duplicate embedding
-                # and double OpenAI billing per fact. (MP-001 fix)
-                await memory.add_fact(
-                    fact=fact_text,
-                    graph_type=graph_type,
-                    source="pipeline_extraction",
-                    confidence=0.85,
-                )
-                stored += 1
-            except Exception as e:
-                self._logger.warning(
-                    "fact_store_failed fact=%s error=%s",
-                    fact_text[:50],
-                    str(e),
-                )
-
-        ctx.facts_stored = stored
-
-        return {"stored": stored}
+            facts.append({"fact": fact_text, "graph_type": graph_type})
+
+        # One batched embedding call and set-based dedup for all facts;
+        # dedup is SupabaseMemory's concern (MP-001).
+        try:
+            result = await memory.add_facts_bulk(
+                facts,
+                source="pipeline_extraction",
+                confidence=0.85,
+            )
+        except Exception as e:
+            self._logger.warning(
+                "fact_store_failed count=%d error=%s",
+                len(facts),
+                str(e),
+            )
+            result = {"stored": 0, "deduplicated": 0}
+
+        ctx.facts_stored = result["stored"]
+
+        return {"stored": result["stored"], "deduplicated": result["deduplicated"]}
 
     def _classify_graph_type(self, fact_dict: dict) -> str:
         """Classify a fact into user/relationship/nikita graph."""
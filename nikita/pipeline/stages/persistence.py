@@ -31,6 +31,8 @@ class PersistenceStage(BaseStage):
     name = "persistence"
     is_critical = False
     timeout_seconds = 15.0
+    reads = frozenset({"extracted_thoughts", "extracted_threads", "extracted_facts"})
+    writes = frozenset({"thoughts_persisted", "threads_persisted"})
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
@@ -68,6 +70,10 @@ class PersistenceStage(BaseStage):
             except Exception as e:
                 self._logger.warning("thought_resolution_failed error=%s", str(e))
 
+        # Later stages' thought/thread lookups must see the rows written above
+        if thoughts_persisted or threads_persisted or thoughts_resolved:
+            ctx.get_loader(self._session).invalidate("thoughts", "threads")
+
         # Record counts on context
         ctx.thoughts_persisted = thoughts_persisted
         ctx.threads_persisted = threads_persisted
@@ -7,8 +7,9 @@ Implements:
 - AC-3.3.1: Loads Jinja2 template, renders with PipelineContext data
 - AC-3.3.2: Calls Claude Haiku for narrative enrichment (optional)
 - AC-3.3.3: Falls back to raw Jinja2 output if Haiku fails
-- AC-3.3.4: Stores result in ready_prompts via ReadyPromptRepository.set_current()
-- AC-3.3.5: Generates BOTH text and voice prompts in one pass
+- AC-3.3.4: Stores results in ready_prompts via ReadyPromptRepository.set_current_many()
+- AC-3.3.5: Generates BOTH text and voice prompts in one pass (shared render,
+  concurrent Haiku enrichment)
 - AC-3.4.1: Text prompt post-enrichment: 5,500-6,500 tokens (warn if outside range)
 - AC-3.4.2: Voice prompt post-enrichment: 2,800-3,500 tokens (warn if outside range, per Spec 108 FR-017)
 - AC-3.4.3: If over budget, truncate lower-priority sections (Vice -> Chapter -> Psychology)
@@ -21,17 +22,47 @@ Spec 045 additions:
 
 from __future__ import annotations
 
+import asyncio
 import time
-from datetime import datetime, timezone
+from collections.abc import Awaitable
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from nikita.config.models import Models
+from nikita.llm.clients import get_agent
+from nikita.observability.profiler import profile_span
 from nikita.pipeline.stages.base import BaseStage
 
 if TYPE_CHECKING:
+    from nikita.pipeline.loader import PipelineDataLoader
     from nikita.pipeline.models import PipelineContext
+    from nikita.pipeline.templates import RenderedSection
     from sqlalchemy.ext.asyncio import AsyncSession
 
+# Memory episode queries for _enrich_context, by graph type
+MEMORY_QUERIES = {
+    "relationship": "shared moments relationship history",
+    "nikita": "nikita life events activities",
+}
+# Budget for the batched query-embedding call during enrichment
+MEMORY_EMBEDDING_TIMEOUT_SECONDS = 8.0
+# Budget for each enrichment source; a slow source falls back on its own
+ENRICH_SOURCE_TIMEOUT_SECONDS = 12.0
+
+# Spec 045 WP-2: one unified template, rendered for each platform
+PROMPT_TEMPLATE = "system_prompt.j2"
+PLATFORMS = ("text", "voice")
+# Template vars that differ between platforms; template sections reading
+# none of them render identically for both
+PLATFORM_TEMPLATE_VARS = frozenset({"platform", "available_audio_tags"})
+# AC-3.4.3: sections dropped when over budget, lowest priority first, as
+# (template block, marker rendered at the top of the section)
+TRUNCATION_ORDER = (
+    ("vice_shaping", "<!-- SEC:VICE_SHAPING -->"),
+    ("chapter_behavior", "<!-- SEC:CHAPTER_BEHAVIOR -->"),
+    ("psychological_depth", "<!-- SEC:PSYCHOLOGICAL_DEPTH -->"),
+)
+
 
 class PromptBuilderStage(BaseStage):
     """Generate system prompts for both text and voice platforms.
@@ -78,19 +109,32 @@ class PromptBuilderStage(BaseStage):
         # Spec 045 WP-1: Enrich context with conversation history, memory, state
         await self._enrich_context(ctx)
 
-        results = {}
-
-        # Generate text prompt (AC-3.3.5) — unified template
-        text_prompt, text_tokens, text_time = await self._generate_prompt(ctx, "text")
-        results["text_generated"] = text_prompt is not None
-        results["text_tokens"] = text_tokens
-        results["text_time_ms"] = text_time
+        # AC-3.3.5: both platforms from one set of template vars; sections
+        # that don't read the platform are rendered once and shared
+        start = time.perf_counter()
+        try:
+            with profile_span("render"):
+                rendered = self._render_prompts(ctx)
+        except Exception as e:
+            self._logger.error("template_render_failed error=%s", str(e))
+            rendered = {}
+
+        # Haiku enrichment dominates; run both platforms' calls concurrently
+        generated = dict(zip(PLATFORMS, await asyncio.gather(*(
+            self._generate_prompt(ctx, platform, rendered.get(platform), start)
+            for platform in PLATFORMS
+        )), strict=True))
+        await self._store_prompts(
+            ctx, {p: g for p, g in generated.items() if g[0] is not None}
+        )
 
-        # Generate voice prompt (AC-3.3.5) — same unified template, different platform
-        voice_prompt, voice_tokens, voice_time = await self._generate_prompt(ctx, "voice")
-        results["voice_generated"] = voice_prompt is not None
-        results["voice_tokens"] = voice_tokens
-        results["voice_time_ms"] = voice_time
+        results = {}
+        for platform, (prompt, tokens, gen_time) in generated.items():
+            results[f"{platform}_generated"] = prompt is not None
+            results[f"{platform}_tokens"] = tokens
+            results[f"{platform}_time_ms"] = gen_time
+        text_prompt, text_tokens, _ = generated["text"]
+        voice_prompt, voice_tokens, _ = generated["voice"]
 
         # Set on context (use the prompt matching ctx.platform)
         if ctx.platform == "voice" and voice_prompt is not None:
@@ -134,134 +178,21 @@ class PromptBuilderStage(BaseStage):
         )
         ctx.vulnerability_level = compute_vulnerability_level(ctx.chapter)
 
-        # Load conversation summaries (WP-3)
-        if self._session:
-            try:
-                from nikita.db.repositories.conversation_repository import ConversationRepository
-
-                conv_repo = ConversationRepository(self._session)
-                summaries = await conv_repo.get_conversation_summaries_for_prompt(
-                    user_id=ctx.user_id,
-                    exclude_conversation_id=ctx.conversation_id,
-                )
-                ctx.last_conversation_summary = summaries.get("last_summary")
-                ctx.today_summaries = summaries.get("today_summaries")
-                ctx.week_summaries = summaries.get("week_summaries")
-            except Exception as e:
-                self._logger.warning("enrich_conversation_summaries_failed error=%s", str(e))
-
-        # Compute hours since last interaction
-        if self._session:
-            try:
-                from nikita.db.repositories.user_repository import UserRepository
-
-                user_repo = UserRepository(self._session)
-                user = await user_repo.get(ctx.user_id)
-                if user:
-                    # Store user reference for template (profile, backstory, etc.)
-                    ctx.user = user
-                    if hasattr(user, "last_interaction_at") and user.last_interaction_at:
-                        delta = datetime.now(timezone.utc) - user.last_interaction_at
-                        ctx.hours_since_last = round(delta.total_seconds() / 3600, 1)
-            except Exception as e:
-                self._logger.warning("enrich_user_data_failed error=%s", str(e))
-
-        # Load memory episodes (relationship history + nikita events)
-        if self._session:
-            try:
-                from nikita.config.settings import get_settings
-                from nikita.memory.supabase_memory import SupabaseMemory
-
-                settings = get_settings()
-                if settings.openai_api_key:
-                    memory = SupabaseMemory(
-                        session=self._session,
-                        user_id=ctx.user_id,
-                        openai_api_key=settings.openai_api_key,
-                    )
-                    # Relationship episodes
-                    try:
-                        rel_facts = await memory.search(
-                            query="shared moments relationship history",
-                            graph_types=["relationship"],
-                            limit=10,
-                        )
-                        ctx.relationship_episodes = [f['fact'] for f in rel_facts]
-                    except Exception:
-                        pass
-
-                    # Nikita's own life events
-                    try:
-                        nikita_facts = await memory.search(
-                            query="nikita life events activities",
-                            graph_types=["nikita"],
-                            limit=10,
-                        )
-                        ctx.nikita_events = [f['fact'] for f in nikita_facts]
-                    except Exception:
-                        pass
-            except Exception as e:
-                self._logger.warning("enrich_memory_failed error=%s", str(e))
-
-        # Load historical thoughts from nikita_thoughts (Spec 068)
-        if self._session:
-            try:
-                from nikita.db.repositories.thought_repository import NikitaThoughtRepository
-
-                thought_repo = NikitaThoughtRepository(self._session)
-                db_thoughts = await thought_repo.get_active_thoughts(
-                    user_id=ctx.user_id, limit=10,
-                )
-                # NikitaThought.content → list[str] for template section 8 (INNER LIFE)
-                ctx.active_thoughts = [t.content for t in db_thoughts]
-            except Exception as e:
-                self._logger.warning("enrich_thoughts_failed error=%s", str(e))
-
-        # Spec 106 I14: Load voice conversation summaries for cross-platform continuity
-        if self._session:
-            try:
-                from nikita.db.repositories.conversation_repository import ConversationRepository
-                conv_repo = ConversationRepository(self._session)
-                ctx.voice_summaries = await conv_repo.get_recent_voice_summaries(
-                    user_id=ctx.user_id, limit=3
-                )
-            except Exception as e:
-                self._logger.warning("enrich_voice_summaries_failed error=%s", str(e))
-                ctx.voice_summaries = []
-
-        # Spec 104 Story 4: Load thought-driven conversation openers
-        if self._session:
-            try:
-                from nikita.db.repositories.thought_repository import NikitaThoughtRepository
-                thought_repo = NikitaThoughtRepository(self._session)
-                ctx.conversation_openers = await thought_repo.get_active_openers(
-                    user_id=ctx.user_id, limit=3
-                )
-            except Exception as e:
-                self._logger.warning("enrich_openers_failed error=%s", str(e))
-
-        # Load open threads from DB + merge with current extraction (Spec 068)
         if self._session:
-            try:
-                from nikita.db.repositories.thread_repository import ConversationThreadRepository
-
-                thread_repo = ConversationThreadRepository(self._session)
-                db_threads = await thread_repo.get_open_threads(
-                    user_id=ctx.user_id, limit=10,
-                )
-                # Exclude current conversation to avoid duplicating extracted_threads
-                historical = [
-                    {"topic": t.content, "type": t.thread_type, "created": str(t.created_at)}
-                    for t in db_threads
-                    if t.source_conversation_id != ctx.conversation_id
-                ]
-                # Merge: current extraction + historical from DB
-                ctx.open_threads = ctx.extracted_threads + historical
-            except Exception as e:
-                self._logger.warning("enrich_threads_failed error=%s", str(e))
-                # Fallback: use extraction data only
-                if ctx.extracted_threads:
-                    ctx.open_threads = ctx.extracted_threads
+            # Independent sources fan out concurrently; each falls back on its
+            # own failure or after ENRICH_SOURCE_TIMEOUT_SECONDS. The per-run
+            # loader reuses ctx.user and rows earlier stages already fetched,
+            # reads summaries on its own pooled session and serializes the
+            # rest on the shared session, so enrichment takes about as long as
+            # its slowest source (the memory embeddings) rather than the sum.
+            loader = ctx.get_loader(self._session)
+            await asyncio.gather(
+                self._enrich_source("conversation_summaries", self._load_summaries(ctx, loader)),
+                self._enrich_source("user_data", self._load_user_data(ctx, loader)),
+                self._enrich_source("memory", self._load_memory_episodes(ctx, loader)),
+                self._enrich_source("thoughts", self._load_thoughts(ctx, loader)),
+                self._enrich_source("threads", self._load_open_threads(ctx, loader)),
+            )
         elif ctx.extracted_threads:
             ctx.open_threads = ctx.extracted_threads
 
@@ -276,49 +207,191 @@ class PromptBuilderStage(BaseStage):
             len(ctx.open_threads),
         )
 
+    async def _enrich_source(self, name: str, load: Awaitable[None]) -> None:
+        """Run one enrichment source; a failure or timeout only loses that source."""
+        try:
+            await asyncio.wait_for(load, timeout=ENRICH_SOURCE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            self._logger.warning(
+                "enrich_%s_timeout timeout=%s", name, ENRICH_SOURCE_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            self._logger.warning("enrich_%s_failed error=%s", name, str(e) or type(e).__name__)
+
+    async def _load_summaries(self, ctx: PipelineContext, loader: PipelineDataLoader) -> None:
+        """Conversation summaries (WP-3) + voice summaries (Spec 106 I14)."""
+        ctx.voice_summaries = []
+        summaries = await loader.summaries()
+        ctx.last_conversation_summary = summaries.get("last_summary")
+        ctx.today_summaries = summaries.get("today_summaries")
+        ctx.week_summaries = summaries.get("week_summaries")
+        # Cross-platform continuity
+        ctx.voice_summaries = summaries.get("voice_summaries") or []
+
+    async def _load_user_data(self, ctx: PipelineContext, loader: PipelineDataLoader) -> None:
+        """Hours since last interaction; loader.user() also stores ctx.user for the template."""
+        user = await loader.user()
+        if user and getattr(user, "last_interaction_at", None):
+            delta = datetime.now(UTC) - user.last_interaction_at
+            ctx.hours_since_last = round(delta.total_seconds() / 3600, 1)
+
+    async def _load_memory_episodes(self, ctx: PipelineContext, loader: PipelineDataLoader) -> None:
+        """Relationship history + Nikita's own life events from memory.
+
+        Both query embeddings come from one API call, bounded by
+        MEMORY_EMBEDDING_TIMEOUT_SECONDS (on timeout the prompt goes out
+        without episodes). If the batch call errors otherwise, each search
+        embeds its own query. Searches hold the session lock.
+        """
+        from nikita.config.settings import get_settings
+
+        if not get_settings().openai_api_key:
+            return
+        memory = loader.memory()
+        searches = [
+            ("relationship_episodes", MEMORY_QUERIES["relationship"], ["relationship"]),
+            ("nikita_events", MEMORY_QUERIES["nikita"], ["nikita"]),
+        ]
+
+        embeddings: list[list[float] | None] = [None] * len(searches)
+        try:
+            batch = await asyncio.wait_for(
+                memory.generate_embeddings_batch([query for _, query, _ in searches]),
+                timeout=MEMORY_EMBEDDING_TIMEOUT_SECONDS,
+            )
+            if isinstance(batch, list) and len(batch) == len(searches):
+                embeddings = batch
+        except TimeoutError:
+            raise
+        except Exception as e:
+            self._logger.debug("enrich_memory_batch_embedding_failed error=%s", str(e))
+
+        for (field_name, query, graph_types), embedding in zip(searches, embeddings, strict=True):
+            try:
+                async with loader.session_lock:
+                    facts = await memory.search(
+                        query=query,
+                        graph_types=graph_types,
+                        limit=10,
+                        query_embedding=embedding,
+                    )
+                setattr(ctx, field_name, [f['fact'] for f in facts])
+            except Exception:
+                pass
+
+    async def _load_thoughts(self, ctx: PipelineContext, loader: PipelineDataLoader) -> None:
+        """Historical thoughts (Spec 068) + conversation openers (Spec 104 Story 4)."""
+        thoughts = await loader.thoughts()
+        # NikitaThought.content → list[str] for template section 8 (INNER LIFE)
+        ctx.active_thoughts = [t.content for t in thoughts[None]]
+        ctx.conversation_openers = [t.content for t in thoughts["wants_to_share"]]
+
+    async def _load_open_threads(self, ctx: PipelineContext, loader: PipelineDataLoader) -> None:
+        """Open threads from DB merged with the current extraction (Spec 068)."""
+        # Fallback if the lookup fails: extraction data only
+        if ctx.extracted_threads:
+            ctx.open_threads = ctx.extracted_threads
+        db_threads = await loader.open_threads()
+        # Exclude current conversation to avoid duplicating extracted_threads
+        historical = [
+            {"topic": t.content, "type": t.thread_type, "created": str(t.created_at)}
+            for t in db_threads
+            if t.source_conversation_id != ctx.conversation_id
+        ]
+        # Merge: current extraction + historical from DB
+        ctx.open_threads = ctx.extracted_threads + historical
+
     async def _generate_prompt(
-        self, ctx: PipelineContext, platform: str
+        self,
+        ctx: PipelineContext,
+        platform: str,
+        sections: list[RenderedSection] | None,
+        start: float,
     ) -> tuple[str | None, int, float]:
-        """Generate a single prompt for a platform.
+        """Finish a single platform's prompt from its rendered template.
 
-        Spec 045 WP-2: Always uses system_prompt.j2 (unified template).
+        Spec 045 WP-2: sections are system_prompt.j2 rendered for platform
+        (see _render_prompts). Storage is left to the caller so both
+        platforms are written together.
 
         Args:
             ctx: Pipeline context with user state and extraction results.
             platform: 'text' or 'voice'.
+            sections: Rendered template sections, or None if rendering failed.
+            start: perf_counter() reading taken before rendering.
 
         Returns:
             (prompt_text, token_count, generation_time_ms)
         """
-        start = time.perf_counter()
-
-        # Step 1: Render unified Jinja2 template (Spec 045 WP-2)
-        template_name = "system_prompt.j2"
-        try:
-            raw_prompt = self._render_template(template_name, ctx, platform)
-        except Exception as e:
-            self._logger.error("template_render_failed platform=%s error=%s", platform, str(e))
+        if sections is None:
             return None, 0, (time.perf_counter() - start) * 1000
 
-        # Step 2: Count tokens
-        token_count = self._count_tokens(raw_prompt)
+        # Tokens were counted per section at render time (and cached with it)
+        raw_prompt = "".join(section.text for section in sections)
+        token_count = sum(section.tokens for section in sections)
 
-        # Step 3: Optional Haiku enrichment (AC-3.3.2, AC-3.3.3)
+        # Optional Haiku enrichment (AC-3.3.2, AC-3.3.3)
         enriched_prompt = await self._enrich_with_haiku(raw_prompt, platform)
+        final_prompt: str | list[RenderedSection]
         if enriched_prompt:
             token_count = self._count_tokens(enriched_prompt)
             final_prompt = enriched_prompt
         else:
-            final_prompt = raw_prompt
+            final_prompt = sections
 
-        # Step 4: Token budget validation + truncation (AC-3.4.1, AC-3.4.2, AC-3.4.3)
+        # Token budget validation + truncation (AC-3.4.1, AC-3.4.2, AC-3.4.3)
         final_prompt, token_count = self._enforce_token_budget(final_prompt, token_count, platform)
 
-        # Step 5: Store in ready_prompts (AC-3.3.4)
-        gen_time_ms = (time.perf_counter() - start) * 1000
-        await self._store_prompt(ctx, platform, final_prompt, token_count, gen_time_ms)
+        return final_prompt, token_count, (time.perf_counter() - start) * 1000
 
-        return final_prompt, token_count, gen_time_ms
+    def _render_prompts(
+        self,
+        ctx: PipelineContext,
+        platforms: tuple[str, ...] = PLATFORMS,
+        template_name: str = PROMPT_TEMPLATE,
+    ) -> dict[str, list[RenderedSection]]:
+        """Render the unified template for several platforms at once.
+
+        Template vars are built once. Sections (top-level blocks) that read
+        none of PLATFORM_TEMPLATE_VARS are rendered once and shared; the rest
+        are rendered per platform. Sections whose inputs are unchanged since
+        an earlier run come from the section cache, token counts included.
+
+        Args:
+            ctx: Pipeline context.
+            platforms: Platforms to render for.
+            template_name: Template file name (e.g., "system_prompt.j2").
+
+        Returns:
+            Rendered sections in template order, by platform.
+        """
+        from nikita.config.settings import get_settings
+        from nikita.pipeline.templates import render_sections, section_cache, template_sections
+
+        cache = section_cache if get_settings().prompt_section_cache_enabled else None
+        template_vars = self._build_template_vars(ctx, platforms[0])
+        sections = template_sections(template_name)
+        per_platform = [s.name for s in sections if s.variables & PLATFORM_TEMPLATE_VARS]
+        shared = render_sections(
+            template_name,
+            template_vars,
+            [s.name for s in sections if not s.variables & PLATFORM_TEMPLATE_VARS],
+            count_tokens=self._count_tokens,
+            cache=cache,
+        )
+
+        prompts = {}
+        for platform in platforms:
+            platform_vars = {**template_vars, **self._platform_template_vars(ctx, platform)}
+            rendered = {
+                **shared,
+                **render_sections(
+                    template_name, platform_vars, per_platform,
+                    count_tokens=self._count_tokens, cache=cache,
+                ),
+            }
+            prompts[platform] = [rendered[s.name] for s in sections]
+        return prompts
 
     def _render_template(self, template_name: str, ctx: PipelineContext, platform: str) -> str:
         """Render a Jinja2 template with PipelineContext data.
@@ -331,10 +404,8 @@ class PromptBuilderStage(BaseStage):
         Returns:
             Rendered prompt text.
         """
-        from nikita.pipeline.templates import render_template
-
-        template_vars = self._build_template_vars(ctx, platform)
-        return render_template(template_name, **template_vars)
+        sections = self._render_prompts(ctx, (platform,), template_name)[platform]
+        return "".join(section.text for section in sections)
 
     def _build_template_vars(self, ctx: PipelineContext, platform: str) -> dict:
         """Convert PipelineContext to flat dict for Jinja2 template (Spec 045 WP-1).
@@ -390,8 +461,8 @@ class PromptBuilderStage(BaseStage):
             )
 
         return {
-            # Core
-            "platform": platform,
+            # Core (platform-specific vars: see _platform_template_vars)
+            **self._platform_template_vars(ctx, platform),
             "user_id": str(ctx.user_id),
             "conversation_id": str(ctx.conversation_id),
             # User state
@@ -444,8 +515,6 @@ class PromptBuilderStage(BaseStage):
             "conversation_openers": getattr(ctx, "conversation_openers", []),
             # Spec 106 I14: Cross-platform voice conversation summaries
             "voice_summaries": getattr(ctx, "voice_summaries", []),
-            # Spec 108: Audio tags for voice prompt
-            "available_audio_tags": self._get_available_audio_tags(ctx.chapter) if platform == "voice" else "",
             # H4: Onboarding JSONB extras (backstory_preview, hobbies, geek_out_on, saturday_morning)
             # Sourced from user.onboarding_profile JSONB — unpacked above in _build_template_vars.
             "backstory_preview": backstory_preview,
@@ -454,6 +523,22 @@ class PromptBuilderStage(BaseStage):
             "saturday_morning": saturday_morning,
         }
 
+    def _platform_template_vars(self, ctx: PipelineContext, platform: str) -> dict:
+        """The template vars that differ between platforms (PLATFORM_TEMPLATE_VARS).
+
+        Args:
+            ctx: Pipeline context.
+            platform: 'text' or 'voice'.
+
+        Returns:
+            Template variables dict.
+        """
+        return {
+            "platform": platform,
+            # Spec 108: Audio tags for voice prompt
+            "available_audio_tags": self._get_available_audio_tags(ctx.chapter) if platform == "voice" else "",
+        }
+
     def _get_available_audio_tags(self, chapter: int) -> str:
         """Get formatted audio tag instruction for voice prompt (Spec 108).
 
@@ -511,8 +596,10 @@ class PromptBuilderStage(BaseStage):
             )
 
             # Use Haiku for cost efficiency — pydantic-ai 1.x reads ANTHROPIC_API_KEY from env
-            agent = Agent(model=Models.haiku())
-            result = await agent.run(enrichment_prompt)
+            model = Models.haiku()
+            agent = get_agent(("prompt_enrichment", model), lambda: Agent(model=model))
+            with profile_span("llm"):
+                result = await agent.run(enrichment_prompt)
 
             # pydantic-ai 1.x uses .output, older versions use .data
             enriched = getattr(result, "output", None) or getattr(result, "data", None)
@@ -525,12 +612,12 @@ class PromptBuilderStage(BaseStage):
             return None
 
     def _enforce_token_budget(
-        self, prompt: str, token_count: int, platform: str
+        self, prompt: str | list[RenderedSection], token_count: int, platform: str
     ) -> tuple[str, int]:
         """Validate and enforce token budget. Truncate if over.
 
         Args:
-            prompt: Prompt text.
+            prompt: Prompt text, or its rendered sections.
             token_count: Current token count.
             platform: 'text' or 'voice'.
 
@@ -561,19 +648,25 @@ class PromptBuilderStage(BaseStage):
             )
             prompt = self._truncate_prompt(prompt, max_tokens)
             token_count = self._count_tokens(prompt)
+        elif not isinstance(prompt, str):
+            prompt = "".join(section.text for section in prompt)
 
         return prompt, token_count
 
-    def _truncate_prompt(self, prompt: str, target_tokens: int) -> str:
+    def _truncate_prompt(self, prompt: str | list[RenderedSection], target_tokens: int) -> str:
         """Truncate prompt by removing lower-priority sections.
 
-        Priority (lowest first, remove first):
+        Priority (lowest first, remove first), see TRUNCATION_ORDER:
         1. Vice Shaping
         2. Chapter Behavior
         3. Psychological Depth
 
+        Rendered sections are dropped whole, budgeted with their per-section
+        token counts. Flat text (a Haiku-enriched prompt) has no section
+        structure left, so sections are cut out by their <!-- SEC: --> markers.
+
         Args:
-            prompt: Prompt text.
+            prompt: Prompt text, or its rendered sections.
             target_tokens: Target token count.
 
         Returns:
@@ -581,21 +674,26 @@ class PromptBuilderStage(BaseStage):
         """
         from nikita.context.utils.token_counter import TokenCounter
 
-        counter = TokenCounter(budget=target_tokens)
+        if not isinstance(prompt, str):
+            sections = list(prompt)
+            total = sum(section.tokens for section in sections)
+            for name, _ in TRUNCATION_ORDER:
+                if total <= target_tokens:
+                    break
+                total -= sum(s.tokens for s in sections if s.name == name)
+                sections = [s for s in sections if s.name != name]
+            current = "".join(section.text for section in sections)
+            if total <= target_tokens:
+                return current
 
-        # Try removing sections in priority order (AC-3.4.3)
-        # Markers are rendered HTML comments in system_prompt.j2
-        sections_to_remove = [
-            "<!-- SEC:VICE_SHAPING -->",
-            "<!-- SEC:CHAPTER_BEHAVIOR -->",
-            "<!-- SEC:PSYCHOLOGICAL_DEPTH -->",
-        ]
+        counter = TokenCounter(budget=target_tokens)
 
-        current = prompt
-        for section_header in sections_to_remove:
-            if counter.fits_budget(current):
-                break
-            current = self._remove_section(current, section_header)
+        if isinstance(prompt, str):
+            current = prompt
+            for _, section_header in TRUNCATION_ORDER:
+                if counter.fits_budget(current):
+                    break
+                current = self._remove_section(current, section_header)
 
         # If still over, hard truncate
         if not counter.fits_budget(current):
@@ -628,27 +726,27 @@ class PromptBuilderStage(BaseStage):
         else:
             return prompt[:start] + prompt[next_section:]
 
-    async def _store_prompt(
+    async def _store_prompts(
         self,
         ctx: PipelineContext,
-        platform: str,
-        prompt_text: str,
-        token_count: int,
-        gen_time_ms: float,
+        prompts: dict[str, tuple[str, int, float]],
     ) -> None:
-        """Store generated prompt in ready_prompts table.
+        """Store generated prompts in the ready_prompts table.
+
+        All platforms are written together (ReadyPromptRepository.set_current_many),
+        as are their generated_prompts audit logs.
 
         Args:
             ctx: Pipeline context.
-            platform: 'text' or 'voice'.
-            prompt_text: Generated prompt text.
-            token_count: Token count.
-            gen_time_ms: Generation time in milliseconds.
+            prompts: (prompt_text, token_count, generation_time_ms) by platform.
         """
         if not self._session:
             self._logger.warning("no_session_for_prompt_storage")
             return
+        if not prompts:
+            return
 
+        platforms = ",".join(prompts)
         try:
             from nikita.db.repositories.ready_prompt_repository import ReadyPromptRepository
 
@@ -661,13 +759,18 @@ class PromptBuilderStage(BaseStage):
                 "vices": ctx.vices,
             }
 
-            await repo.set_current(
+            await repo.set_current_many(
                 user_id=ctx.user_id,
-                platform=platform,
-                prompt_text=prompt_text,
-                token_count=token_count,
+                prompts=[
+                    {
+                        "platform": platform,
+                        "prompt_text": prompt_text,
+                        "token_count": token_count,
+                        "generation_time_ms": gen_time_ms,
+                    }
+                    for platform, (prompt_text, token_count, gen_time_ms) in prompts.items()
+                ],
                 pipeline_version="045-v1",
-                generation_time_ms=gen_time_ms,
                 context_snapshot=context_snapshot,
                 conversation_id=ctx.conversation_id,
             )
@@ -677,25 +780,30 @@ class PromptBuilderStage(BaseStage):
                 from nikita.db.repositories.generated_prompt_repository import GeneratedPromptRepository
 
                 prompt_repo = GeneratedPromptRepository(self._session)
-                await prompt_repo.create_log(
+                await prompt_repo.create_logs(
                     user_id=ctx.user_id,
-                    prompt_content=prompt_text,
-                    token_count=token_count,
-                    generation_time_ms=gen_time_ms,
+                    entries=[
+                        {
+                            "platform": platform,
+                            "prompt_content": prompt_text,
+                            "token_count": token_count,
+                            "generation_time_ms": gen_time_ms,
+                        }
+                        for platform, (prompt_text, token_count, gen_time_ms) in prompts.items()
+                    ],
                     meta_prompt_template="045-v1",
                     conversation_id=ctx.conversation_id,
                     context_snapshot=context_snapshot,
-                    platform=platform,
                 )
             except Exception as log_err:
-                self._logger.warning("prompt_log_failed platform=%s error=%s", platform, str(log_err))
+                self._logger.warning("prompt_log_failed platforms=%s error=%s", platforms, str(log_err))
 
             # Spec 043 T1.2: Sync voice prompt to user.cached_voice_prompt for outbound calls
-            if platform == "voice":
-                await self._sync_cached_voice_prompt(ctx.user_id, prompt_text)
+            if "voice" in prompts:
+                await self._sync_cached_voice_prompt(ctx.user_id, prompts["voice"][0])
 
         except Exception as e:
-            self._logger.warning("prompt_store_failed platform=%s error=%s", platform, str(e))
+            self._logger.warning("prompt_store_failed platforms=%s error=%s", platforms, str(e))
 
     async def _sync_cached_voice_prompt(self, user_id, prompt_text: str) -> None:
         """Sync voice prompt to user.cached_voice_prompt for outbound calls.
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 import structlog
 
 from nikita.config.models import Models
+from nikita.observability.profiler import profile_span
 from nikita.pipeline.stages.base import BaseStage
 
 if TYPE_CHECKING:
@@ -32,6 +33,8 @@ class SummaryStage(BaseStage):
     name = "summary"
     is_critical = False
     timeout_seconds = 60.0
+    reads = frozenset({"extraction_summary", "conversation"})
+    writes = frozenset({"extraction_summary", "daily_summary_updated"})
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
@@ -50,9 +53,9 @@ class SummaryStage(BaseStage):
         active_arcs: list[str] = []
         if self._session:
             try:
-                from nikita.db.repositories.thought_repository import NikitaThoughtRepository
-                thought_repo = NikitaThoughtRepository(self._session)
-                active_arcs = await thought_repo.get_active_arcs(user_id=ctx.user_id)
+                # Shared with PromptBuilderStage's thought lookups (one query)
+                thoughts = await ctx.get_loader(self._session).thoughts()
+                active_arcs = [t.content for t in thoughts["arc"]]
             except Exception as e:
                 self._logger.warning("load_arcs_failed error=%s", str(e))
 
@@ -140,9 +143,10 @@ class SummaryStage(BaseStage):
             if not text:
                 return ""
 
-            result = await agent.run(
-                f"Summarize this conversation:\n\n{text}"
-            )
+            with profile_span("llm"):
+                result = await agent.run(
+                    f"Summarize this conversation:\n\n{text}"
+                )
             # pydantic-ai 1.x uses .output, older uses .data
             output = getattr(result, "output", None) or getattr(result, "data", "")
             return output or ""
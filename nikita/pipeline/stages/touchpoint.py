@@ -27,6 +27,8 @@ class TouchpointStage(BaseStage):
     name = "touchpoint"
     is_critical = False
     timeout_seconds = 30.0
+    reads = frozenset({"life_events"})
+    writes = frozenset({"touchpoint_scheduled"})
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
@@ -28,6 +28,9 @@ class ViceStage(BaseStage):
     name = "vice"
     is_critical = False
     timeout_seconds = 45.0
+    reads = frozenset({"conversation", "chapter"})
+    writes = frozenset()
+    uses_session = False  # ViceService manages its own session
 
     def __init__(self, session: AsyncSession = None, **kwargs) -> None:
         super().__init__(session=session, **kwargs)
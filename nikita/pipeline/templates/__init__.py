@@ -1,12 +1,81 @@
-"""Pipeline template utilities."""
+"""Pipeline template utilities.
+
+Templates made of top-level blocks can be rendered section by section
+(render_sections). Each section's output is cached in-process, keyed on a
+hash of exactly the variables that section reads, so sections whose inputs
+are unchanged since an earlier render (persona, chapter behavior, vice
+shaping, ...) are neither re-rendered nor re-token-counted.
+"""
+import hashlib
+import json
 import os
-from functools import lru_cache
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from functools import cache, lru_cache
+from typing import Any, NamedTuple
+from uuid import UUID
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, meta, nodes, select_autoescape
 
 _TEMPLATE_DIR = os.path.dirname(__file__)
 
 
+# Rendered sections kept by the process-wide section cache
+SECTION_CACHE_SIZE = 512
+
+
+class TemplateSection(NamedTuple):
+    """A top-level {% block %} of a template and the variables it reads."""
+
+    name: str
+    variables: frozenset[str]
+
+
+class RenderedSection(NamedTuple):
+    """One rendered section; tokens is None when no counter was given."""
+
+    name: str
+    text: str
+    tokens: int | None
+
+
+class SectionCache:
+    """LRU of rendered sections keyed on (template, section, input hash)."""
+
+    def __init__(self, maxsize: int = SECTION_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], tuple[str, int | None]] = OrderedDict()
+
+    def get(self, key: tuple[str, str, str]) -> tuple[str, int | None] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: tuple[str, str, str], text: str, tokens: int | None) -> None:
+        self._entries[key] = (text, tokens)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+section_cache = SectionCache()
+
+
 @lru_cache(maxsize=1)
 def _get_env() -> Environment:
     """Get cached Jinja2 environment."""
@@ -31,3 +100,103 @@ def render_template(template_name: str, **context) -> str:
     env = _get_env()
     tmpl = env.get_template(template_name)
     return tmpl.render(**context)
+
+
+@cache
+def template_sections(template_name: str) -> tuple[TemplateSection, ...]:
+    """List a template's top-level blocks in render order.
+
+    The template must consist only of top-level blocks (outside them, only
+    comments), so that concatenating the rendered sections reproduces
+    render_template() byte for byte.
+
+    Args:
+        template_name: Name of the template file (e.g., "system_prompt.j2")
+
+    Returns:
+        One TemplateSection per block, with the context variables it reads.
+    """
+    env = _get_env()
+    source, _, _ = env.loader.get_source(env, template_name)
+    sections = []
+    for node in env.parse(source).body:
+        if not isinstance(node, nodes.Block):
+            raise ValueError(f"{template_name}: content outside a top-level block")
+        body = nodes.Template(node.body, environment=env)
+        sections.append(
+            TemplateSection(node.name, frozenset(meta.find_undeclared_variables(body)))
+        )
+    return tuple(sections)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Decimal | UUID):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, set | frozenset | tuple):
+        return list(value)
+    # Arbitrary objects (e.g. ORM rows) have no stable content hash
+    raise TypeError(f"unhashable template input: {type(value).__name__}")
+
+
+def section_input_hash(section: TemplateSection, context: dict[str, Any]) -> str | None:
+    """Hash of the values of exactly the variables a section reads.
+
+    Returns None when a value isn't plain data (dicts, lists, scalars,
+    Decimal, UUID, dates), which makes the section uncacheable.
+    """
+    # Absent variables stay absent: Undefined renders unlike None
+    inputs = {name: context[name] for name in section.variables if name in context}
+    try:
+        encoded = json.dumps(inputs, sort_keys=True, default=_plain, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def render_sections(
+    template_name: str,
+    context: dict[str, Any],
+    names: list[str] | None = None,
+    count_tokens: Callable[[str], int] | None = None,
+    cache: SectionCache | None = section_cache,
+) -> dict[str, RenderedSection]:
+    """Render individual top-level blocks of a template.
+
+    Sections found in the cache under the same input hash are returned
+    without rendering or counting.
+
+    Args:
+        template_name: Name of the template file (e.g., "system_prompt.j2")
+        context: Template variables
+        names: Blocks to render (default: all, see template_sections)
+        count_tokens: Optional token counter applied to each rendered section
+        cache: Section cache (None disables caching)
+
+    Returns:
+        RenderedSection by block name, in render order.
+    """
+    env = _get_env()
+    tmpl = env.get_template(template_name)
+    sections = {section.name: section for section in template_sections(template_name)}
+    if names is None:
+        names = list(sections)
+    rendered = {}
+    for name in names:
+        key = None
+        if cache is not None:
+            input_hash = section_input_hash(sections[name], context)
+            if input_hash is not None:
+                key = (template_name, name, input_hash)
+                cached = cache.get(key)
+                if cached is not None and (cached[1] is not None or count_tokens is None):
+                    rendered[name] = RenderedSection(name, *cached)
+                    continue
+        # Fresh context per block: {% set %} inside a block stays local to it
+        text = "".join(tmpl.blocks[name](tmpl.new_context(context)))
+        tokens = count_tokens(text) if count_tokens is not None else None
+        if key is not None:
+            cache.put(key, text, tokens)
+        rendered[name] = RenderedSection(name, text, tokens)
+    return rendered
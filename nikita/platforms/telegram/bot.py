@@ -7,8 +7,8 @@ SEC-03: HTML escaping for all user-provided content to prevent injection attacks
 """
 
 import html
-from httpx import AsyncClient
 from nikita.config.settings import get_settings
+from nikita.llm.clients import get_http_client
 
 
 def escape_html(text: str) -> str:
@@ -42,7 +42,8 @@ class TelegramBot:
             self.base_url = f"https://api.telegram.org/bot{token}"
         else:
             self.base_url = None  # Bot not configured
-        self.client = AsyncClient()
+        # Process-wide pooled client, closed at shutdown by close_clients()
+        self.client = get_http_client("telegram")
 
     async def send_message(
         self,
@@ -263,8 +264,11 @@ class TelegramBot:
         return data
 
     async def close(self):
-        """Close the HTTP client connection."""
-        await self.client.aclose()
+        """Release the bot's HTTP client.
+
+        The client is shared by every TelegramBot and closed once at
+        shutdown (nikita.llm.clients.close_clients), so this is a no-op.
+        """
 
 
 # Singleton instance
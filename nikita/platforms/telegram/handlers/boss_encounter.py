@@ -163,10 +163,15 @@ class BossEncounterHandler:
         try:
             boss_prompt = get_boss_prompt(user.chapter)
 
-            conversation = await self.conversation_repo.get_active_conversation(user.id)
+            conversation = await self.conversation_repo.get_active_conversation(
+                user.id, load_messages=False
+            )
             conversation_history = []
-            if conversation and conversation.messages:
-                for msg in conversation.messages[-10:]:
+            if conversation:
+                recent = await self.conversation_repo.get_recent_messages(
+                    conversation.id, limit=10
+                )
+                for msg in recent:
                     conversation_history.append({
                         "role": msg.get("role", "unknown"),
                         "content": msg.get("content", ""),
@@ -34,6 +34,7 @@ from nikita.config.settings import get_settings
 logger = logging.getLogger(__name__)
 
 from nikita.agents.text.handler import MessageHandler as TextAgentMessageHandler
+from nikita.agents.text.history import DEFAULT_HISTORY_LIMIT
 from nikita.config.enums import EngagementState
 from nikita.db.models.conversation import Conversation
 from nikita.db.models.engagement import EngagementHistory
@@ -286,16 +287,19 @@ class MessageHandler:
             f"status={conversation.status}"
         )
 
-        # Append user message to conversation
-        await self.conversation_repo.append_message(
+        # Append user message to conversation (one INSERT, nothing reloaded)
+        user_message = await self.conversation_repo.append_message(
             conversation_id=conversation.id,
             role="user",
             content=text,
         )
 
-        # Spec 038 T1.1: Refresh conversation to get fresh messages list
-        # Without this, conversation.messages would be stale (missing the just-appended message)
-        await self.conversation_repo.session.refresh(conversation)
+        # Spec 038 T1.1: The agent needs the messages including the one just
+        # appended. Only the history window is fetched (the conversation was
+        # loaded without its messages); the agent never looks further back.
+        conversation_messages = await self.conversation_repo.get_recent_messages(
+            conversation.id, limit=DEFAULT_HISTORY_LIMIT
+        )
 
         # Send typing indicator for better UX
         await self.bot.send_chat_action(chat_id, "typing")
@@ -383,12 +387,12 @@ class MessageHandler:
             logger.info(
                 f"[LLM-DEBUG] Calling text_agent_handler.handle for user_id={user.id}, "
                 f"conversation_id={conversation.id}, "
-                f"message_count={len(conversation.messages) if conversation.messages else 0}"
+                f"message_count={user_message.seq}"
             )
             decision = await self.text_agent_handler.handle(
                 user.id,
                 text,
-                conversation_messages=conversation.messages,
+                conversation_messages=conversation_messages,
                 conversation_id=conversation.id,
                 session=self.conversation_repo.session,  # Spec 038: Session propagation
                 psyche_state=psyche_state_dict,  # Spec 056: Psyche state injection
@@ -574,7 +578,10 @@ class MessageHandler:
         Returns:
             Active or newly created Conversation.
         """
-        conversation = await self.conversation_repo.get_active_conversation(user_id)
+        # Messages are not loaded: the turn fetches its history window
+        conversation = await self.conversation_repo.get_active_conversation(
+            user_id, load_messages=False
+        )
         if conversation is None:
             conversation = await self.conversation_repo.create_conversation(
                 user_id=user_id,
@@ -847,7 +854,7 @@ class MessageHandler:
         transaction which holds ``FOR UPDATE`` on the user row. The only
         synchronous work here is message generation + the Telegram HTTP
         send (no DB writes). ``HandoffManager.execute_handoff`` spawns
-        ``generate_and_store_social_circle`` and ``_bootstrap_pipeline``
+        ``generate_and_store_social_circle`` and ``bootstrap_pipeline``
         as fire-and-forget asyncio tasks on fresh sessions — those tasks
         don't update the users row, so the outer FOR UPDATE does not
         deadlock them. They may briefly serialize behind the outer
@@ -1305,10 +1312,15 @@ Tap below — it'll only take a minute. 😏"""
         try:
             boss_prompt = get_boss_prompt(user.chapter)
 
-            conversation = await self.conversation_repo.get_active_conversation(user.id)
+            conversation = await self.conversation_repo.get_active_conversation(
+                user.id, load_messages=False
+            )
             conversation_history = []
-            if conversation and conversation.messages:
-                for msg in conversation.messages[-10:]:
+            if conversation:
+                recent = await self.conversation_repo.get_recent_messages(
+                    conversation.id, limit=10
+                )
+                for msg in recent:
                     conversation_history.append({
                         "role": msg.get("role", "unknown"),
                         "content": msg.get("content", ""),
@@ -16,6 +16,7 @@ from pydantic_ai import Agent
 
 from nikita.config.models import Models
 from nikita.config.settings import get_settings
+from nikita.llm.clients import get_agent
 from nikita.services.venue_research import Venue
 
 if TYPE_CHECKING:
@@ -406,10 +407,8 @@ Generate vivid scenarios authentic to {profile.city}'s {profile.social_scene} sc
         settings = get_settings()
 
         # Create agent matching MetaPromptService pattern
-        agent = Agent(
-            Models.haiku(),
-            output_type=str,
-        )
+        model = Models.haiku()
+        agent = get_agent(("backstory", model), lambda: Agent(model, output_type=str))
 
         # Add character prefilling for Nikita voice consistency
         enhanced_prompt = f"[Nikita]\n{prompt}\n\nRespond with valid JSON only:"
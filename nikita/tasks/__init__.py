@@ -1 +1,4 @@
-"""Background task definitions for Celery workers."""
+"""Background task definitions.
+
+work_queue: durable work_jobs queue (enqueue, drain, job handlers).
+"""
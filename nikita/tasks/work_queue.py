@@ -0,0 +1,329 @@
+"""Durable work queue: enqueue, drain, and job handlers.
+
+Background work used to be launched with asyncio.create_task on the
+request instance, so it was lost whenever Cloud Run scaled the instance
+down (or the request session closed underneath it). Jobs are now rows in
+work_jobs:
+
+- enqueue() inserts a row, optionally inside the caller's transaction
+  (outbox pattern: the job only becomes visible if the caller commits).
+- kick_drain() starts an in-process drain right away for low latency.
+- pg_cron POSTs /tasks/drain-work-queue every minute as the safety net,
+  picking up anything a dead instance left behind (expired leases).
+
+Handlers run in their own DB session and must be idempotent: a job whose
+worker died mid-run is retried after its lease expires.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from nikita.config.settings import get_settings
+from nikita.db.database import get_session_maker
+from nikita.db.models.work_job import WorkJob, WorkJobKind, WorkJobStatus
+from nikita.db.repositories.work_job_repository import WorkJobRepository
+
+logger = logging.getLogger(__name__)
+
+# Lease held while a handler runs; a pipeline run is capped well below this
+DEFAULT_LEASE_SECONDS: float = 600.0
+
+# Handlers are cancelled this long before their lease expires so a slow
+# job is failed (and retried) by its own worker rather than double-run
+LEASE_MARGIN_SECONDS: float = 30.0
+
+# Exponential retry backoff: base * 2^(attempt-1), capped
+RETRY_BASE_SECONDS: float = 30.0
+RETRY_MAX_SECONDS: float = 1800.0
+
+# Jobs claimed per round. Each handler holds a pooled connection for its
+# whole run, so keep this well under DB_POOL_SIZE.
+DRAIN_BATCH_SIZE: int = 3
+
+# Stop claiming new rounds after this long (pg_cron fires every minute)
+DRAIN_TIME_BUDGET_SECONDS: float = 45.0
+
+WORKER_ID: str = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+_HANDLERS: dict[str, JobHandler] = {}
+
+# Strong references to in-flight kick_drain tasks (the event loop only
+# keeps weak ones, so an unreferenced task can be garbage-collected)
+_background_drains: set[asyncio.Task] = set()
+
+
+def register_handler(kind: WorkJobKind) -> Callable[[JobHandler], JobHandler]:
+    """Register the coroutine that runs jobs of `kind`."""
+
+    def decorator(func: JobHandler) -> JobHandler:
+        _HANDLERS[kind.value] = func
+        return func
+
+    return decorator
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    """Backoff before the next attempt after `attempts` failed attempts."""
+    return min(RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), RETRY_MAX_SECONDS)
+
+
+async def enqueue(
+    kind: WorkJobKind,
+    payload: dict[str, Any],
+    *,
+    session: AsyncSession | None = None,
+    dedupe_key: str | None = None,
+    delay_seconds: float = 0.0,
+    max_attempts: int = 5,
+) -> UUID | None:
+    """Persist a job.
+
+    With `session`, the row is written in the caller's transaction and
+    nothing is committed; the caller should call kick_drain() after its
+    own commit. Without one, the job is committed in a short session and
+    a drain is kicked immediately.
+
+    Returns:
+        The job id, or None if `dedupe_key` was already enqueued.
+    """
+    if session is not None:
+        return await WorkJobRepository(session).enqueue(
+            kind.value,
+            payload,
+            dedupe_key=dedupe_key,
+            delay_seconds=delay_seconds,
+            max_attempts=max_attempts,
+        )
+
+    async with get_session_maker()() as own_session:
+        job_id = await WorkJobRepository(own_session).enqueue(
+            kind.value,
+            payload,
+            dedupe_key=dedupe_key,
+            delay_seconds=delay_seconds,
+            max_attempts=max_attempts,
+        )
+        await own_session.commit()
+    if delay_seconds <= 0:
+        kick_drain()
+    return job_id
+
+
+async def enqueue_or_run(
+    kind: WorkJobKind,
+    payload: dict[str, Any],
+    fallback: Callable[[], Coroutine[Any, Any, None]],
+    *,
+    dedupe_key: str | None = None,
+) -> None:
+    """Enqueue a job, or run `fallback` as an in-process task.
+
+    The fallback (the old fire-and-forget behaviour) is used when
+    WORK_QUEUE_ENABLED=false or the enqueue itself fails, so a queue
+    outage never drops onboarding work that used to run.
+    """
+    if get_settings().work_queue_enabled:
+        try:
+            await enqueue(kind, payload, dedupe_key=dedupe_key)
+            return
+        except Exception as e:
+            logger.warning(
+                "[WORK-QUEUE] Enqueue %s failed, running in-process: %s", kind.value, e
+            )
+    _spawn(fallback())
+
+
+def kick_drain() -> None:
+    """Start a best-effort drain on this instance without awaiting it.
+
+    Durability does not depend on this: if the instance goes away, the
+    pg_cron drain picks the job up.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No running loop (sync caller) - leave it to the cron drain
+        return
+    _spawn(drain())
+
+
+def _spawn(coro: Coroutine[Any, Any, Any]) -> None:
+    task = asyncio.get_running_loop().create_task(coro)
+    _background_drains.add(task)
+    task.add_done_callback(_background_drains.discard)
+
+
+async def drain(
+    *,
+    max_jobs: int | None = None,
+    time_budget_seconds: float = DRAIN_TIME_BUDGET_SECONDS,
+    batch_size: int = DRAIN_BATCH_SIZE,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+) -> dict[str, int]:
+    """Claim and run due jobs until the queue is empty or the budget is spent.
+
+    Each round claims up to `batch_size` jobs (committing the lease before
+    any handler starts) and runs them concurrently.
+
+    Returns:
+        Counts: claimed, completed, retried, dead, reaped.
+    """
+    session_maker = get_session_maker()
+    stats = {"claimed": 0, "completed": 0, "retried": 0, "dead": 0, "reaped": 0}
+    started = time.monotonic()
+
+    async with session_maker() as session:
+        stats["reaped"] = await WorkJobRepository(session).reap_exhausted()
+        await session.commit()
+
+    while time.monotonic() - started < time_budget_seconds:
+        limit = batch_size
+        if max_jobs is not None:
+            limit = min(limit, max_jobs - stats["claimed"])
+            if limit <= 0:
+                break
+
+        async with session_maker() as session:
+            jobs = await WorkJobRepository(session).claim_batch(
+                WORKER_ID, limit, lease_seconds
+            )
+            await session.commit()
+        if not jobs:
+            break
+        stats["claimed"] += len(jobs)
+
+        outcomes = await asyncio.gather(
+            *(_run_job(job, lease_seconds) for job in jobs)
+        )
+        for outcome in outcomes:
+            stats[outcome] += 1
+
+    return stats
+
+
+async def _run_job(job: WorkJob, lease_seconds: float) -> str:
+    """Run one claimed job and record its outcome in a fresh session.
+
+    Returns:
+        "completed", "retried", or "dead".
+    """
+    handler = _HANDLERS.get(job.kind)
+    error: str | None = None
+    if handler is None:
+        error = f"no handler registered for kind {job.kind!r}"
+    else:
+        try:
+            await asyncio.wait_for(
+                handler(dict(job.payload or {})),
+                timeout=max(lease_seconds - LEASE_MARGIN_SECONDS, 1.0),
+            )
+        except TimeoutError:
+            error = "handler timed out before lease expiry"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+    async with get_session_maker()() as session:
+        repo = WorkJobRepository(session)
+        if error is None:
+            await repo.complete(job.id)
+            outcome = "completed"
+        else:
+            status = await repo.fail(
+                job.id, error, retry_delay_seconds(job.attempts)
+            )
+            outcome = "dead" if status == WorkJobStatus.DEAD.value else "retried"
+            log = logger.error if outcome == "dead" else logger.warning
+            log(
+                "[WORK-QUEUE] Job %s (%s) attempt %d failed (%s): %s",
+                job.id,
+                job.kind,
+                job.attempts,
+                outcome,
+                error,
+            )
+        await session.commit()
+    return outcome
+
+
+# ---------------------------------------------------------------------------
+# Handlers
+# ---------------------------------------------------------------------------
+
+
+@register_handler(WorkJobKind.PIPELINE_RUN)
+async def _handle_pipeline_run(payload: dict[str, Any]) -> None:
+    """Run the unified pipeline for a stored conversation (voice post-call).
+
+    The whole run is one transaction (stages write through the shared
+    session under savepoints), so a failed run is rolled back before the
+    job fails: the retry starts from nothing instead of duplicating what
+    the stages ahead of the failure wrote.
+    """
+    from nikita.db.repositories.conversation_repository import ConversationRepository
+    from nikita.db.repositories.user_repository import UserRepository
+    from nikita.pipeline.orchestrator import PipelineOrchestrator
+
+    conversation_id = UUID(payload["conversation_id"])
+    user_id = UUID(payload["user_id"])
+
+    async with get_session_maker()() as session:
+        conversation = await ConversationRepository(session).get(conversation_id)
+        if conversation is None:
+            # Nothing to retry: the conversation row is gone
+            logger.warning("[WORK-QUEUE] Conversation %s not found", conversation_id)
+            return
+        user = await UserRepository(session).get(user_id)
+
+        result = await PipelineOrchestrator(session).process(
+            conversation_id=conversation_id,
+            user_id=user_id,
+            platform=payload.get("platform", "text"),
+            conversation=conversation,
+            user=user,
+        )
+        if not result.success and not result.skipped:
+            await session.rollback()
+            raise RuntimeError(
+                f"pipeline failed at {result.error_stage}: {result.error_message}"
+            )
+        await session.commit()
+
+
+@register_handler(WorkJobKind.ONBOARDING_SOCIAL_CIRCLE)
+async def _handle_social_circle(payload: dict[str, Any]) -> None:
+    """Generate and store the onboarding social circle (Spec 035)."""
+    from nikita.onboarding.handoff import generate_and_store_social_circle
+
+    stored = await generate_and_store_social_circle(
+        user_id=UUID(payload["user_id"]),
+        location=payload.get("location"),
+        hobbies=payload.get("hobbies"),
+        job_field=payload.get("job_field"),
+        meeting_context=payload.get("meeting_context"),
+    )
+    if not stored:
+        raise RuntimeError("social circle generation failed")
+
+
+@register_handler(WorkJobKind.ONBOARDING_BOOTSTRAP_PIPELINE)
+async def _handle_bootstrap_pipeline(payload: dict[str, Any]) -> None:
+    """Run the post-onboarding pipeline bootstrap (Spec 043 T2.2)."""
+    from nikita.onboarding.handoff import HandoffManager
+
+    conversation_id = payload.get("conversation_id")
+    await HandoffManager().bootstrap_pipeline(
+        UUID(payload["user_id"]),
+        conversation_id=UUID(conversation_id) if conversation_id else None,
+        raise_on_failure=True,
+    )
@@ -0,0 +1,109 @@
+"""Backfill memory_facts.embedding_compact from the full embeddings.
+
+Run after supabase/migrations/20261017170000_memory_facts_compact_embedding.sql
+is applied and MEMORY_EMBEDDING_STORAGE=dual is deployed (so facts written
+while the backfill runs already get both columns), and before switching to
+MEMORY_EMBEDDING_STORAGE=compact (which also needs
+MEMORY_COMPACT_DEDUP_SIMILARITY_THRESHOLD from
+scripts/calibrate_dedup_threshold.py --record).
+
+Each batch is one UPDATE in its own transaction
+(``MemoryFactRepository.backfill_compact_embeddings``): the compact vector
+is computed in Postgres from the stored embedding, so the script makes no
+embedding API calls. Short transactions keep row locks and WAL bursts
+small; ``--sleep`` spaces batches out on a busy instance.
+
+Idempotent: only rows with a NULL embedding_compact are touched, so a
+re-run (or a concurrent run) continues where the last one stopped.
+
+Usage
+-----
+
+    uv run python scripts/backfill_compact_embeddings.py [--batch-size 500] [--sleep 0.2] [--max-batches N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from nikita.db.database import get_session_maker
+from nikita.db.repositories.memory_fact_repository import MemoryFactRepository
+
+logger = logging.getLogger("backfill_compact_embeddings")
+
+
+async def run(
+    batch_size: int = 500,
+    sleep: float = 0.0,
+    max_batches: int | None = None,
+) -> dict:
+    """Backfill until no row is missing a compact embedding.
+
+    Returns a summary dict suitable for logging / scripting.
+    """
+    session_maker = get_session_maker()
+    summary = {"batches": 0, "updated": 0, "seconds": 0.0}
+    start = time.monotonic()
+
+    while max_batches is None or summary["batches"] < max_batches:
+        async with session_maker() as session:
+            updated = await MemoryFactRepository(session).backfill_compact_embeddings(
+                batch_size=batch_size
+            )
+            await session.commit()
+        if not updated:
+            break
+        summary["batches"] += 1
+        summary["updated"] += updated
+        logger.info(
+            "batch=%d updated=%d total=%d",
+            summary["batches"],
+            updated,
+            summary["updated"],
+        )
+        if sleep:
+            await asyncio.sleep(sleep)
+
+    summary["seconds"] = round(time.monotonic() - start, 1)
+    logger.info(
+        "backfill complete batches=%d updated=%d seconds=%.1f",
+        summary["batches"],
+        summary["updated"],
+        summary["seconds"],
+    )
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Fill memory_facts.embedding_compact in batches."
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per UPDATE.")
+    parser.add_argument(
+        "--sleep", type=float, default=0.0, help="Seconds to wait between batches."
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="Stop after this many batches (default: run to completion).",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
+
+    asyncio.run(
+        run(batch_size=args.batch_size, sleep=args.sleep, max_batches=args.max_batches)
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Move conversations.messages JSONB arrays into conversation_messages.
+
+Run after supabase/migrations/20261017200000_create_conversation_messages.sql
+is applied and the code that appends to conversation_messages is deployed.
+Conversation.messages reads the JSONB array followed by the rows, so
+conversations read the same before, during and after the backfill; moving
+the arrays just stops long conversations from carrying a large JSONB
+document (and lets later reads fetch a window of rows).
+
+Each batch is one statement in its own transaction
+(``ConversationRepository.backfill_message_rows``): the messages of up to
+``--batch-size`` conversations are inserted as rows at their array
+positions and the arrays emptied. Short transactions keep row locks and
+WAL bursts small; ``--sleep`` spaces batches out on a busy instance.
+
+Idempotent: only conversations with a non-empty array are touched, so a
+re-run (or a concurrent run) continues where the last one stopped.
+
+Usage
+-----
+
+    uv run python scripts/backfill_conversation_messages.py [--batch-size 200] [--sleep 0.2] [--max-batches N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from nikita.db.database import get_session_maker
+from nikita.db.repositories.conversation_repository import ConversationRepository
+
+logger = logging.getLogger("backfill_conversation_messages")
+
+
+async def run(
+    batch_size: int = 200,
+    sleep: float = 0.0,
+    max_batches: int | None = None,
+) -> dict:
+    """Backfill until no conversation has JSONB messages left.
+
+    Returns a summary dict suitable for logging / scripting.
+    """
+    session_maker = get_session_maker()
+    summary = {"batches": 0, "conversations": 0, "seconds": 0.0}
+    start = time.monotonic()
+
+    while max_batches is None or summary["batches"] < max_batches:
+        async with session_maker() as session:
+            moved = await ConversationRepository(session).backfill_message_rows(
+                batch_size=batch_size
+            )
+            await session.commit()
+        if not moved:
+            break
+        summary["batches"] += 1
+        summary["conversations"] += moved
+        logger.info(
+            "batch=%d conversations=%d total=%d",
+            summary["batches"],
+            moved,
+            summary["conversations"],
+        )
+        if sleep:
+            await asyncio.sleep(sleep)
+
+    summary["seconds"] = round(time.monotonic() - start, 1)
+    logger.info(
+        "backfill complete batches=%d conversations=%d seconds=%.1f",
+        summary["batches"],
+        summary["conversations"],
+        summary["seconds"],
+    )
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Move conversations.messages arrays into conversation_messages in batches."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=200, help="Conversations per statement."
+    )
+    parser.add_argument(
+        "--sleep", type=float, default=0.0, help="Seconds to wait between batches."
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="Stop after this many batches (default: run to completion).",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
+
+    asyncio.run(
+        run(batch_size=args.batch_size, sleep=args.sleep, max_batches=args.max_batches)
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
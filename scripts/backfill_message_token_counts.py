@@ -0,0 +1,115 @@
+"""Fill conversation_messages.token_count for rows written without one.
+
+Run after supabase/migrations/20261017220000_conversation_messages_token_count.sql
+is applied and the code that counts tokens in append_message is deployed.
+Rows appended before that, and rows moved from the legacy JSONB arrays by
+scripts/backfill_conversation_messages.py, have a NULL count; the history
+loader estimates those on every turn until this fills them in.
+
+Token counting is tiktoken (the same count_tokens the write path uses), so
+it runs here rather than in SQL: each batch reads up to ``--batch-size``
+rows with a NULL count (ConversationRepository
+.get_messages_missing_token_count), counts them and writes the counts back
+in one executemany UPDATE, in its own transaction. ``--sleep`` spaces
+batches out on a busy instance.
+
+Idempotent: only NULL rows are read, so a re-run continues where the last
+one stopped. Run one instance at a time (concurrent runs would count the
+same rows twice, harmlessly).
+
+Usage
+-----
+
+    uv run python scripts/backfill_message_token_counts.py [--batch-size 1000] [--sleep 0.2] [--max-batches N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from nikita.context.utils.token_counter import count_tokens
+from nikita.db.database import get_session_maker
+from nikita.db.repositories.conversation_repository import ConversationRepository
+
+logger = logging.getLogger("backfill_message_token_counts")
+
+
+async def run(
+    batch_size: int = 1000,
+    sleep: float = 0.0,
+    max_batches: int | None = None,
+) -> dict:
+    """Backfill until no message row lacks a token count.
+
+    Returns a summary dict suitable for logging / scripting.
+    """
+    session_maker = get_session_maker()
+    summary = {"batches": 0, "messages": 0, "seconds": 0.0}
+    start = time.monotonic()
+
+    while max_batches is None or summary["batches"] < max_batches:
+        async with session_maker() as session:
+            repo = ConversationRepository(session)
+            rows = await repo.get_messages_missing_token_count(limit=batch_size)
+            counted = await repo.set_message_token_counts(
+                [(conversation_id, seq, count_tokens(content)) for conversation_id, seq, content in rows]
+            )
+            await session.commit()
+        if not counted:
+            break
+        summary["batches"] += 1
+        summary["messages"] += counted
+        logger.info(
+            "batch=%d messages=%d total=%d",
+            summary["batches"],
+            counted,
+            summary["messages"],
+        )
+        if sleep:
+            await asyncio.sleep(sleep)
+
+    summary["seconds"] = round(time.monotonic() - start, 1)
+    logger.info(
+        "backfill complete batches=%d messages=%d seconds=%.1f",
+        summary["batches"],
+        summary["messages"],
+        summary["seconds"],
+    )
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Fill conversation_messages.token_count in batches."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Message rows per batch."
+    )
+    parser.add_argument(
+        "--sleep", type=float, default=0.0, help="Seconds to wait between batches."
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="Stop after this many batches (default: run to completion).",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
+
+    asyncio.run(
+        run(batch_size=args.batch_size, sleep=args.sleep, max_batches=args.max_batches)
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
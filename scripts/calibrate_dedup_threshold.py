@@ -0,0 +1,199 @@
+"""Calibrate the memory dedup thresholds against labeled fact pairs.
+
+SupabaseMemory supersedes an existing fact when a new one is at least
+``threshold`` cosine-similar to it. The right threshold depends on the
+embedding the similarity is computed on: full vector(1536) embeddings
+(memory_dedup_similarity_threshold) and the 512-dim compact embeddings
+(memory_compact_dedup_similarity_threshold) spread similarities
+differently.
+
+The labeled pairs are in tests/fixtures/memory_dedup_pairs.yaml. With
+``--record`` every text is embedded once with the production model and the
+per-pair similarities for both storage modes are written to
+tests/fixtures/memory_dedup_similarities.json. The compact similarity goes
+through compact_embedding() and float16 rounding, like halfvec storage.
+Without ``--record`` the recorded similarities are used.
+
+For each mode the script prints precision / recall / F1 of "duplicate" at
+the configured threshold and the best-F1 threshold of a sweep. Update the
+setting (and its history comment) when they disagree. The compact threshold
+is unset until first calibrated, and compact storage is refused until then;
+tests/scripts/test_calibrate_dedup_threshold.py fails on a threshold that
+no longer separates the pairs.
+
+Usage
+-----
+
+    uv run python scripts/calibrate_dedup_threshold.py [--record]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+PAIRS_PATH = FIXTURES / "memory_dedup_pairs.yaml"
+SIMILARITIES_PATH = FIXTURES / "memory_dedup_similarities.json"
+
+MODES = ("full", "compact")
+
+
+@dataclass(frozen=True)
+class Metrics:
+    threshold: float
+    precision: float
+    recall: float
+    f1: float
+
+
+def load_pairs(path: Path = PAIRS_PATH) -> list[dict]:
+    """Labeled pairs: dicts with "a", "b" and "duplicate"."""
+    return yaml.safe_load(path.read_text(encoding="utf-8"))["pairs"]
+
+
+def pair_key(pair: dict) -> str:
+    return f"{pair['a']}\n{pair['b']}"
+
+
+def load_similarities(path: Path = SIMILARITIES_PATH) -> dict:
+    """Recorded similarities ({} when never recorded)."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def evaluate(similarities: list[float], labels: list[bool], threshold: float) -> Metrics:
+    """Precision / recall / F1 of predicting duplicate as similarity >= threshold."""
+    sims = np.asarray(similarities)
+    truth = np.asarray(labels, dtype=bool)
+    predicted = sims >= threshold
+    tp = int(np.sum(predicted & truth))
+    precision = tp / int(predicted.sum()) if predicted.any() else 1.0
+    recall = tp / int(truth.sum()) if truth.any() else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return Metrics(round(threshold, 3), precision, recall, f1)
+
+
+def best_threshold(similarities: list[float], labels: list[bool]) -> Metrics:
+    """Best-F1 threshold in 0.50-0.995 (0.005 steps); ties go to the higher one.
+
+    Preferring the higher threshold on ties keeps distinct facts apart,
+    which is the costlier mistake (a wrongly superseded fact is lost).
+    """
+    best: Metrics | None = None
+    for step in range(100, 200):
+        metrics = evaluate(similarities, labels, round(step * 0.005, 3))
+        if best is None or metrics.f1 >= best.f1:
+            best = metrics
+    return best
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    return float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+async def record(pairs: list[dict]) -> dict:
+    """Embed the fixture texts and measure per-pair similarities per mode."""
+    from nikita.config.settings import get_settings
+    from nikita.llm.clients import get_openai_client
+    from nikita.memory.supabase_memory import (
+        EMBEDDING_MODEL,
+        _embed_with_retry,
+        compact_embedding,
+    )
+
+    api_key = get_settings().openai_api_key
+    if not api_key:
+        raise SystemExit("OPENAI_API_KEY is required for --record")
+
+    texts = list(dict.fromkeys(t for p in pairs for t in (p["a"], p["b"])))
+    vectors = await _embed_with_retry(get_openai_client(api_key), texts)
+    full = {t: np.asarray(v, dtype=np.float32) for t, v in zip(texts, vectors, strict=True)}
+    # halfvec stores float16
+    compact = {
+        t: np.asarray(compact_embedding(v), dtype=np.float16).astype(np.float32)
+        for t, v in zip(texts, vectors, strict=True)
+    }
+
+    return {
+        "model": EMBEDDING_MODEL,
+        "recorded_at": datetime.now(UTC).date().isoformat(),
+        "pairs": {
+            pair_key(p): {
+                "full": round(_cosine(full[p["a"]], full[p["b"]]), 4),
+                "compact": round(_cosine(compact[p["a"]], compact[p["b"]]), 4),
+            }
+            for p in pairs
+        },
+    }
+
+
+def report(pairs: list[dict], recorded: dict) -> None:
+    from nikita.config.settings import get_settings
+
+    settings = get_settings()
+    configured = {
+        "full": settings.memory_dedup_similarity_threshold,
+        "compact": settings.memory_compact_dedup_similarity_threshold,
+    }
+    scored = [p for p in pairs if pair_key(p) in recorded.get("pairs", {})]
+    print(
+        f"{len(scored)}/{len(pairs)} pairs with recorded similarities "
+        f"({recorded.get('model')}, {recorded.get('recorded_at')})"
+    )
+    labels = [p["duplicate"] for p in scored]
+    for mode in MODES:
+        sims = [recorded["pairs"][pair_key(p)][mode] for p in scored]
+        best = best_threshold(sims, labels)
+        if configured[mode] is None:
+            current_text = "configured: not calibrated"
+        else:
+            current = evaluate(sims, labels, configured[mode])
+            current_text = (
+                f"configured {current.threshold:.3f}: "
+                f"P={current.precision:.2f} R={current.recall:.2f} F1={current.f1:.2f}"
+            )
+        print(
+            f"{mode:<8} {current_text} | "
+            f"best {best.threshold:.3f}: "
+            f"P={best.precision:.2f} R={best.recall:.2f} F1={best.f1:.2f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Calibrate memory dedup thresholds against labeled fact pairs."
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help=f"Embed the pairs and write {SIMILARITIES_PATH.name} first.",
+    )
+    args = parser.parse_args()
+
+    pairs = load_pairs()
+    if args.record:
+        recorded = asyncio.run(record(pairs))
+        SIMILARITIES_PATH.write_text(json.dumps(recorded, indent=2) + "\n", encoding="utf-8")
+        print(f"wrote {SIMILARITIES_PATH}")
+    else:
+        recorded = load_similarities()
+        if not recorded:
+            print(f"{SIMILARITIES_PATH} not found; run with --record first")
+            return 1
+
+    report(pairs, recorded)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
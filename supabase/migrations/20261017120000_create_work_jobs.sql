@@ -0,0 +1,91 @@
+-- Durable work queue (work_jobs) replacing fire-and-forget asyncio.create_task.
+--
+-- Voice post-call pipelines (30-60s) and onboarding background work
+-- (social circle generation, pipeline bootstrap) used to run as in-memory
+-- tasks on the request instance and were lost when Cloud Run scaled to zero
+-- or recycled the instance. They are now persisted here and claimed by
+-- workers with SELECT ... FOR UPDATE SKIP LOCKED under a time-bounded lease.
+--
+-- Lifecycle: pending -> running -> completed | pending (retry w/ backoff) | dead.
+-- A running row whose locked_until has passed is claimable again, so a job
+-- abandoned by a dead instance is picked up by the next drain.
+--
+-- Drain: POST /api/v1/tasks/drain-work-queue every minute (Step 2). The
+-- enqueueing instance also drains in-process right after commit, so the cron
+-- tick is the durability backstop, not the latency path.
+--
+-- RLS: admin / service_role only (backend uses the service role).
+
+-- ---------------------------------------------------------------------------
+-- Step 1: Table + indexes
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS work_jobs (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  kind VARCHAR(50) NOT NULL,
+  payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+  status VARCHAR(20) NOT NULL DEFAULT 'pending',
+  attempts INT NOT NULL DEFAULT 0,
+  max_attempts INT NOT NULL DEFAULT 5,
+  run_after TIMESTAMPTZ NOT NULL DEFAULT now(),
+  locked_by VARCHAR(100),
+  locked_until TIMESTAMPTZ,
+  dedupe_key VARCHAR(200) UNIQUE,
+  last_error TEXT,
+  completed_at TIMESTAMPTZ,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CONSTRAINT work_jobs_status_check
+    CHECK (status IN ('pending', 'running', 'completed', 'dead'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_work_jobs_claimable
+  ON work_jobs (run_after)
+  WHERE status IN ('pending', 'running');
+
+ALTER TABLE work_jobs ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "admin_and_service_role_only" ON work_jobs;
+
+CREATE POLICY "admin_and_service_role_only"
+  ON work_jobs FOR ALL
+  TO authenticated, service_role
+  USING (is_admin() OR auth.role() = 'service_role')
+  WITH CHECK (is_admin() OR auth.role() = 'service_role');
+
+-- ---------------------------------------------------------------------------
+-- Step 2: pg_cron drain (bearer read from Vault, see 20260505173604)
+-- ---------------------------------------------------------------------------
+DO $$
+BEGIN
+  BEGIN
+    PERFORM cron.unschedule('nikita-drain-work-queue');
+  EXCEPTION WHEN OTHERS THEN NULL;
+  END;
+
+  PERFORM cron.schedule(
+    'nikita-drain-work-queue',
+    '* * * * *',
+    $S$
+    SELECT net.http_post(
+        url := 'https://nikita-api-1040094048579.us-central1.run.app/api/v1/tasks/drain-work-queue',
+        body := '{}'::jsonb,
+        headers := jsonb_build_object(
+          'Authorization', 'Bearer ' || (SELECT decrypted_secret FROM vault.decrypted_secrets WHERE name = 'task_auth_secret'),
+          'Content-Type', 'application/json'
+        )
+    );
+    $S$
+  );
+END $$;
+
+-- ---------------------------------------------------------------------------
+-- Step 3: Retention — completed/dead rows older than 7 days
+-- ---------------------------------------------------------------------------
+DELETE FROM cron.job WHERE jobname = 'work_jobs_prune';
+SELECT cron.schedule(
+  'work_jobs_prune',
+  '30 4 * * *',
+  $$DELETE FROM work_jobs
+      WHERE status IN ('completed', 'dead')
+        AND updated_at < now() - interval '7 days';$$
+);
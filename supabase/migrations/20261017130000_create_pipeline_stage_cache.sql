@@ -0,0 +1,45 @@
+-- Pipeline stage output cache (pipeline_stage_cache).
+--
+-- Retried pipelines (mark_failed -> detect_stale_sessions) and admin
+-- trigger-pipeline re-runs used to execute every stage from scratch,
+-- including the critical LLM extraction. Pure stages now persist their
+-- PipelineContext writes here on success; a later run over unchanged
+-- conversation content (same input_hash) and the same stage_version
+-- replays them instead of calling the LLM.
+--
+-- One row per (conversation_id, stage_name); upserts replace stale rows.
+-- Rows go away with their conversation (ON DELETE CASCADE) and are pruned
+-- after 14 days, well past the retry window.
+--
+-- RLS: admin / service_role only (backend uses the service role).
+
+CREATE TABLE IF NOT EXISTS pipeline_stage_cache (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  conversation_id UUID NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+  stage_name VARCHAR(50) NOT NULL,
+  stage_version INT NOT NULL,
+  input_hash VARCHAR(64) NOT NULL,
+  output JSONB NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CONSTRAINT uq_pipeline_stage_cache_conversation_stage
+    UNIQUE (conversation_id, stage_name)
+);
+
+ALTER TABLE pipeline_stage_cache ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "admin_and_service_role_only" ON pipeline_stage_cache;
+
+CREATE POLICY "admin_and_service_role_only"
+  ON pipeline_stage_cache FOR ALL
+  TO authenticated, service_role
+  USING (is_admin() OR auth.role() = 'service_role')
+  WITH CHECK (is_admin() OR auth.role() = 'service_role');
+
+DELETE FROM cron.job WHERE jobname = 'pipeline_stage_cache_prune';
+SELECT cron.schedule(
+  'pipeline_stage_cache_prune',
+  '45 4 * * *',
+  $$DELETE FROM pipeline_stage_cache
+      WHERE updated_at < now() - interval '14 days';$$
+);
@@ -0,0 +1,44 @@
+-- Pipeline latency histograms (pipeline_latency_histograms).
+--
+-- Each API instance keeps fixed log-bucket histograms per (stage, component)
+-- in memory and flushes one row per key about once a minute. component is
+-- 'total' for stage wall time or a profiler component (db, llm, embedding,
+-- render, other). /admin/pipeline/timings and /admin/pipeline/profile merge
+-- rows by adding bucket counts instead of sorting raw job_executions samples.
+--
+-- Retention: 30 days.
+-- RLS: admin / service_role only (backend uses the service role).
+
+CREATE TABLE IF NOT EXISTS pipeline_latency_histograms (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  window_start TIMESTAMPTZ NOT NULL,
+  window_end TIMESTAMPTZ NOT NULL,
+  stage VARCHAR(50) NOT NULL,
+  component VARCHAR(20) NOT NULL,
+  sample_count INT NOT NULL,
+  sum_ms DOUBLE PRECISION NOT NULL,
+  max_ms DOUBLE PRECISION NOT NULL,
+  buckets JSONB NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_latency_histograms_window_end
+  ON pipeline_latency_histograms (window_end);
+
+ALTER TABLE pipeline_latency_histograms ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "admin_and_service_role_only" ON pipeline_latency_histograms;
+
+CREATE POLICY "admin_and_service_role_only"
+  ON pipeline_latency_histograms FOR ALL
+  TO authenticated, service_role
+  USING (is_admin() OR auth.role() = 'service_role')
+  WITH CHECK (is_admin() OR auth.role() = 'service_role');
+
+DELETE FROM cron.job WHERE jobname = 'pipeline_latency_histograms_prune';
+SELECT cron.schedule(
+  'pipeline_latency_histograms_prune',
+  '0 5 * * *',
+  $$DELETE FROM pipeline_latency_histograms
+      WHERE window_end < now() - interval '30 days';$$
+);
@@ -0,0 +1,39 @@
+-- Persistent embedding cache (embedding_cache).
+--
+-- SupabaseMemory used to call the OpenAI embeddings API for every search,
+-- although many queries are constant strings (PromptBuilderStage's memory
+-- queries, the voice server tool's context query). Embeddings are now
+-- cached in process (LRU) and, behind that, here, keyed on the model and a
+-- SHA-256 of the whitespace-normalized text, so a cold instance gets the
+-- vector from one indexed lookup instead of an API round trip.
+--
+-- Rows are immutable (the same text always embeds to the same vector) and
+-- pruned after 30 days; a pruned text is simply embedded again.
+--
+-- RLS: admin / service_role only (backend uses the service role).
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+  model VARCHAR(64) NOT NULL,
+  text_hash VARCHAR(64) NOT NULL,
+  embedding vector(1536) NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (model, text_hash)
+);
+
+ALTER TABLE embedding_cache ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "admin_and_service_role_only" ON embedding_cache;
+
+CREATE POLICY "admin_and_service_role_only"
+  ON embedding_cache FOR ALL
+  TO authenticated, service_role
+  USING (is_admin() OR auth.role() = 'service_role')
+  WITH CHECK (is_admin() OR auth.role() = 'service_role');
+
+DELETE FROM cron.job WHERE jobname = 'embedding_cache_prune';
+SELECT cron.schedule(
+  'embedding_cache_prune',
+  '15 5 * * *',
+  $$DELETE FROM embedding_cache
+      WHERE created_at < now() - interval '30 days';$$
+);
@@ -0,0 +1,24 @@
+-- HNSW index for memory fact vector search (memory_facts).
+--
+-- SupabaseMemory searches order a user's active facts by cosine distance.
+-- The IVFFlat index from migration 0009 was built on an empty table
+-- (lists = 50 with no training data), so its recall is poor and the planner
+-- falls back to scanning the user's rows as fact counts grow. HNSW needs no
+-- training and keeps recall as rows are added.
+--
+-- The index is partial on is_active: superseded facts are never searched,
+-- and queries filter with the bare column (MemoryFactRepository) so the
+-- predicate matches. Query-time tuning (hnsw.ef_search, pgvector >= 0.8
+-- hnsw.iterative_scan) is set per connection from settings
+-- (memory_hnsw_ef_search, memory_hnsw_iterative_scan).
+--
+-- m / ef_construction are pgvector's defaults, written out for the record;
+-- scripts/benchmark_memory_ann.py measures recall vs latency for a build.
+
+DROP INDEX IF EXISTS idx_memory_facts_embedding_cosine;
+
+CREATE INDEX IF NOT EXISTS idx_memory_facts_embedding_hnsw
+  ON memory_facts
+  USING hnsw (embedding vector_cosine_ops)
+  WITH (m = 16, ef_construction = 64)
+  WHERE is_active;
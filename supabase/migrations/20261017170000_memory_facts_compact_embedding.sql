@@ -0,0 +1,28 @@
+-- Compact embedding column for memory facts (memory_facts.embedding_compact).
+--
+-- Full embeddings are vector(1536): ~6 KB per row plus an HNSW index of the
+-- same order, and index size / buffer-cache pressure now bound search
+-- latency. embedding_compact holds the first 512 dimensions of the same
+-- text-embedding-3 vector, renormalized (identical to requesting
+-- dimensions = 512 from the API), as halfvec: ~1 KB per row.
+--
+-- Rollout, driven by settings.memory_embedding_storage:
+--   1. dual     new facts are written with both columns
+--   2. backfill scripts/backfill_compact_embeddings.py fills existing rows
+--               in batches (computed in SQL, no API calls; pgvector >= 0.7)
+--   3. compact  searches and dedup use this column and its index, with
+--               memory_compact_dedup_similarity_threshold
+-- Once compact has been verified, idx_memory_facts_embedding_hnsw can be
+-- dropped to release its cache footprint; that is a separate migration.
+
+ALTER TABLE memory_facts
+  ADD COLUMN IF NOT EXISTS embedding_compact halfvec(512);
+
+-- Same shape as idx_memory_facts_embedding_hnsw: partial on is_active to
+-- match the repository's search predicate. NULL vectors are not indexed, so
+-- rows become searchable as the backfill reaches them.
+CREATE INDEX IF NOT EXISTS idx_memory_facts_embedding_compact_hnsw
+  ON memory_facts
+  USING hnsw (embedding_compact halfvec_cosine_ops)
+  WITH (m = 16, ef_construction = 64)
+  WHERE is_active;
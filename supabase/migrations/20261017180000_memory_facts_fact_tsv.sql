@@ -0,0 +1,24 @@
+-- Full-text search column for hybrid memory retrieval (memory_facts.fact_tsv).
+--
+-- recall_memory queries are often about specific names, places and dates,
+-- which lexical matching finds more reliably than embeddings, and without
+-- an embedding call. SupabaseMemory.search(hybrid=True) runs a lexical
+-- search on this column first and fuses it with the vector results
+-- (reciprocal-rank fusion), or skips the vector search when enough facts
+-- match every query term.
+--
+-- fact_tsv is a stored generated column, so every write path (ORM inserts,
+-- bulk inserts, backfills) keeps it current. Adding it rewrites the table
+-- once. The 'english' configuration must match FTS_CONFIG in
+-- nikita/db/repositories/memory_fact_repository.py.
+
+ALTER TABLE memory_facts
+  ADD COLUMN IF NOT EXISTS fact_tsv tsvector
+  GENERATED ALWAYS AS (to_tsvector('english', fact)) STORED;
+
+-- Partial on is_active like the vector indexes; searches filter with the
+-- bare column.
+CREATE INDEX IF NOT EXISTS idx_memory_facts_fact_tsv
+  ON memory_facts
+  USING gin (fact_tsv)
+  WHERE is_active;
@@ -0,0 +1,88 @@
+-- Memory fact compaction (memory_compaction_runs + nightly cron).
+--
+-- add_fact() only supersedes a new fact's single nearest neighbour, so
+-- users accumulate near-duplicate, superseded and stale low-confidence
+-- rows that every vector search has to skip. POST /api/v1/tasks/memory-compaction
+-- (nikita/memory/compaction.py), per user with new facts since their last
+-- run:
+--   - clusters active facts by embedding similarity (dedup threshold) and
+--     supersedes all but the newest fact of each cluster, which keeps the
+--     cluster's highest confidence;
+--   - deactivates old facts below memory_compaction_min_confidence;
+--   - hard-deletes facts superseded more than
+--     memory_compaction_superseded_retention_days ago;
+-- and records one memory_compaction_runs row.
+--
+-- Retention: 90 days.
+-- RLS: admin / service_role only (backend uses the service role).
+
+-- ---------------------------------------------------------------------------
+-- Step 1: Table + indexes
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS memory_compaction_runs (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  active_before INT NOT NULL,
+  active_after INT NOT NULL,
+  clusters_merged INT NOT NULL,
+  facts_merged INT NOT NULL,
+  low_confidence_retired INT NOT NULL,
+  superseded_deleted INT NOT NULL,
+  duration_ms INT NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_memory_compaction_runs_user_created
+  ON memory_compaction_runs (user_id, created_at);
+
+-- Long-superseded lookup for the hard delete
+CREATE INDEX IF NOT EXISTS idx_memory_facts_inactive_updated
+  ON memory_facts (user_id, updated_at)
+  WHERE NOT is_active;
+
+ALTER TABLE memory_compaction_runs ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "admin_and_service_role_only" ON memory_compaction_runs;
+
+CREATE POLICY "admin_and_service_role_only"
+  ON memory_compaction_runs FOR ALL
+  TO authenticated, service_role
+  USING (is_admin() OR auth.role() = 'service_role')
+  WITH CHECK (is_admin() OR auth.role() = 'service_role');
+
+-- ---------------------------------------------------------------------------
+-- Step 2: pg_cron trigger, nightly (bearer read from Vault, see 20260505173604)
+-- ---------------------------------------------------------------------------
+DO $$
+BEGIN
+  BEGIN
+    PERFORM cron.unschedule('nikita-memory-compaction');
+  EXCEPTION WHEN OTHERS THEN NULL;
+  END;
+
+  PERFORM cron.schedule(
+    'nikita-memory-compaction',
+    '45 3 * * *',
+    $S$
+    SELECT net.http_post(
+        url := 'https://nikita-api-1040094048579.us-central1.run.app/api/v1/tasks/memory-compaction',
+        body := '{}'::jsonb,
+        headers := jsonb_build_object(
+          'Authorization', 'Bearer ' || (SELECT decrypted_secret FROM vault.decrypted_secrets WHERE name = 'task_auth_secret'),
+          'Content-Type', 'application/json'
+        )
+    );
+    $S$
+  );
+END $$;
+
+-- ---------------------------------------------------------------------------
+-- Step 3: Retention — runs older than 90 days
+-- ---------------------------------------------------------------------------
+DELETE FROM cron.job WHERE jobname = 'memory_compaction_runs_prune';
+SELECT cron.schedule(
+  'memory_compaction_runs_prune',
+  '45 4 * * *',
+  $$DELETE FROM memory_compaction_runs
+      WHERE created_at < now() - interval '90 days';$$
+);
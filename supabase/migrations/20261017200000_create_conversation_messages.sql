@@ -0,0 +1,34 @@
+-- Append-only conversation messages (conversation_messages).
+--
+-- ConversationRepository.append_message used to append to the
+-- conversations.messages JSONB array, which rewrites the whole document
+-- (and its TOAST chunks) for every message: a 300-message thread writes
+-- O(n^2) bytes and multi-MB of WAL per session. Appended messages are now
+-- one row each here; Conversation.messages reads the legacy JSONB array
+-- followed by these rows (ORDER BY seq), so readers are unchanged.
+--
+-- seq is the message's 1-based position in the conversation, counting the
+-- legacy JSONB messages first. scripts/backfill_conversation_messages.py
+-- moves existing arrays into this table (seq 1..n) and empties them.
+--
+-- RLS: admin / service_role only (backend uses the service role).
+
+CREATE TABLE IF NOT EXISTS conversation_messages (
+  conversation_id UUID NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+  seq INT NOT NULL,
+  role TEXT NOT NULL,
+  content TEXT NOT NULL,
+  analysis JSONB,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (conversation_id, seq)
+);
+
+ALTER TABLE conversation_messages ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "admin_and_service_role_only" ON conversation_messages;
+
+CREATE POLICY "admin_and_service_role_only"
+  ON conversation_messages FOR ALL
+  TO authenticated, service_role
+  USING (is_admin() OR auth.role() = 'service_role')
+  WITH CHECK (is_admin() OR auth.role() = 'service_role');
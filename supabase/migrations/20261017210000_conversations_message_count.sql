@@ -0,0 +1,19 @@
+-- Cached message count on conversations (conversations.message_count).
+--
+-- The text agent only needs the last ~80 messages of a conversation, but
+-- the message handler loaded the whole conversation (legacy JSONB array
+-- plus every conversation_messages row) each turn to get them.
+-- ConversationRepository.get_recent_messages now fetches just the window,
+-- and message_count replaces len(messages) as the conversation's size.
+--
+-- message_count = length of the legacy JSONB array + conversation_messages
+-- rows, i.e. the seq of the last message. append_message increments it in
+-- the same UPDATE that bumps last_message_at and takes the new seq from it.
+
+ALTER TABLE conversations
+  ADD COLUMN IF NOT EXISTS message_count INT NOT NULL DEFAULT 0;
+
+UPDATE conversations c
+SET message_count = jsonb_array_length(c.messages) + (
+  SELECT count(*) FROM conversation_messages m WHERE m.conversation_id = c.id
+);
@@ -0,0 +1,16 @@
+-- Per-message token counts (conversation_messages.token_count).
+--
+-- The text agent's history budget estimated every message's tokens on
+-- every turn. The count is now computed once (tiktoken, cl100k_base) when
+-- the message is written and read back with it. Rows written before this
+-- migration, and rows moved from the legacy JSONB arrays, are NULL until
+-- scripts/backfill_message_token_counts.py fills them; readers estimate
+-- NULL rows as before.
+
+ALTER TABLE conversation_messages
+  ADD COLUMN IF NOT EXISTS token_count INT;
+
+-- Lets the backfill find the remaining rows without scanning the table
+CREATE INDEX IF NOT EXISTS idx_conversation_messages_token_count_null
+  ON conversation_messages (conversation_id, seq)
+  WHERE token_count IS NULL;
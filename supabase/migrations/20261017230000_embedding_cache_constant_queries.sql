@@ -0,0 +1,26 @@
+-- Limit embedding_cache to constant queries.
+--
+-- The persistent tier used to store a row for every embedded text,
+-- including ingested facts and per-message recall queries: user text that
+-- is rarely looked up again and already lives in memory_facts. Only the
+-- constant queries registered at startup (EmbeddingCache.warm_up) are
+-- stored now, so existing rows are dropped; the constants are re-embedded
+-- on the next warm-up.
+--
+-- Retention: the daily prune keeps the 30-day age limit and also caps the
+-- table at the 1000 most recently written rows.
+
+TRUNCATE embedding_cache;
+
+DELETE FROM cron.job WHERE jobname = 'embedding_cache_prune';
+SELECT cron.schedule(
+  'embedding_cache_prune',
+  '15 5 * * *',
+  $$DELETE FROM embedding_cache
+      WHERE created_at < now() - interval '30 days'
+         OR (model, text_hash) NOT IN (
+              SELECT model, text_hash FROM embedding_cache
+              ORDER BY created_at DESC
+              LIMIT 1000
+            );$$
+);
@@ -3,9 +3,13 @@
 Tests message history loading, conversion, token budgeting, and tool call pairing.
 """
 
-import pytest
+import random
+import time
+from unittest.mock import patch
 from uuid import uuid4
 
+import pytest
+
 from pydantic_ai.messages import (
     ModelMessage,
     ModelRequest,
@@ -384,3 +388,103 @@ class TestEdgeCases:
         assert result is not None
         # Should preserve the message even if over budget (minimum turns)
         assert len(result) == 1
+
+
+class TestTruncationPerformance:
+    """Single-pass budget truncation on production-sized histories (80 messages)."""
+
+    @staticmethod
+    def _history(count: int, seed: int = 0) -> list[ModelMessage]:
+        rng = random.Random(seed)
+        messages: list[ModelMessage] = []
+        for i in range(count):
+            content = "x" * rng.randint(0, 600)
+            if i % 2 == 0:
+                messages.append(ModelRequest(parts=[UserPromptPart(content=content)]))
+            else:
+                messages.append(ModelResponse(parts=[TextPart(content=content)]))
+        return messages
+
+    @staticmethod
+    def _truncate_by_reestimating(loader, messages, budget, min_turns=10):
+        """The previous algorithm: drop the oldest until the rest fits."""
+        if len(messages) <= min_turns:
+            return messages
+        current = messages.copy()
+        while len(current) > min_turns:
+            if loader._estimate_tokens(current) <= budget:
+                break
+            current = current[1:]
+        return current
+
+    @pytest.mark.parametrize("budget", [0, 100, 1500, 3000, 100_000])
+    def test_same_cut_as_reestimating(self, budget):
+        loader = HistoryLoader(conversation_id=uuid4())
+        for seed in range(20):
+            messages = self._history(80, seed)
+
+            expected = self._truncate_by_reestimating(loader, messages, budget)
+            assert loader._truncate_to_budget(messages, budget) == expected
+
+    def test_80_messages_under_1ms_without_tiktoken(self):
+        """Truncating an 80-message history is one cheap pass, no tiktoken."""
+        loader = HistoryLoader(conversation_id=uuid4())
+        messages = self._history(80)
+        estimator = get_token_estimator()
+
+        with patch.object(estimator, "estimate_accurate", wraps=estimator.estimate_accurate) as accurate:
+            runs = 200
+            start = time.perf_counter()
+            for _ in range(runs):
+                loader._truncate_to_budget(messages, DEFAULT_TOKEN_BUDGET)
+            elapsed_ms = (time.perf_counter() - start) * 1000 / runs
+
+        accurate.assert_not_called()
+        # ~0.05ms here; generous margin for slow CI
+        assert elapsed_ms < 1.0, f"truncation took {elapsed_ms:.3f}ms per call"
+
+    def test_load_skips_tiktoken_unless_debug_logging(self, caplog):
+        raw_messages = [
+            {"role": "user" if i % 2 == 0 else "nikita", "content": f"Message {i}"}
+            for i in range(80)
+        ]
+        loader = HistoryLoader(conversation_id=uuid4(), raw_messages=raw_messages)
+        estimator = get_token_estimator()
+
+        with patch.object(estimator, "estimate_accurate", return_value=1) as accurate:
+            caplog.set_level("INFO", logger="nikita.agents.text.history")
+            loader.load()
+            accurate.assert_not_called()
+
+            caplog.set_level("DEBUG", logger="nikita.agents.text.history")
+            loader.load()
+            assert accurate.call_count == 80
+
+    def test_stored_token_counts_replace_estimates(self):
+        """Messages with a stored token_count are not estimated again."""
+        raw_messages = [
+            {"role": "user" if i % 2 == 0 else "nikita", "content": "x" * 400, "token_count": 10}
+            for i in range(80)
+        ]
+        loader = HistoryLoader(conversation_id=uuid4(), raw_messages=raw_messages)
+        estimator = get_token_estimator()
+
+        with patch.object(estimator, "estimate_fast", wraps=estimator.estimate_fast) as fast:
+            # 80 x 10 stored tokens fit; 80 x ~100 estimated would not
+            result = loader.load(token_budget=800)
+
+        assert len(result) == 80
+        fast.assert_not_called()
+
+    def test_missing_token_counts_are_estimated(self):
+        raw_messages = [
+            {"role": "user", "content": "x" * 400, "token_count": 10},
+            {"role": "nikita", "content": "x" * 400},
+        ] * 10
+        loader = HistoryLoader(conversation_id=uuid4())
+        messages, counts = loader._convert_with_token_counts(raw_messages)
+
+        assert counts == [10, None] * 10
+        # 10 x 10 stored + 10 x 100 estimated
+        assert len(loader._truncate_to_budget(messages, 1100, token_counts=counts)) == 20
+        assert len(loader._truncate_to_budget(messages, 1099, token_counts=counts)) == 19
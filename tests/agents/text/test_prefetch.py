@@ -0,0 +1,134 @@
+"""Tests for the per-turn recall_memory prefetch (nikita/agents/text/prefetch.py)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from nikita.agents.text.prefetch import MemoryPrefetch, prefetched_results
+
+RESULTS = [{"fact": "User's sister is getting married in June", "graph_type": "user"}]
+
+
+def _prefetch(query: str, results=RESULTS, min_overlap: float = 0.5) -> MemoryPrefetch:
+    with patch("nikita.agents.text.prefetch._search", AsyncMock(return_value=results)):
+        return MemoryPrefetch.start(uuid4(), "sk-test", query, min_overlap=min_overlap)
+
+
+class TestCovers:
+    """Whether a recall query may reuse the prefetched search."""
+
+    @pytest.mark.asyncio
+    async def test_query_restating_the_message(self):
+        prefetch = _prefetch("My sister's wedding is next month, I'm so nervous")
+
+        assert prefetch.covers("sister wedding")
+        assert prefetch.covers("user's sister's wedding plans")
+
+    @pytest.mark.asyncio
+    async def test_unrelated_query(self):
+        prefetch = _prefetch("My sister's wedding is next month")
+
+        assert not prefetch.covers("user's job")
+        assert not prefetch.covers("what did we talk about last week")
+
+    @pytest.mark.asyncio
+    async def test_stopword_only_query_needs_exact_match(self):
+        prefetch = _prefetch("what about you?")
+
+        assert prefetch.covers("What about you?")
+        assert not prefetch.covers("about them")
+
+    @pytest.mark.asyncio
+    async def test_min_overlap(self):
+        prefetch = _prefetch("My sister's wedding", min_overlap=1.0)
+
+        assert prefetch.covers("sister wedding")
+        assert not prefetch.covers("sister wedding venue")
+
+
+class TestResults:
+    """Waiting for and discarding the prefetched search."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_running_search(self):
+        prefetch = _prefetch("sister wedding")
+
+        assert await prefetch.results() == RESULTS
+        # Awaiting twice returns the same results
+        assert await prefetch.results() == RESULTS
+
+    @pytest.mark.asyncio
+    async def test_failed_search_returns_none(self):
+        prefetch = _prefetch("sister wedding", results=None)
+
+        assert await prefetch.results() is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_search_is_not_used(self):
+        async def slow(*args):
+            await asyncio.sleep(10)
+
+        with patch("nikita.agents.text.prefetch._search", slow):
+            prefetch = MemoryPrefetch.start(uuid4(), "sk-test", "sister wedding", min_overlap=0.5)
+        prefetch.cancel()
+        await asyncio.sleep(0)
+
+        assert not prefetch.covers("sister wedding")
+        assert await prefetch.results() is None
+
+    @pytest.mark.asyncio
+    async def test_search_uses_own_session(self):
+        """The prefetch never touches the turn's SupabaseMemory session."""
+        memory = MagicMock()
+        memory.search = AsyncMock(return_value=RESULTS)
+        session_ctx = AsyncMock()
+        session_ctx.__aenter__.return_value = AsyncMock()
+
+        with (
+            patch("nikita.db.database.get_session_maker", return_value=MagicMock(return_value=session_ctx)),
+            patch("nikita.memory.supabase_memory.SupabaseMemory", return_value=memory),
+        ):
+            prefetch = MemoryPrefetch.start(uuid4(), "sk-test", "sister wedding", min_overlap=0.5)
+            assert await prefetch.results() == RESULTS
+
+        memory.search.assert_awaited_once_with("sister wedding", limit=5, hybrid=True)
+
+
+class TestRecallMemoryUsesPrefetch:
+    """recall_memory returns covered prefetches without searching."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_hit_skips_search(self):
+        from nikita.agents.text.tools import recall_memory
+
+        deps = MagicMock()
+        deps.memory.search_memory = AsyncMock(return_value=[])
+        deps.memory_prefetch = _prefetch("My sister's wedding is next month")
+        ctx = MagicMock(deps=deps)
+
+        result = await recall_memory(ctx, "sister wedding")
+
+        assert "married in June" in result
+        deps.memory.search_memory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_miss_searches(self):
+        from nikita.agents.text.tools import recall_memory
+
+        deps = MagicMock()
+        deps.memory.search_memory = AsyncMock(return_value=[])
+        deps.memory_prefetch = _prefetch("My sister's wedding is next month")
+        ctx = MagicMock(deps=deps)
+
+        await recall_memory(ctx, "user's job")
+
+        deps.memory.search_memory.assert_awaited_once_with("user's job", limit=5, hybrid=True)
+
+    @pytest.mark.asyncio
+    async def test_failed_prefetch_falls_back(self):
+        deps = MagicMock()
+        deps.memory_prefetch = _prefetch("sister wedding", results=None)
+
+        assert await prefetched_results(deps, "sister wedding") is None
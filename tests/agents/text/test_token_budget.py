@@ -294,3 +294,19 @@ class TestTokenEstimation:
 
         assert manager._estimate_tokens("") == 0
         assert manager._estimate_tokens(None) == 0
+
+    def test_stored_history_tokens_skip_counting(self):
+        """A stored history count is used as is; the text is not counted."""
+        from unittest.mock import patch
+
+        from nikita.agents.text.token_budget import TierContent, TokenBudgetManager
+
+        manager = TokenBudgetManager()
+        content = TierContent(history="x" * 4000, history_tokens=900)
+
+        with patch.object(manager, "_estimate_tokens", wraps=manager._estimate_tokens) as estimate:
+            result = manager.allocate(content)
+
+        assert result.history_tokens == 900
+        assert result.truncated_history == content.history
+        assert not any(call.args[0] == content.history for call in estimate.call_args_list)
@@ -3,7 +3,7 @@
 T2.2 Acceptance Criteria (recall_memory):
 - AC-2.2.1: Tool decorated with `@agent.tool(retries=2)`
 - AC-2.2.2: Tool accepts query: str parameter
-- AC-2.2.3: Tool calls `memory.search_memory(query, limit=5)`
+- AC-2.2.3: Tool calls `memory.search_memory(query, limit=5, hybrid=True)`
 - AC-2.2.4: Tool returns formatted string of results
 - AC-2.2.5: Tool handles empty results gracefully
 
@@ -68,7 +68,7 @@ class TestRecallMemoryTool:
 
     @pytest.mark.asyncio
     async def test_ac_2_2_3_calls_search_memory(self):
-        """AC-2.2.3: Tool calls memory.search_memory(query, limit=5)."""
+        """AC-2.2.3: Tool calls memory.search_memory(query, limit=5, hybrid=True)."""
         from nikita.agents.text.tools import recall_memory
 
         # Create mock context with memory
@@ -80,6 +80,7 @@ class TestRecallMemoryTool:
 
         mock_deps = MagicMock()
         mock_deps.memory = mock_memory
+        mock_deps.memory_prefetch = None
         mock_deps.user = mock_user
 
         mock_ctx = MagicMock()
@@ -89,7 +90,7 @@ class TestRecallMemoryTool:
         await recall_memory(mock_ctx, "test query")
 
         # Verify search_memory was called with correct args
-        mock_memory.search_memory.assert_called_once_with("test query", limit=5)
+        mock_memory.search_memory.assert_called_once_with("test query", limit=5, hybrid=True)
 
     @pytest.mark.asyncio
     async def test_ac_2_2_4_returns_formatted_results(self):
@@ -119,6 +120,7 @@ class TestRecallMemoryTool:
 
         mock_deps = MagicMock()
         mock_deps.memory = mock_memory
+        mock_deps.memory_prefetch = None
 
         mock_ctx = MagicMock()
         mock_ctx.deps = mock_deps
@@ -144,6 +146,7 @@ class TestRecallMemoryTool:
 
         mock_deps = MagicMock()
         mock_deps.memory = mock_memory
+        mock_deps.memory_prefetch = None
 
         mock_ctx = MagicMock()
         mock_ctx.deps = mock_deps
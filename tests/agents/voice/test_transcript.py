@@ -252,7 +252,7 @@ class TestTranscriptMemoryIntegration:
 
     @pytest.mark.asyncio
     async def test_batch_store_facts(self, sample_transcript):
-        """Store multiple facts in batch."""
+        """Store multiple facts with one memory client, session and bulk call."""
         from nikita.agents.voice.transcript import TranscriptManager
 
         user_id = uuid4()
@@ -266,11 +266,17 @@ class TestTranscriptMemoryIntegration:
         ]
 
         mock_memory = AsyncMock()
-        mock_memory.add_fact = AsyncMock()
-
-        with patch(
-            "nikita.memory.get_memory_client",
-            return_value=mock_memory,
+        mock_memory.add_facts_bulk = AsyncMock(
+            return_value={"stored": 3, "superseded": 0, "deduplicated": 0}
+        )
+        mock_session = AsyncMock()
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        session_maker.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch("nikita.memory.SupabaseMemory", return_value=mock_memory) as memory_cls,
+            patch("nikita.db.database.get_session_maker", return_value=session_maker),
         ):
             result = await manager.store_facts_batch(
                 user_id=user_id,
@@ -278,8 +284,59 @@ class TestTranscriptMemoryIntegration:
                 facts=facts,
             )
 
-            assert result["facts_stored"] == 3
-            assert mock_memory.add_fact.call_count == 3
+        assert result["facts_stored"] == 3
+        assert result["errors"] == 0
+        memory_cls.assert_called_once()
+        session_maker.assert_called_once()
+        mock_memory.add_facts_bulk.assert_awaited_once()
+        batch = mock_memory.add_facts_bulk.call_args.args[0]
+        assert [f["fact"] for f in batch] == [f["fact"] for f in facts]
+        assert batch[0]["metadata"] == {"category": "occupation", "session_id": session_id}
+        assert mock_memory.add_facts_bulk.call_args.kwargs["source"] == "voice_call"
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_store_facts_uses_manager_session(self):
+        """With a manager session, facts are written there and not committed."""
+        from nikita.agents.voice.transcript import TranscriptManager
+
+        session = AsyncMock()
+        manager = TranscriptManager(session=session)
+        mock_memory = AsyncMock()
+        mock_memory.add_facts_bulk = AsyncMock(
+            return_value={"stored": 1, "superseded": 0, "deduplicated": 1}
+        )
+
+        with patch("nikita.memory.SupabaseMemory", return_value=mock_memory) as memory_cls:
+            result = await manager.store_facts_batch(
+                user_id=uuid4(),
+                session_id="voice_session",
+                facts=[{"fact": "Has a dog"}, {"fact": "Owns a dog"}, {"fact": ""}],
+            )
+
+        assert memory_cls.call_args.kwargs["session"] is session
+        assert len(mock_memory.add_facts_bulk.call_args.args[0]) == 2
+        assert result["facts_stored"] == 1
+        assert result["deduplicated"] == 1
+        session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_store_facts_failure_counts_errors(self):
+        from nikita.agents.voice.transcript import TranscriptManager
+
+        manager = TranscriptManager(session=AsyncMock())
+        mock_memory = AsyncMock()
+        mock_memory.add_facts_bulk = AsyncMock(side_effect=RuntimeError("embedding down"))
+
+        with patch("nikita.memory.SupabaseMemory", return_value=mock_memory):
+            result = await manager.store_facts_batch(
+                user_id=uuid4(),
+                session_id="voice_session",
+                facts=[{"fact": "Works at Google"}, {"fact": "Enjoys hiking"}],
+            )
+
+        assert result["facts_stored"] == 0
+        assert result["errors"] == 2
 
 
 class TestTranscriptSummary:
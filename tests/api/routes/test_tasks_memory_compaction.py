@@ -0,0 +1,119 @@
+"""Tests for /tasks/memory-compaction endpoint."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from nikita.api.routes.tasks import router
+
+
+@pytest.fixture
+def app():
+    """Create test FastAPI app with tasks router."""
+    app = FastAPI()
+    app.include_router(router, prefix="/tasks")
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    """Create async HTTP client."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+def _settings(enabled: bool) -> MagicMock:
+    mock_settings = MagicMock()
+    mock_settings.memory_compaction_enabled = enabled
+    mock_settings.task_auth_secret = None
+    mock_settings.telegram_webhook_secret = None
+    return mock_settings
+
+
+def _session_maker() -> MagicMock:
+    mock_session_ctx = AsyncMock()
+    mock_session_ctx.__aenter__ = AsyncMock(return_value=AsyncMock())
+    mock_session_ctx.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=mock_session_ctx)
+
+
+class TestMemoryCompactionEndpoint:
+    """Test /tasks/memory-compaction endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_flag_off_returns_skip(self, client):
+        with patch("nikita.api.routes.tasks.get_settings", return_value=_settings(False)):
+            response = await client.post("/tasks/memory-compaction")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "skipped",
+            "reason": "memory_compaction_enabled=false",
+        }
+
+    @pytest.mark.asyncio
+    async def test_recent_execution_skips(self, client):
+        mock_job_repo = AsyncMock()
+        mock_job_repo.has_recent_execution.return_value = True
+
+        with (
+            patch("nikita.api.routes.tasks.get_settings", return_value=_settings(True)),
+            patch("nikita.api.routes.tasks.get_session_maker", return_value=_session_maker()),
+            patch("nikita.api.routes.tasks.JobExecutionRepository", return_value=mock_job_repo),
+        ):
+            response = await client.post("/tasks/memory-compaction")
+
+        assert response.json()["reason"] == "already_executed_recently"
+        mock_job_repo.start_execution.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_runs_compaction(self, client):
+        mock_job_repo = AsyncMock()
+        mock_job_repo.has_recent_execution.return_value = False
+        mock_job_repo.start_execution.return_value = MagicMock(id="test-id")
+        totals = {
+            "users": 3,
+            "failed": 0,
+            "facts_merged": 12,
+            "low_confidence_retired": 4,
+            "superseded_deleted": 30,
+        }
+
+        with (
+            patch("nikita.api.routes.tasks.get_settings", return_value=_settings(True)),
+            patch("nikita.api.routes.tasks.get_session_maker", return_value=_session_maker()),
+            patch("nikita.api.routes.tasks.JobExecutionRepository", return_value=mock_job_repo),
+            patch(
+                "nikita.memory.compaction.run_memory_compaction",
+                AsyncMock(return_value=totals),
+            ),
+        ):
+            response = await client.post("/tasks/memory-compaction")
+
+        assert response.json() == {"status": "ok", **totals}
+        mock_job_repo.complete_execution.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_marks_execution_failed(self, client):
+        mock_job_repo = AsyncMock()
+        mock_job_repo.has_recent_execution.return_value = False
+        mock_job_repo.start_execution.return_value = MagicMock(id="test-id")
+
+        with (
+            patch("nikita.api.routes.tasks.get_settings", return_value=_settings(True)),
+            patch("nikita.api.routes.tasks.get_session_maker", return_value=_session_maker()),
+            patch("nikita.api.routes.tasks.JobExecutionRepository", return_value=mock_job_repo),
+            patch(
+                "nikita.memory.compaction.run_memory_compaction",
+                AsyncMock(side_effect=RuntimeError("db down")),
+            ),
+        ):
+            response = await client.post("/tasks/memory-compaction")
+
+        assert response.json() == {"status": "error", "error": "db down"}
+        mock_job_repo.fail_execution.assert_awaited_once()
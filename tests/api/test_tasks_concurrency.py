@@ -67,3 +67,117 @@ class TestBatchLimiter:
         assert result["deferred"] == 15
         assert result["detected"] == 25
         assert result["processed"] == 10
+
+
+class TestPipelineWorkerPool:
+    """Bounded-concurrency pool behind /tasks/process-conversations."""
+
+    def test_worker_concurrency_within_db_pool(self):
+        from nikita.api.routes.tasks import (
+            PIPELINE_PEAK_CONNECTIONS,
+            PIPELINE_WORKER_CONCURRENCY,
+        )
+        from nikita.db.database import DB_MAX_OVERFLOW, DB_POOL_SIZE
+
+        # Workers at their peak plus the calling job's session leave at
+        # least half of max_overflow free
+        peak = PIPELINE_WORKER_CONCURRENCY * PIPELINE_PEAK_CONNECTIONS + 1
+        assert PIPELINE_WORKER_CONCURRENCY > 0
+        assert peak <= DB_POOL_SIZE + DB_MAX_OVERFLOW // 2
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_up_to_limit(self):
+        import asyncio
+
+        from nikita.api.routes import tasks
+
+        running = 0
+        peak = 0
+
+        async def fake_pipeline(conv_id, session_maker):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return MagicMock(success=True)
+
+        ids = [uuid4() for _ in range(12)]
+        with patch.object(tasks, "_process_conversation_pipeline", fake_pipeline):
+            results, timed_out, deferred = await tasks._run_pipeline_pool(ids, MagicMock())
+
+        assert len(results) == 12  # tail drained inside the budget
+        assert deferred == 0
+        assert timed_out == 0
+        assert peak == tasks.PIPELINE_WORKER_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_tail_deferred_when_budget_spent(self):
+        from nikita.api.routes import tasks
+
+        async def fake_pipeline(conv_id, session_maker):
+            return MagicMock(success=True)
+
+        ids = [uuid4() for _ in range(25)]
+        with (
+            patch.object(tasks, "_process_conversation_pipeline", fake_pipeline),
+            patch.object(tasks, "PIPELINE_DRAIN_BUDGET_SECONDS", 0.0),
+        ):
+            results, _, deferred = await tasks._run_pipeline_pool(ids, MagicMock())
+
+        assert len(results) == MAX_CONCURRENT_PIPELINES
+        assert deferred == 25 - MAX_CONCURRENT_PIPELINES
+
+    @pytest.mark.asyncio
+    async def test_timeout_isolated_per_conversation(self):
+        import asyncio
+
+        from nikita.api.routes import tasks
+
+        slow_id = uuid4()
+
+        async def fake_pipeline(conv_id, session_maker):
+            if conv_id == slow_id:
+                await asyncio.sleep(1)
+            return MagicMock(success=True)
+
+        ids = [slow_id, uuid4(), uuid4()]
+        with (
+            patch.object(tasks, "_process_conversation_pipeline", fake_pipeline),
+            patch.object(tasks, "PIPELINE_TIMEOUT_SECONDS", 0.05),
+        ):
+            results, timed_out, _ = await tasks._run_pipeline_pool(ids, MagicMock())
+
+        assert timed_out == 1
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_timed_out_conversation_marked_failed(self):
+        import asyncio
+
+        from nikita.api.routes import tasks
+
+        session = AsyncMock()
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__ = AsyncMock(return_value=session)
+        session_maker.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        async def slow_get(_id):
+            await asyncio.sleep(1)
+
+        conv_repo = MagicMock()
+        conv_repo.get = slow_get
+        conv_repo.mark_failed = AsyncMock()
+
+        with (
+            patch(
+                "nikita.db.repositories.conversation_repository.ConversationRepository",
+                return_value=conv_repo,
+            ),
+            patch.object(tasks, "PIPELINE_TIMEOUT_SECONDS", 0.05),
+        ):
+            results, timed_out, _ = await tasks._run_pipeline_pool([uuid4()], session_maker)
+
+        assert results == []
+        assert timed_out == 1
+        conv_repo.mark_failed.assert_awaited_once()
@@ -142,3 +142,24 @@ class TestPortalUrlCanonical:
         get_settings.cache_clear()
         settings = get_settings()
         assert settings.portal_url == "https://staging.nikita-mygirl.com"
+
+
+class TestCompactEmbeddingStorage:
+    """Compact storage needs a calibrated compact dedup threshold."""
+
+    def test_compact_refused_without_calibrated_threshold(self, monkeypatch):
+        monkeypatch.setenv("MEMORY_EMBEDDING_STORAGE", "compact")
+        monkeypatch.delenv("MEMORY_COMPACT_DEDUP_SIMILARITY_THRESHOLD", raising=False)
+        with pytest.raises(ValueError, match="calibrated"):
+            Settings()
+
+    def test_compact_allowed_with_threshold(self, monkeypatch):
+        monkeypatch.setenv("MEMORY_EMBEDDING_STORAGE", "compact")
+        monkeypatch.setenv("MEMORY_COMPACT_DEDUP_SIMILARITY_THRESHOLD", "0.84")
+        settings = Settings()
+        assert settings.memory_compact_dedup_similarity_threshold == 0.84
+
+    def test_dual_needs_no_compact_threshold(self, monkeypatch):
+        monkeypatch.setenv("MEMORY_EMBEDDING_STORAGE", "dual")
+        monkeypatch.delenv("MEMORY_COMPACT_DEDUP_SIMILARITY_THRESHOLD", raising=False)
+        assert Settings().memory_compact_dedup_similarity_threshold is None
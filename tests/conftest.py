@@ -29,6 +29,9 @@ def clear_singleton_caches():
     - get_session_maker() - SQLAlchemy async session factory
     - get_settings() - Pydantic settings singleton
     - _shared_cache - Rate limiter InMemoryCache with asyncio.Lock()
+    - section_cache - Rendered prompt sections (token counts may be mocked)
+    - embedding_cache - Embedding LRU (vectors may be mocked)
+    - nikita.llm.clients - Pooled HTTP/OpenAI clients and cached agents
     """
     # Let the test run first
     yield
@@ -55,3 +58,19 @@ def clear_singleton_caches():
     import nikita.platforms.telegram.rate_limiter as rl
 
     rl._shared_cache = None
+
+    # Clear rendered prompt sections (cached token counts come from whatever
+    # counter the test used)
+    from nikita.pipeline.templates import section_cache
+
+    section_cache.clear()
+
+    from nikita.memory.embedding_cache import embedding_cache
+
+    embedding_cache.clear()
+
+    # Pooled clients are bound to the test's event loop; cached agents may
+    # have been built by a patched Agent class
+    from nikita.llm.clients import clear_clients
+
+    clear_clients()
@@ -289,22 +289,43 @@ class TestConversationRepositoryIntegration:
     async def test_append_message_to_jsonb(
         self, conv_repo: ConversationRepository, user: User
     ):
-        """AC-T14.1: Append message updates JSONB array."""
+        """AC-T14.1: Append message adds a message row."""
         conv = await conv_repo.create_conversation(
             user_id=user.id,
             platform="telegram",
         )
 
-        updated = await conv_repo.append_message(
+        appended = await conv_repo.append_message(
             conversation_id=conv.id,
             role="user",
             content="Hello Nikita!",
             analysis={"sentiment": "positive"},
         )
+        assert appended.seq == 1
 
-        assert len(updated.messages) == 1
-        assert updated.messages[0]["role"] == "user"
-        assert updated.messages[0]["content"] == "Hello Nikita!"
+        await conv_repo.session.refresh(conv)
+        assert len(conv.messages) == 1
+        assert conv.messages[0]["role"] == "user"
+        assert conv.messages[0]["content"] == "Hello Nikita!"
+        assert conv.last_message_at is not None
+
+    @pytest.mark.asyncio
+    async def test_get_recent_messages_window(
+        self, conv_repo: ConversationRepository, user: User
+    ):
+        """Only the last N messages are fetched; message_count is cached."""
+        conv = await conv_repo.create_conversation(
+            user_id=user.id,
+            platform="telegram",
+        )
+        for i in range(5):
+            await conv_repo.append_message(conv.id, "user", f"message {i}")
+
+        recent = await conv_repo.get_recent_messages(conv.id, limit=3)
+        assert [m["content"] for m in recent] == ["message 2", "message 3", "message 4"]
+
+        await conv_repo.session.refresh(conv)
+        assert conv.message_count == 5
 
     @pytest.mark.asyncio
     async def test_get_recent_conversations(
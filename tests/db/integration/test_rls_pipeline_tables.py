@@ -183,19 +183,20 @@ class TestPipelineIndexes:
 
     @pytest.mark.asyncio
     async def test_memory_facts_embedding_index(self, session: AsyncSession):
-        """IVFFlat index on memory_facts.embedding exists."""
+        """Partial HNSW index on memory_facts.embedding exists."""
         result = await session.execute(
             text("""
-                SELECT indexname
+                SELECT indexname, indexdef
                 FROM pg_indexes
                 WHERE tablename = 'memory_facts'
-                AND indexname = 'idx_memory_facts_embedding_cosine'
+                AND indexname = 'idx_memory_facts_embedding_hnsw'
             """)
         )
         index = result.fetchone()
         if index is None:
-            pytest.skip("IVFFlat index not found - migration 0009 not applied")
-        assert index[0] == "idx_memory_facts_embedding_cosine"
+            pytest.skip("HNSW index not found - memory_facts_hnsw_index migration not applied")
+        assert "hnsw" in index[1]
+        assert "WHERE is_active" in index[1]
 
     @pytest.mark.asyncio
     async def test_ready_prompts_current_unique_index(self, session: AsyncSession):
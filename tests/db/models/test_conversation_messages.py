@@ -0,0 +1,72 @@
+"""Tests for Conversation.messages over JSONB + conversation_messages rows."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from nikita.db.models.conversation import Conversation, ConversationMessage
+
+
+def _conversation(messages=None) -> Conversation:
+    return Conversation(
+        user_id=uuid4(),
+        platform="telegram",
+        messages=messages if messages is not None else [],
+        started_at=datetime.now(UTC),
+    )
+
+
+class TestConversationMessages:
+    """Appends go to rows; reads merge the legacy array and the rows."""
+
+    def test_constructor_sets_legacy_array(self):
+        legacy = [{"role": "user", "content": "hi", "timestamp": "2026-01-01T10:00:00"}]
+        conv = _conversation(legacy)
+
+        assert conv.messages_json == legacy
+        assert conv.messages == legacy
+        assert conv.message_count == 1
+
+    def test_add_message_appends_row_after_legacy(self):
+        conv = _conversation([{"role": "user", "content": "hi"}])
+
+        conv.add_message("nikita", "hey", {"sentiment": "positive"})
+        conv.add_message("user", "how are you?")
+
+        assert conv.messages_json == [{"role": "user", "content": "hi"}]
+        assert [row.seq for row in conv.message_rows] == [2, 3]
+        assert [m["content"] for m in conv.messages] == ["hi", "hey", "how are you?"]
+        assert conv.messages[1]["analysis"] == {"sentiment": "positive"}
+        assert "analysis" not in conv.messages[2]
+        assert conv.message_count == 3
+
+    def test_add_message_stores_token_count(self):
+        from nikita.context.utils.token_counter import count_tokens
+
+        conv = _conversation()
+        conv.add_message("user", "how was your day?")
+
+        assert conv.message_rows[0].token_count == count_tokens("how was your day?")
+        assert conv.messages[0]["token_count"] == count_tokens("how was your day?")
+
+    def test_row_dict_has_jsonb_format(self):
+        row = ConversationMessage(
+            seq=1,
+            role="user",
+            content="hi",
+            created_at=datetime(2026, 10, 17, 12, 0, tzinfo=UTC),
+        )
+
+        assert row.to_dict() == {
+            "role": "user",
+            "content": "hi",
+            "timestamp": "2026-10-17T12:00:00+00:00",
+        }
+
+    def test_class_level_messages_is_jsonb_column(self):
+        """SQL expressions on Conversation.messages still hit the JSONB column."""
+        sql = str(
+            (Conversation.messages == []).compile(dialect=postgresql.dialect())
+        )
+        assert sql.startswith("conversations.messages =")
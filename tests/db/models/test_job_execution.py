@@ -33,11 +33,14 @@ class TestJobExecutionModel:
 
         Spec 215 PR 215-D adds heartbeat + generate_daily_arcs (Contract 2).
         Spec 214 T4.4 adds handoff_greeting_backstop (FR-11e cron).
+        drain_work_queue drains the durable work_jobs queue.
+        memory_compaction compacts memory facts nightly.
         """
         expected_jobs = {
             "decay", "deliver", "summary", "cleanup", "process-conversations",
             "post_processing", "psyche_batch", "refresh_voice_prompts",
             "heartbeat", "generate_daily_arcs", "handoff_greeting_backstop",
+            "drain_work_queue", "memory_compaction",
         }
         actual_jobs = {j.value for j in JobName}
         assert actual_jobs == expected_jobs
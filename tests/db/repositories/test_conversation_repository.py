@@ -4,7 +4,7 @@ TDD Tests for T4: Create ConversationRepository
 
 Acceptance Criteria:
 - AC-T4.1: create(user_id, platform, started_at) creates new conversation
-- AC-T4.2: append_message(conv_id, role, content, analysis) adds message to JSONB
+- AC-T4.2: append_message(conv_id, role, content, analysis) adds a message row
 - AC-T4.3: get_recent(user_id, limit=10) returns last N conversations
 - AC-T4.4: search(user_id, query) performs full-text search on search_vector
 - AC-T4.5: close_conversation(conv_id, score_delta) sets ended_at and score_delta
@@ -18,6 +18,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from nikita.context.utils.token_counter import count_tokens
 from nikita.db.models.conversation import Conversation
 from nikita.db.repositories.conversation_repository import ConversationRepository
 
@@ -117,52 +118,79 @@ class TestConversationRepository:
         assert before <= call_args.started_at <= after
 
     # ========================================
-    # AC-T4.2: append_message adds message to JSONB
+    # AC-T4.2: append_message adds a conversation_messages row
     # ========================================
+    @staticmethod
+    def _returning(row) -> MagicMock:
+        """execute() result whose one_or_none() returns row."""
+        result = MagicMock()
+        result.one_or_none.return_value = row
+        return result
+
     @pytest.mark.asyncio
-    async def test_append_message_adds_to_messages(
-        self, mock_session: AsyncMock, sample_conversation: Conversation
-    ):
-        """AC-T4.2: append_message adds message to JSONB messages array."""
-        mock_session.get.return_value = sample_conversation
+    async def test_append_message_adds_to_messages(self, mock_session: AsyncMock):
+        """AC-T4.2: append_message inserts the message in one statement."""
+        conversation_id = uuid4()
+        created_at = datetime.now(UTC)
+        mock_session.execute.return_value = self._returning(
+            MagicMock(seq=4, created_at=created_at)
+        )
 
         repo = ConversationRepository(mock_session)
         result = await repo.append_message(
-            conversation_id=sample_conversation.id,
+            conversation_id=conversation_id,
             role="user",
             content="Hello Nikita!",
             analysis={"sentiment": "positive"},
         )
 
-        # Verify add_message was called on conversation
-        sample_conversation.add_message.assert_called_once_with(
-            "user", "Hello Nikita!", {"sentiment": "positive"}
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.await_args.args[0])
+        assert sql.startswith("WITH touched AS")
+        # Incremented on the locked row, not derived from a snapshot subquery
+        assert "SET message_count=(conversations.message_count + " in sql
+        assert "last_message_at=now()" in sql
+        assert "SELECT touched.id, touched.message_count" in sql
+        assert "INSERT INTO conversation_messages" in sql
+        # Nothing is loaded or reloaded
+        mock_session.get.assert_not_called()
+        mock_session.refresh.assert_not_called()
+
+        assert result.conversation_id == conversation_id
+        assert result.seq == 4
+        assert result.to_dict() == {
+            "role": "user",
+            "content": "Hello Nikita!",
+            "timestamp": created_at.isoformat(),
+            "analysis": {"sentiment": "positive"},
+            "token_count": count_tokens("Hello Nikita!"),
+        }
+        # Counted at write time and passed with the INSERT
+        assert count_tokens("Hello Nikita!") in (
+            mock_session.execute.await_args.args[0].compile().params.values()
         )
-        mock_session.flush.assert_called_once()
-        mock_session.refresh.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_append_message_without_analysis(
-        self, mock_session: AsyncMock, sample_conversation: Conversation
-    ):
+    async def test_append_message_without_analysis(self, mock_session: AsyncMock):
         """AC-T4.2: append_message works without analysis parameter."""
-        mock_session.get.return_value = sample_conversation
+        mock_session.execute.return_value = self._returning(
+            MagicMock(seq=1, created_at=datetime.now(UTC))
+        )
 
         repo = ConversationRepository(mock_session)
-        await repo.append_message(
-            conversation_id=sample_conversation.id,
+        result = await repo.append_message(
+            conversation_id=uuid4(),
             role="nikita",
             content="Hey! How's it going?",
         )
 
-        sample_conversation.add_message.assert_called_once_with(
-            "nikita", "Hey! How's it going?", None
-        )
+        assert result.analysis is None
+        assert "analysis" not in result.to_dict()
 
     @pytest.mark.asyncio
     async def test_append_message_raises_if_not_found(self, mock_session: AsyncMock):
         """AC-T4.2: append_message raises ValueError if conversation not found."""
-        mock_session.get.return_value = None
+        mock_session.execute.return_value = self._returning(None)
 
         repo = ConversationRepository(mock_session)
 
@@ -173,6 +201,151 @@ class TestConversationRepository:
                 content="Hello",
             )
 
+    # ========================================
+    # Windowed message loading
+    # ========================================
+    @staticmethod
+    def _rows(*seqs: int) -> MagicMock:
+        """execute() result of message rows (newest first, as queried)."""
+        from nikita.db.models.conversation import ConversationMessage
+
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [
+            ConversationMessage(
+                seq=seq, role="user", content=f"m{seq}", created_at=datetime.now(UTC)
+            )
+            for seq in seqs
+        ]
+        return result
+
+    @staticmethod
+    def _legacy(*contents: str) -> MagicMock:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [
+            {"role": "user", "content": content} for content in contents
+        ]
+        return result
+
+    @pytest.mark.asyncio
+    async def test_get_recent_messages_rows_fill_window(self, mock_session: AsyncMock):
+        """A full window of rows needs no legacy query."""
+        mock_session.execute.return_value = self._rows(12, 11, 10)
+
+        repo = ConversationRepository(mock_session)
+        messages = await repo.get_recent_messages(uuid4(), limit=3)
+
+        assert [m["content"] for m in messages] == ["m10", "m11", "m12"]
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "ORDER BY conversation_messages.seq DESC" in sql
+        assert "LIMIT" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_recent_messages_all_rows_from_seq_one(self, mock_session: AsyncMock):
+        """Rows starting at seq 1 mean there are no legacy messages."""
+        mock_session.execute.return_value = self._rows(2, 1)
+
+        repo = ConversationRepository(mock_session)
+        messages = await repo.get_recent_messages(uuid4(), limit=80)
+
+        assert [m["content"] for m in messages] == ["m1", "m2"]
+        mock_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_recent_messages_tops_up_from_legacy(self, mock_session: AsyncMock):
+        """Missing messages come from the end of the legacy JSONB array."""
+        mock_session.execute.side_effect = [self._rows(5, 4), self._legacy("l2", "l3")]
+
+        repo = ConversationRepository(mock_session)
+        messages = await repo.get_recent_messages(uuid4(), limit=4)
+
+        assert [m["content"] for m in messages] == ["l2", "l3", "m4", "m5"]
+        legacy_call = mock_session.execute.await_args_list[1]
+        assert "jsonb_array_elements(c.messages) WITH ORDINALITY" in str(legacy_call.args[0])
+        assert legacy_call.args[1]["missing"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_recent_messages_legacy_only(self, mock_session: AsyncMock):
+        """Conversations not yet backfilled are read from the JSONB array."""
+        mock_session.execute.side_effect = [self._rows(), self._legacy("l1")]
+
+        repo = ConversationRepository(mock_session)
+        messages = await repo.get_recent_messages(uuid4(), limit=80)
+
+        assert messages == [{"role": "user", "content": "l1"}]
+        assert mock_session.execute.await_args_list[1].args[1]["missing"] == 80
+
+    @pytest.mark.asyncio
+    async def test_get_active_conversation_without_messages(self, mock_session: AsyncMock):
+        """load_messages=False does not select the JSONB array."""
+        from sqlalchemy.dialects import postgresql
+
+        mock_session.execute.return_value = MagicMock()
+        repo = ConversationRepository(mock_session)
+
+        await repo.get_active_conversation(uuid4())
+        full = mock_session.execute.await_args.args[0]
+        await repo.get_active_conversation(uuid4(), load_messages=False)
+        windowed = mock_session.execute.await_args.args[0]
+
+        def columns(stmt) -> str:
+            sql = str(stmt.compile(dialect=postgresql.dialect()))
+            return sql[: sql.index("FROM")]
+
+        assert "conversations.messages," in columns(full)
+        assert "conversations.messages," not in columns(windowed)
+        assert "conversations.message_count" in columns(windowed)
+
+    @pytest.mark.asyncio
+    async def test_get_messages_missing_token_count(self, mock_session: AsyncMock):
+        conversation_id = uuid4()
+        result = MagicMock()
+        result.all.return_value = [(conversation_id, 1, "hi")]
+        mock_session.execute.return_value = result
+
+        repo = ConversationRepository(mock_session)
+        rows = await repo.get_messages_missing_token_count(limit=50)
+
+        assert rows == [(conversation_id, 1, "hi")]
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "conversation_messages.token_count IS NULL" in sql
+
+    @pytest.mark.asyncio
+    async def test_set_message_token_counts_one_executemany(self, mock_session: AsyncMock):
+        conversation_id = uuid4()
+        repo = ConversationRepository(mock_session)
+
+        assert await repo.set_message_token_counts([]) == 0
+        mock_session.execute.assert_not_called()
+
+        updated = await repo.set_message_token_counts(
+            [(conversation_id, 1, 3), (conversation_id, 2, 7)]
+        )
+
+        assert updated == 2
+        mock_session.execute.assert_awaited_once()
+        assert mock_session.execute.await_args.args[1] == [
+            {"conversation_id": conversation_id, "seq": 1, "token_count": 3},
+            {"conversation_id": conversation_id, "seq": 2, "token_count": 7},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backfill_message_rows_moves_arrays(self, mock_session: AsyncMock):
+        """backfill_message_rows moves arrays to rows and empties them in one statement."""
+        mock_session.execute.return_value = MagicMock(rowcount=42)
+
+        repo = ConversationRepository(mock_session)
+        moved = await repo.backfill_message_rows(batch_size=50)
+
+        assert moved == 42
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.call_args.args[0])
+        assert "INSERT INTO conversation_messages" in sql
+        assert "WITH ORDINALITY" in sql
+        assert "SET messages = '[]'::jsonb" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert mock_session.execute.call_args.args[1] == {"batch_size": 50}
+
     # ========================================
     # AC-T4.3: get_recent returns last N conversations
     # ========================================
@@ -344,15 +517,19 @@ class TestConversationRepositoryJSONB:
     @pytest.mark.asyncio
     async def test_multiple_messages_can_be_appended(self, mock_session: AsyncMock):
         """Verify multiple messages can be appended sequentially."""
-        conv = MagicMock(spec=Conversation)
-        conv.id = uuid4()
-        conv.add_message = MagicMock()
-        mock_session.get.return_value = conv
+        results = []
+        for seq in (1, 2, 3):
+            result = MagicMock()
+            result.one_or_none.return_value = MagicMock(seq=seq, created_at=datetime.now(UTC))
+            results.append(result)
+        mock_session.execute.side_effect = results
 
         repo = ConversationRepository(mock_session)
+        conversation_id = uuid4()
 
-        await repo.append_message(conv.id, "user", "Hi!")
-        await repo.append_message(conv.id, "nikita", "Hey there!")
-        await repo.append_message(conv.id, "user", "How are you?")
+        await repo.append_message(conversation_id, "user", "Hi!")
+        await repo.append_message(conversation_id, "nikita", "Hey there!")
+        last = await repo.append_message(conversation_id, "user", "How are you?")
 
-        assert conv.add_message.call_count == 3
+        assert mock_session.execute.await_count == 3
+        assert last.seq == 3
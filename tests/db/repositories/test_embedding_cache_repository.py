@@ -0,0 +1,46 @@
+"""Tests for EmbeddingCacheRepository."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from nikita.db.repositories.embedding_cache_repository import EmbeddingCacheRepository
+
+
+@pytest.fixture
+def mock_session():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    return session
+
+
+@pytest.mark.asyncio
+class TestEmbeddingCacheRepository:
+    async def test_get_many_maps_hash_to_vector(self, mock_session):
+        result = MagicMock()
+        result.all.return_value = [("h1", [0.1, 0.2])]
+        mock_session.execute.return_value = result
+
+        found = await EmbeddingCacheRepository(mock_session).get_many("m", ["h1", "h2"])
+
+        assert found == {"h1": [0.1, 0.2]}
+        mock_session.execute.assert_awaited_once()
+
+    async def test_empty_inputs_skip_the_database(self, mock_session):
+        repo = EmbeddingCacheRepository(mock_session)
+
+        assert await repo.get_many("m", []) == {}
+        await repo.insert_many("m", {})
+
+        mock_session.execute.assert_not_called()
+
+    async def test_insert_many_is_one_statement_that_keeps_existing_rows(self, mock_session):
+        await EmbeddingCacheRepository(mock_session).insert_many(
+            "m", {"h1": [0.1] * 1536, "h2": [0.2] * 1536},
+        )
+
+        stmt = mock_session.execute.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT DO NOTHING" in sql
+        mock_session.execute.assert_awaited_once()
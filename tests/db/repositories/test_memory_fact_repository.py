@@ -1,9 +1,12 @@
 """Tests for MemoryFactRepository (Spec 042 T0.5)."""
 
 import pytest
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from sqlalchemy.dialects import postgresql
+
 from nikita.db.models.memory_fact import MemoryFact
 from nikita.db.repositories.memory_fact_repository import MemoryFactRepository
 
@@ -137,6 +140,71 @@ class TestSemanticSearch:
 
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_semantic_search_ef_search_sets_guc_first(self, repo, mock_session, user_id):
+        """ef_search is set for the transaction before the search runs."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repo.semantic_search(
+            user_id=user_id,
+            query_embedding=[0.1] * 1536,
+            ef_search=200,
+        )
+
+        assert mock_session.execute.await_count == 2
+        set_config = mock_session.execute.await_args_list[0].args[0]
+        sql = str(set_config.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        assert "set_config('hnsw.ef_search', '200', true)" in sql
+
+    @pytest.mark.asyncio
+    async def test_semantic_search_batch_resorts_by_distance(self, repo, mock_session, user_id):
+        """Rows an iterative index scan returns slightly out of order are re-sorted."""
+        near, far = MagicMock(spec=MemoryFact), MagicMock(spec=MemoryFact)
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(far, 0.4), (near, 0.1)]
+        mock_session.execute.return_value = mock_result
+
+        results = await repo.semantic_search_batch(
+            user_id=user_id,
+            query_embedding=[0.1] * 1536,
+            graph_types=["user"],
+        )
+
+        assert results == [(near, 0.1), (far, 0.4)]
+        mock_session.execute.assert_called_once()
+
+
+class TestLexicalSearch:
+    """Tests for lexical_search (full-text search on fact_tsv)."""
+
+    @pytest.mark.asyncio
+    async def test_lexical_search_single_ranked_query(self, repo, mock_session, user_id):
+        fact = MagicMock(spec=MemoryFact)
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(fact, 0.5, True)]
+        mock_session.execute.return_value = mock_result
+
+        results = await repo.lexical_search(user_id, "sister wedding", ["user"], limit=5)
+
+        assert results == [(fact, 0.5, True)]
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "plainto_tsquery('english'::regconfig" in sql
+        assert "websearch_to_tsquery('english'::regconfig" in sql
+        assert "memory_facts.fact_tsv @@" in sql
+        assert "ORDER BY ts_rank_cd(memory_facts.fact_tsv" in sql
+        assert "memory_facts.is_active AND" in sql
+
+    @pytest.mark.asyncio
+    async def test_lexical_search_ors_query_words(self, repo, mock_session, user_id):
+        """Any-term matching is built from the words, not by editing tsquery text."""
+        mock_session.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+
+        await repo.lexical_search(user_id, 'her "sister\'s" -wedding or & jazz', ["user"])
+
+        params = mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()).params
+        assert "her or sister or s or wedding or jazz" in params.values()
 
 class TestGetRecent:
     """Tests for get_recent method (AC-0.5.3)."""
@@ -223,6 +291,210 @@ class TestDeactivate:
         assert result is False
 
 
+class TestBulkOperations:
+    """Tests for add_facts, find_nearest_batch and deactivate_many."""
+
+    @pytest.mark.asyncio
+    async def test_add_facts_single_multi_row_insert(self, repo, mock_session, user_id):
+        rows = [
+            {
+                "id": uuid4(),
+                "user_id": user_id,
+                "graph_type": "user",
+                "fact": f"fact {i}",
+                "source": "test",
+                "confidence": 0.8,
+                "embedding": [0.1] * 1536,
+                "fact_metadata": {},
+                "is_active": True,
+                "conversation_id": None,
+            }
+            for i in range(3)
+        ]
+
+        await repo.add_facts(rows)
+
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO memory_facts")
+        assert "fact_m2" in sql
+
+    @pytest.mark.asyncio
+    async def test_add_facts_empty_is_noop(self, repo, mock_session):
+        await repo.add_facts([])
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_nearest_batch_one_lateral_query(self, repo, mock_session, user_id):
+        match_id = uuid4()
+        result = MagicMock()
+        result.all.return_value = [(1, match_id, 0.08)]
+        mock_session.execute = AsyncMock(return_value=result)
+
+        matches = await repo.find_nearest_batch(user_id, [[0.1] * 1536, [0.2] * 1536])
+
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "JOIN LATERAL" in sql
+        assert "LIMIT" in sql
+        assert matches == [None, (match_id, 0.08)]
+
+    @pytest.mark.asyncio
+    async def test_find_nearest_batch_compact_uses_halfvec_column(self, repo, mock_session, user_id):
+        result = MagicMock()
+        result.all.return_value = []
+        mock_session.execute = AsyncMock(return_value=result)
+
+        await repo.find_nearest_batch(user_id, [[0.1] * 512], compact=True)
+
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "memory_facts.embedding_compact <=> CAST(queries.embedding AS HALFVEC(512))" in sql
+
+    @pytest.mark.asyncio
+    async def test_backfill_compact_embeddings_single_update(self, repo, mock_session):
+        mock_session.execute = AsyncMock(return_value=MagicMock(rowcount=250))
+
+        updated = await repo.backfill_compact_embeddings(batch_size=250)
+
+        assert updated == 250
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE memory_facts SET embedding_compact=CAST(l2_normalize(subvector(")
+        assert "AS HALFVEC(512))" in sql
+        assert "embedding_compact IS NULL" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+
+    @pytest.mark.asyncio
+    async def test_deactivate_many_single_update(self, repo, mock_session):
+        old_a, old_b, new_a, new_b = uuid4(), uuid4(), uuid4(), uuid4()
+
+        await repo.deactivate_many({old_a: new_a, old_b: new_b})
+
+        mock_session.execute.assert_awaited_once()
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE memory_facts SET is_active")
+        assert "CASE memory_facts.id" in sql
+
+    @pytest.mark.asyncio
+    async def test_deactivate_many_empty_is_noop(self, repo, mock_session):
+        await repo.deactivate_many({})
+        mock_session.execute.assert_not_called()
+
+
+class TestEmbeddingProjection:
+    """Entity queries leave the deferred embedding columns unloaded."""
+
+    @staticmethod
+    def _select_list(mock_session) -> str:
+        stmt = mock_session.execute.call_args.args[0]
+        return str(stmt.compile(dialect=postgresql.dialect())).split("FROM")[0]
+
+    @pytest.mark.asyncio
+    async def test_semantic_search_skips_embeddings(self, repo, mock_session, user_id):
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repo.semantic_search(user_id=user_id, query_embedding=[0.1] * 1536)
+
+        select_list = self._select_list(mock_session)
+        assert "memory_facts.fact," in select_list
+        assert "memory_facts.embedding," not in select_list
+        assert "memory_facts.embedding_compact" not in select_list
+
+    @pytest.mark.asyncio
+    async def test_get_recent_with_embeddings(self, repo, mock_session, user_id):
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repo.get_recent(user_id=user_id)
+        assert "memory_facts.embedding" not in self._select_list(mock_session)
+
+        await repo.get_recent(user_id=user_id, with_embeddings=True)
+        select_list = self._select_list(mock_session)
+        assert "memory_facts.embedding," in select_list
+        assert "memory_facts.embedding_compact" in select_list
+
+    @pytest.mark.asyncio
+    async def test_get_fact_texts_selects_fact_only(self, repo, mock_session, user_id):
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = ["User likes tea"]
+        mock_session.execute.return_value = mock_result
+
+        texts = await repo.get_fact_texts(user_id, graph_type="user", limit=50)
+
+        assert texts == ["User likes tea"]
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT memory_facts.fact \nFROM memory_facts")
+        assert "LIMIT" in sql
+
+    def test_unloaded_embedding_raises(self):
+        """Reading a deferred vector off a loaded fact raises instead of lazy-loading."""
+        assert MemoryFact.embedding.property.deferred
+        assert MemoryFact.embedding_compact.property.deferred
+        assert MemoryFact.embedding.property.raiseload
+
+
+class TestCompaction:
+    """Queries used by nikita.memory.compaction."""
+
+    @pytest.mark.asyncio
+    async def test_get_active_vectors_projects_columns(self, repo, mock_session, user_id):
+        """Only id / embedding / confidence are selected, newest first."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repo.get_active_vectors(user_id, limit=100, compact=True)
+
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        select_list = sql.split("FROM")[0]
+        assert "embedding_compact" in select_list
+        assert "memory_facts.fact" not in select_list
+        assert "ORDER BY memory_facts.created_at DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_set_confidences_single_update(self, repo, mock_session):
+        """Confidences are set with one CASE update; empty input is a no-op."""
+        await repo.set_confidences({})
+        mock_session.execute.assert_not_called()
+
+        await repo.set_confidences({uuid4(): 0.9, uuid4(): 0.8})
+
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "UPDATE memory_facts SET confidence=CASE" in sql
+
+    @pytest.mark.asyncio
+    async def test_delete_superseded_only_inactive(self, repo, mock_session, user_id):
+        """Only superseded inactive facts past the cutoff are deleted."""
+        mock_session.execute.return_value = MagicMock(rowcount=3)
+
+        deleted = await repo.delete_superseded(user_id, inactive_before=datetime(2026, 1, 1, tzinfo=UTC))
+
+        assert deleted == 3
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("DELETE FROM memory_facts")
+        assert "NOT memory_facts.is_active" in sql
+        # Retired low-confidence facts have no replacement and are kept
+        assert "memory_facts.superseded_by IS NOT NULL" in sql
+        assert "memory_facts.updated_at <" in sql
+
+    @pytest.mark.asyncio
+    async def test_deactivate_low_confidence(self, repo, mock_session, user_id):
+        """Old low-confidence active facts are deactivated in one UPDATE."""
+        mock_session.execute.return_value = MagicMock(rowcount=2)
+
+        retired = await repo.deactivate_low_confidence(
+            user_id, below=0.3, created_before=datetime(2026, 1, 1, tzinfo=UTC)
+        )
+
+        assert retired == 2
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "memory_facts.confidence <" in sql
+        assert "memory_facts.created_at <" in sql
+
+
 class TestGetByUser:
     """Tests for get_by_user method (AC-0.5.5)."""
 
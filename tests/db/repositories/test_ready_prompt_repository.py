@@ -125,6 +125,58 @@ class TestSetCurrent:
         mock_session.flush.assert_called()
 
 
+    @pytest.mark.asyncio
+    async def test_set_current_counts_tokens_when_omitted(self, repo, mock_session, user_id):
+        """Without a token_count the prompt is counted once, at write time."""
+        from nikita.context.utils.token_counter import count_tokens
+
+        await repo.set_current(
+            user_id=user_id,
+            platform="text",
+            prompt_text="You are Nikita. Keep it short.",
+            pipeline_version="onboarding-bootstrap-b2",
+            generation_time_ms=0.0,
+        )
+
+        added_obj = mock_session.add.call_args[0][0]
+        assert added_obj.token_count == count_tokens("You are Nikita. Keep it short.")
+
+class TestSetCurrentMany:
+    """Tests for set_current_many (both platforms in one batch)."""
+
+    @pytest.mark.asyncio
+    async def test_one_update_and_one_flush_for_all_platforms(self, repo, mock_session, user_id):
+        """All platforms are deactivated by one UPDATE and inserted by one flush."""
+        mock_session.add_all = MagicMock()
+
+        result = await repo.set_current_many(
+            user_id=user_id,
+            prompts=[
+                {"platform": "text", "prompt_text": "Text...", "token_count": 600, "generation_time_ms": 900.0},
+                {"platform": "voice", "prompt_text": "Voice...", "token_count": 300, "generation_time_ms": 800.0},
+            ],
+            pipeline_version="045-v1",
+            context_snapshot={"chapter": 3},
+        )
+
+        mock_session.execute.assert_awaited_once()
+        update_sql = str(mock_session.execute.call_args[0][0])
+        assert "UPDATE ready_prompts" in update_sql
+        assert "platform IN" in update_sql
+        mock_session.flush.assert_awaited_once()
+        mock_session.refresh.assert_not_called()
+
+        added = mock_session.add_all.call_args[0][0]
+        assert added == result
+        assert [p.platform for p in added] == ["text", "voice"]
+        assert all(p.is_current and p.context_snapshot == {"chapter": 3} for p in added)
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_noop(self, repo, mock_session, user_id):
+        assert await repo.set_current_many(user_id=user_id, prompts=[], pipeline_version="045-v1") == []
+        mock_session.execute.assert_not_called()
+
+
 class TestGetHistory:
     """Tests for get_history method (AC-0.6.3)."""
 
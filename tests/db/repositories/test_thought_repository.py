@@ -433,3 +433,28 @@ class TestNikitaThoughtRepository:
         assert result == 1
         mock_session.delete.assert_called_once_with(expired_thoughts[0])
         mock_session.flush.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_get_active_thoughts_by_type_one_round_trip(self, mock_session: AsyncMock):
+        """get_active_thoughts_by_type() groups windowed rows per lookup in one query."""
+        from nikita.db.repositories.thought_repository import NikitaThoughtRepository
+
+        user_id = uuid4()
+        arc = NikitaThought(id=uuid4(), user_id=user_id, thought_type="arc", content="arc")
+        share = NikitaThought(id=uuid4(), user_id=user_id, thought_type="wants_to_share", content="share")
+        old_arc = NikitaThought(id=uuid4(), user_id=user_id, thought_type="arc", content="old arc")
+
+        mock_result = MagicMock()
+        # (thought, overall_rank, type_rank), newest first
+        mock_result.all.return_value = [(arc, 1, 1), (share, 2, 1), (old_arc, 3, 2)]
+        mock_session.execute.return_value = mock_result
+
+        repo = NikitaThoughtRepository(mock_session)
+        result = await repo.get_active_thoughts_by_type(
+            user_id=user_id, limits={None: 2, "arc": 2, "wants_to_share": 1},
+        )
+
+        assert result[None] == [arc, share]
+        assert result["arc"] == [arc, old_arc]
+        assert result["wants_to_share"] == [share]
+        mock_session.execute.assert_awaited_once()
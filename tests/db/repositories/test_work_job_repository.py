@@ -0,0 +1,94 @@
+"""Tests for WorkJobRepository.
+
+Statements are compiled against the PostgreSQL dialect and inspected,
+since claim semantics live in the SQL (SKIP LOCKED, lease expiry).
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from nikita.db.models.work_job import WorkJob, WorkJobKind, WorkJobStatus
+from nikita.db.repositories.work_job_repository import WorkJobRepository
+
+
+def _sql(session: AsyncMock) -> str:
+    stmt = session.execute.call_args[0][0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestWorkJobRepository:
+    """Test suite for WorkJobRepository."""
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        session = AsyncMock(spec=AsyncSession)
+        session.get = AsyncMock()
+        session.execute = AsyncMock()
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session) -> WorkJobRepository:
+        return WorkJobRepository(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_enqueue_is_idempotent_on_dedupe_key(self, repository, mock_session):
+        """Enqueue inserts with ON CONFLICT (dedupe_key) DO NOTHING."""
+        job_id = uuid4()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = job_id
+        mock_session.execute.return_value = result
+
+        returned = await repository.enqueue(
+            WorkJobKind.PIPELINE_RUN.value,
+            {"conversation_id": "c"},
+            dedupe_key="pipeline_run:c",
+        )
+
+        assert returned == job_id
+        sql = _sql(mock_session)
+        assert "INSERT INTO work_jobs" in sql
+        assert "ON CONFLICT (dedupe_key) DO NOTHING" in sql
+        assert "RETURNING work_jobs.id" in sql
+
+    @pytest.mark.asyncio
+    async def test_claim_batch_skips_locked_rows(self, repository, mock_session):
+        """Claim uses FOR UPDATE SKIP LOCKED and re-claims expired leases."""
+        job = WorkJob(id=uuid4(), kind="pipeline_run", status="running", attempts=1)
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [job]
+        mock_session.execute.return_value = result
+
+        jobs = await repository.claim_batch("worker-1", limit=3, lease_seconds=60)
+
+        assert jobs == [job]
+        sql = _sql(mock_session)
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "work_jobs.locked_until <" in sql
+        assert "work_jobs.attempts < work_jobs.max_attempts" in sql
+        assert "attempts=(work_jobs.attempts + " in sql
+
+    @pytest.mark.asyncio
+    async def test_fail_reschedules_when_attempts_remain(self, repository, mock_session):
+        """A failed attempt with retries left goes back to pending."""
+        mock_session.get.return_value = WorkJob(
+            id=uuid4(), kind="pipeline_run", attempts=2, max_attempts=5
+        )
+
+        status = await repository.fail(uuid4(), "boom", retry_delay_seconds=60)
+
+        assert status == WorkJobStatus.PENDING.value
+
+    @pytest.mark.asyncio
+    async def test_fail_marks_dead_when_exhausted(self, repository, mock_session):
+        """The final failed attempt marks the job dead."""
+        mock_session.get.return_value = WorkJob(
+            id=uuid4(), kind="pipeline_run", attempts=5, max_attempts=5
+        )
+
+        status = await repository.fail(uuid4(), "boom", retry_delay_seconds=60)
+
+        assert status == WorkJobStatus.DEAD.value
@@ -0,0 +1,75 @@
+"""Tests for the process-wide client registry (nikita.llm.clients)."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from nikita.llm import clients
+from nikita.llm.clients import (
+    close_clients,
+    get_agent,
+    get_http_client,
+    get_openai_client,
+)
+
+
+class TestHttpClients:
+    def test_same_client_per_provider(self):
+        assert get_http_client("elevenlabs") is get_http_client("elevenlabs")
+        assert get_http_client("elevenlabs") is not get_http_client("telegram")
+
+    def test_unknown_provider_uses_default_limits(self):
+        client = get_http_client("somewhere")
+        assert client.timeout.read == clients.PROVIDER_LIMITS["default"].timeout
+
+    @pytest.mark.asyncio
+    async def test_close_clients_closes_and_forgets(self):
+        client = get_http_client("telegram")
+        await close_clients()
+        assert client.is_closed
+        assert get_http_client("telegram") is not client
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_caps_in_flight_requests(self):
+        in_flight = 0
+        peak = 0
+
+        class SlowTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return httpx.Response(200)
+
+        transport = clients._ConcurrencyLimitedTransport(SlowTransport(), max_concurrency=2)
+        async with httpx.AsyncClient(transport=transport) as client:
+            await asyncio.gather(*(client.get("https://example.test/") for _ in range(6)))
+
+        assert peak == 2
+
+
+class TestOpenAIClient:
+    def test_one_client_per_api_key(self):
+        assert get_openai_client("sk-a") is get_openai_client("sk-a")
+        assert get_openai_client("sk-a") is not get_openai_client("sk-b")
+
+    def test_uses_pooled_transport(self):
+        client = get_openai_client("sk-a")
+        assert client._client is get_http_client("openai")
+
+
+class TestAgents:
+    def test_factory_called_once_per_key(self):
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = get_agent(("summary", "anthropic:haiku"), factory)
+        second = get_agent(("summary", "anthropic:haiku"), factory)
+        other = get_agent(("summary", "anthropic:sonnet"), factory)
+
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
@@ -0,0 +1,122 @@
+"""Tests for nightly memory fact compaction (nikita.memory.compaction)."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from nikita.memory.compaction import cluster_facts, compact_user
+
+
+def _unit(*values: float) -> list[float]:
+    vector = np.asarray(values, dtype=np.float32)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class TestClusterFacts:
+    """Greedy leader clustering on cosine similarity."""
+
+    def test_fewer_than_two_rows(self):
+        assert cluster_facts([], 0.9) == []
+        assert cluster_facts([[1.0, 0.0]], 0.9) == []
+
+    def test_groups_near_duplicates_under_newest(self):
+        """Rows are newest first, so each cluster is led by its first row."""
+        embeddings = [
+            _unit(1.0, 0.0, 0.0),
+            _unit(0.0, 1.0, 0.0),
+            _unit(0.99, 0.05, 0.0),
+            _unit(0.0, 0.98, 0.1),
+            _unit(0.0, 0.0, 1.0),
+        ]
+
+        assert cluster_facts(embeddings, 0.95) == [[0, 2], [1, 3]]
+
+    def test_member_joins_only_first_cluster(self):
+        """A row similar to two leaders is assigned to the earlier one."""
+        embeddings = [_unit(1.0, 0.2), _unit(1.0, -0.2), _unit(1.0, 0.0)]
+
+        assert cluster_facts(embeddings, 0.97) == [[0, 2]]
+
+    def test_zero_vector_is_not_a_duplicate(self):
+        assert cluster_facts([[0.0, 0.0], [0.0, 0.0]], 0.9) == []
+
+    def test_blocks_match_single_pass(self):
+        """Splitting the similarity matrix into blocks changes nothing."""
+        rng = np.random.default_rng(7)
+        base = rng.normal(size=(40, 16))
+        embeddings = np.vstack([base, base + rng.normal(scale=0.01, size=base.shape)])
+
+        expected = cluster_facts(embeddings, 0.99)
+        with patch("nikita.memory.compaction._SIMILARITY_BLOCK", 7):
+            assert cluster_facts(embeddings, 0.99) == expected
+        assert len(expected) == 40
+
+
+class TestCompactUser:
+    """compact_user() with mocked repositories."""
+
+    @pytest.mark.asyncio
+    async def test_supersedes_cluster_by_newest_and_records_run(self):
+        user_id = uuid4()
+        newest, older, oldest, distinct = uuid4(), uuid4(), uuid4(), uuid4()
+        repo = AsyncMock()
+        repo.count_active.return_value = 60
+        repo.get_active_vectors.return_value = [
+            (newest, _unit(1.0, 0.0), 0.6),
+            (older, _unit(1.0, 0.01), 0.9),
+            (distinct, _unit(0.0, 1.0), 0.8),
+            (oldest, _unit(1.0, -0.01), 0.7),
+        ]
+        repo.deactivate_low_confidence.return_value = 2
+        repo.delete_superseded.return_value = 5
+        run_repo = AsyncMock()
+        now = datetime(2026, 10, 17, tzinfo=UTC)
+
+        with (
+            patch("nikita.memory.compaction.MemoryFactRepository", return_value=repo),
+            patch("nikita.memory.compaction.MemoryCompactionRepository", return_value=run_repo),
+        ):
+            stats = await compact_user(
+                MagicMock(), user_id, threshold=0.95, retention_days=30, now=now
+            )
+
+        repo.deactivate_many.assert_awaited_once_with({older: newest, oldest: newest})
+        # The surviving fact keeps the cluster's highest confidence
+        repo.set_confidences.assert_awaited_once_with({newest: 0.9})
+        repo.delete_superseded.assert_awaited_once_with(
+            user_id, inactive_before=now - timedelta(days=30)
+        )
+        assert stats["active_before"] == 60
+        assert stats["active_after"] == 56
+        assert stats["clusters_merged"] == 1
+        assert stats["facts_merged"] == 2
+        assert stats["low_confidence_retired"] == 2
+        assert stats["superseded_deleted"] == 5
+        recorded = run_repo.record.await_args.args[0]
+        assert recorded["user_id"] == user_id
+        assert recorded["facts_merged"] == 2
+
+    @pytest.mark.asyncio
+    async def test_no_duplicates_updates_nothing(self):
+        repo = AsyncMock()
+        repo.count_active.return_value = 2
+        repo.get_active_vectors.return_value = [
+            (uuid4(), _unit(1.0, 0.0), 0.9),
+            (uuid4(), _unit(0.0, 1.0), 0.9),
+        ]
+        repo.deactivate_low_confidence.return_value = 0
+        repo.delete_superseded.return_value = 0
+
+        with (
+            patch("nikita.memory.compaction.MemoryFactRepository", return_value=repo),
+            patch("nikita.memory.compaction.MemoryCompactionRepository", return_value=AsyncMock()),
+        ):
+            stats = await compact_user(MagicMock(), uuid4(), threshold=0.95)
+
+        repo.deactivate_many.assert_awaited_once_with({})
+        repo.set_confidences.assert_awaited_once_with({})
+        assert stats["facts_merged"] == 0
+        assert stats["active_after"] == 2
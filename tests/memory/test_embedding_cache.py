@@ -0,0 +1,124 @@
+"""Tests for the two-tier embedding cache (LRU + embedding_cache table)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from nikita.memory.embedding_cache import EmbeddingCache, text_hash
+from nikita.memory.supabase_memory import EMBEDDING_MODEL, SupabaseMemory
+
+MODEL = "text-embedding-3-small"
+
+
+def _embedder():
+    async def embed(texts):
+        return [[float(len(t))] * 3 for t in texts]
+
+    return AsyncMock(side_effect=embed)
+
+
+@pytest.mark.asyncio
+class TestEmbeddingCache:
+    async def test_only_misses_reach_the_api(self):
+        cache = EmbeddingCache(persistent=False)
+        embed = _embedder()
+
+        await cache.get_many(MODEL, ["a", "bb"], embed)
+        vectors = await cache.get_many(MODEL, ["bb", "ccc", "  bb "], embed)
+
+        assert vectors == [[2.0] * 3, [3.0] * 3, [2.0] * 3]
+        assert [c.args[0] for c in embed.await_args_list] == [["a", "bb"], ["ccc"]]
+        stats = cache.stats()
+        assert (stats["memory_hits"], stats["misses"]) == (2, 3)
+
+    async def test_persistent_tier_fills_lru(self):
+        cache = EmbeddingCache()
+        embed = _embedder()
+        stored = {text_hash(MODEL, "constant query"): [0.5] * 3}
+
+        with patch.object(cache, "_load", AsyncMock(return_value=stored)) as load, \
+             patch.object(cache, "_store", AsyncMock()) as store:
+            assert await cache.warm_up(MODEL, ["constant query"], embed) == 1
+            second = await cache.get_many(MODEL, ["constant query"], embed)
+
+        assert second == [[0.5] * 3]
+        embed.assert_not_awaited()
+        load.assert_awaited_once()
+        store.assert_not_awaited()
+        assert cache.stats()["db_hits"] == 1
+        assert cache.stats()["hit_rate"] == 1.0
+
+    async def test_unregistered_texts_stay_in_process(self):
+        """Fact and per-message texts never read or write the table."""
+        cache = EmbeddingCache()
+        embed = _embedder()
+
+        with patch.object(cache, "_load", AsyncMock(return_value={})) as load, \
+             patch.object(cache, "_store", AsyncMock()) as store:
+            await cache.warm_up(MODEL, ["constant query"], embed)
+            store.reset_mock()
+            load.reset_mock()
+            await cache.get_many(MODEL, ["user said something", "constant query"], embed)
+
+        load.assert_not_awaited()
+        store.assert_not_awaited()
+        assert embed.await_args_list[-1].args[0] == ["user said something"]
+
+    async def test_warm_up_stores_constant_queries(self):
+        cache = EmbeddingCache()
+        embed = _embedder()
+
+        with patch.object(cache, "_load", AsyncMock(return_value={})), \
+             patch.object(cache, "_store", AsyncMock()) as store:
+            await cache.warm_up(MODEL, ["constant query"], embed)
+
+        store.assert_awaited_once_with(MODEL, {text_hash(MODEL, "constant query"): [14.0] * 3})
+
+    async def test_persistent_tier_failure_falls_back_to_api(self):
+        cache = EmbeddingCache()
+        embed = _embedder()
+
+        with patch("nikita.db.database.get_session_maker", side_effect=OSError("db down")):
+            warmed = await cache.warm_up(MODEL, ["query"], embed)
+
+        assert warmed == 1
+        assert await cache.get_many(MODEL, ["query"], embed) == [[5.0] * 3]
+        embed.assert_awaited_once()
+
+    async def test_lru_evicts_least_recently_used(self):
+        cache = EmbeddingCache(maxsize=2, persistent=False)
+        embed = _embedder()
+
+        await cache.get_many(MODEL, ["a", "b"], embed)
+        await cache.get_many(MODEL, ["a"], embed)
+        await cache.get_many(MODEL, ["c"], embed)
+        await cache.get_many(MODEL, ["a", "b"], embed)
+
+        assert embed.await_args_list[-1].args[0] == ["b"]
+
+    async def test_warm_up_failure_is_swallowed(self):
+        cache = EmbeddingCache(persistent=False)
+
+        warmed = await cache.warm_up(MODEL, ["q1", "q2"], AsyncMock(side_effect=OSError("api down")))
+
+        assert warmed == 0
+        assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_repeated_search_query_embeds_once():
+    """Constant PromptBuilder queries hit the OpenAI API once per process."""
+    memory = SupabaseMemory(session=AsyncMock(), user_id=uuid4(), openai_api_key="sk-test")
+    response = MagicMock(data=[MagicMock(embedding=[0.1] * 1536)])
+    memory._client = MagicMock()
+    memory._client.embeddings.create = AsyncMock(return_value=response)
+    memory._repo = MagicMock(semantic_search_batch=AsyncMock(return_value=[]))
+
+    with patch("nikita.memory.embedding_cache.EmbeddingCache._load", AsyncMock(return_value={})), \
+         patch("nikita.memory.embedding_cache.EmbeddingCache._store", AsyncMock()):
+        await memory.search("shared moments relationship history")
+        await memory.search("shared moments relationship history")
+
+    memory._client.embeddings.create.assert_awaited_once()
+    assert memory._client.embeddings.create.call_args.kwargs["model"] == EMBEDDING_MODEL
@@ -267,6 +267,19 @@ class TestSearch:
                 call_kwargs = mock_repo.semantic_search_batch.call_args[1]
                 assert call_kwargs["min_confidence"] == 0.5
 
+    @pytest.mark.asyncio
+    async def test_search_raises_ef_search_for_large_limits(self, memory):
+        """Only limits whose over-fetch exceeds the connection default raise ef_search."""
+        with patch.object(memory, "_generate_embedding", new_callable=AsyncMock, return_value=FAKE_EMBEDDING):
+            with patch.object(memory, "_repo") as mock_repo:
+                mock_repo.semantic_search_batch = AsyncMock(return_value=[])
+
+                await memory.search(query="test", limit=10)
+                assert mock_repo.semantic_search_batch.call_args[1]["ef_search"] is None
+
+                await memory.search(query="test", limit=50)
+                assert mock_repo.semantic_search_batch.call_args[1]["ef_search"] == 200
+
     @pytest.mark.asyncio
     async def test_search_all_graphs_by_default(self, memory):
         """search queries all 3 graphs in a single batch call when graph_types is None."""
@@ -638,9 +651,285 @@ class TestDeduplication:
                     mock_repo.deactivate.assert_not_awaited()
 
 
+class TestAddFactsBulk:
+    """add_facts_bulk: one embedding call, set-based dedup, one INSERT + one UPDATE."""
+
+    @staticmethod
+    def _vec(*head: float) -> list[float]:
+        return list(head) + [0.0] * (1536 - len(head))
+
+    @pytest.mark.asyncio
+    async def test_single_embedding_call_and_one_insert(self, memory, user_id):
+        facts = [
+            {"fact": "User likes coffee", "graph_type": "user"},
+            {"fact": "User lives in Berlin", "graph_type": "user"},
+            {"fact": "We argued about pizza", "graph_type": "relationship"},
+        ]
+        vectors = [self._vec(1.0), self._vec(0.0, 1.0), self._vec(0.0, 0.0, 1.0)]
+        with patch.object(
+            memory, "generate_embeddings_batch", new_callable=AsyncMock, return_value=vectors
+        ) as mock_embed:
+            with patch.object(memory, "_repo") as mock_repo:
+                mock_repo.find_nearest_batch = AsyncMock(return_value=[None, None, None])
+                mock_repo.add_facts = AsyncMock()
+                mock_repo.deactivate_many = AsyncMock()
+
+                result = await memory.add_facts_bulk(
+                    facts, source="pipeline_extraction", confidence=0.85
+                )
+
+        mock_embed.assert_awaited_once_with([f["fact"] for f in facts])
+        mock_repo.find_nearest_batch.assert_awaited_once()
+        rows = mock_repo.add_facts.call_args.args[0]
+        assert [r["fact"] for r in rows] == [f["fact"] for f in facts]
+        assert all(r["user_id"] == user_id and r["confidence"] == 0.85 for r in rows)
+        assert rows[2]["graph_type"] == "relationship"
+        mock_repo.deactivate_many.assert_awaited_once_with({})
+        assert result == {"stored": 3, "superseded": 0, "deduplicated": 0}
+
+    @pytest.mark.asyncio
+    async def test_near_duplicates_within_batch_keep_last(self, memory):
+        facts = [
+            {"fact": "User likes coffee", "graph_type": "user"},
+            {"fact": "User lives in Berlin", "graph_type": "user"},
+            {"fact": "User really likes coffee", "graph_type": "user"},
+        ]
+        vectors = [self._vec(1.0, 0.1), self._vec(0.0, 1.0), self._vec(1.0, 0.12)]
+        with patch.object(
+            memory, "generate_embeddings_batch", new_callable=AsyncMock, return_value=vectors
+        ):
+            with patch.object(memory, "_repo") as mock_repo:
+                mock_repo.find_nearest_batch = AsyncMock(return_value=[None, None])
+                mock_repo.add_facts = AsyncMock()
+                mock_repo.deactivate_many = AsyncMock()
+
+                result = await memory.add_facts_bulk(facts, source="test", confidence=0.8)
+
+        rows = mock_repo.add_facts.call_args.args[0]
+        assert [r["fact"] for r in rows] == ["User lives in Berlin", "User really likes coffee"]
+        assert mock_repo.find_nearest_batch.call_args.kwargs["embeddings"] == [vectors[1], vectors[2]]
+        assert result["deduplicated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_supersedes_existing_near_duplicates(self, memory):
+        """Existing facts within the dedup distance are deactivated in one UPDATE."""
+        old_id, unrelated_id = uuid4(), uuid4()
+        facts = [
+            {"fact": "User really loves coffee", "graph_type": "user"},
+            {"fact": "User lives in Berlin", "graph_type": "user"},
+        ]
+        with patch.object(
+            memory,
+            "generate_embeddings_batch",
+            new_callable=AsyncMock,
+            return_value=[self._vec(1.0), self._vec(0.0, 1.0)],
+        ):
+            with patch.object(memory, "_repo") as mock_repo:
+                mock_repo.find_nearest_batch = AsyncMock(
+                    return_value=[(old_id, 0.05), (unrelated_id, 0.4)]
+                )
+                mock_repo.add_facts = AsyncMock()
+                mock_repo.deactivate_many = AsyncMock()
+
+                result = await memory.add_facts_bulk(facts, source="test", confidence=0.8)
+
+        rows = mock_repo.add_facts.call_args.args[0]
+        mock_repo.deactivate_many.assert_awaited_once_with({old_id: rows[0]["id"]})
+        assert result == {"stored": 2, "superseded": 1, "deduplicated": 0}
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_makes_no_calls(self, memory):
+        with patch.object(memory, "generate_embeddings_batch", new_callable=AsyncMock) as mock_embed:
+            result = await memory.add_facts_bulk([{"fact": "", "graph_type": "user"}], source="test", confidence=0.8)
+
+        mock_embed.assert_not_awaited()
+        assert result == {"stored": 0, "superseded": 0, "deduplicated": 0}
+
+
 # ── T1.3: Embedding Generation ───────────────────────────────────────────────
 
 
+class TestHybridSearch:
+    """search(hybrid=True): full-text search, fast path, reciprocal-rank fusion."""
+
+    @staticmethod
+    def _fact(text: str):
+        fact = MagicMock()
+        fact.id = uuid4()
+        fact.fact = text
+        fact.graph_type = "user"
+        fact.created_at = datetime(2026, 1, 15, tzinfo=timezone.utc)
+        fact.confidence = 0.9
+        return fact
+
+    @pytest.mark.asyncio
+    async def test_fast_path_skips_embedding_and_vector_search(self, memory):
+        sister, wedding = self._fact("User's sister lives in Lyon"), self._fact("Sister's wedding is in June")
+        with patch.object(memory, "_generate_embedding", new_callable=AsyncMock) as mock_embed:
+            with patch.object(memory, "_repo") as mock_repo:
+                mock_repo.lexical_search = AsyncMock(
+                    return_value=[(sister, 0.4, True), (wedding, 0.3, True)]
+                )
+                mock_repo.semantic_search_batch = AsyncMock()
+
+                results = await memory.search("sister", limit=5, hybrid=True)
+
+        mock_embed.assert_not_awaited()
+        mock_repo.semantic_search_batch.assert_not_awaited()
+        assert [r["fact"] for r in results] == [sister.fact, wedding.fact]
+        assert results[0]["distance"] is None
+        assert results[0]["score"] == 0.4
+
+    @pytest.mark.asyncio
+    async def test_partial_matches_fuse_with_vector_results(self, memory):
+        both, vector_only, text_only = self._fact("a"), self._fact("b"), self._fact("c")
+        with patch.object(memory, "_generate_embedding", new_callable=AsyncMock, return_value=FAKE_EMBEDDING):
+            with patch.object(memory, "_repo") as mock_repo:
+                mock_repo.lexical_search = AsyncMock(
+                    return_value=[(text_only, 0.5, False), (both, 0.2, False)]
+                )
+                mock_repo.semantic_search_batch = AsyncMock(
+                    return_value=[(vector_only, 0.1), (both, 0.2)]
+                )
+
+                results = await memory.search("Lyon trip", limit=5, hybrid=True)
+
+        # both: 1/62 + 1/62 beats either list's first place (1/61)
+        assert [r["fact"] for r in results] == ["a", "b", "c"]
+        assert results[0]["distance"] == 0.2
+        assert results[2]["distance"] is None
+        assert results[0]["score"] == pytest.approx(2 / 62)
+
+    @pytest.mark.asyncio
+    async def test_not_hybrid_by_default(self, memory):
+        with patch.object(memory, "_generate_embedding", new_callable=AsyncMock, return_value=FAKE_EMBEDDING):
+            with patch.object(memory, "_repo") as mock_repo:
+                mock_repo.lexical_search = AsyncMock()
+                mock_repo.semantic_search_batch = AsyncMock(return_value=[])
+
+                await memory.search("sister")
+
+        mock_repo.lexical_search.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_setting_disables_hybrid(self, memory):
+        from nikita.config.settings import get_settings as _get_settings
+
+        settings = _get_settings().model_copy(update={"memory_hybrid_search_enabled": False})
+        with patch("nikita.memory.supabase_memory.get_settings", return_value=settings):
+            with patch.object(memory, "_generate_embedding", new_callable=AsyncMock, return_value=FAKE_EMBEDDING):
+                with patch.object(memory, "_repo") as mock_repo:
+                    mock_repo.lexical_search = AsyncMock()
+                    mock_repo.semantic_search_batch = AsyncMock(return_value=[])
+
+                    await memory.search_memory("sister", limit=5, hybrid=True)
+
+        mock_repo.lexical_search.assert_not_awaited()
+        mock_repo.semantic_search_batch.assert_awaited_once()
+
+
+class TestCompactStorage:
+    """memory_embedding_storage: dual writes embedding_compact, compact searches it."""
+
+    @staticmethod
+    def _storage(mode: str, compact_threshold: float = 0.8):
+        from nikita.config.settings import get_settings as _get_settings
+
+        settings = _get_settings().model_copy(update={
+            "memory_embedding_storage": mode,
+            "memory_compact_dedup_similarity_threshold": compact_threshold,
+        })
+        return patch("nikita.memory.supabase_memory.get_settings", return_value=settings)
+
+    def test_compact_embedding_is_normalized_prefix(self):
+        from nikita.memory.supabase_memory import COMPACT_EMBEDDING_DIMS, compact_embedding
+
+        vector = [3.0, 4.0] + [0.0] * (COMPACT_EMBEDDING_DIMS - 2) + [9.0] * 1024
+        compact = compact_embedding(vector)
+
+        assert len(compact) == COMPACT_EMBEDDING_DIMS
+        assert compact[:2] == pytest.approx([0.6, 0.8])
+        assert compact[2:] == [0.0] * (COMPACT_EMBEDDING_DIMS - 2)
+
+    @pytest.mark.asyncio
+    async def test_full_storage_writes_no_compact_column(self, memory):
+        with self._storage("full"):
+            with patch.object(memory, "_generate_embedding", new_callable=AsyncMock, return_value=FAKE_EMBEDDING):
+                with patch.object(memory, "find_similar", new_callable=AsyncMock, return_value=None):
+                    with patch.object(memory, "_repo") as mock_repo:
+                        mock_repo.add_fact = AsyncMock(return_value=MagicMock())
+                        await memory.add_fact("User likes tea", "user", "conversation", 0.8)
+
+        assert "embedding_compact" not in mock_repo.add_fact.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_dual_storage_writes_compact_but_searches_full(self, memory):
+        with self._storage("dual"):
+            with patch.object(memory, "_generate_embedding", new_callable=AsyncMock, return_value=FAKE_EMBEDDING):
+                with patch.object(memory, "_repo") as mock_repo:
+                    mock_repo.semantic_search = AsyncMock(return_value=[])
+                    mock_repo.add_fact = AsyncMock(return_value=MagicMock())
+                    await memory.add_fact("User likes tea", "user", "conversation", 0.8)
+
+        assert len(mock_repo.add_fact.call_args.kwargs["embedding_compact"]) == 512
+        search_kwargs = mock_repo.semantic_search.call_args.kwargs
+        assert search_kwargs["query_embedding"] == FAKE_EMBEDDING
+        assert "compact" not in search_kwargs
+
+    @pytest.mark.asyncio
+    async def test_compact_storage_searches_compact_column(self, memory):
+        with self._storage("compact"):
+            with patch.object(memory, "_repo") as mock_repo:
+                mock_repo.semantic_search_batch = AsyncMock(return_value=[])
+                await memory.search("coffee", query_embedding=FAKE_EMBEDDING)
+
+        kwargs = mock_repo.semantic_search_batch.call_args.kwargs
+        assert kwargs["compact"] is True
+        assert len(kwargs["query_embedding"]) == 512
+
+    @pytest.mark.asyncio
+    async def test_compact_storage_dedups_with_compact_threshold(self, memory):
+        """Similarity 0.82 supersedes at the compact threshold 0.8, not at 0.87."""
+        old = MagicMock()
+        old.id = uuid4()
+        new = MagicMock()
+        new.id = uuid4()
+        with self._storage("compact", compact_threshold=0.8):
+            with patch.object(memory, "_generate_embedding", new_callable=AsyncMock, return_value=FAKE_EMBEDDING):
+                with patch.object(memory, "_repo") as mock_repo:
+                    mock_repo.semantic_search = AsyncMock(return_value=[(old, 0.18)])
+                    mock_repo.add_fact = AsyncMock(return_value=new)
+                    mock_repo.deactivate = AsyncMock()
+                    await memory.add_fact("User likes tea", "user", "conversation", 0.8)
+
+        assert mock_repo.semantic_search.call_args.kwargs["compact"] is True
+        mock_repo.deactivate.assert_awaited_once_with(old.id, superseded_by_id=new.id)
+
+    @pytest.mark.asyncio
+    async def test_compact_storage_bulk_add(self, memory):
+        vectors = [[1.0] + [0.0] * 1535, [0.0, 1.0] + [0.0] * 1534]
+        with self._storage("compact"):
+            with patch.object(
+                memory, "generate_embeddings_batch", new_callable=AsyncMock, return_value=vectors
+            ):
+                with patch.object(memory, "_repo") as mock_repo:
+                    mock_repo.find_nearest_batch = AsyncMock(return_value=[None, None])
+                    mock_repo.add_facts = AsyncMock()
+                    mock_repo.deactivate_many = AsyncMock()
+                    await memory.add_facts_bulk(
+                        [{"fact": "a", "graph_type": "user"}, {"fact": "b", "graph_type": "user"}],
+                        source="test",
+                        confidence=0.8,
+                    )
+
+        nearest_kwargs = mock_repo.find_nearest_batch.call_args.kwargs
+        assert nearest_kwargs["compact"] is True
+        assert all(len(e) == 512 for e in nearest_kwargs["embeddings"])
+        rows = mock_repo.add_facts.call_args.args[0]
+        assert rows[0]["embedding"] == vectors[0]
+        assert len(rows[0]["embedding_compact"]) == 512
+
+
 class TestEmbeddingGeneration:
     """AC-1.3.1: Uses OpenAI text-embedding-3-small (1536 dims)."""
 
@@ -797,16 +1086,15 @@ class TestNikitaMemoryCompat:
     @pytest.mark.asyncio
     async def test_get_user_facts(self, memory):
         """get_user_facts returns list of fact strings from user graph."""
-        mock_fact1 = MagicMock()
-        mock_fact1.fact = "Likes coffee"
-        mock_fact2 = MagicMock()
-        mock_fact2.fact = "Works at Google"
-
         with patch.object(memory, "_repo") as mock_repo:
-            mock_repo.get_by_user = AsyncMock(return_value=[mock_fact1, mock_fact2])
+            mock_repo.get_fact_texts = AsyncMock(return_value=["Likes coffee", "Works at Google"])
 
             facts = await memory.get_user_facts(limit=50)
             assert facts == ["Likes coffee", "Works at Google"]
+            # Only the fact column is queried, limited in SQL
+            mock_repo.get_fact_texts.assert_awaited_once_with(
+                user_id=memory.user_id, graph_type="user", limit=50
+            )
 
     @pytest.mark.asyncio
     async def test_add_relationship_episode(self, memory):
@@ -820,11 +1108,8 @@ class TestNikitaMemoryCompat:
     @pytest.mark.asyncio
     async def test_get_relationship_episodes(self, memory):
         """get_relationship_episodes returns list of episode strings."""
-        mock_fact = MagicMock()
-        mock_fact.fact = "Went to the movies together"
-
         with patch.object(memory, "_repo") as mock_repo:
-            mock_repo.get_by_user = AsyncMock(return_value=[mock_fact])
+            mock_repo.get_fact_texts = AsyncMock(return_value=["Went to the movies together"])
 
             episodes = await memory.get_relationship_episodes(limit=50)
             assert episodes == ["Went to the movies together"]
@@ -841,11 +1126,8 @@ class TestNikitaMemoryCompat:
     @pytest.mark.asyncio
     async def test_get_nikita_events(self, memory):
         """get_nikita_events returns list of event strings from nikita graph."""
-        mock_fact = MagicMock()
-        mock_fact.fact = "Started new project at work"
-
         with patch.object(memory, "_repo") as mock_repo:
-            mock_repo.get_by_user = AsyncMock(return_value=[mock_fact])
+            mock_repo.get_fact_texts = AsyncMock(return_value=["Started new project at work"])
 
             events = await memory.get_nikita_events(limit=50)
             assert events == ["Started new project at work"]
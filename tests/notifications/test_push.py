@@ -36,7 +36,7 @@ class TestSendPush:
 
         with (
             patch("nikita.notifications.push.get_settings", return_value=mock_settings),
-            patch("nikita.notifications.push.httpx.AsyncClient") as mock_client_cls,
+            patch("nikita.notifications.push.get_http_client") as mock_client_cls,
         ):
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
@@ -62,7 +62,7 @@ class TestSendPush:
 
         with (
             patch("nikita.notifications.push.get_settings", return_value=mock_settings),
-            patch("nikita.notifications.push.httpx.AsyncClient") as mock_client_cls,
+            patch("nikita.notifications.push.get_http_client") as mock_client_cls,
         ):
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
@@ -82,7 +82,7 @@ class TestSendPush:
 
         with (
             patch("nikita.notifications.push.get_settings", return_value=mock_settings),
-            patch("nikita.notifications.push.httpx.AsyncClient") as mock_client_cls,
+            patch("nikita.notifications.push.get_http_client") as mock_client_cls,
         ):
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
@@ -100,7 +100,7 @@ class TestSendPush:
         """Network error returns error dict, doesn't raise."""
         with (
             patch("nikita.notifications.push.get_settings", return_value=mock_settings),
-            patch("nikita.notifications.push.httpx.AsyncClient") as mock_client_cls,
+            patch("nikita.notifications.push.get_http_client") as mock_client_cls,
         ):
             mock_client = AsyncMock()
             mock_client.post.side_effect = httpx.ConnectError("Connection refused")
@@ -132,7 +132,7 @@ class TestSendPush:
 
         with (
             patch("nikita.notifications.push.get_settings", return_value=mock_settings),
-            patch("nikita.notifications.push.httpx.AsyncClient") as mock_client_cls,
+            patch("nikita.notifications.push.get_http_client") as mock_client_cls,
         ):
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
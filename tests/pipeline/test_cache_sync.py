@@ -1,6 +1,6 @@
 """Tests for Spec 043 T1.2: Voice prompt cache sync in PromptBuilder.
 
-Verifies that _store_prompt() syncs voice prompts to both
+Verifies that _store_prompts() syncs voice prompts to both
 ready_prompts table AND user.cached_voice_prompt.
 """
 
@@ -50,7 +50,7 @@ class TestVoicePromptCacheSync:
     async def test_voice_prompt_stored_in_ready_prompts(self, builder, ctx, mock_session):
         """AC-3.2.1: Voice prompt stored in ready_prompts table."""
         mock_repo = AsyncMock()
-        mock_repo.set_current = AsyncMock()
+        mock_repo.set_current_many = AsyncMock()
 
         # Mock the sync method to avoid needing UserRepository
         builder._sync_cached_voice_prompt = AsyncMock()
@@ -59,12 +59,13 @@ class TestVoicePromptCacheSync:
             "nikita.db.repositories.ready_prompt_repository.ReadyPromptRepository",
             return_value=mock_repo,
         ):
-            await builder._store_prompt(ctx, "voice", "test voice prompt", 100, 50.0)
+            await builder._store_prompts(ctx, {"voice": ("test voice prompt", 100, 50.0)})
 
-        mock_repo.set_current.assert_called_once()
-        call_kwargs = mock_repo.set_current.call_args.kwargs
-        assert call_kwargs["platform"] == "voice"
-        assert call_kwargs["prompt_text"] == "test voice prompt"
+        mock_repo.set_current_many.assert_called_once()
+        [stored] = mock_repo.set_current_many.call_args.kwargs["prompts"]
+        assert stored["platform"] == "voice"
+        assert stored["prompt_text"] == "test voice prompt"
+        builder._sync_cached_voice_prompt.assert_awaited_once_with(ctx.user_id, "test voice prompt")
 
     @pytest.mark.asyncio
     async def test_voice_prompt_synced_to_cached_voice_prompt(self, builder, ctx, mock_session):
@@ -89,7 +90,7 @@ class TestVoicePromptCacheSync:
     async def test_text_prompt_not_synced_to_cached_voice_prompt(self, builder, ctx, mock_session):
         """AC-3.2.3: Text prompt NOT synced to cached_voice_prompt (voice only)."""
         mock_repo = AsyncMock()
-        mock_repo.set_current = AsyncMock()
+        mock_repo.set_current_many = AsyncMock()
 
         builder._sync_cached_voice_prompt = AsyncMock()
 
@@ -97,7 +98,7 @@ class TestVoicePromptCacheSync:
             "nikita.db.repositories.ready_prompt_repository.ReadyPromptRepository",
             return_value=mock_repo,
         ):
-            await builder._store_prompt(ctx, "text", "text prompt", 100, 50.0)
+            await builder._store_prompts(ctx, {"text": ("text prompt", 100, 50.0)})
 
         builder._sync_cached_voice_prompt.assert_not_called()
 
@@ -34,6 +34,9 @@ def pipeline_context():
     )
 
 
+_EMPTY_THOUGHTS = {None: [], "wants_to_share": [], "arc": []}
+
+
 def _make_conv_repo_mock():
     """Return an AsyncMock ConversationRepository that returns empty summaries."""
     conv_repo = AsyncMock()
@@ -73,7 +76,9 @@ class TestEnrichContextThoughts:
              patch(_GET_SETTINGS, return_value=_make_settings_mock()):
 
             thought_repo = AsyncMock()
-            thought_repo.get_active_thoughts.return_value = [mock_thought_1, mock_thought_2]
+            thought_repo.get_active_thoughts_by_type.return_value = {
+                None: [mock_thought_1, mock_thought_2], "wants_to_share": [], "arc": [],
+            }
             MockThoughtRepo.return_value = thought_repo
 
             thread_repo = AsyncMock()
@@ -90,9 +95,10 @@ class TestEnrichContextThoughts:
             assert pipeline_context.active_thoughts[0] == "I wonder if he's thinking about me"
             assert pipeline_context.active_thoughts[1] == "Should I bring up that restaurant?"
 
-            # Verify correct arguments passed
-            thought_repo.get_active_thoughts.assert_called_once_with(
-                user_id=pipeline_context.user_id, limit=10,
+            # Verify one batched lookup (recent thoughts + openers + arcs)
+            thought_repo.get_active_thoughts_by_type.assert_called_once_with(
+                user_id=pipeline_context.user_id,
+                limits={None: 10, "wants_to_share": 3, "arc": 5},
             )
 
     @pytest.mark.asyncio
@@ -105,7 +111,7 @@ class TestEnrichContextThoughts:
              patch(_GET_SETTINGS, return_value=_make_settings_mock()):
 
             thought_repo = AsyncMock()
-            thought_repo.get_active_thoughts.side_effect = Exception("DB connection lost")
+            thought_repo.get_active_thoughts_by_type.side_effect = Exception("DB connection lost")
             MockThoughtRepo.return_value = thought_repo
 
             thread_repo = AsyncMock()
@@ -145,7 +151,7 @@ class TestEnrichContextThreads:
              patch(_GET_SETTINGS, return_value=_make_settings_mock()):
 
             thought_repo = AsyncMock()
-            thought_repo.get_active_thoughts.return_value = []
+            thought_repo.get_active_thoughts_by_type.return_value = _EMPTY_THOUGHTS
             MockThoughtRepo.return_value = thought_repo
 
             thread_repo = AsyncMock()
@@ -186,7 +192,7 @@ class TestEnrichContextThreads:
              patch(_GET_SETTINGS, return_value=_make_settings_mock()):
 
             thought_repo = AsyncMock()
-            thought_repo.get_active_thoughts.return_value = []
+            thought_repo.get_active_thoughts_by_type.return_value = _EMPTY_THOUGHTS
             MockThoughtRepo.return_value = thought_repo
 
             thread_repo = AsyncMock()
@@ -216,7 +222,7 @@ class TestEnrichContextThreads:
              patch(_GET_SETTINGS, return_value=_make_settings_mock()):
 
             thought_repo = AsyncMock()
-            thought_repo.get_active_thoughts.return_value = []
+            thought_repo.get_active_thoughts_by_type.return_value = _EMPTY_THOUGHTS
             MockThoughtRepo.return_value = thought_repo
 
             thread_repo = AsyncMock()
@@ -254,3 +260,114 @@ class TestEnrichContextThreads:
         await stage._enrich_context(pipeline_context)
 
         assert pipeline_context.open_threads == []
+
+
+class TestEnrichContextFanOut:
+    """Enrichment sources run concurrently with per-source fallbacks."""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_max_not_sum_of_sources(self, mock_session, pipeline_context):
+        """Memory embedding (slow, network) overlaps the DB lookups."""
+        import asyncio
+        import time
+
+        def slow(value, delay):
+            async def load(*args, **kwargs):
+                await asyncio.sleep(delay)
+                return value
+            return load
+
+        memory = MagicMock()
+        memory.generate_embeddings_batch = AsyncMock(side_effect=slow([[0.1], [0.2]], 0.1))
+        memory.search = AsyncMock(return_value=[{"fact": "we went hiking"}])
+
+        with patch(_THOUGHT_REPO) as MockThoughtRepo, \
+             patch(_THREAD_REPO) as MockThreadRepo, \
+             patch(_CONV_REPO) as MockConvRepo, \
+             patch(_USER_REPO) as MockUserRepo, \
+             patch(_SUPABASE_MEMORY, return_value=memory), \
+             patch(_GET_SETTINGS, return_value=_make_settings_mock("sk-test")):
+            MockThoughtRepo.return_value.get_active_thoughts_by_type = AsyncMock(
+                side_effect=slow(_EMPTY_THOUGHTS, 0.02))
+            MockThreadRepo.return_value.get_open_threads = AsyncMock(
+                side_effect=slow([], 0.02))
+            MockConvRepo.return_value.get_conversation_summaries_for_prompt = AsyncMock(
+                side_effect=slow({"last_summary": "we argued"}, 0.02))
+            MockUserRepo.return_value.get = AsyncMock(side_effect=slow(None, 0.02))
+
+            start = time.perf_counter()
+            await PromptBuilderStage(session=mock_session)._enrich_context(pipeline_context)
+            elapsed = time.perf_counter() - start
+
+        # Sequential would be ~0.1 + 4 * 0.02 = 0.18s
+        assert elapsed < 0.16
+        assert pipeline_context.last_conversation_summary == "we argued"
+        assert pipeline_context.relationship_episodes == ["we went hiking"]
+        # Both searches reuse the single batched embedding call
+        memory.generate_embeddings_batch.assert_awaited_once()
+        embeddings = [c.kwargs["query_embedding"] for c in memory.search.call_args_list]
+        assert sorted(embeddings) == [[0.1], [0.2]]
+
+    @pytest.mark.asyncio
+    async def test_memory_timeout_falls_back_without_blocking_others(
+        self, mock_session, pipeline_context,
+    ):
+        import asyncio
+
+        async def hang(queries):
+            await asyncio.sleep(10)
+
+        memory = MagicMock()
+        memory.generate_embeddings_batch = hang
+        memory.search = AsyncMock(return_value=[])
+        pipeline_context.extracted_threads = [{"topic": "job"}]
+
+        with patch(_THOUGHT_REPO) as MockThoughtRepo, \
+             patch(_THREAD_REPO) as MockThreadRepo, \
+             patch(_CONV_REPO) as MockConvRepo, \
+             patch(_USER_REPO) as MockUserRepo, \
+             patch(_SUPABASE_MEMORY, return_value=memory), \
+             patch(_GET_SETTINGS, return_value=_make_settings_mock("sk-test")), \
+             patch("nikita.pipeline.stages.prompt_builder.MEMORY_EMBEDDING_TIMEOUT_SECONDS", 0.05):
+            MockThoughtRepo.return_value.get_active_thoughts_by_type = AsyncMock(return_value=_EMPTY_THOUGHTS)
+            MockThreadRepo.return_value.get_open_threads = AsyncMock(side_effect=Exception("DB gone"))
+            MockConvRepo.return_value = _make_conv_repo_mock()
+            MockUserRepo.return_value = _make_user_repo_mock()
+
+            await asyncio.wait_for(
+                PromptBuilderStage(session=mock_session)._enrich_context(pipeline_context), 1.0,
+            )
+
+        memory.search.assert_not_called()
+        assert pipeline_context.relationship_episodes == []
+        # Threads lookup failed: falls back to the current extraction
+        assert pipeline_context.open_threads == [{"topic": "job"}]
+
+    @pytest.mark.asyncio
+    async def test_slow_source_times_out_without_blocking_others(
+        self, mock_session, pipeline_context,
+    ):
+        import asyncio
+
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        pipeline_context.extracted_threads = [{"topic": "job"}]
+
+        with patch(_THOUGHT_REPO) as MockThoughtRepo, \
+             patch(_THREAD_REPO) as MockThreadRepo, \
+             patch(_CONV_REPO) as MockConvRepo, \
+             patch(_USER_REPO) as MockUserRepo, \
+             patch(_GET_SETTINGS, return_value=_make_settings_mock()), \
+             patch("nikita.pipeline.stages.prompt_builder.ENRICH_SOURCE_TIMEOUT_SECONDS", 0.05):
+            MockThoughtRepo.return_value.get_active_thoughts_by_type = AsyncMock(side_effect=hang)
+            MockThreadRepo.return_value.get_open_threads = AsyncMock(return_value=[])
+            MockConvRepo.return_value = _make_conv_repo_mock()
+            MockUserRepo.return_value = _make_user_repo_mock()
+
+            await asyncio.wait_for(
+                PromptBuilderStage(session=mock_session)._enrich_context(pipeline_context), 1.0,
+            )
+
+        assert pipeline_context.active_thoughts == []
+        assert pipeline_context.open_threads == [{"topic": "job"}]
@@ -0,0 +1,129 @@
+"""Tests for the per-run PipelineDataLoader."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from nikita.pipeline.models import PipelineContext
+
+_THOUGHT_REPO = "nikita.db.repositories.thought_repository.NikitaThoughtRepository"
+_CONV_REPO = "nikita.db.repositories.conversation_repository.ConversationRepository"
+_USER_REPO = "nikita.db.repositories.user_repository.UserRepository"
+
+
+def _ctx(**kwargs) -> PipelineContext:
+    return PipelineContext(
+        conversation_id=uuid4(),
+        user_id=uuid4(),
+        started_at=datetime.now(UTC),
+        platform="text",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+class TestPipelineDataLoader:
+    async def test_reuses_caller_loaded_user(self):
+        user = MagicMock()
+        ctx = _ctx(user=user)
+
+        with patch(_USER_REPO) as mock_user_repo:
+            assert await ctx.get_loader(AsyncMock()).user() is user
+
+        mock_user_repo.assert_not_called()
+
+    async def test_fetched_user_is_stored_on_ctx(self):
+        ctx = _ctx()
+        user = MagicMock()
+
+        with patch(_USER_REPO) as mock_user_repo:
+            mock_user_repo.return_value.get = AsyncMock(return_value=user)
+            loader = ctx.get_loader(AsyncMock())
+            await loader.user()
+            await loader.user()
+
+        assert ctx.user is user
+        mock_user_repo.return_value.get.assert_awaited_once()
+
+    async def test_concurrent_callers_share_one_query(self):
+        ctx = _ctx()
+
+        async def slow_summaries(**kwargs):
+            await asyncio.sleep(0.01)
+            return {"last_summary": "we argued"}
+
+        with patch(_CONV_REPO) as mock_conv_repo:
+            repo = mock_conv_repo.return_value
+            repo.get_conversation_summaries_for_prompt = AsyncMock(side_effect=slow_summaries)
+            loader = ctx.get_loader(AsyncMock())
+            results = await asyncio.gather(*(loader.summaries() for _ in range(3)))
+
+        assert all(r == {"last_summary": "we argued"} for r in results)
+        repo.get_conversation_summaries_for_prompt.assert_awaited_once()
+
+    async def test_summaries_use_own_session_without_lock(self):
+        """With a session maker, summaries don't queue behind shared-session reads."""
+        ctx = _ctx()
+        own_session = AsyncMock()
+        own_session.__aenter__.return_value = own_session
+        shared = AsyncMock()
+
+        with patch(_CONV_REPO) as mock_conv_repo:
+            mock_conv_repo.return_value.get_conversation_summaries_for_prompt = AsyncMock(
+                return_value={"last_summary": "we argued"},
+            )
+            loader = ctx.get_loader(shared, MagicMock(return_value=own_session))
+            async with loader.session_lock:
+                summaries = await asyncio.wait_for(loader.summaries(), 1.0)
+
+        assert summaries == {"last_summary": "we argued"}
+        mock_conv_repo.assert_called_once_with(own_session)
+
+    async def test_summary_and_prompt_builder_share_thought_query(self):
+        """SummaryStage's arcs and PromptBuilder's thoughts/openers: one query."""
+        from nikita.pipeline.stages.prompt_builder import PromptBuilderStage
+        from nikita.pipeline.stages.summary import SummaryStage
+
+        ctx = _ctx(extraction_summary="talked about work")
+        session = AsyncMock()
+        arc = MagicMock(content="career change arc")
+        opener = MagicMock(content="tell him about the gallery")
+
+        with patch(_THOUGHT_REPO) as mock_thought_repo, \
+             patch(_CONV_REPO) as mock_conv_repo, \
+             patch("nikita.db.repositories.thread_repository.ConversationThreadRepository") as mock_thread_repo, \
+             patch("nikita.config.settings.get_settings", return_value=MagicMock(openai_api_key=None)):
+            thought_repo = mock_thought_repo.return_value
+            thought_repo.get_active_thoughts_by_type = AsyncMock(return_value={
+                None: [arc, opener], "wants_to_share": [opener], "arc": [arc],
+            })
+            mock_conv_repo.return_value.get_conversation_summaries_for_prompt = AsyncMock(return_value={})
+            mock_thread_repo.return_value.get_open_threads = AsyncMock(return_value=[])
+
+            await SummaryStage(session=session)._run(ctx)
+            await PromptBuilderStage(session=session)._enrich_context(ctx)
+
+        thought_repo.get_active_thoughts_by_type.assert_awaited_once()
+        assert ctx.active_thoughts == ["career change arc", "tell him about the gallery"]
+        assert ctx.conversation_openers == ["tell him about the gallery"]
+
+    async def test_invalidate_and_failures_refetch(self):
+        ctx = _ctx()
+
+        with patch(_THOUGHT_REPO) as mock_thought_repo:
+            repo = mock_thought_repo.return_value
+            repo.get_active_thoughts_by_type = AsyncMock(
+                side_effect=[OSError("db blip"), {None: []}, {None: []}],
+            )
+            loader = ctx.get_loader(AsyncMock())
+            with pytest.raises(OSError):
+                await loader.thoughts()
+            await loader.thoughts()
+            await loader.thoughts()
+            loader.invalidate("thoughts")
+            await loader.thoughts()
+
+        assert repo.get_active_thoughts_by_type.await_count == 3
@@ -324,3 +324,122 @@ class TestPipelineOrchestratorRetry:
         assert result.success is False
         assert flaky.call_count == 1
         assert result.error_stage == "extraction"
+
+
+class DeclaredStage(FakeStage):
+    """Fake stage with ctx read/write declarations and an execution trace."""
+
+    def __init__(
+        self,
+        name: str,
+        reads: set[str],
+        writes: set[str],
+        trace: list[str],
+        uses_session: bool = False,
+        delay: float = 0.02,
+        success: bool = True,
+    ):
+        super().__init__(name=name, delay=delay, success=success)
+        self.reads = frozenset(reads)
+        self.writes = frozenset(writes)
+        self.uses_session = uses_session
+        self._trace = trace
+
+    async def execute(self, context: PipelineContext):
+        self._trace.append(f"start:{self.name}")
+        result = await super().execute(context)
+        self._trace.append(f"end:{self.name}")
+        return result
+
+
+@pytest.mark.asyncio
+class TestPipelineOrchestratorStageDag:
+    """Concurrent waves built from declared ctx reads/writes."""
+
+    async def test_default_stage_waves(self):
+        """Independent post-extraction stages share a wave; barriers stay alone."""
+        orch = PipelineOrchestrator(session=MagicMock())
+        waves = [[n for n, _, _ in w] for w in orch._build_waves(orch._get_stages())]
+
+        assert waves[0] == ["extraction"]
+        assert waves[-1] == ["prompt_builder"]
+        flat = [n for w in waves for n in w]
+        assert flat.index("persistence") < flat.index("memory_update")
+        life_sim_wave = next(w for w in waves if "life_sim" in w)
+        assert {"vice", "game_state"} <= set(life_sim_wave)
+        assert flat.index("life_sim") < flat.index("emotional") < flat.index("conflict")
+
+    async def test_independent_stages_overlap(self):
+        trace: list[str] = []
+        stages = [
+            ("a", DeclaredStage("a", set(), {"life_events"}, trace), False),
+            ("b", DeclaredStage("b", set(), {"score_delta"}, trace), False),
+        ]
+        orch = _make_orchestrator(stages)
+        result = await orch.process(uuid4(), uuid4())
+
+        assert result.success is True
+        assert trace[:2] == ["start:a", "start:b"]
+
+    async def test_dependent_stage_waits_for_writer(self):
+        trace: list[str] = []
+        stages = [
+            ("writer", DeclaredStage("writer", set(), {"life_events"}, trace), False),
+            ("reader", DeclaredStage("reader", {"life_events"}, {"touchpoint_scheduled"}, trace), False),
+        ]
+        orch = _make_orchestrator(stages)
+        await orch.process(uuid4(), uuid4())
+
+        assert trace == ["start:writer", "end:writer", "start:reader", "end:reader"]
+
+    async def test_session_stages_serialized(self):
+        """Stages sharing the pipeline session never hold savepoints concurrently."""
+        trace: list[str] = []
+        stages = [
+            ("a", DeclaredStage("a", set(), {"life_events"}, trace, uses_session=True), False),
+            ("b", DeclaredStage("b", set(), {"score_delta"}, trace, uses_session=True), False),
+        ]
+        orch = _make_orchestrator(stages)
+        await orch.process(uuid4(), uuid4())
+
+        assert trace == ["start:a", "end:a", "start:b", "end:b"]
+
+    async def test_session_stages_stay_in_caller_transaction(self):
+        """Stage writes go through savepoints; only the caller commits."""
+        trace: list[str] = []
+        stages = [
+            ("a", DeclaredStage("a", set(), {"life_events"}, trace, uses_session=True), False),
+            ("b", DeclaredStage("b", set(), {"score_delta"}, trace, uses_session=True), False),
+        ]
+        orch = _make_orchestrator(stages)
+        session = orch._session
+        await orch.process(uuid4(), uuid4())
+
+        assert session.begin_nested.call_count == 2
+        session.commit.assert_not_called()
+
+    async def test_critical_stage_is_barrier(self):
+        trace: list[str] = []
+        stages = [
+            ("crit", DeclaredStage("crit", set(), {"facts_stored"}, trace, success=False), True),
+            ("after", DeclaredStage("after", set(), {"life_events"}, trace), False),
+        ]
+        orch = _make_orchestrator(stages)
+        result = await orch.process(uuid4(), uuid4())
+
+        assert result.success is False
+        assert result.error_stage == "crit"
+        assert "start:after" not in trace
+
+    async def test_concurrent_non_critical_failure_recorded(self):
+        trace: list[str] = []
+        stages = [
+            ("ok", DeclaredStage("ok", set(), {"life_events"}, trace), False),
+            ("bad", DeclaredStage("bad", set(), {"score_delta"}, trace, success=False), False),
+        ]
+        orch = _make_orchestrator(stages)
+        result = await orch.process(uuid4(), uuid4())
+
+        assert result.success is True
+        assert "bad" in result.context.stage_errors
+        assert "ok" in result.context.stage_timings
@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from nikita.pipeline.models import PipelineContext, PipelineResult
 from nikita.pipeline.orchestrator import PipelineOrchestrator
+from nikita.pipeline.templates import RenderedSection
 
 def _make_conversation(messages=None):
     if messages is None:
@@ -69,6 +70,9 @@ def _mock_session():
     ))
     return session
 
+def _bulk_result(facts, **kwargs):
+    return {"stored": len(facts), "superseded": 0, "deduplicated": 0}
+
 MOCK_EXTRACTION = SimpleNamespace(data=SimpleNamespace(
     facts=["User went hiking in Alps near Zermatt", "User has friend named Jake",
            "User works at DataFlow", "User distant due to work stress",
@@ -124,7 +128,7 @@ class TestBug003Fix:
         stage = MemoryUpdateStage(session=_mock_session())
         with patch("nikita.memory.supabase_memory.SupabaseMemory") as MM, \
              patch("nikita.config.settings.get_settings") as ms:
-            m = AsyncMock(); m.find_similar = AsyncMock(return_value=[]); m.add_fact = AsyncMock()
+            m = AsyncMock(); m.add_facts_bulk = AsyncMock(side_effect=_bulk_result)
             MM.return_value = m; ms.return_value = SimpleNamespace(openai_api_key="t")
             await stage._run(ctx)
         assert ctx.facts_stored == 3
@@ -137,7 +141,7 @@ class TestBug003Fix:
         stage = MemoryUpdateStage(session=_mock_session())
         with patch("nikita.memory.supabase_memory.SupabaseMemory") as MM, \
              patch("nikita.config.settings.get_settings") as ms:
-            m = AsyncMock(); m.find_similar = AsyncMock(return_value=[]); m.add_fact = AsyncMock()
+            m = AsyncMock(); m.add_facts_bulk = AsyncMock(side_effect=_bulk_result)
             MM.return_value = m; ms.return_value = SimpleNamespace(openai_api_key="t")
             await stage._run(ctx)
         assert ctx.facts_stored == 1
@@ -206,14 +210,14 @@ class TestFullPipeline:
              patch("nikita.config.settings.get_settings") as ms, \
              patch("nikita.pipeline.stages.life_sim.LifeSimulator", create=True), \
              patch("nikita.pipeline.stages.touchpoint.TouchpointEngine", create=True), \
-             patch("nikita.pipeline.stages.prompt_builder.PromptBuilderStage._render_template") as mrt, \
+             patch("nikita.pipeline.stages.prompt_builder.PromptBuilderStage._render_prompts") as mrt, \
              patch("nikita.pipeline.stages.prompt_builder.PromptBuilderStage._enrich_with_haiku") as mh, \
-             patch("nikita.pipeline.stages.prompt_builder.PromptBuilderStage._store_prompt") as msp, \
+             patch("nikita.pipeline.stages.prompt_builder.PromptBuilderStage._store_prompts") as msp, \
              patch("nikita.pipeline.stages.prompt_builder.PromptBuilderStage._count_tokens") as mct:
             MA.return_value = AsyncMock(run=AsyncMock(return_value=MOCK_EXTRACTION))
-            m = AsyncMock(); m.find_similar = AsyncMock(return_value=[]); m.add_fact = AsyncMock()
+            m = AsyncMock(); m.add_facts_bulk = AsyncMock(side_effect=_bulk_result)
             MM.return_value = m; ms.return_value = SimpleNamespace(openai_api_key="t")
-            mrt.return_value = prompt; mh.return_value = None; msp.return_value = None; mct.return_value = 800
+            mrt.return_value = {p: [RenderedSection("identity", prompt, 800)] for p in ("text", "voice")}; mh.return_value = None; msp.return_value = None; mct.return_value = 800
             result = await orch.process(
                 conversation_id=conv.id, user_id=user.id,
                 platform="text", conversation=conv, user=user,
@@ -4,13 +4,15 @@ Acceptance Criteria:
 - AC-3.3.1: Loads Jinja2 template, renders with PipelineContext data
 - AC-3.3.2: Calls Claude Haiku for narrative enrichment (optional)
 - AC-3.3.3: Falls back to raw Jinja2 output if Haiku fails
-- AC-3.3.4: Stores result in ready_prompts via ReadyPromptRepository.set_current()
+- AC-3.3.4: Stores results in ready_prompts via ReadyPromptRepository.set_current_many()
 - AC-3.3.5: Generates BOTH text and voice prompts in one pass
 - AC-3.4.1: Text prompt post-enrichment: 5,500-6,500 tokens (warn if outside range)
 - AC-3.4.2: Voice prompt post-enrichment: 1,800-2,200 tokens (warn if outside range)
 - AC-3.4.3: If over budget, truncate lower-priority sections
 """
 
+import asyncio
+import time
 from decimal import Decimal
 from datetime import datetime, timezone
 from uuid import uuid4
@@ -20,6 +22,7 @@ import pytest
 
 from nikita.pipeline.models import PipelineContext
 from nikita.pipeline.stages.prompt_builder import PromptBuilderStage
+from nikita.pipeline.templates import RenderedSection
 
 
 def _make_context(**overrides) -> PipelineContext:
@@ -143,9 +146,14 @@ class TestPromptBuilderStage:
         core = "## 1. IDENTITY\n" + ("Nikita is your girlfriend. " * 500)
         vice = "\n## 11. VICE SHAPING\n" + ("vice content " * 3000)
         chapter = "\n## 10. CHAPTER BEHAVIOR\n" + ("chapter content " * 3000)
-        huge_prompt = core + chapter + vice
-
-        with patch.object(stage, "_render_template", return_value=huge_prompt):
+        sections = [
+            RenderedSection(name, text, stage._count_tokens(text))
+            for name, text in [("identity", core), ("chapter_behavior", chapter), ("vice_shaping", vice)]
+        ]
+
+        with patch.object(
+            stage, "_render_prompts", return_value={"text": sections, "voice": sections}
+        ):
             result = await stage._run(ctx)
 
         # Should have truncated text prompt to within budget
@@ -156,26 +164,28 @@ class TestPromptBuilderStage:
         assert "## 11. VICE SHAPING" not in ctx.generated_prompt
 
     async def test_ac_3_3_4_stores_in_ready_prompts(self):
-        """AC-3.3.4: Stores result in ready_prompts via ReadyPromptRepository.set_current()."""
+        """AC-3.3.4: Stores results in ready_prompts via ReadyPromptRepository.set_current_many()."""
         ctx = _make_context()
         mock_session = MagicMock()
         mock_repo = AsyncMock()
 
         stage = PromptBuilderStage(session=mock_session)
 
-        # Patch the import path where it's used (inside _store_prompt method)
+        # Patch the import path where it's used (inside _store_prompts method)
         with patch("nikita.db.repositories.ready_prompt_repository.ReadyPromptRepository", return_value=mock_repo):
             await stage._run(ctx)
 
-        # Should have called set_current for both text and voice
-        assert mock_repo.set_current.call_count == 2
+        # One batched write for both text and voice
+        mock_repo.set_current_many.assert_awaited_once()
+        stored = mock_repo.set_current_many.call_args.kwargs["prompts"]
+        assert [p["platform"] for p in stored] == ["text", "voice"]
 
     async def test_graceful_failure_on_template_error(self):
         """Stage handles template render failures gracefully."""
         ctx = _make_context()
         stage = PromptBuilderStage(session=None)
 
-        with patch.object(stage, "_render_template", side_effect=Exception("Template error")):
+        with patch.object(stage, "_render_prompts", side_effect=Exception("Template error")):
             result = await stage._run(ctx)
 
         # Should fail gracefully
@@ -257,6 +267,22 @@ class TestPromptBuilderStage:
         assert "AUDIO TAGS" in voice_vars["available_audio_tags"].upper() or \
                "[chuckles]" in voice_vars["available_audio_tags"]
 
+    async def test_truncate_drops_whole_sections_by_priority(self):
+        """AC-3.4.3: rendered sections are dropped whole, using their token counts."""
+        stage = PromptBuilderStage(session=None)
+        sections = [
+            RenderedSection("identity", "core\n", 400),
+            RenderedSection("psychological_depth", "psych\n", 300),
+            RenderedSection("chapter_behavior", "chapter\n", 300),
+            RenderedSection("vice_shaping", "vices\n", 300),
+            RenderedSection("footer", "footer", 100),
+        ]
+
+        result = stage._truncate_prompt(sections, target_tokens=850)
+
+        # Vice and chapter go; the footer after them is kept
+        assert result == "core\npsych\nfooter"
+
     async def test_remove_section_handles_missing_section(self):
         """_remove_section handles missing marker gracefully."""
         stage = PromptBuilderStage(session=None)
@@ -472,7 +498,7 @@ class TestPromptStorage:
     """Tests for prompt storage (AC-3.5.3)."""
 
     async def test_prompts_stored_via_repository(self):
-        """Both text and voice prompts stored via ReadyPromptRepository.set_current()."""
+        """Both text and voice prompts stored via ReadyPromptRepository.set_current_many()."""
         ctx = _make_context()
         mock_session = MagicMock()
         stage = PromptBuilderStage(session=mock_session)
@@ -482,8 +508,9 @@ class TestPromptStorage:
         with patch("nikita.db.repositories.ready_prompt_repository.ReadyPromptRepository", return_value=mock_repo):
             await stage._run(ctx)
 
-        # Should have called set_current for both text and voice
-        assert mock_repo.set_current.call_count == 2
+        # Should have stored both text and voice in one call
+        mock_repo.set_current_many.assert_awaited_once()
+        assert len(mock_repo.set_current_many.call_args.kwargs["prompts"]) == 2
 
     async def test_is_current_flag_set(self):
         """Stored prompts have is_current=True flag."""
@@ -496,8 +523,8 @@ class TestPromptStorage:
         with patch("nikita.db.repositories.ready_prompt_repository.ReadyPromptRepository", return_value=mock_repo):
             await stage._run(ctx)
 
-        # Check set_current was called (is_current flag is set by the repository method)
-        assert mock_repo.set_current.called
+        # Check set_current_many was called (is_current flag is set by the repository method)
+        assert mock_repo.set_current_many.called
 
     async def test_storage_includes_context_snapshot(self):
         """Stored prompts include context_snapshot with key metadata."""
@@ -517,7 +544,8 @@ class TestPromptStorage:
             await stage._run(ctx)
 
         # Check context_snapshot was passed
-        calls = mock_repo.set_current.call_args_list
+        calls = mock_repo.set_current_many.call_args_list
+        assert calls
         for call in calls:
             snapshot = call[1].get("context_snapshot")
             assert snapshot is not None
@@ -641,7 +669,7 @@ class TestEnrichContextMemoryBug:
         rel_fact_dict = {"fact": "we went hiking", "fact_type": "relationship", "id": "abc"}
         nikita_fact_dict = {"fact": "nikita went to yoga", "fact_type": "nikita", "id": "def"}
 
-        async def mock_search(query, graph_types=None, limit=10):
+        async def mock_search(query, graph_types=None, limit=10, query_embedding=None):
             if graph_types == ["relationship"]:
                 return [rel_fact_dict]
             if graph_types == ["nikita"]:
@@ -763,3 +791,59 @@ class TestEnrichContextMemoryBug:
         assert "climbing" in rendered, "hobbies_full_list should appear in rendered prompt"
         assert "vintage synthesizers" in rendered, "geek_out_on should appear in rendered prompt"
         assert "farmers market" in rendered, "saturday_morning should appear in rendered prompt"
+
+
+# ── Shared render + concurrent platform generation ───────────────────────────
+
+
+@pytest.mark.asyncio
+class TestSharedRender:
+    """Both platforms come from one set of template vars and one shared render."""
+
+    async def test_sections_match_full_render(self):
+        """Concatenated per-platform sections equal a full render of the template."""
+        from nikita.pipeline.templates import render_template
+
+        ctx = _make_context(chapter=3, vices=["dark_humor", "risk_taking"])
+        stage = PromptBuilderStage(session=None)
+
+        prompts = stage._render_prompts(ctx)
+
+        for platform in ("text", "voice"):
+            full = render_template("system_prompt.j2", **stage._build_template_vars(ctx, platform))
+            assert "".join(section.text for section in prompts[platform]) == full
+        assert prompts["text"] != prompts["voice"]
+
+    async def test_platform_independent_sections_render_once(self):
+        from nikita.pipeline import templates
+        from nikita.pipeline.stages.prompt_builder import PLATFORM_TEMPLATE_VARS
+
+        ctx = _make_context()
+        stage = PromptBuilderStage(session=None)
+        sections = templates.template_sections("system_prompt.j2")
+
+        with patch.object(templates, "render_sections", wraps=templates.render_sections) as spy:
+            stage._render_prompts(ctx)
+
+        rendered = [name for call in spy.call_args_list for name in call.args[2]]
+        for section in sections:
+            per_platform = bool(section.variables & PLATFORM_TEMPLATE_VARS)
+            assert rendered.count(section.name) == (2 if per_platform else 1)
+        assert {"identity", "vice_shaping"} <= {s.name for s in sections if not s.variables & PLATFORM_TEMPLATE_VARS}
+
+    async def test_haiku_enrichment_runs_concurrently(self):
+        ctx = _make_context()
+        stage = PromptBuilderStage(session=None)
+
+        async def slow_enrich(raw, platform):
+            await asyncio.sleep(0.1)
+            return None
+
+        with patch.object(stage, "_enrich_with_haiku", side_effect=slow_enrich), \
+             patch.object(stage, "_count_tokens", side_effect=lambda text: len(text) // 4):
+            start = time.perf_counter()
+            result = await stage._run(ctx)
+            elapsed = time.perf_counter() - start
+
+        assert result["text_generated"] and result["voice_generated"]
+        assert elapsed < 0.18
@@ -0,0 +1,202 @@
+"""Tests for the persisted pipeline stage output cache.
+
+A retried pipeline replays cached outputs of cacheable stages and only
+re-executes the rest.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from nikita.pipeline.models import PipelineContext
+from nikita.pipeline.orchestrator import PipelineOrchestrator
+from nikita.pipeline.stage_cache import StageCache
+from nikita.pipeline.stages.base import BaseStage
+
+
+class CountingExtraction(BaseStage):
+    name = "extraction"
+    is_critical = True
+    reads = frozenset({"conversation"})
+    writes = frozenset({"extracted_facts", "extraction_summary"})
+    cache_version = 1
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.runs = 0
+
+    async def _run(self, ctx: PipelineContext) -> dict | None:
+        self.runs += 1
+        ctx.extracted_facts = ["likes jazz"]
+        ctx.extraction_summary = "talked about jazz"
+        return None
+
+
+class FlakyMemoryUpdate(BaseStage):
+    name = "memory_update"
+    is_critical = True
+    reads = frozenset({"extracted_facts"})
+    writes = frozenset({"facts_stored"})
+
+    def __init__(self, fail: bool, **kwargs):
+        super().__init__(**kwargs)
+        self.fail = fail
+        self.seen_facts: list | None = None
+
+    async def _run(self, ctx: PipelineContext) -> dict | None:
+        self.seen_facts = list(ctx.extracted_facts)
+        if self.fail:
+            raise RuntimeError("embedding outage")
+        ctx.facts_stored = len(ctx.extracted_facts)
+        return None
+
+
+class InMemoryCacheRepository:
+    """Stands in for PipelineStageCacheRepository; rows survive across runs."""
+
+    rows: dict = {}
+
+    def __init__(self, session):
+        pass
+
+    async def get_for_conversation(self, conversation_id, stage_names):
+        return {
+            name: row
+            for (conv, name), row in self.rows.items()
+            if conv == conversation_id and name in stage_names
+        }
+
+    async def upsert(self, conversation_id, stage_name, stage_version, input_hash, output):
+        self.rows[(conversation_id, stage_name)] = SimpleNamespace(
+            stage_version=stage_version, input_hash=input_hash, output=output,
+        )
+
+
+def _session_maker():
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=AsyncMock())
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=ctx)
+
+
+@pytest.fixture
+def cache_repo():
+    InMemoryCacheRepository.rows = {}
+    with (
+        patch(
+            "nikita.db.repositories.pipeline_stage_cache_repository.PipelineStageCacheRepository",
+            InMemoryCacheRepository,
+        ),
+        patch("nikita.db.database.get_session_maker", return_value=_session_maker()),
+    ):
+        yield InMemoryCacheRepository
+
+
+def _orchestrator(extraction, memory_update) -> PipelineOrchestrator:
+    session = MagicMock()
+    session.begin_nested = MagicMock(return_value=AsyncMock())
+    return PipelineOrchestrator(
+        session=session,
+        stages=[
+            ("extraction", extraction, True),
+            ("memory_update", memory_update, True),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+class TestStageCacheRetry:
+    async def test_retry_reuses_extraction_after_later_failure(self, cache_repo):
+        """memory_update fails -> retry replays extraction, reruns memory_update."""
+        conv_id, user_id = uuid4(), uuid4()
+        conversation = SimpleNamespace(messages=[{"role": "user", "content": "jazz?"}])
+        extraction = CountingExtraction()
+
+        first = await _orchestrator(extraction, FlakyMemoryUpdate(fail=True)).process(
+            conv_id, user_id, conversation=conversation,
+        )
+        assert not first.success
+        assert first.error_stage == "memory_update"
+
+        memory_update = FlakyMemoryUpdate(fail=False)
+        second = await _orchestrator(extraction, memory_update).process(
+            conv_id, user_id, conversation=conversation,
+        )
+
+        assert second.success
+        assert extraction.runs == 1
+        assert memory_update.seen_facts == ["likes jazz"]
+        assert second.context.extraction_summary == "talked about jazz"
+        assert second.context.stage_results["extraction"]["cached"] is True
+
+    async def test_changed_messages_miss_cache(self, cache_repo):
+        """New messages change the input hash, so extraction runs again."""
+        conv_id, user_id = uuid4(), uuid4()
+        extraction = CountingExtraction()
+        conversation = SimpleNamespace(messages=[{"role": "user", "content": "hi"}])
+
+        await _orchestrator(extraction, FlakyMemoryUpdate(fail=False)).process(
+            conv_id, user_id, conversation=conversation,
+        )
+        conversation.messages.append({"role": "nikita", "content": "hey"})
+        await _orchestrator(extraction, FlakyMemoryUpdate(fail=False)).process(
+            conv_id, user_id, conversation=conversation,
+        )
+
+        assert extraction.runs == 2
+
+    async def test_version_bump_misses_cache(self, cache_repo):
+        """Bumping cache_version invalidates stored outputs."""
+        conv_id, user_id = uuid4(), uuid4()
+        conversation = SimpleNamespace(messages=[{"role": "user", "content": "hi"}])
+        extraction = CountingExtraction()
+
+        await _orchestrator(extraction, FlakyMemoryUpdate(fail=False)).process(
+            conv_id, user_id, conversation=conversation,
+        )
+        extraction.cache_version = 2
+        await _orchestrator(extraction, FlakyMemoryUpdate(fail=False)).process(
+            conv_id, user_id, conversation=conversation,
+        )
+
+        assert extraction.runs == 2
+
+    async def test_disabled_by_setting(self, cache_repo):
+        """PIPELINE_STAGE_CACHE_ENABLED=false runs every stage."""
+        conv_id, user_id = uuid4(), uuid4()
+        conversation = SimpleNamespace(messages=[{"role": "user", "content": "hi"}])
+        extraction = CountingExtraction()
+        settings = MagicMock(pipeline_stage_cache_enabled=False, psyche_agent_enabled=False)
+
+        with patch("nikita.pipeline.orchestrator.get_settings", return_value=settings):
+            for _ in range(2):
+                await _orchestrator(extraction, FlakyMemoryUpdate(fail=False)).process(
+                    conv_id, user_id, conversation=conversation,
+                )
+
+        assert extraction.runs == 2
+        assert cache_repo.rows == {}
+
+
+class TestStageCacheInputHash:
+    def test_hash_covers_non_conversation_reads(self):
+        """A stage's other ctx reads are part of its cache key."""
+        cache = StageCache(uuid4(), [{"content": "hi"}], MagicMock())
+        stage = FlakyMemoryUpdate(fail=False)
+        ctx = PipelineContext(
+            conversation_id=uuid4(),
+            user_id=uuid4(),
+            started_at=datetime.now(UTC),
+            platform="text",
+        )
+
+        ctx.extracted_facts = ["a"]
+        before = cache.input_hash(stage, ctx)
+        ctx.extracted_facts = ["b"]
+
+        assert cache.input_hash(stage, ctx) != before
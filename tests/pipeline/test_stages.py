@@ -105,7 +105,9 @@ class TestMemoryUpdateStage:
         ]
         stage = MemoryUpdateStage(session=_mock_session())
         mm = AsyncMock()
-        mm.add_fact = AsyncMock()
+        mm.add_facts_bulk = AsyncMock(
+            return_value={"stored": 2, "superseded": 0, "deduplicated": 0}
+        )
         ms = MagicMock()
         ms.openai_api_key = "test-key"
         with (
@@ -115,21 +117,29 @@ class TestMemoryUpdateStage:
             result = await stage._run(ctx)
         assert result["stored"] == 2
         assert ctx.facts_stored == 2
-        # add_fact called for every fact — dedup is SupabaseMemory's concern (MP-001)
-        assert mm.add_fact.call_count == 2
+        # All facts go to SupabaseMemory in one call — dedup is its concern (MP-001)
+        mm.add_facts_bulk.assert_awaited_once()
+        facts = mm.add_facts_bulk.call_args.args[0]
+        assert facts == [
+            {"fact": "User likes pizza", "graph_type": "user"},
+            {"fact": "User works at Google", "graph_type": "user"},
+        ]
+        assert mm.add_facts_bulk.call_args.kwargs["source"] == "pipeline_extraction"
 
-    async def test_memory_update_delegates_dedup_to_add_fact(self):
-        """MP-001: Stage no longer calls find_similar; dedup is inside add_fact (Spec 102 FR-001).
+    async def test_memory_update_delegates_dedup_to_memory(self):
+        """MP-001: Stage does not call find_similar; dedup is inside add_facts_bulk.
 
-        Both facts are passed to add_fact — SupabaseMemory handles dedup
-        internally with a single embedding, avoiding double OpenAI billing.
+        Both facts are forwarded — SupabaseMemory dedups them against each
+        other and existing facts with a single batched embedding call.
         """
         from nikita.pipeline.stages.memory_update import MemoryUpdateStage
         ctx = _make_context()
         ctx.extracted_facts = [{"content": "User likes pizza"}, {"content": "User likes pizza a lot"}]
         stage = MemoryUpdateStage(session=_mock_session())
         mm = AsyncMock()
-        mm.add_fact = AsyncMock()
+        mm.add_facts_bulk = AsyncMock(
+            return_value={"stored": 1, "superseded": 0, "deduplicated": 1}
+        )
         ms = MagicMock()
         ms.openai_api_key = "test-key"
         with (
@@ -137,9 +147,9 @@ class TestMemoryUpdateStage:
             patch("nikita.config.settings.get_settings", return_value=ms),
         ):
             result = await stage._run(ctx)
-        # Both facts forwarded; dedup handled inside add_fact, not the stage
-        assert mm.add_fact.call_count == 2
-        assert result["stored"] == 2
+        assert len(mm.add_facts_bulk.call_args.args[0]) == 2
+        mm.find_similar.assert_not_called()
+        assert result == {"stored": 1, "deduplicated": 1}
 
     async def test_memory_update_no_facts_skips(self):
         from nikita.pipeline.stages.memory_update import MemoryUpdateStage
@@ -149,13 +159,13 @@ class TestMemoryUpdateStage:
         result = await stage._run(ctx)
         assert result["stored"] == 0
 
-    async def test_memory_update_fact_error_continues(self):
+    async def test_memory_update_store_error_logged(self):
         from nikita.pipeline.stages.memory_update import MemoryUpdateStage
         ctx = _make_context()
         ctx.extracted_facts = [{"content": "fact1"}, {"content": "fact2"}]
         stage = MemoryUpdateStage(session=_mock_session())
         mm = AsyncMock()
-        mm.add_fact = AsyncMock(side_effect=[RuntimeError("DB error"), None])
+        mm.add_facts_bulk = AsyncMock(side_effect=RuntimeError("DB error"))
         ms = MagicMock()
         ms.openai_api_key = "test-key"
         with (
@@ -163,7 +173,8 @@ class TestMemoryUpdateStage:
             patch("nikita.config.settings.get_settings", return_value=ms),
         ):
             result = await stage._run(ctx)
-        assert result["stored"] == 1
+        assert result["stored"] == 0
+        assert ctx.facts_stored == 0
 
     async def test_classify_graph_type_nikita(self):
         from nikita.pipeline.stages.memory_update import MemoryUpdateStage
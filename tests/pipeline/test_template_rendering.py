@@ -401,3 +401,63 @@ class TestTemplatePlatformConsistency:
 
         assert "You are Nikita Volkov" in text
         assert "You are Nikita Volkov" in voice
+
+
+class TestSectionRendering:
+    """system_prompt.j2 rendered section by section, with the section cache."""
+
+    VARS = {"platform": "text", "chapter": 2, "vices": ["dark_humor"], "relationship_score": 60.0}
+
+    def test_sections_concatenate_to_full_render(self):
+        from nikita.pipeline.templates import render_sections
+
+        sections = render_sections("system_prompt.j2", self.VARS, cache=None)
+
+        assert "".join(s.text for s in sections.values()) == render_template("system_prompt.j2", **self.VARS)
+
+    def test_section_dependencies(self):
+        from nikita.pipeline.templates import template_sections
+
+        deps = {s.name: s.variables for s in template_sections("system_prompt.j2")}
+
+        assert deps["identity"] == frozenset()
+        assert deps["vice_shaping"] == {"vices"}
+        assert deps["chapter_behavior"] == {"chapter"}
+        # {% set %} locals are not inputs
+        assert "fact_limit" not in deps["memory"]
+
+    def test_only_sections_with_changed_inputs_rerender(self):
+        from nikita.pipeline.templates import SectionCache, render_sections, template_sections
+
+        cache = SectionCache()
+        counted = []
+
+        def count(text):
+            counted.append(text)
+            return len(text) // 4
+
+        first = render_sections("system_prompt.j2", self.VARS, count_tokens=count, cache=cache)
+        counted.clear()
+        second = render_sections(
+            "system_prompt.j2", {**self.VARS, "vices": ["risk_taking"]}, count_tokens=count, cache=cache,
+        )
+
+        assert counted == [second["vice_shaping"].text]
+        assert second["vice_shaping"].text != first["vice_shaping"].text
+        assert second["identity"] == first["identity"]
+        assert cache.misses == len(template_sections("system_prompt.j2")) + 1
+
+    def test_object_inputs_are_not_cached(self):
+        from types import SimpleNamespace
+
+        from nikita.pipeline.templates import SectionCache, render_sections
+
+        cache = SectionCache()
+        user = SimpleNamespace(profile=SimpleNamespace(name="Anna", age=None, occupation=None,
+                                                       location_city=None, primary_interest=None))
+        render_sections("system_prompt.j2", {**self.VARS, "user": user}, ["memory"], cache=cache)
+        user.profile.name = "Maria"
+        rendered = render_sections("system_prompt.j2", {**self.VARS, "user": user}, ["memory"], cache=cache)
+
+        assert "Maria" in rendered["memory"].text
+        assert len(cache) == 0
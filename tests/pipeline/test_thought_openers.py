@@ -34,6 +34,7 @@ async def test_get_active_openers_returns_max_3():
 @pytest.mark.asyncio
 async def test_openers_populated_in_context():
     """PromptBuilderStage._enrich_context populates ctx.conversation_openers."""
+    from nikita.pipeline.loader import PipelineDataLoader
     from nikita.pipeline.stages.prompt_builder import PromptBuilderStage
 
     mock_session = AsyncMock()
@@ -51,6 +52,7 @@ async def test_openers_populated_in_context():
     ctx.active_thoughts = []
     ctx.open_threads = []
     ctx.conversation_openers = []
+    ctx.get_loader = lambda session: PipelineDataLoader(session, ctx)
 
     openers = ["I want to tell him about my dream", "Ask about his weekend"]
 
@@ -74,8 +76,11 @@ async def test_openers_populated_in_context():
 
         # Setup thought repo to return openers
         mock_thought_instance = MockThoughtRepo.return_value
-        mock_thought_instance.get_active_thoughts = AsyncMock(return_value=[])
-        mock_thought_instance.get_active_openers = AsyncMock(return_value=openers)
+        mock_thought_instance.get_active_thoughts_by_type = AsyncMock(return_value={
+            None: [],
+            "wants_to_share": [MagicMock(content=text) for text in openers],
+            "arc": [],
+        })
 
         MockConvRepo.return_value.get_conversation_summaries_for_prompt = AsyncMock(return_value={})
         MockUserRepo.return_value.get = AsyncMock(return_value=None)
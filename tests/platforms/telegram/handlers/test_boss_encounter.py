@@ -247,6 +247,38 @@ class TestHandleSingleTurnBoss:
         sent_text = mock_bot.send_message.call_args.kwargs["text"]
         assert "love you" in sent_text.lower() or "you're the one" in sent_text.lower()
 
+    @pytest.mark.asyncio
+    async def test_judges_with_recent_history_only(
+        self, handler, mock_conversation_repo, mock_boss_judgment, mock_boss_state_machine, mock_user
+    ):
+        """History comes from the last 10 stored messages, not the full transcript."""
+        conversation = MagicMock(id="conv-1")
+        mock_conversation_repo.get_active_conversation.return_value = conversation
+        mock_conversation_repo.get_recent_messages = AsyncMock(return_value=[
+            {"role": "user", "content": "hi"},
+            {"role": "nikita", "content": "prove it"},
+        ])
+        mock_boss_judgment.judge_boss_outcome.return_value = MagicMock(
+            outcome="PASS", reasoning="ok"
+        )
+        mock_boss_state_machine.process_outcome.return_value = {"passed": True, "new_chapter": 2}
+
+        with patch(
+            "nikita.engine.chapters.prompts.get_boss_prompt",
+            return_value={"in_character_opening": "Q?", "success_criteria": "S"},
+        ), patch("asyncio.sleep", new_callable=AsyncMock):
+            await handler.handle_single_turn_boss(mock_user, "answer", chat_id=111)
+
+        mock_conversation_repo.get_active_conversation.assert_awaited_once_with(
+            mock_user.id, load_messages=False
+        )
+        mock_conversation_repo.get_recent_messages.assert_awaited_once_with("conv-1", limit=10)
+        history = mock_boss_judgment.judge_boss_outcome.call_args.kwargs["conversation_history"]
+        assert history == [
+            {"role": "user", "content": "hi"},
+            {"role": "nikita", "content": "prove it"},
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Outcome delivery helpers
@@ -64,6 +64,7 @@ def mock_conversation_repository():
     repo.get_active_conversation = AsyncMock()
     repo.create_conversation = AsyncMock()
     repo.append_message = AsyncMock()
+    repo.get_recent_messages = AsyncMock(return_value=[])
     # Mock session.refresh for conversation refresh after agent response
     mock_session = MagicMock()
     mock_session.refresh = AsyncMock()
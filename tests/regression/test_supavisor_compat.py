@@ -78,3 +78,11 @@ class TestSupavisorCompatibility:
             "in async background-task contexts (Walk M 2026-04-19, GH #359)."
         )
         assert cargs["server_settings"].get("statement_timeout") == "30000"
+
+    def test_connect_args_has_hnsw_search_settings(self):
+        """pgvector HNSW search settings ride along in server_settings."""
+        from nikita.db.database import _build_connect_args
+        from nikita.config.settings import Settings
+        cargs = _build_connect_args(Settings(_env_file=None))
+        assert cargs["server_settings"]["hnsw.ef_search"] == "100"
+        assert cargs["server_settings"]["hnsw.iterative_scan"] == "relaxed_order"
@@ -0,0 +1,57 @@
+"""Tests for scripts/backfill_compact_embeddings.py.
+
+ORM-mock unit tests only — no live DB.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _session_maker(sessions):
+    maker = MagicMock()
+    contexts = []
+    for session in sessions:
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=session)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        contexts.append(ctx)
+    maker.side_effect = contexts
+    return maker
+
+
+@pytest.mark.asyncio
+async def test_runs_batches_until_nothing_left_committing_each():
+    from scripts import backfill_compact_embeddings as backfill
+
+    sessions = [MagicMock(commit=AsyncMock()) for _ in range(3)]
+    repo = MagicMock()
+    repo.backfill_compact_embeddings = AsyncMock(side_effect=[500, 120, 0])
+
+    with patch.object(backfill, "get_session_maker", return_value=_session_maker(sessions)), \
+         patch.object(backfill, "MemoryFactRepository", return_value=repo):
+        summary = await backfill.run(batch_size=500)
+
+    assert summary["batches"] == 2
+    assert summary["updated"] == 620
+    repo.backfill_compact_embeddings.assert_awaited_with(batch_size=500)
+    for session in sessions:
+        session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_max_batches_stops_early():
+    from scripts import backfill_compact_embeddings as backfill
+
+    sessions = [MagicMock(commit=AsyncMock()) for _ in range(2)]
+    repo = MagicMock()
+    repo.backfill_compact_embeddings = AsyncMock(return_value=100)
+
+    with patch.object(backfill, "get_session_maker", return_value=_session_maker(sessions)), \
+         patch.object(backfill, "MemoryFactRepository", return_value=repo):
+        summary = await backfill.run(batch_size=100, max_batches=2)
+
+    assert summary == {"batches": 2, "updated": 200, "seconds": summary["seconds"]}
+    assert repo.backfill_compact_embeddings.await_count == 2
@@ -0,0 +1,41 @@
+"""Tests for scripts/backfill_conversation_messages.py.
+
+ORM-mock unit tests only — no live DB.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _session_maker(sessions):
+    maker = MagicMock()
+    contexts = []
+    for session in sessions:
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=session)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        contexts.append(ctx)
+    maker.side_effect = contexts
+    return maker
+
+
+@pytest.mark.asyncio
+async def test_runs_batches_until_nothing_left_committing_each():
+    from scripts import backfill_conversation_messages as backfill
+
+    sessions = [MagicMock(commit=AsyncMock()) for _ in range(3)]
+    repo = MagicMock()
+    repo.backfill_message_rows = AsyncMock(side_effect=[200, 35, 0])
+
+    with patch.object(backfill, "get_session_maker", return_value=_session_maker(sessions)), \
+         patch.object(backfill, "ConversationRepository", return_value=repo):
+        summary = await backfill.run(batch_size=200)
+
+    assert summary["batches"] == 2
+    assert summary["conversations"] == 235
+    repo.backfill_message_rows.assert_awaited_with(batch_size=200)
+    for session in sessions:
+        session.commit.assert_awaited_once()
@@ -0,0 +1,51 @@
+"""Tests for scripts/backfill_message_token_counts.py.
+
+ORM-mock unit tests only — no live DB.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from nikita.context.utils.token_counter import count_tokens
+
+
+def _session_maker(sessions):
+    maker = MagicMock()
+    contexts = []
+    for session in sessions:
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=session)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        contexts.append(ctx)
+    maker.side_effect = contexts
+    return maker
+
+
+@pytest.mark.asyncio
+async def test_counts_batches_until_nothing_left_committing_each():
+    from scripts import backfill_message_token_counts as backfill
+
+    conversation_id = uuid4()
+    sessions = [MagicMock(commit=AsyncMock()) for _ in range(2)]
+    repo = MagicMock()
+    repo.get_messages_missing_token_count = AsyncMock(
+        side_effect=[[(conversation_id, 1, "hello there"), (conversation_id, 2, "")], []]
+    )
+    repo.set_message_token_counts = AsyncMock(side_effect=lambda counts: len(counts))
+
+    with patch.object(backfill, "get_session_maker", return_value=_session_maker(sessions)), \
+         patch.object(backfill, "ConversationRepository", return_value=repo):
+        summary = await backfill.run(batch_size=500)
+
+    assert summary["batches"] == 1
+    assert summary["messages"] == 2
+    repo.get_messages_missing_token_count.assert_awaited_with(limit=500)
+    repo.set_message_token_counts.assert_any_await(
+        [(conversation_id, 1, count_tokens("hello there")), (conversation_id, 2, 0)]
+    )
+    for session in sessions:
+        session.commit.assert_awaited_once()
@@ -0,0 +1,67 @@
+"""Tests for scripts/calibrate_dedup_threshold.py and the dedup fixture.
+
+The configured thresholds are checked against the labeled pairs in
+tests/fixtures/memory_dedup_pairs.yaml once their similarities have been
+recorded (``--record``); until then that check skips.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from nikita.config.settings import get_settings
+from scripts import calibrate_dedup_threshold as calibration
+
+
+def test_evaluate_counts_duplicates_at_or_above_threshold():
+    metrics = calibration.evaluate([0.95, 0.88, 0.86, 0.70], [True, True, False, False], 0.87)
+    assert (metrics.precision, metrics.recall, metrics.f1) == (1.0, 1.0, 1.0)
+
+    metrics = calibration.evaluate([0.95, 0.88, 0.86, 0.70], [True, True, False, False], 0.90)
+    assert metrics.precision == 1.0
+    assert metrics.recall == 0.5
+
+
+def test_best_threshold_separates_and_prefers_higher_on_ties():
+    best = calibration.best_threshold([0.93, 0.90, 0.85, 0.80], [True, True, False, False])
+    assert best.f1 == 1.0
+    # Every threshold in (0.85, 0.90] separates; the highest one wins
+    assert best.threshold == pytest.approx(0.9)
+
+
+def test_fixture_pairs_are_labeled_both_ways():
+    pairs = calibration.load_pairs()
+    assert all(isinstance(p["duplicate"], bool) and p["a"] and p["b"] for p in pairs)
+    labels = [p["duplicate"] for p in pairs]
+    assert labels.count(True) >= 10
+    assert labels.count(False) >= 10
+    assert len({calibration.pair_key(p) for p in pairs}) == len(pairs)
+
+
+@pytest.mark.parametrize(
+    ("mode", "setting"),
+    [
+        ("full", "memory_dedup_similarity_threshold"),
+        ("compact", "memory_compact_dedup_similarity_threshold"),
+    ],
+)
+def test_configured_threshold_separates_recorded_pairs(mode, setting):
+    """The setting stays within 0.05 F1 of the best threshold for its embedding."""
+    recorded = calibration.load_similarities().get("pairs", {})
+    pairs = [p for p in calibration.load_pairs() if calibration.pair_key(p) in recorded]
+    if not pairs:
+        pytest.skip("no recorded similarities; run calibrate_dedup_threshold.py --record")
+
+    threshold = getattr(get_settings(), setting)
+    if threshold is None:
+        pytest.skip(f"{setting} not calibrated yet; compact storage is refused until it is")
+
+    sims = [recorded[calibration.pair_key(p)][mode] for p in pairs]
+    labels = [p["duplicate"] for p in pairs]
+    configured = calibration.evaluate(sims, labels, threshold)
+    best = calibration.best_threshold(sims, labels)
+
+    assert configured.f1 >= best.f1 - 0.05, (
+        f"{setting}={configured.threshold} gives F1 {configured.f1:.2f} on the labeled "
+        f"pairs; {best.threshold} gives {best.f1:.2f}. Recalibrate the setting."
+    )
@@ -0,0 +1,192 @@
+"""Tests for the durable work queue drain loop and dispatch fallbacks."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from nikita.db.models.work_job import WorkJob, WorkJobKind, WorkJobStatus
+from nikita.tasks import work_queue
+
+
+def _session_maker():
+    session = AsyncMock()
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=session)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=ctx)
+
+
+async def _settle_background_tasks() -> None:
+    """Let tasks spawned by the queue run to completion."""
+    while work_queue._background_drains:
+        await asyncio.gather(*work_queue._background_drains)
+
+
+def _job(kind: WorkJobKind, attempts: int = 1) -> WorkJob:
+    return WorkJob(id=uuid4(), kind=kind.value, payload={}, attempts=attempts)
+
+
+@pytest.fixture
+def repo():
+    repo = MagicMock()
+    repo.reap_exhausted = AsyncMock(return_value=0)
+    repo.complete = AsyncMock()
+    repo.fail = AsyncMock(return_value=WorkJobStatus.PENDING.value)
+    with (
+        patch.object(work_queue, "get_session_maker", return_value=_session_maker()),
+        patch.object(work_queue, "WorkJobRepository", return_value=repo),
+    ):
+        yield repo
+
+
+@pytest.mark.asyncio
+class TestDrain:
+    async def test_runs_claimed_jobs_until_queue_empty(self, repo):
+        """Each claimed job's handler runs and the job is completed."""
+        jobs = [_job(WorkJobKind.PIPELINE_RUN), _job(WorkJobKind.PIPELINE_RUN)]
+        repo.claim_batch = AsyncMock(side_effect=[jobs, []])
+        handler = AsyncMock()
+
+        with patch.dict(work_queue._HANDLERS, {WorkJobKind.PIPELINE_RUN.value: handler}):
+            stats = await work_queue.drain()
+
+        assert handler.await_count == 2
+        assert repo.complete.await_count == 2
+        assert stats["claimed"] == 2
+        assert stats["completed"] == 2
+
+    async def test_failed_job_is_retried_with_backoff(self, repo):
+        """A raising handler records a failure with exponential backoff."""
+        job = _job(WorkJobKind.PIPELINE_RUN, attempts=3)
+        repo.claim_batch = AsyncMock(side_effect=[[job], []])
+        handler = AsyncMock(side_effect=RuntimeError("llm down"))
+
+        with patch.dict(work_queue._HANDLERS, {WorkJobKind.PIPELINE_RUN.value: handler}):
+            stats = await work_queue.drain()
+
+        repo.fail.assert_awaited_once()
+        job_id, error, delay = repo.fail.await_args.args
+        assert job_id == job.id
+        assert "llm down" in error
+        assert delay == work_queue.RETRY_BASE_SECONDS * 4
+        assert stats["retried"] == 1
+        repo.complete.assert_not_awaited()
+
+    async def test_one_failing_job_does_not_block_others(self, repo):
+        """Jobs in the same batch complete independently."""
+        ok, bad = _job(WorkJobKind.PIPELINE_RUN), _job(WorkJobKind.ONBOARDING_SOCIAL_CIRCLE)
+        repo.claim_batch = AsyncMock(side_effect=[[ok, bad], []])
+        repo.fail = AsyncMock(return_value=WorkJobStatus.DEAD.value)
+        handlers = {
+            WorkJobKind.PIPELINE_RUN.value: AsyncMock(),
+            WorkJobKind.ONBOARDING_SOCIAL_CIRCLE.value: AsyncMock(side_effect=ValueError()),
+        }
+
+        with patch.dict(work_queue._HANDLERS, handlers):
+            stats = await work_queue.drain()
+
+        repo.complete.assert_awaited_once_with(ok.id)
+        assert stats["completed"] == 1
+        assert stats["dead"] == 1
+
+    async def test_max_jobs_caps_claims(self, repo):
+        """max_jobs bounds the total number of claimed jobs."""
+        repo.claim_batch = AsyncMock(return_value=[_job(WorkJobKind.PIPELINE_RUN)])
+
+        with patch.dict(work_queue._HANDLERS, {WorkJobKind.PIPELINE_RUN.value: AsyncMock()}):
+            stats = await work_queue.drain(max_jobs=2, batch_size=1)
+
+        assert repo.claim_batch.await_count == 2
+        assert stats["claimed"] == 2
+
+
+@pytest.mark.asyncio
+class TestEnqueueOrRun:
+    async def test_falls_back_to_in_process_task_when_disabled(self):
+        """WORK_QUEUE_ENABLED=false keeps the old create_task behaviour."""
+        fallback = AsyncMock()
+        settings = MagicMock(work_queue_enabled=False)
+
+        with (
+            patch.object(work_queue, "get_settings", return_value=settings),
+            patch.object(work_queue, "enqueue", new=AsyncMock()) as enqueue,
+        ):
+            await work_queue.enqueue_or_run(WorkJobKind.ONBOARDING_SOCIAL_CIRCLE, {}, fallback)
+            await _settle_background_tasks()
+
+        enqueue.assert_not_awaited()
+        fallback.assert_awaited_once()
+
+    async def test_falls_back_when_enqueue_fails(self):
+        """A queue outage never drops the work."""
+        fallback = AsyncMock()
+        settings = MagicMock(work_queue_enabled=True)
+
+        with (
+            patch.object(work_queue, "get_settings", return_value=settings),
+            patch.object(work_queue, "enqueue", new=AsyncMock(side_effect=OSError())),
+        ):
+            await work_queue.enqueue_or_run(WorkJobKind.ONBOARDING_SOCIAL_CIRCLE, {}, fallback)
+            await _settle_background_tasks()
+
+        fallback.assert_awaited_once()
+
+
+
+@pytest.fixture
+def pipeline_run():
+    """Run _handle_pipeline_run against a mocked orchestrator result."""
+    session = AsyncMock()
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=session)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    repo = MagicMock(get=AsyncMock(return_value=MagicMock()))
+    payload = {"conversation_id": str(uuid4()), "user_id": str(uuid4())}
+
+    async def run(result):
+        orchestrator = MagicMock(process=AsyncMock(return_value=result))
+        with (
+            patch.object(work_queue, "get_session_maker", return_value=MagicMock(return_value=ctx)),
+            patch(
+                "nikita.db.repositories.conversation_repository.ConversationRepository",
+                return_value=repo,
+            ),
+            patch("nikita.db.repositories.user_repository.UserRepository", return_value=repo),
+            patch("nikita.pipeline.orchestrator.PipelineOrchestrator", return_value=orchestrator),
+        ):
+            await work_queue._handle_pipeline_run(payload)
+
+    run.session = session
+    return run
+
+
+@pytest.mark.asyncio
+class TestHandlers:
+    async def test_pipeline_run_commits_successful_run(self, pipeline_run):
+        await pipeline_run(MagicMock(success=True, skipped=False))
+
+        pipeline_run.session.commit.assert_awaited_once()
+        pipeline_run.session.rollback.assert_not_awaited()
+
+    async def test_pipeline_run_rolls_back_failed_run(self, pipeline_run):
+        """Rows written before the failing stage never commit, so the retry can't duplicate them."""
+        result = MagicMock(
+            success=False, skipped=False, error_stage="memory_update", error_message="down"
+        )
+
+        with pytest.raises(RuntimeError, match="memory_update"):
+            await pipeline_run(result)
+
+        pipeline_run.session.rollback.assert_awaited_once()
+        pipeline_run.session.commit.assert_not_awaited()
+
+    async def test_bootstrap_raises_on_pipeline_failure(self):
+        """The onboarding bootstrap job fails (and is retried) when its pipeline run fails."""
+        bootstrap = AsyncMock()
+
+        with patch("nikita.onboarding.handoff.HandoffManager.bootstrap_pipeline", new=bootstrap):
+            await work_queue._handle_bootstrap_pipeline({"user_id": str(uuid4())})
+
+        assert bootstrap.await_args.kwargs["raise_on_failure"] is True
@@ -0,0 +1,158 @@
+"""Tests for streaming latency histograms and the stage profiler."""
+
+import asyncio
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from nikita.observability.latency import (
+    LatencyHistogram,
+    LatencyRecorder,
+    bucket_index,
+    bucket_upper_ms,
+)
+from nikita.observability.profiler import profile_span, profile_stage
+from nikita.pipeline.orchestrator import PipelineOrchestrator
+from nikita.pipeline.stages.base import BaseStage
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_bucket_error(self):
+        """Bucketed percentiles stay within one bucket (~19%) of exact ones."""
+        rng = random.Random(7)
+        samples = [rng.lognormvariate(5, 1) for _ in range(5000)]
+        hist = LatencyHistogram()
+        for s in samples:
+            hist.record(s)
+
+        exact = sorted(samples)
+        for q in (0.5, 0.95, 0.99):
+            true = exact[int(q * len(exact)) - 1]
+            assert true <= hist.percentile(q) <= true * 2 ** 0.25 * 1.001
+
+    def test_merge_equals_single_histogram(self):
+        """Merging per-window histograms is exact (counts add)."""
+        a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i, ms in enumerate([3.0, 40.0, 900.0, 12_000.0, 0.2]):
+            (a if i % 2 else b).record(ms)
+            both.record(ms)
+        a.merge(b)
+
+        assert a == both
+
+    def test_bucket_bounds(self):
+        assert bucket_index(0.5) == 0
+        for ms in (1.0, 7.3, 250.0, 60_000.0):
+            idx = bucket_index(ms)
+            assert bucket_upper_ms(idx - 1) <= ms < bucket_upper_ms(idx)
+
+    def test_row_round_trip(self):
+        hist = LatencyHistogram()
+        for ms in (5.0, 50.0, 500.0):
+            hist.record(ms)
+        row = {str(k): v for k, v in hist.buckets.items()}
+
+        assert LatencyHistogram.from_row(row, hist.count, hist.sum_ms, hist.max_ms) == hist
+
+
+@pytest.mark.asyncio
+class TestLatencyRecorder:
+    async def test_flush_writes_one_row_per_key_and_resets(self):
+        recorder = LatencyRecorder()
+        for ms in (10.0, 20.0, 30.0):
+            recorder.record("extraction", "total", ms)
+        recorder.record("extraction", "llm", 25.0)
+
+        repo = MagicMock(insert_windows=AsyncMock())
+        session_ctx = MagicMock()
+        session_ctx.__aenter__ = AsyncMock(return_value=AsyncMock())
+        session_ctx.__aexit__ = AsyncMock(return_value=None)
+        with patch(
+            "nikita.db.repositories.pipeline_latency_repository.PipelineLatencyRepository",
+            return_value=repo,
+        ):
+            written = await recorder.flush(MagicMock(return_value=session_ctx))
+
+        assert written == 2
+        rows = {(r["stage"], r["component"]): r for r in repo.insert_windows.await_args.args[0]}
+        assert rows[("extraction", "total")]["sample_count"] == 3
+        assert rows[("extraction", "total")]["sum_ms"] == 60.0
+        assert recorder.pending() == {}
+
+    async def test_flush_failure_drops_samples(self):
+        """A DB outage never grows the in-process buffer."""
+        recorder = LatencyRecorder()
+        recorder.record("summary", "total", 5.0)
+
+        written = await recorder.flush(MagicMock(side_effect=OSError("db down")))
+
+        assert written == 0
+        assert recorder.pending() == {}
+
+
+@pytest.mark.asyncio
+class TestProfiler:
+    async def test_spans_charge_the_current_stage_only(self):
+        """Concurrent stages each accumulate their own component time."""
+
+        async def stage(name: str, component: str):
+            with profile_stage(name) as profile:
+                with profile_span(component):
+                    await asyncio.sleep(0.02)
+                return profile
+
+        llm, db = await asyncio.gather(stage("a", "llm"), stage("b", "embedding"))
+
+        assert llm.calls["llm"] == 1 and llm.calls["embedding"] == 0
+        assert db.calls["embedding"] == 1 and db.calls["llm"] == 0
+        assert llm.ms["llm"] >= 15
+
+    async def test_span_outside_stage_is_noop(self):
+        with profile_span("llm"):
+            await asyncio.sleep(0)
+
+    async def test_life_sim_llm_call_is_charged_to_llm(self):
+        from nikita.life_simulation.event_generator import EventGenerator, GeneratedEventList
+
+        async def run(prompt, output_type):
+            await asyncio.sleep(0.02)
+            return MagicMock(output=GeneratedEventList(events=[]))
+
+        agent = MagicMock(run=run)
+        generator = EventGenerator(entity_manager=MagicMock())
+        with patch("nikita.llm.clients.get_agent", return_value=agent), \
+             profile_stage("life_sim") as profile:
+            await generator._call_llm("prompt")
+
+        assert profile.calls["llm"] == 1
+        assert profile.ms["llm"] >= 15
+
+    async def test_orchestrator_records_breakdown_and_histograms(self):
+        class SlowLlmStage(BaseStage):
+            name = "prompt_builder"
+
+            async def _run(self, ctx):
+                with profile_span("render"):
+                    pass
+                with profile_span("llm"):
+                    await asyncio.sleep(0.02)
+                return None
+
+        recorder = LatencyRecorder()
+        session = MagicMock()
+        session.begin_nested = MagicMock(return_value=AsyncMock())
+        orch = PipelineOrchestrator(
+            session=session, stages=[("prompt_builder", SlowLlmStage(), False)],
+        )
+        with patch("nikita.pipeline.orchestrator.latency_recorder", recorder):
+            result = await orch.process(uuid4(), uuid4())
+
+        breakdown = result.context.stage_results["prompt_builder"]["breakdown"]
+        assert breakdown["llm_calls"] == 1
+        assert breakdown["render_calls"] == 1
+        assert breakdown["llm_ms"] >= 15
+        pending = recorder.pending()
+        assert pending[("prompt_builder", "total")].count == 1
+        assert pending[("prompt_builder", "llm")].count == 1
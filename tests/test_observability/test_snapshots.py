@@ -1,17 +1,21 @@
 """Tests for context snapshot and delta computation (Spec 110 AC-2)."""
 
+import asyncio
+import time
 from datetime import datetime, timezone
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 
+from nikita.observability.emitter import EventEmitter
 from nikita.observability.snapshots import (
     STAGE_FIELDS,
     compute_delta,
+    delta_from_writes,
     snapshot_ctx,
 )
-from nikita.pipeline.models import PipelineContext
+from nikita.pipeline.models import PipelineContext, track_writes
 
 
 def _make_ctx(**kwargs) -> PipelineContext:
@@ -196,3 +200,99 @@ class TestComputeDelta:
 
         assert len(delta["facts"]) == 10
         assert delta["facts_count"] == 20
+
+
+class TestDeltaFromWrites:
+    """Low-overhead mode: deltas from PipelineContext's write log."""
+
+    def test_write_log_records_assigned_fields(self):
+        ctx = _make_ctx()
+        with track_writes() as written:
+            ctx.facts_stored = 3
+            ctx.facts_deduplicated = 1
+        ctx.emotional_tone = "happy"  # outside the block: not logged
+
+        assert written == {"facts_stored", "facts_deduplicated"}
+
+    def test_builder_payload_matches_compute_delta(self):
+        ctx = _make_ctx()
+        with track_writes() as written:
+            ctx.score_delta = Decimal("2.5")
+            ctx.score_events = ["compliment"]
+            ctx.chapter_changed = True
+
+        assert delta_from_writes(written, ctx, "game_state") == compute_delta(
+            {}, ctx, "game_state"
+        )
+
+    def test_generic_fallback_serializes_only_written_fields(self):
+        ctx = _make_ctx()
+        with track_writes() as written:
+            ctx.relationship_score = Decimal("61")
+
+        assert delta_from_writes(written, ctx, "custom_stage") == {
+            "relationship_score": 61.0
+        }
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stages_log_separately(self):
+        """Stages gathered in one wave each see only their own writes."""
+        ctx = _make_ctx()
+
+        async def stage(field_name: str):
+            with track_writes() as written:
+                await asyncio.sleep(0)
+                setattr(ctx, field_name, True)
+                await asyncio.sleep(0)
+            return written
+
+        a, b = await asyncio.gather(stage("touchpoint_scheduled"), stage("daily_summary_updated"))
+
+        assert a == {"touchpoint_scheduled"}
+        assert b == {"daily_summary_updated"}
+
+
+class TestObservabilityOverhead:
+    """Micro-benchmark: per-stage observability cost, snapshot vs write log."""
+
+    ROUNDS = 200
+
+    def _per_stage_us(self, observe) -> float:
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(self.ROUNDS):
+                observe()
+            best = min(best, (time.perf_counter() - start) / self.ROUNDS)
+        return best * 1_000_000
+
+    def test_write_log_is_cheaper_than_snapshots(self):
+        facts = [{"text": f"fact {i} " + "x" * 80, "type": "preference"} for i in range(300)]
+        ctx = _make_ctx(extracted_facts=facts, extracted_threads=list(facts))
+        emitter = EventEmitter(uuid4(), uuid4())
+
+        def snapshot_mode():
+            before = snapshot_ctx(ctx, "extraction")
+            ctx.extraction_summary = "talked"
+            emitter.emit("extraction.complete", data=compute_delta(before, ctx, "extraction"))
+
+        def write_log_mode():
+            with track_writes() as written:
+                ctx.extraction_summary = "talked"
+            emitter.emit("extraction.complete", data=delta_from_writes(written, ctx, "extraction"))
+
+        snapshot_us = self._per_stage_us(snapshot_mode)
+        write_log_us = self._per_stage_us(write_log_mode)
+
+        # Relative to snapshots on the same machine (~70x locally)
+        assert write_log_us * 10 < snapshot_us
+
+    def test_emit_does_not_serialize(self):
+        """Sizing is deferred to flush; emit only appends."""
+        emitter = EventEmitter(uuid4(), uuid4())
+        big = {"items": [{"text": "x" * 200} for _ in range(500)]}
+
+        emitter.emit("extraction.complete", data=big)
+
+        assert emitter._buffer[0]["data"] is big
+        assert emitter.events[0]["data"]["_truncated"] is True